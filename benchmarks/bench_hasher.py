@@ -0,0 +1,98 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+bench_hasher.py
+
+Compare the throughput (MB/s) of the old `Sha256Verifyer.load` loop
+(1 KiB reads) with :func:`src.utils.hasher.hash_file`, and how much a
+concurrent thread (like the Kivy render loop) can run meanwhile.
+
+Usage: python benchmarks/bench_hasher.py [size in MB]
+"""
+import os
+import sys
+import time
+import hashlib
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from src.utils.hasher import hash_file, hash_files
+
+
+def hash_file_1k(filename: str) -> str:
+    """The hashing loop of `Sha256Verifyer.load` before the hasher engine"""
+    sha256 = hashlib.sha256()
+    with open(filename, "rb") as file:
+        for block in iter(lambda: file.read(1024), b""):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def measure(name: str, size: int, func, *args):
+    """Run `func` while a thread counts how many 1ms ticks it could do"""
+    ticks = [0]
+    running = [True]
+
+    def ticker():
+        while running[0]:
+            ticks[0] += 1
+            time.sleep(0.001)
+
+    thread = threading.Thread(target=ticker)
+    thread.start()
+
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+
+    running[0] = False
+    thread.join()
+
+    print(
+        f"{name:<24} {size / (1 << 20) / elapsed:>10,.1f} MB/s"
+        + f" {ticks[0] / elapsed:>10,.0f} ticks/s"
+    )
+
+
+def main():
+    """Create a random file and hash it with each engine"""
+    size = int(sys.argv[1] if len(sys.argv) > 1 else 100) << 20
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filenames = []
+        for i in range(4):
+            filename = os.path.join(tmpdir, f"bench_{i}.bin")
+            with open(filename, "wb") as file:
+                for _ in range(size >> 20):
+                    file.write(os.urandom(1 << 20))
+            filenames.append(filename)
+
+        measure("1 KiB reads (before)", size, hash_file_1k, filenames[0])
+        measure("hash_file (after)", size, hash_file, filenames[0])
+        measure("hash_files x4 (after)", size * 4, hash_files, filenames)
+
+
+if __name__ == "__main__":
+    main()
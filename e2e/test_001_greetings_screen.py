@@ -44,9 +44,12 @@ class TestAboutScreen(GraphicUnitTest):
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
+    @patch("src.app.screens.greetings_screen.get_session")
     @patch("src.app.screens.greetings_screen.partial")
     @patch("src.app.screens.greetings_screen.Clock.schedule_once")
-    def test_on_enter(self, mock_schedule_once, mock_partial, mock_get_locale):
+    def test_on_enter(
+        self, mock_schedule_once, mock_partial, mock_get_session, mock_get_locale
+    ):
         screen = GreetingsScreen()
         self.render(screen)
         screen.on_enter()
@@ -55,6 +58,7 @@ class TestAboutScreen(GraphicUnitTest):
         EventLoop.ensure_window()
 
         mock_get_locale.assert_called()
+        mock_get_session.assert_not_called()
         mock_partial.assert_called()
         mock_schedule_once.assert_called()
 
@@ -395,8 +399,65 @@ class TestAboutScreen(GraphicUnitTest):
     @patch("src.app.screens.greetings_screen.partial")
     @patch("src.app.screens.greetings_screen.Clock.schedule_once")
     @patch("src.app.screens.greetings_screen.GreetingsScreen.set_screen")
+    @patch(
+        "src.app.screens.greetings_screen.get_warm_up",
+        return_value=False,
+    )
+    @patch("src.app.screens.greetings_screen.get_session")
     def test_check_internet_connection(
         self,
+        mock_get_session,
+        mock_get_warm_up,
+        mock_set_screen,
+        mock_schedule_once,
+        mock_partial,
+        mock_selector,
+        mock_manager,
+        mock_get_locale,
+    ):
+        mock_manager.get_screen = MagicMock()
+        mock_manager.get_screen.update = MagicMock()
+        mock_selector.return_value = MagicMock(releases=["v0.0.1"])
+        screen = GreetingsScreen()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        screen.update(name=screen.name, key="check-internet-connection")
+
+        # patch assertions
+        mock_get_locale.assert_called_once()
+        mock_manager.get_screen.assert_called_once()
+        mock_partial.assert_called_once_with(
+            mock_manager.get_screen().update,
+            name="GreetingsScreen",
+            key="version",
+            value="v0.0.1",
+        )
+        mock_schedule_once.assert_called()
+        mock_set_screen.assert_called_once_with(name="MainScreen", direction="left")
+        mock_get_warm_up.assert_called_once()
+        mock_get_session.assert_not_called()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.base_screen.BaseScreen.manager")
+    @patch("src.app.screens.greetings_screen.Selector")
+    @patch("src.app.screens.greetings_screen.partial")
+    @patch("src.app.screens.greetings_screen.Clock.schedule_once")
+    @patch("src.app.screens.greetings_screen.GreetingsScreen.set_screen")
+    @patch(
+        "src.app.screens.greetings_screen.get_warm_up",
+        return_value=True,
+    )
+    @patch("src.app.screens.greetings_screen.get_session")
+    def test_check_internet_connection_warm_up(
+        self,
+        mock_get_session,
+        mock_get_warm_up,
         mock_set_screen,
         mock_schedule_once,
         mock_partial,
@@ -426,6 +487,8 @@ class TestAboutScreen(GraphicUnitTest):
         )
         mock_schedule_once.assert_called()
         mock_set_screen.assert_called_once_with(name="MainScreen", direction="left")
+        mock_get_warm_up.assert_called_once()
+        mock_get_session().warm_up.assert_called_once()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
@@ -435,8 +498,9 @@ class TestAboutScreen(GraphicUnitTest):
         "src.app.screens.greetings_screen.Selector", side_effect=[Exception("Mocked")]
     )
     @patch("src.app.screens.greetings_screen.GreetingsScreen.redirect_exception")
+    @patch("src.app.screens.greetings_screen.get_session")
     def test_fail_check_internet_connection(
-        self, mock_redirect_exception, mock_selector, mock_get_locale
+        self, mock_get_session, mock_redirect_exception, mock_selector, mock_get_locale
     ):
         screen = GreetingsScreen()
         self.render(screen)
@@ -451,6 +515,9 @@ class TestAboutScreen(GraphicUnitTest):
         mock_selector.assert_called()
         mock_redirect_exception.assert_called()
 
+        # offline, so the connections are not opened in advance
+        mock_get_session.assert_not_called()
+
     @patch("sys.platform", "win32")
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
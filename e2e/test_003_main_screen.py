@@ -671,6 +671,58 @@ class TestMainScreen(GraphicUnitTest):
         pattern = re.compile(r".*v24\.03\.0\.zip")
         self.assertTrue(pattern.match(mock_isfile.call_args[0][0]))
 
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch("src.app.screens.main_screen.MainScreen.set_background")
+    @patch("src.app.screens.main_screen.MainScreen.set_screen")
+    @patch("src.app.screens.main_screen.MainScreen.manager")
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_destdir_assets",
+        return_value="mockdir",
+    )
+    @patch("src.app.screens.main_screen.os.path.isfile", side_effect=[True])
+    @patch("src.app.screens.main_screen.AssetScrubber")
+    def test_on_release_flash_corrupted_zip_to_download_screen(
+        self,
+        mock_asset_scrubber,
+        mock_isfile,
+        mock_get_destdir_assets,
+        mock_get_locale,
+        mock_manager,
+        mock_set_screen,
+        mock_set_background,
+    ):
+        mock_manager.get_screen = MagicMock()
+        mock_asset_scrubber.return_value.corrupted.return_value = [
+            os.path.join("mockdir", "krux-v24.03.0.zip")
+        ]
+
+        screen = MainScreen()
+        screen.version = "v24.03.0"
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+        window = EventLoop.window
+        grid = window.children[0].children[0]
+        button = grid.children[3]
+
+        screen.update(name="SelectVersionScreen", key="device", value="m5stickv")
+        action = getattr(screen.__class__, f"on_release_{button.id}")
+        action(button)
+
+        mock_get_locale.assert_any_call()
+        mock_get_destdir_assets.assert_called_once()
+        mock_set_background.assert_called_once_with(wid="main_flash", rgba=(0, 0, 0, 1))
+        mock_set_screen.assert_called_once_with(
+            name="DownloadStableZipScreen", direction="left"
+        )
+        mock_asset_scrubber.assert_called_once_with(destdir="mockdir")
+        pattern = re.compile(r".*v24\.03\.0\.zip")
+        self.assertTrue(pattern.match(mock_isfile.call_args[0][0]))
+
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch("src.app.screens.main_screen.MainScreen.set_background")
     @patch("src.app.screens.main_screen.MainScreen.set_screen")
@@ -70,17 +70,17 @@ class TestSelectVersionScreen(GraphicUnitTest):
         mock_get_locale.assert_called_once()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
-    @patch("src.utils.selector.requests")
+    @patch("src.utils.selector.get_session")
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
     @patch("src.app.screens.select_version_screen.SelectVersionScreen.manager")
-    def test_render_buttons(self, mock_manager, mock_get_locale, mock_requests):
+    def test_render_buttons(self, mock_manager, mock_get_locale, mock_get_session):
         # Configure mocks
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = MOCKED_FOUND_API
-        mock_requests.get.return_value = mock_response
+        mock_get_session().get.return_value = mock_response
         mock_manager.get_screen = MagicMock()
 
         screen = SelectVersionScreen()
@@ -102,20 +102,20 @@ class TestSelectVersionScreen(GraphicUnitTest):
         mock_get_locale.assert_any_call()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
-    @patch("src.utils.selector.requests")
+    @patch("src.utils.selector.get_session")
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
     @patch("src.app.screens.select_version_screen.SelectVersionScreen.manager")
     @patch("src.app.screens.select_version_screen.SelectVersionScreen.set_background")
     def test_on_press(
-        self, mock_set_background, mock_manager, mock_get_locale, mock_requests
+        self, mock_set_background, mock_manager, mock_get_locale, mock_get_session
     ):
         # Configure mocks
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = MOCKED_FOUND_API
-        mock_requests.get.return_value = mock_response
+        mock_get_session().get.return_value = mock_response
         mock_manager.get_screen = MagicMock()
 
         screen = SelectVersionScreen()
@@ -143,7 +143,7 @@ class TestSelectVersionScreen(GraphicUnitTest):
         mock_get_locale.assert_any_call()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
-    @patch("src.utils.selector.requests")
+    @patch("src.utils.selector.get_session")
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
@@ -152,15 +152,14 @@ class TestSelectVersionScreen(GraphicUnitTest):
         self,
         mock_redirect_exception,
         mock_get_locale,
-        mock_requests,
+        mock_get_session,
     ):
         # Configure mocks
         mock_response = MagicMock(status_code=404)
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
             "Mocked 404"
         )
-        mock_requests.exceptions = requests.exceptions
-        mock_requests.get.return_value = mock_response
+        mock_get_session().get.return_value = mock_response
 
         screen = SelectVersionScreen()
         screen.fetch_releases()
@@ -169,7 +168,7 @@ class TestSelectVersionScreen(GraphicUnitTest):
         mock_redirect_exception.assert_called_once()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
-    @patch("src.utils.selector.requests")
+    @patch("src.utils.selector.get_session")
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
@@ -182,13 +181,13 @@ class TestSelectVersionScreen(GraphicUnitTest):
         mock_set_screen,
         mock_set_background,
         mock_get_locale,
-        mock_requests,
+        mock_get_session,
     ):
         # Configure mocks
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = MOCKED_FOUND_API
-        mock_requests.get.return_value = mock_response
+        mock_get_session().get.return_value = mock_response
         mock_manager.get_screen = MagicMock()
 
         screen = SelectVersionScreen()
@@ -1,5 +1,5 @@
 import os
-from unittest.mock import patch, call, MagicMock
+from unittest.mock import patch, call
 from kivy.base import EventLoop, EventLoopBase
 from kivy.tests.common import GraphicUnitTest
 from kivy.core.text import LabelBase, DEFAULT_FONT
@@ -39,7 +39,7 @@ class TestDownloadStableZipScreen(GraphicUnitTest):
         self.assertEqual(screen.thread, None)
         self.assertEqual(screen.trigger, None)
         self.assertEqual(screen.version, None)
-        self.assertEqual(screen.to_screen, "DownloadStableZipSha256Screen")
+        self.assertEqual(screen.to_screen, "VerifyStableZipScreen")
         self.assertEqual(grid.id, "download_stable_zip_screen_grid")
         self.assertEqual(grid.children[1].id, "download_stable_zip_screen_progress")
         self.assertEqual(grid.children[0].id, "download_stable_zip_screen_info")
@@ -98,9 +98,16 @@ class TestDownloadStableZipScreen(GraphicUnitTest):
         "src.app.screens.base_screen.BaseScreen.get_destdir_assets",
         return_value="mockdir",
     )
-    @patch("src.app.screens.download_stable_zip_screen.ZipDownloader")
+    @patch("src.app.screens.download_stable_zip_screen.ReleaseDownloader")
+    @patch(
+        "src.app.screens.download_stable_zip_screen.get_download_connections",
+        return_value=1,
+    )
+    @patch("src.app.screens.download_stable_zip_screen.get_artifact_store")
     def test_update_version(
         self,
+        mock_get_artifact_store,
+        mock_get_download_connections,
         mock_downloader,
         mock_get_destdir_assets,
         mock_get_locale,
@@ -119,7 +126,14 @@ class TestDownloadStableZipScreen(GraphicUnitTest):
         # patch assertions
         mock_get_locale.assert_any_call()
         mock_get_destdir_assets.assert_any_call()
-        mock_downloader.assert_called_once()
+        mock_get_download_connections.assert_called_once()
+        mock_get_artifact_store.assert_called_once()
+        mock_downloader.assert_called_once_with(
+            version="v0.0.1",
+            destdir="mockdir",
+            connections=1,
+            store=mock_get_artifact_store(),
+        )
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
@@ -168,7 +182,7 @@ class TestDownloadStableZipScreen(GraphicUnitTest):
         EventLoop.ensure_window()
 
         # do tests
-        with patch.object(screen, "trigger") as mock_trigger, patch.object(
+        with patch.object(screen, "_trigger") as mock_trigger, patch.object(
             screen, "downloader"
         ) as mock_downloader:
 
@@ -209,13 +223,13 @@ class TestDownloadStableZipScreen(GraphicUnitTest):
 
             # patch assertions
             mock_get_locale.assert_any_call()
-            assert len(mock_trigger.mock_calls) >= 1
+            mock_trigger.assert_called_once()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
-    @patch("src.app.screens.download_stable_zip_screen.ZipDownloader")
+    @patch("src.app.screens.download_stable_zip_screen.ReleaseDownloader")
     @patch("src.app.screens.download_stable_zip_screen.partial")
     @patch("src.app.screens.download_stable_zip_screen.Clock.schedule_once")
     def test_on_progress(
@@ -260,8 +274,6 @@ class TestDownloadStableZipScreen(GraphicUnitTest):
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
-    @patch("src.app.screens.download_stable_zip_screen.time.sleep")
-    @patch("src.app.screens.download_stable_zip_screen.DownloadStableZipScreen.manager")
     @patch("src.app.screens.download_stable_zip_screen.partial")
     @patch("src.app.screens.download_stable_zip_screen.Clock.schedule_once")
     @patch(
@@ -272,13 +284,8 @@ class TestDownloadStableZipScreen(GraphicUnitTest):
         mock_set_screen,
         mock_schedule_once,
         mock_partial,
-        mock_manager,
-        mock_sleep,
         mock_get_locale,
     ):
-        # Mocks
-        mock_manager.get_screen = MagicMock()
-
         # screen
         screen = DownloadStableZipScreen()
         screen.version = "v0.0.1"
@@ -300,20 +307,10 @@ class TestDownloadStableZipScreen(GraphicUnitTest):
 
         # patch assertions
         mock_get_locale.assert_any_call()
-        mock_sleep.assert_called_once_with(2.1)
-        mock_manager.get_screen.assert_called_once_with("DownloadStableZipSha256Screen")
-        mock_partial.assert_has_calls(
-            [
-                call(screen.update, name=screen.name, key="canvas"),
-                call(
-                    mock_manager.get_screen().update,
-                    name=screen.name,
-                    key="version",
-                    value="v0.0.1",
-                ),
-            ]
+        mock_partial.assert_called_once_with(
+            screen.update, name=screen.name, key="canvas"
         )
         mock_schedule_once.assert_called()
         mock_set_screen.assert_called_once_with(
-            name="DownloadStableZipSha256Screen", direction="left"
+            name="VerifyStableZipScreen", direction="left"
         )
@@ -177,7 +177,18 @@ class TestDownloadBetaScreen(GraphicUnitTest):
         "src.app.screens.base_screen.BaseScreen.get_destdir_assets",
         return_value="mockdir",
     )
-    def test_update_downloader(self, mock_destdir_assets, mock_get_locale):
+    @patch(
+        "src.app.screens.download_beta_screen.get_download_connections",
+        return_value=1,
+    )
+    @patch("src.app.screens.download_beta_screen.get_artifact_store")
+    def test_update_downloader(
+        self,
+        mock_get_artifact_store,
+        mock_get_download_connections,
+        mock_destdir_assets,
+        mock_get_locale,
+    ):
         screen = DownloadBetaScreen()
         screen.firmware = "kboot.kfpkg"
         screen.device = "amigo"
@@ -214,6 +225,8 @@ class TestDownloadBetaScreen(GraphicUnitTest):
         # patch assertions
         mock_get_locale.assert_any_call()
         mock_destdir_assets.assert_any_call()
+        mock_get_download_connections.assert_called_once()
+        mock_get_artifact_store.assert_called_once()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
@@ -260,7 +273,7 @@ class TestDownloadBetaScreen(GraphicUnitTest):
         EventLoop.ensure_window()
 
         # do tests
-        with patch.object(screen, "trigger") as mock_trigger, patch.object(
+        with patch.object(screen, "_trigger") as mock_trigger, patch.object(
             screen, "downloader"
         ) as mock_downloader:
 
@@ -290,7 +303,7 @@ class TestDownloadBetaScreen(GraphicUnitTest):
 
             # patch assertions
             mock_get_locale.assert_any_call()
-            assert len(mock_trigger.mock_calls) >= 1
+            mock_trigger.assert_called_once()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
@@ -1,5 +1,5 @@
 import os
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, call
 from kivy.base import EventLoop, EventLoopBase
 from kivy.tests.common import GraphicUnitTest
 from kivy.core.text import LabelBase, DEFAULT_FONT
@@ -367,10 +367,12 @@ class TestWarningAlreadyDownloadedScreen(GraphicUnitTest):
     @patch("src.app.screens.unzip_stable_screen.UnzipStableScreen.set_background")
     @patch("src.app.screens.unzip_stable_screen.KbootUnzip")
     @patch("src.app.screens.unzip_stable_screen.UnzipStableScreen.manager")
-    @patch("src.app.screens.unzip_stable_screen.time.sleep")
+    @patch("src.app.screens.unzip_stable_screen.partial")
+    @patch("src.app.screens.unzip_stable_screen.Clock.schedule_once")
     def test_on_release_flash_button(
         self,
-        mock_sleep,
+        mock_schedule_once,
+        mock_partial,
         mock_manager,
         mock_kboot_unzip,
         mock_set_background,
@@ -378,7 +380,7 @@ class TestWarningAlreadyDownloadedScreen(GraphicUnitTest):
         mock_get_destdir_assets,
         mock_get_locale,
     ):
-        mock_kboot_unzip.load = MagicMock()
+        mock_kboot_unzip.return_value.kboot = "krux-v0.0.1/maixpy_mock/kboot.kfpkg"
         mock_manager.get_screen = MagicMock()
 
         screen = UnzipStableScreen()
@@ -395,13 +397,12 @@ class TestWarningAlreadyDownloadedScreen(GraphicUnitTest):
         action = getattr(screen.__class__, f"on_release_{button.id}")
         action(button)
 
-        p = os.path.join("mock", "krux-v0.0.1", "maixpy_mock", "kboot.kfpkg")
         text = "".join(
             [
-                "Extracted",
+                "Flash with",
                 "\n",
                 "[color=#efcc00]",
-                p,
+                "krux-v0.0.1/maixpy_mock/kboot.kfpkg",
                 "[/color]",
             ]
         )
@@ -419,10 +420,86 @@ class TestWarningAlreadyDownloadedScreen(GraphicUnitTest):
             device="mock",
             output="mock",
         )
-        # mock_kboot_unzip.load.assert_called_once()
+        # kboot.kfpkg is streamed, not extracted
+        mock_kboot_unzip.return_value.open.assert_called_once_with(
+            "krux-v0.0.1/maixpy_mock/kboot.kfpkg"
+        )
+        mock_kboot_unzip.return_value.load.assert_not_called()
         mock_set_background.assert_called_once_with(wid=button.id, rgba=(0, 0, 0, 1))
         mock_manager.get_screen.assert_called_once_with("FlashScreen")
-        mock_sleep.assert_called_once_with(2.1)
+        screen_mock = mock_manager.get_screen.return_value
+        mock_partial.assert_has_calls(
+            [
+                call(
+                    screen_mock.update,
+                    name=screen.name,
+                    key="firmware",
+                    value=mock_kboot_unzip.return_value.open.return_value,
+                ),
+                call(screen_mock.update, name=screen.name, key="device", value="mock"),
+                call(
+                    screen_mock.update,
+                    name=screen.name,
+                    key="baudrate",
+                    value=1500000,
+                ),
+                call(screen_mock.update, name=screen.name, key="flasher"),
+            ],
+            any_order=True,
+        )
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_destdir_assets", return_value="mock"
+    )
+    @patch("src.app.screens.base_screen.BaseScreen.get_baudrate", return_value=1500000)
+    @patch("src.app.screens.unzip_stable_screen.UnzipStableScreen.set_background")
+    @patch("src.app.screens.unzip_stable_screen.UnzipStableScreen.set_screen")
+    @patch("src.app.screens.unzip_stable_screen.UnzipStableScreen.redirect_exception")
+    @patch("src.app.screens.unzip_stable_screen.KbootUnzip")
+    @patch("src.app.screens.unzip_stable_screen.UnzipStableScreen.manager")
+    def test_fail_on_release_flash_button(
+        self,
+        mock_manager,
+        mock_kboot_unzip,
+        mock_redirect_exception,
+        mock_set_screen,
+        mock_set_background,
+        mock_get_baudrate,
+        mock_get_destdir_assets,
+        mock_get_locale,
+    ):
+        mock_kboot_unzip.return_value.open.side_effect = RuntimeError(
+            "Cannot open mock/krux-v0.0.1.zip: None"
+        )
+        mock_manager.get_screen = MagicMock()
+
+        screen = UnzipStableScreen()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        # DO tests
+        screen.update(name="VerifyStableZipScreen", key="device", value="mock")
+        screen.update(name="VerifyStableZipScreen", key="version", value="v0.0.1")
+        screen.update(name="VerifyStableZipScreen", key="flash-button")
+        button = screen.ids[f"{screen.id}_flash_button"]
+        action = getattr(screen.__class__, f"on_release_{button.id}")
+        action(button)
+
+        # patch assertions
+        exc = mock_redirect_exception.call_args.kwargs["exception"]
+        self.assertEqual(str(exc), "Cannot open mock/krux-v0.0.1.zip: None")
+        mock_get_baudrate.assert_called()
+        mock_get_destdir_assets.assert_called_once()
+        mock_get_locale.assert_called()
+        mock_set_background.assert_called_once_with(wid=button.id, rgba=(0, 0, 0, 1))
+        mock_manager.get_screen.assert_not_called()
+        mock_set_screen.assert_not_called()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
@@ -483,3 +560,114 @@ class TestWarningAlreadyDownloadedScreen(GraphicUnitTest):
         mock_set_background.assert_called()
         mock_manager.get_screen.assert_called()
         mock_sleep.assert_called()
+        mock_firmware_unzip.assert_called_once_with(
+            filename=os.path.join("mock", "krux-v0.0.1.zip"),
+            device="mock",
+            output="mock",
+            pubkey=os.path.join("mock", "selfcustody.pem"),
+        )
+        mock_firmware_unzip.return_value.load.assert_called_once()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_destdir_assets", return_value="mock"
+    )
+    @patch("src.app.screens.unzip_stable_screen.UnzipStableScreen.set_background")
+    @patch("src.app.screens.unzip_stable_screen.UnzipStableScreen.set_screen")
+    @patch("src.app.screens.unzip_stable_screen.UnzipStableScreen.redirect_exception")
+    @patch("src.app.screens.unzip_stable_screen.FirmwareUnzip")
+    @patch("src.app.screens.unzip_stable_screen.UnzipStableScreen.manager")
+    @patch("src.app.screens.unzip_stable_screen.time.sleep")
+    def test_fail_on_release_airgapped_button_bad_signature(
+        self,
+        mock_sleep,
+        mock_manager,
+        mock_firmware_unzip,
+        mock_redirect_exception,
+        mock_set_screen,
+        mock_set_background,
+        mock_get_destdir_assets,
+        mock_get_locale,
+    ):
+        mock_firmware_unzip.return_value.verified = False
+        mock_manager.get_screen = MagicMock()
+
+        screen = UnzipStableScreen()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        # DO tests
+        screen.update(name="VerifyStableZipScreen", key="device", value="mock")
+        screen.update(name="VerifyStableZipScreen", key="version", value="v0.0.1")
+        screen.update(name="VerifyStableZipScreen", key="airgap-button")
+
+        button = screen.ids[f"{screen.id}_airgap_button"]
+        action = getattr(screen.__class__, f"on_release_{button.id}")
+        action(button)
+
+        # patch assertions
+        p = os.path.join("mock", "krux-v0.0.1", "maixpy_mock", "firmware.bin")
+        exc = mock_redirect_exception.call_args.kwargs["exception"]
+        self.assertEqual(str(exc), f"Invalid signature for {p}")
+        mock_get_locale.assert_called()
+        mock_firmware_unzip.return_value.load.assert_called_once()
+        mock_set_screen.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_destdir_assets", return_value="mock"
+    )
+    @patch("src.app.screens.unzip_stable_screen.UnzipStableScreen.set_background")
+    @patch("src.app.screens.unzip_stable_screen.UnzipStableScreen.set_screen")
+    @patch("src.app.screens.unzip_stable_screen.UnzipStableScreen.redirect_exception")
+    @patch("src.app.screens.unzip_stable_screen.FirmwareUnzip")
+    @patch("src.app.screens.unzip_stable_screen.UnzipStableScreen.manager")
+    @patch("src.app.screens.unzip_stable_screen.time.sleep")
+    def test_fail_on_release_airgapped_button_missing_pubkey(
+        self,
+        mock_sleep,
+        mock_manager,
+        mock_firmware_unzip,
+        mock_redirect_exception,
+        mock_set_screen,
+        mock_set_background,
+        mock_get_destdir_assets,
+        mock_get_locale,
+    ):
+        mock_firmware_unzip.return_value.load.side_effect = ValueError(
+            "File mock/selfcustody.pem do not exist"
+        )
+        mock_manager.get_screen = MagicMock()
+
+        screen = UnzipStableScreen()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        # DO tests
+        screen.update(name="VerifyStableZipScreen", key="device", value="mock")
+        screen.update(name="VerifyStableZipScreen", key="version", value="v0.0.1")
+        screen.update(name="VerifyStableZipScreen", key="airgap-button")
+
+        button = screen.ids[f"{screen.id}_airgap_button"]
+        action = getattr(screen.__class__, f"on_release_{button.id}")
+        action(button)
+
+        # patch assertions
+        exc = mock_redirect_exception.call_args.kwargs["exception"]
+        self.assertEqual(str(exc), "File mock/selfcustody.pem do not exist")
+        mock_manager.get_screen.assert_not_called()
+        mock_get_locale.assert_called()
+        mock_firmware_unzip.return_value.load.assert_called_once()
+        mock_set_screen.assert_not_called()
+        mock_sleep.assert_not_called()
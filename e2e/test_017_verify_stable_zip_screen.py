@@ -1,10 +1,14 @@
 import os
+import hashlib
+import tempfile
 from unittest.mock import MagicMock, patch, call
 from kivy.base import EventLoop, EventLoopBase
 from kivy.tests.common import GraphicUnitTest
 from src.app.screens.verify_stable_zip_screen import (
     VerifyStableZipScreen,
 )
+from src.utils.hasher import hash_file
+from src.utils.trust import SELFCUSTODY_PEM
 
 
 class TestVerifyStableZipScreen(GraphicUnitTest):
@@ -39,19 +43,29 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
     )
     @patch("src.app.screens.verify_stable_zip_screen.Sha256Verifyer")
     @patch("src.app.screens.verify_stable_zip_screen.Sha256CheckVerifyer")
+    @patch("src.app.screens.verify_stable_zip_screen.get_verification_cache")
     def test_verify_sha256(
         self,
+        mock_get_verification_cache,
         mock_check_verifyer,
         mock_verifyer,
         mock_get_locale,
     ):
+        mock_get_verification_cache.return_value.lookup.return_value = None
+        mock_check_verifyer.return_value.data = "abcd krux-v0.0.1.zip"
+        mock_verifyer.return_value.data = "abcd"
+        mock_verifyer.return_value.verify.return_value = True
+
         screen = VerifyStableZipScreen()
         self.render(screen)
 
         # get your Window instance safely
         EventLoop.ensure_window()
 
-        screen.verify_sha256(assets_dir="mockdir", version="v0.0.1")
+        actual = screen.verify_sha256(assets_dir="mockdir", version="v0.0.1")
+
+        # default assertions
+        self.assertEqual(actual, ("abcd", "abcd", True))
 
         # patch assertions
         mock_get_locale.assert_called()
@@ -59,21 +73,66 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         mock_check_verifyer.assert_called_once_with(
             filename="mockdir/krux-v0.0.1.zip.sha256.txt"
         )
+        mock_verifyer.return_value.load.assert_called_once()
+        cache = mock_get_verification_cache.return_value
+        cache.lookup.assert_called_once_with("mockdir/krux-v0.0.1.zip", "abcd")
+        cache.put.assert_called_once_with(
+            "mockdir/krux-v0.0.1.zip", "abcd", digest="abcd", verified=True
+        )
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.verify_stable_zip_screen.Sha256Verifyer")
+    @patch("src.app.screens.verify_stable_zip_screen.Sha256CheckVerifyer")
+    @patch("src.app.screens.verify_stable_zip_screen.get_verification_cache")
+    def test_verify_sha256_cached(
+        self,
+        mock_get_verification_cache,
+        mock_check_verifyer,
+        mock_verifyer,
+        mock_get_locale,
+    ):
+        mock_get_verification_cache.return_value.lookup.return_value = {
+            "digest": "abcd",
+            "verified": True,
+        }
+        mock_check_verifyer.return_value.data = "abcd krux-v0.0.1.zip"
+
+        screen = VerifyStableZipScreen()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        actual = screen.verify_sha256(assets_dir="mockdir", version="v0.0.1")
+
+        # default assertions
+        self.assertEqual(actual, ("abcd", "abcd", True))
+
+        # patch assertions
+        mock_get_locale.assert_called()
+        mock_verifyer.assert_not_called()
+        mock_get_verification_cache.return_value.put.assert_not_called()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
     @patch("src.app.screens.verify_stable_zip_screen.SigVerifyer")
-    @patch("src.app.screens.verify_stable_zip_screen.PemCheckVerifyer")
+    @patch("src.app.screens.verify_stable_zip_screen.get_trust_store")
     @patch("src.app.screens.verify_stable_zip_screen.SigCheckVerifyer")
+    @patch("src.app.screens.verify_stable_zip_screen.get_verification_cache")
     def test_verify_signature(
         self,
+        mock_get_verification_cache,
         mock_sig_check_verifyer,
-        mock_pem_check_verifyer,
+        mock_get_trust_store,
         mock_sig_verifyer,
         mock_get_locale,
     ):
+        mock_get_verification_cache.return_value.lookup.return_value = None
         screen = VerifyStableZipScreen()
         self.render(screen)
 
@@ -87,16 +146,180 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         mock_sig_check_verifyer.assert_called_once_with(
             filename="mockdir/krux-v0.0.1.zip.sig"
         )
-        mock_pem_check_verifyer.assert_called_once_with(
-            filename="mockdir/selfcustody.pem"
-        )
+        mock_get_trust_store.return_value.write_pem.assert_called_once()
         mock_sig_verifyer.assert_called_once_with(
             filename="mockdir/krux-v0.0.1.zip",
             regexp=r"^.*\.zip$",
             signature=mock_sig_check_verifyer().data,
-            pubkey=mock_pem_check_verifyer().data,
+            pubkey=mock_get_trust_store().pem,
+            digest=None,
+        )
+        mock_sig_verifyer().load.assert_called_once()
+        mock_sig_verifyer().verify.assert_called_once()
+        mock_get_verification_cache.return_value.put.assert_called_once_with(
+            "mockdir/krux-v0.0.1.zip",
+            mock_sig_check_verifyer().data,
+            mock_get_trust_store().pem,
+            digest=mock_sig_verifyer().digest,
+            verified=mock_sig_verifyer().verify(),
+        )
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.verify_stable_zip_screen.SigVerifyer")
+    @patch("src.app.screens.verify_stable_zip_screen.get_trust_store")
+    @patch("src.app.screens.verify_stable_zip_screen.SigCheckVerifyer")
+    @patch("src.app.screens.verify_stable_zip_screen.get_verification_cache")
+    def test_verify_signature_cached(
+        self,
+        mock_get_verification_cache,
+        mock_sig_check_verifyer,
+        mock_get_trust_store,
+        mock_sig_verifyer,
+        mock_get_locale,
+    ):
+        mock_get_verification_cache.return_value.lookup.return_value = {
+            "digest": "abcd",
+            "verified": True,
+        }
+        screen = VerifyStableZipScreen()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        actual = screen.verify_signature(assets_dir="mockdir", version="v0.0.1")
+
+        # default assertions
+        self.assertTrue(actual)
+
+        # patch assertions
+        mock_get_locale.assert_called()
+        mock_get_verification_cache.return_value.lookup.assert_called_once_with(
+            "mockdir/krux-v0.0.1.zip",
+            mock_sig_check_verifyer().data,
+            mock_get_trust_store().pem,
+        )
+        mock_sig_verifyer.assert_not_called()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.verify_stable_zip_screen.SigVerifyer")
+    @patch("src.app.screens.verify_stable_zip_screen.get_trust_store")
+    @patch("src.app.screens.verify_stable_zip_screen.SigCheckVerifyer")
+    @patch("src.app.screens.verify_stable_zip_screen.get_verification_cache")
+    def test_verify_signature_rotated_key(
+        self,
+        mock_get_verification_cache,
+        mock_sig_check_verifyer,
+        mock_get_trust_store,
+        mock_sig_verifyer,
+        mock_get_locale,
+    ):
+        mock_get_verification_cache.return_value.lookup.return_value = None
+        mock_sig_verifyer.return_value.verify.return_value = False
+        mock_get_trust_store.return_value.is_rotated.return_value = True
+        screen = VerifyStableZipScreen()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        actual = screen.verify_signature(assets_dir="mockdir", version="v0.0.1")
+
+        # a rotated key is not trusted, so it fails closed
+        self.assertFalse(actual)
+
+        # patch assertions
+        mock_get_locale.assert_called()
+        mock_get_trust_store.return_value.is_rotated.assert_called_once()
+        mock_sig_verifyer.assert_called_once()
+        mock_get_verification_cache.return_value.put.assert_called_once_with(
+            "mockdir/krux-v0.0.1.zip",
+            mock_sig_check_verifyer().data,
+            mock_get_trust_store().pem,
+            digest=mock_sig_verifyer().digest,
+            verified=False,
         )
 
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.verify_stable_zip_screen.get_trust_store")
+    @patch("src.app.screens.verify_stable_zip_screen.get_verification_cache")
+    @patch("src.app.screens.verify_stable_zip_screen.Clock.schedule_once")
+    def test_verify_hash_file_once(
+        self,
+        mock_schedule_once,
+        mock_get_verification_cache,
+        mock_get_trust_store,
+        mock_get_locale,
+    ):
+        mock_get_verification_cache.return_value.lookup.return_value = None
+        mock_get_trust_store.return_value.pem = SELFCUSTODY_PEM
+        mock_get_trust_store.return_value.is_rotated.return_value = False
+        screen = VerifyStableZipScreen()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            zipfile = os.path.join(tmpdir, "krux-v0.0.1.zip")
+            with open(zipfile, "wb") as f:
+                f.write(b"PK\x05\x06" + b"\x00" * 18)
+            with open(zipfile, "rb") as f:
+                sha256 = hashlib.sha256(f.read()).hexdigest()
+            with open(f"{zipfile}.sha256.txt", "w", encoding="utf8") as f:
+                f.write(f"{sha256} krux-v0.0.1.zip")
+            with open(f"{zipfile}.sig", "wb") as f:
+                # a DER encoded ECDSA signature (r=1, s=1)
+                f.write(b"\x30\x06\x02\x01\x01\x02\x01\x01")
+
+            # hashed by the integrity verification (no digest sidecar),
+            # then by the authenticity verification (digest sidecar)
+            for _ in range(2):
+                with patch(
+                    "src.utils.verifyer.sha256_verifyer.hash_file", wraps=hash_file
+                ) as mock_sha256_hash_file, patch(
+                    "src.utils.verifyer.sig_verifyer.hash_file", wraps=hash_file
+                ) as mock_sig_hash_file:
+                    checksummed = screen.verify_sha256(
+                        assets_dir=tmpdir, version="v0.0.1"
+                    )[2]
+                    screen.verify_signature(assets_dir=tmpdir, version="v0.0.1")
+
+                self.assertTrue(checksummed)
+                self.assertEqual(
+                    mock_sha256_hash_file.call_count + mock_sig_hash_file.call_count,
+                    1,
+                )
+
+        # patch assertions
+        mock_get_locale.assert_called()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    def test_is_key_rotated_offline(self, mock_get_locale):
+        trust = MagicMock()
+        trust.is_rotated.side_effect = OSError("offline")
+        screen = VerifyStableZipScreen()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        self.assertFalse(screen.is_key_rotated(trust))
+        mock_get_locale.assert_called()
+        trust.is_rotated.assert_called_once()
+
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -157,8 +380,9 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
 
         # get your Window instance safely
         EventLoop.ensure_window()
-        screen.on_pre_enter()
-        screen.on_enter()
+
+        # wait the worker thread
+        screen.thread.join()
 
         # patch assertions
         mock_get_locale.assert_called()
@@ -170,6 +394,122 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
             assets_dir="mockdir", version=screen.manager.get_screen().version
         )
 
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.verify_stable_zip_screen.Clock.schedule_once")
+    @patch(
+        "src.app.screens.verify_stable_zip_screen.VerifyStableZipScreen.build_message_verify_sha256",
+        side_effect=ValueError("File mockdir/krux-v0.0.1.zip do not exist"),
+    )
+    def test_verify_exception(
+        self, mock_build_message_verify_sha256, mock_schedule_once, mock_get_locale
+    ):
+        screen = VerifyStableZipScreen()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+        mock_schedule_once.reset_mock()
+
+        screen.verify(assets_dir="mockdir", version="v0.0.1")
+
+        # patch assertions
+        mock_get_locale.assert_called()
+        mock_build_message_verify_sha256.assert_called_once()
+        fn = mock_schedule_once.call_args[0][0]
+        self.assertEqual(fn.keywords["key"], "exception")
+        self.assertIsInstance(fn.keywords["value"], ValueError)
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.verify_stable_zip_screen.Clock.schedule_once")
+    def test_on_hash_progress(self, mock_schedule_once, mock_get_locale):
+        screen = VerifyStableZipScreen()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+        mock_schedule_once.reset_mock()
+
+        screen.on_hash_progress(1024, 4096, check="Integrity verification")
+
+        # patch assertions
+        mock_get_locale.assert_called()
+        fn = mock_schedule_once.call_args[0][0]
+        self.assertEqual(fn.keywords["key"], "progress")
+        self.assertEqual(
+            fn.keywords["value"],
+            {
+                "check": "Integrity verification",
+                "hashed_len": 1024,
+                "total_len": 4096,
+            },
+        )
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    def test_update_progress(self, mock_get_locale):
+        screen = VerifyStableZipScreen()
+        screen.on_pre_enter()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        screen.update(
+            name=screen.name,
+            key="progress",
+            value={
+                "check": "Integrity verification",
+                "hashed_len": 1024,
+                "total_len": 4096,
+            },
+        )
+
+        # default assertions
+        self.assertEqual(
+            screen.ids[f"{screen.id}_label"].text,
+            "".join(
+                [
+                    "[color=#efcc00]Integrity verification[/color]",
+                    "\n",
+                    "\n",
+                    "[b]25.00 %[/b]",
+                    "\n",
+                    "1024 / 4096 B",
+                ]
+            ),
+        )
+
+        # patch assertions
+        mock_get_locale.assert_called()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    def test_update_verified(self, mock_get_locale):
+        screen = VerifyStableZipScreen()
+        screen.on_pre_enter()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        screen.update(name=screen.name, key="verified", value="mock")
+
+        # default assertions
+        self.assertEqual(screen.ids[f"{screen.id}_label"].text, "mock")
+
+        # patch assertions
+        mock_get_locale.assert_called()
+
     def test_prettyfy_hash(self):
         _hash = "f254692f766dc6b009c8ca7f43b674d088062685bb203b850f8b702f641b5935"
         pretty = VerifyStableZipScreen.prettyfy_hash(_hash)
@@ -481,6 +821,9 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         EventLoop.ensure_window()
         button = screen.ids[f"{screen.id}_label"]
 
+        # wait the worker thread
+        screen.thread.join()
+
         # DO tests
         action = getattr(screen.__class__, f"on_ref_press_{button.id}")
         action(None, "Back")
@@ -445,7 +445,11 @@ class TestConfigKruxInstaller(GraphicUnitTest):
         config.setdefaults.assert_has_calls(
             [
                 call("destdir", {"assets": "mockdir"}),
-                call("flash", {"baudrate": 1500000}),
+                call("flash", {"baudrate": 1500000, "parallel": 0}),
+                call(
+                    "download",
+                    {"connections": 1, "cache_size": 512, "warm_up": 0},
+                ),
                 call("locale", {"lang": "en_US.UTF-8"}),
             ]
         )
@@ -479,7 +483,11 @@ class TestConfigKruxInstaller(GraphicUnitTest):
         config.setdefaults.assert_has_calls(
             [
                 call("destdir", {"assets": "mockdir"}),
-                call("flash", {"baudrate": 1500000}),
+                call("flash", {"baudrate": 1500000, "parallel": 0}),
+                call(
+                    "download",
+                    {"connections": 1, "cache_size": 512, "warm_up": 0},
+                ),
                 call("locale", {"lang": "en_US.UTF-8"}),
             ]
         )
@@ -513,7 +521,11 @@ class TestConfigKruxInstaller(GraphicUnitTest):
         config.setdefaults.assert_has_calls(
             [
                 call("destdir", {"assets": "mockdir"}),
-                call("flash", {"baudrate": 1500000}),
+                call("flash", {"baudrate": 1500000, "parallel": 0}),
+                call(
+                    "download",
+                    {"connections": 1, "cache_size": 512, "warm_up": 0},
+                ),
                 call("locale", {"lang": "en_US"}),
             ]
         )
@@ -547,7 +559,11 @@ class TestConfigKruxInstaller(GraphicUnitTest):
         config.setdefaults.assert_has_calls(
             [
                 call("destdir", {"assets": "mockdir"}),
-                call("flash", {"baudrate": 1500000}),
+                call("flash", {"baudrate": 1500000, "parallel": 0}),
+                call(
+                    "download",
+                    {"connections": 1, "cache_size": 512, "warm_up": 0},
+                ),
                 call("locale", {"lang": "en_US"}),
             ]
         )
@@ -574,6 +590,34 @@ class TestConfigKruxInstaller(GraphicUnitTest):
                 "section": "flash",
                 "key": "baudrate",
             },
+            {
+                "type": "bool",
+                "title": "Flash all devices",
+                "desc": "Flash in parallel every connected device of the same kind",
+                "section": "flash",
+                "key": "parallel",
+            },
+            {
+                "type": "numeric",
+                "title": "Download connections",
+                "desc": "Parallel connections used to download large assets",
+                "section": "download",
+                "key": "connections",
+            },
+            {
+                "type": "numeric",
+                "title": "Download cache size",
+                "desc": "Maximum size (in MB) of downloaded assets kept for reuse",
+                "section": "download",
+                "key": "cache_size",
+            },
+            {
+                "type": "bool",
+                "title": "Pre-connect to GitHub",
+                "desc": "Open the connections to GitHub hosts while online, before downloads",
+                "section": "download",
+                "key": "warm_up",
+            },
             {
                 "type": "options",
                 "title": "Locale",
@@ -58,9 +58,6 @@ class TestConfigKruxInstaller(GraphicUnitTest):
             "WarningBetaScreen",
             "AboutScreen",
             "DownloadStableZipScreen",
-            "DownloadStableZipSha256Screen",
-            "DownloadStableZipSigScreen",
-            "DownloadSelfcustodyPemScreen",
             "VerifyStableZipScreen",
             "UnzipStableScreen",
             "DownloadBetaScreen",
@@ -104,9 +101,6 @@ class TestConfigKruxInstaller(GraphicUnitTest):
             "WarningBetaScreen",
             "AboutScreen",
             "DownloadStableZipScreen",
-            "DownloadStableZipSha256Screen",
-            "DownloadStableZipSigScreen",
-            "DownloadSelfcustodyPemScreen",
             "VerifyStableZipScreen",
             "UnzipStableScreen",
             "DownloadBetaScreen",
@@ -150,9 +144,6 @@ class TestConfigKruxInstaller(GraphicUnitTest):
             "WarningBetaScreen",
             "AboutScreen",
             "DownloadStableZipScreen",
-            "DownloadStableZipSha256Screen",
-            "DownloadStableZipSigScreen",
-            "DownloadSelfcustodyPemScreen",
             "VerifyStableZipScreen",
             "UnzipStableScreen",
             "DownloadBetaScreen",
@@ -196,9 +187,6 @@ class TestConfigKruxInstaller(GraphicUnitTest):
             "WarningBetaScreen",
             "AboutScreen",
             "DownloadStableZipScreen",
-            "DownloadStableZipSha256Screen",
-            "DownloadStableZipSigScreen",
-            "DownloadSelfcustodyPemScreen",
             "VerifyStableZipScreen",
             "UnzipStableScreen",
             "DownloadBetaScreen",
@@ -242,9 +230,6 @@ class TestConfigKruxInstaller(GraphicUnitTest):
             "WarningBetaScreen",
             "AboutScreen",
             "DownloadStableZipScreen",
-            "DownloadStableZipSha256Screen",
-            "DownloadStableZipSigScreen",
-            "DownloadSelfcustodyPemScreen",
             "VerifyStableZipScreen",
             "UnzipStableScreen",
             "DownloadBetaScreen",
@@ -299,9 +284,6 @@ class TestConfigKruxInstaller(GraphicUnitTest):
             "WarningBetaScreen",
             "AboutScreen",
             "DownloadStableZipScreen",
-            "DownloadStableZipSha256Screen",
-            "DownloadStableZipSigScreen",
-            "DownloadSelfcustodyPemScreen",
             "VerifyStableZipScreen",
             "UnzipStableScreen",
             "DownloadBetaScreen",
@@ -354,9 +336,6 @@ class TestConfigKruxInstaller(GraphicUnitTest):
             "WarningBetaScreen",
             "AboutScreen",
             "DownloadStableZipScreen",
-            "DownloadStableZipSha256Screen",
-            "DownloadStableZipSigScreen",
-            "DownloadSelfcustodyPemScreen",
             "VerifyStableZipScreen",
             "UnzipStableScreen",
             "DownloadBetaScreen",
@@ -394,9 +373,6 @@ class TestConfigKruxInstaller(GraphicUnitTest):
             "WarningBetaScreen",
             "AboutScreen",
             "DownloadStableZipScreen",
-            "DownloadStableZipSha256Screen",
-            "DownloadStableZipSigScreen",
-            "DownloadSelfcustodyPemScreen",
             "VerifyStableZipScreen",
             "UnzipStableScreen",
             "DownloadBetaScreen",
@@ -432,9 +408,6 @@ class TestConfigKruxInstaller(GraphicUnitTest):
             "WarningBetaScreen",
             "AboutScreen",
             "DownloadStableZipScreen",
-            "DownloadStableZipSha256Screen",
-            "DownloadStableZipSigScreen",
-            "DownloadSelfcustodyPemScreen",
             "VerifyStableZipScreen",
             "UnzipStableScreen",
             "DownloadBetaScreen",
@@ -449,3 +422,29 @@ class TestConfigKruxInstaller(GraphicUnitTest):
 
         mock_get_destdir_assets.assert_called_once()
         mock_get_locale.assert_called()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch.dict(os.environ, {"LANG": "en_US.UTF-8"}, clear=True)
+    @patch("src.app.AssetScrubber")
+    def test_on_start(self, mock_scrubber):
+        app = KruxInstallerApp()
+        app.config = MagicMock()
+        app.config.get = MagicMock(return_value="mock")
+        app.on_start()
+
+        app.config.get.assert_called_once_with("destdir", "assets")
+        mock_scrubber.assert_called_once_with(destdir="mock")
+        mock_scrubber.return_value.start.assert_called_once()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch.dict(os.environ, {"LANG": "en_US.UTF-8"}, clear=True)
+    @patch(
+        "src.app.AssetScrubber", side_effect=ValueError("Given path not exist: mock")
+    )
+    def test_on_start_without_destdir(self, mock_scrubber):
+        app = KruxInstallerApp()
+        app.config = MagicMock()
+        app.config.get = MagicMock(return_value="mock")
+        app.on_start()
+
+        mock_scrubber.assert_called_once_with(destdir="mock")
@@ -1,3 +1,4 @@
+import io
 from unittest.mock import patch, MagicMock, call
 from kivy.base import EventLoop, EventLoopBase
 from kivy.tests.common import GraphicUnitTest
@@ -52,6 +53,22 @@ class TestBaseFlashScreen(GraphicUnitTest):
         # patch assertions
         mock_get_locale.assert_called()
 
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.base_flash_screen.os.path.exists")
+    def test_set_firmware_stream(self, mock_exists, mock_get_locale):
+        screen = BaseFlashScreen(wid="mock_screen", name="MockScreen")
+        stream = io.BytesIO(b"kboot")
+        screen.firmware = stream
+        self.assertEqual(screen.firmware, stream)
+
+        mock_exists.assert_not_called()
+
+        # patch assertions
+        mock_get_locale.assert_called()
+
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -120,3 +137,16 @@ class TestBaseFlashScreen(GraphicUnitTest):
 
         # patch assertions
         mock_get_locale.assert_called()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.base_flash_screen.get_port_registry")
+    def test_on_leave(self, mock_get_port_registry, mock_get_locale):
+        screen = BaseFlashScreen(wid="mock_screen", name="MockScreen")
+        screen.on_leave()
+
+        # patch assertions
+        mock_get_locale.assert_called()
+        mock_get_port_registry.return_value.stop.assert_called_once()
@@ -1,3 +1,4 @@
+import io
 import threading
 from unittest.mock import patch, MagicMock, call
 from kivy.base import EventLoop, EventLoopBase
@@ -96,6 +97,23 @@ class TestFlashScreen(GraphicUnitTest):
         # patch assertions
         mock_get_locale.assert_called()
 
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    def test_update_device(self, mock_get_locale):
+        screen = FlashScreen()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+        screen.update(name=screen.name, key="device", value="amigo")
+
+        self.assertEqual(screen.flasher.device, "amigo")
+
+        # patch assertions
+        mock_get_locale.assert_called()
+
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -118,6 +136,27 @@ class TestFlashScreen(GraphicUnitTest):
         mock_get_locale.assert_called()
         mock_exists.assert_has_calls([call("mock.kfpkg"), call("mock.kfpkg")])
 
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    def test_update_flasher_stream(self, mock_get_locale):
+        screen = FlashScreen()
+        stream = io.BytesIO(b"kboot")
+        screen.firmware = stream
+        screen.baudrate = 1500000
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+        screen.update(name=screen.name, key="flasher")
+
+        self.assertIs(screen.flasher.firmware, stream)
+        self.assertEqual(screen.flasher.baudrate, 1500000)
+
+        # patch assertions
+        mock_get_locale.assert_called()
+
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -381,14 +420,167 @@ class TestFlashScreen(GraphicUnitTest):
         # patch assertions
         mock_get_locale.assert_any_call()
 
+    @patch("src.app.screens.flash_screen.get_port_registry")
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.flash_screen.get_parallel_flash", return_value=True)
+    @patch("src.app.screens.flash_screen.threading.Thread")
+    def test_on_enter_parallel(
+        self,
+        mock_thread,
+        mock_get_parallel_flash,
+        mock_get_locale,
+        mock_get_port_registry,
+    ):
+        screen = FlashScreen()
+        screen.flasher = MagicMock()
+
+        screen.on_pre_enter()
+        screen.on_enter()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        # patch assertions
+        mock_get_locale.assert_called()
+        mock_get_parallel_flash.assert_called_once()
+        mock_thread.assert_called_once_with(name=screen.name, target=screen.flash_all)
+        mock_get_port_registry.return_value.start.assert_called_once()
+
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
+    def test_on_process_port(self, mock_get_locale):
+        screen = FlashScreen()
+        screen.on_pre_enter()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        on_process_port = getattr(FlashScreen, "on_process_port")
+        with patch("src.app.screens.flash_screen.Clock") as mock_clock:
+            mock_clock.schedule_once.side_effect = lambda fn, dt: fn(dt)
+            on_process_port("/dev/ttyUSB0", "firmware.bin", 1, 2, "21 KiB/s")
+            on_process_port("/dev/ttyUSB1", "firmware.bin", 1, 4, "21 KiB/s")
+
+        # changed in main thread
+        self.assertEqual(mock_clock.schedule_once.call_count, 2)
+
+        text = "\n".join(
+            [
+                "[b]PLEASE DO NOT UNPLUG YOUR DEVICE[/b]",
+                "/dev/ttyUSB0: 50.00 % [color=#efcc00]firmware.bin[/color] at 21 KiB/s",
+                "/dev/ttyUSB1: 25.00 % [color=#efcc00]firmware.bin[/color] at 21 KiB/s",
+            ]
+        )
+        self.assertEqual(screen.ids[f"{screen.id}_progress"].text, text)
+
+        # patch assertions
+        mock_get_locale.assert_any_call()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    def test_on_data_port(self, mock_get_locale):
+        screen = FlashScreen()
+        screen.output = []
+        screen.on_pre_enter()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        on_data_port = getattr(FlashScreen, "on_data_port")
+        with patch("src.app.screens.flash_screen.Clock") as mock_clock:
+            mock_clock.schedule_once.side_effect = lambda fn, dt: fn(dt)
+            on_data_port("/dev/ttyUSB0", "\x1b[32m\x1b[1m[INFO]\x1b[0m Rebooting...")
+            on_data_port("/dev/ttyUSB0", "mock")
+
+        # changed in main thread
+        self.assertEqual(mock_clock.schedule_once.call_count, 2)
+
+        self.assertEqual(
+            screen.output, ["/dev/ttyUSB0: [color=#00ff00]INFO[/color] Rebooting..."]
+        )
+
+        # patch assertions
+        mock_get_locale.assert_any_call()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    def test_flash_all(self, mock_get_locale):
+        screen = FlashScreen()
+        screen.flasher = MagicMock()
+        screen.flasher.flash_all.return_value = {
+            "/dev/ttyUSB0": {"success": True, "error": None}
+        }
+        screen.on_pre_enter()
+        screen.done = MagicMock()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        screen.flash_all()
+
+        # patch assertions
+        mock_get_locale.assert_any_call()
+        screen.flasher.flash_all.assert_called_once_with(
+            callback=getattr(FlashScreen, "on_process_port"),
+            on_data=getattr(FlashScreen, "on_data_port"),
+        )
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    def test_fail_flash_all(self, mock_get_locale):
+        screen = FlashScreen()
+        screen.flasher = MagicMock()
+        screen.flasher.flash_all.return_value = {
+            "/dev/ttyUSB0": {"success": True, "error": None},
+            "/dev/ttyUSB1": {"success": False, "error": "Greeting fail"},
+        }
+        screen.on_pre_enter()
+        self.render(screen)
+
+        # get your Window instance safely
+        EventLoop.ensure_window()
+
+        with self.assertRaises(RuntimeError) as exc_info:
+            screen.flash_all()
+
+        self.assertEqual(str(exc_info.exception), "/dev/ttyUSB1: Greeting fail")
+
+        # patch assertions
+        mock_get_locale.assert_any_call()
+
+    @patch("src.app.screens.flash_screen.get_port_registry")
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.flash_screen.get_parallel_flash", return_value=False)
     @patch("src.app.screens.flash_screen.partial")
     @patch("src.app.screens.flash_screen.threading.Thread")
     @patch("src.utils.flasher.Flasher")
-    def test_on_enter(self, mock_flasher, mock_thread, mock_partial, mock_get_locale):
+    def test_on_enter(
+        self,
+        mock_flasher,
+        mock_thread,
+        mock_partial,
+        mock_get_parallel_flash,
+        mock_get_locale,
+        mock_get_port_registry,
+    ):
         mock_flasher.__class__.print_callback = MagicMock()
 
         screen = FlashScreen()
@@ -416,11 +608,14 @@ class TestFlashScreen(GraphicUnitTest):
             any_order=True,
         )
         mock_thread.assert_called_once_with(name=screen.name, target=mock_partial())
+        mock_get_port_registry.return_value.start.assert_called_once()
 
+    @patch("src.app.screens.flash_screen.get_port_registry")
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
+    @patch("src.app.screens.flash_screen.get_parallel_flash", return_value=False)
     @patch("src.app.screens.flash_screen.partial")
     @patch("src.app.screens.flash_screen.threading.Thread")
     @patch("src.utils.flasher.Flasher")
@@ -431,7 +626,9 @@ class TestFlashScreen(GraphicUnitTest):
         mock_flasher,
         mock_thread,
         mock_partial,
+        mock_get_parallel_flash,
         mock_get_locale,
+        mock_get_port_registry,
     ):
         mock_flasher.__class__.print_callback = MagicMock()
 
@@ -473,10 +670,12 @@ class TestFlashScreen(GraphicUnitTest):
         mock_thread.assert_called_once_with(name=screen.name, target=mock_partial())
         mock_redirect_exception.assert_called()
 
+    @patch("src.app.screens.flash_screen.get_port_registry")
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
+    @patch("src.app.screens.flash_screen.get_parallel_flash", return_value=False)
     @patch("src.app.screens.flash_screen.partial")
     @patch("src.app.screens.flash_screen.threading.Thread")
     @patch("src.utils.flasher.Flasher")
@@ -487,7 +686,9 @@ class TestFlashScreen(GraphicUnitTest):
         mock_flasher,
         mock_thread,
         mock_partial,
+        mock_get_parallel_flash,
         mock_get_locale,
+        mock_get_port_registry,
     ):
         mock_flasher.__class__.print_callback = MagicMock()
 
@@ -524,10 +725,12 @@ class TestFlashScreen(GraphicUnitTest):
         mock_thread.assert_called_once_with(name=screen.name, target=mock_partial())
         mock_redirect_exception.assert_called()
 
+    @patch("src.app.screens.flash_screen.get_port_registry")
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
+    @patch("src.app.screens.flash_screen.get_parallel_flash", return_value=False)
     @patch("src.app.screens.flash_screen.partial")
     @patch("src.app.screens.flash_screen.threading.Thread")
     @patch("src.utils.flasher.Flasher")
@@ -538,7 +741,9 @@ class TestFlashScreen(GraphicUnitTest):
         mock_flasher,
         mock_thread,
         mock_partial,
+        mock_get_parallel_flash,
         mock_get_locale,
+        mock_get_port_registry,
     ):
         mock_flasher.__class__.print_callback = MagicMock()
 
@@ -232,13 +232,21 @@ class TestWipeScreen(GraphicUnitTest):
         # patch assertions
         mock_get_locale.assert_any_call()
 
+    @patch("src.app.screens.wipe_screen.get_port_registry")
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
     @patch("src.app.screens.wipe_screen.partial")
     @patch("src.app.screens.wipe_screen.threading.Thread")
     @patch("src.utils.flasher.Flasher")
-    def test_on_enter(self, mock_flasher, mock_thread, mock_partial, mock_get_locale):
+    def test_on_enter(
+        self,
+        mock_flasher,
+        mock_thread,
+        mock_partial,
+        mock_get_locale,
+        mock_get_port_registry,
+    ):
         mock_flasher.__class__.print_callback = MagicMock()
 
         screen = WipeScreen()
@@ -265,7 +273,9 @@ class TestWipeScreen(GraphicUnitTest):
             any_order=True,
         )
         mock_thread.assert_called_once_with(name=screen.name, target=mock_partial())
+        mock_get_port_registry.return_value.start.assert_called_once()
 
+    @patch("src.app.screens.wipe_screen.get_port_registry")
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
@@ -280,6 +290,7 @@ class TestWipeScreen(GraphicUnitTest):
         mock_thread,
         mock_partial,
         mock_get_locale,
+        mock_get_port_registry,
     ):
         mock_flasher.__class__.print_callback = MagicMock()
 
@@ -322,6 +333,7 @@ class TestWipeScreen(GraphicUnitTest):
         mock_thread.assert_called_once_with(name=screen.name, target=mock_partial())
         mock_redirect_exception.assert_called()
 
+    @patch("src.app.screens.wipe_screen.get_port_registry")
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
@@ -336,6 +348,7 @@ class TestWipeScreen(GraphicUnitTest):
         mock_thread,
         mock_partial,
         mock_get_locale,
+        mock_get_port_registry,
     ):
         mock_flasher.__class__.print_callback = MagicMock()
 
@@ -378,6 +391,7 @@ class TestWipeScreen(GraphicUnitTest):
         mock_thread.assert_called_once_with(name=screen.name, target=mock_partial())
         mock_redirect_exception.assert_called()
 
+    @patch("src.app.screens.wipe_screen.get_port_registry")
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
@@ -392,6 +406,7 @@ class TestWipeScreen(GraphicUnitTest):
         mock_thread,
         mock_partial,
         mock_get_locale,
+        mock_get_port_registry,
     ):
         mock_flasher.__class__.print_callback = MagicMock()
 
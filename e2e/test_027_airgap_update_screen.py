@@ -67,6 +67,19 @@ class TestAirgapUpdateScreen(GraphicUnitTest):
         self.assertEqual(screen.firmware_sig, os.path.join("mock", "firmware.bin.sig"))
         mock_get_locale.assert_any_call()
 
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    def test_update_firmware_digest(self, mock_get_locale):
+        screen = AirgapUpdateScreen()
+        self.assertIsNone(screen.firmware_digest)
+
+        screen.update(name=screen.name, key="digest", value="abcd")
+
+        self.assertEqual(screen.firmware_digest, "abcd")
+        mock_get_locale.assert_any_call()
+
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
@@ -136,16 +149,12 @@ class TestAirgapUpdateScreen(GraphicUnitTest):
     @patch("src.app.screens.base_screen.BaseScreen.set_background")
     @patch("src.app.screens.base_screen.BaseScreen.set_screen")
     @patch("src.app.screens.airgap_update_screen.shutil.copyfile")
-    @patch("src.utils.verifyer.sha256_verifyer.os.path.exists", return_value=True)
-    @patch(
-        "src.utils.verifyer.sha256_verifyer.open",
-        new_callable=mock_open,
-        read_data=MOCK_SIG,
-    )
+    @patch("src.app.screens.airgap_update_screen.hash_copy", return_value="abcd")
+    @patch("src.app.screens.airgap_update_screen.open", new_callable=mock_open)
     def test_on_release_button(
         self,
         open_mock,
-        mock_exists,
+        mock_hash_copy,
         mock_copyfile,
         mock_set_screen,
         mock_set_background,
@@ -157,6 +166,8 @@ class TestAirgapUpdateScreen(GraphicUnitTest):
         screen.manager = MagicMock()
         screen.manager.get_screen = MagicMock()
 
+        screen.update(name=screen.name, key="binary", value="firmware.bin")
+        screen.update(name=screen.name, key="digest", value="abcd")
         screen.update(name=screen.name, key="drives", value=[os.path.join("mock", "0")])
 
         action = getattr(AirgapUpdateScreen, f"on_release_{screen.id}_button_0")
@@ -172,5 +183,51 @@ class TestAirgapUpdateScreen(GraphicUnitTest):
             name="WarningAfterAirgapUpdateScreen", direction="left"
         )
         mock_copyfile.assert_called()
-        mock_exists.assert_called()
-        open_mock.assert_called()
+        open_mock.assert_called_once_with("firmware.bin", "rb")
+        mock_hash_copy.assert_called_once_with(
+            open_mock(), os.path.join("mock", "0", "firmware.bin")
+        )
+        mock_partial.assert_any_call(
+            screen.manager.get_screen().update,
+            name=screen.name,
+            key="hash",
+            value="abcd",
+        )
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch(
+        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
+    )
+    @patch("src.app.screens.base_screen.BaseScreen.redirect_exception")
+    @patch("src.app.screens.base_screen.BaseScreen.set_screen")
+    @patch("src.app.screens.airgap_update_screen.shutil.copyfile")
+    @patch("src.app.screens.airgap_update_screen.hash_copy", return_value="efgh")
+    @patch("src.app.screens.airgap_update_screen.open", new_callable=mock_open)
+    def test_fail_on_release_button_corrupted_copy(
+        self,
+        open_mock,
+        mock_hash_copy,
+        mock_copyfile,
+        mock_set_screen,
+        mock_redirect_exception,
+        mock_get_locale,
+    ):
+        screen = AirgapUpdateScreen()
+        screen.manager = MagicMock()
+        screen.manager.get_screen = MagicMock()
+
+        screen.update(name=screen.name, key="binary", value="firmware.bin")
+        screen.update(name=screen.name, key="digest", value="abcd")
+        screen.update(name=screen.name, key="drives", value=[os.path.join("mock", "0")])
+
+        action = getattr(AirgapUpdateScreen, f"on_release_{screen.id}_button_0")
+        action(screen.ids[f"{screen.id}_button_0"])
+
+        mock_get_locale.assert_any_call()
+        mock_hash_copy.assert_called_once()
+        mock_set_screen.assert_not_called()
+        exc = mock_redirect_exception.call_args.kwargs["exception"]
+        self.assertEqual(
+            str(exc),
+            f"Corrupted copy of firmware: {os.path.join('mock', '0', 'firmware.bin')}",
+        )
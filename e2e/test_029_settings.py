@@ -0,0 +1,120 @@
+from unittest.mock import patch, call, MagicMock
+from kivy.base import EventLoop, EventLoopBase
+from kivy.tests.common import GraphicUnitTest
+from src.app.settings import (
+    get_parallel_flash,
+    get_download_connections,
+    get_warm_up,
+    get_artifact_store,
+    get_trust_store,
+    get_verification_cache,
+)
+
+
+class TestSettings(GraphicUnitTest):
+
+    @classmethod
+    def teardown_class(cls):
+        EventLoop.exit()
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch("src.app.settings.App.get_running_app")
+    def test_get_parallel_flash(self, mock_get_ruunning_app):
+        mock_get_ruunning_app.return_value = MagicMock()
+        mock_get_ruunning_app.return_value.config = MagicMock()
+        mock_get_ruunning_app.return_value.config.get = MagicMock()
+        mock_get_ruunning_app.return_value.config.get.side_effect = ["1", "0"]
+
+        # your asserts
+        self.assertTrue(get_parallel_flash())
+        self.assertFalse(get_parallel_flash())
+        mock_get_ruunning_app.return_value.config.get.assert_called_with(
+            "flash", "parallel"
+        )
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch("src.app.settings.App.get_running_app")
+    def test_get_download_connections(self, mock_get_ruunning_app):
+        mock_get_ruunning_app.return_value = MagicMock()
+        mock_get_ruunning_app.return_value.config = MagicMock()
+        mock_get_ruunning_app.return_value.config.get = MagicMock()
+        mock_get_ruunning_app.return_value.config.get.side_effect = ["4", "0"]
+
+        # your asserts
+        self.assertEqual(get_download_connections(), 4)
+        self.assertEqual(get_download_connections(), 1)
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch("src.app.settings.App.get_running_app")
+    def test_get_warm_up(self, mock_get_ruunning_app):
+        mock_get_ruunning_app.return_value = MagicMock()
+        mock_get_ruunning_app.return_value.config = MagicMock()
+        mock_get_ruunning_app.return_value.config.get = MagicMock()
+        mock_get_ruunning_app.return_value.config.get.side_effect = ["0", "1"]
+
+        # your asserts
+        self.assertFalse(get_warm_up())
+        self.assertTrue(get_warm_up())
+        mock_get_ruunning_app.return_value.config.get.assert_called_with(
+            "download", "warm_up"
+        )
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch("src.app.settings.get_store")
+    @patch("src.app.settings.App.get_running_app")
+    def test_get_artifact_store(self, mock_get_ruunning_app, mock_get_store):
+        mock_get_ruunning_app.return_value = MagicMock()
+        mock_get_ruunning_app.return_value.config = MagicMock()
+        mock_get_ruunning_app.return_value.config.get = MagicMock(
+            side_effect=["64", "mockdir"]
+        )
+
+        # your asserts
+        self.assertEqual(get_artifact_store(), mock_get_store.return_value)
+        mock_get_ruunning_app.return_value.config.get.assert_has_calls(
+            [call("download", "cache_size"), call("destdir", "assets")]
+        )
+        mock_get_store.assert_called_once_with(destdir="mockdir", quota=64 * (1 << 20))
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch("src.app.settings.TrustStore")
+    @patch("src.app.settings.get_artifact_store")
+    @patch("src.app.settings.App.get_running_app")
+    def test_get_trust_store(
+        self, mock_get_ruunning_app, mock_get_artifact_store, mock_trust_store
+    ):
+        mock_get_ruunning_app.return_value = MagicMock()
+        mock_get_ruunning_app.return_value.config = MagicMock()
+        mock_get_ruunning_app.return_value.config.get = MagicMock(
+            return_value="mockdir"
+        )
+
+        # your asserts
+        self.assertEqual(get_trust_store(), mock_trust_store.return_value)
+        mock_get_ruunning_app.return_value.config.get.assert_called_once_with(
+            "destdir", "assets"
+        )
+        mock_trust_store.assert_called_once_with(
+            root="mockdir", store=mock_get_artifact_store.return_value
+        )
+
+    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
+    @patch("src.app.settings.verification_cache.get_verification_cache")
+    @patch("src.app.settings.App.get_running_app")
+    def test_get_verification_cache(
+        self, mock_get_ruunning_app, mock_get_verification_cache
+    ):
+        mock_get_ruunning_app.return_value = MagicMock()
+        mock_get_ruunning_app.return_value.create_app_dir = MagicMock(
+            return_value="mocklocal"
+        )
+
+        # your asserts
+        self.assertEqual(
+            get_verification_cache(),
+            mock_get_verification_cache.return_value,
+        )
+        mock_get_ruunning_app.return_value.create_app_dir.assert_called_once_with(
+            name="local"
+        )
+        mock_get_verification_cache.assert_called_once_with(root="mocklocal")
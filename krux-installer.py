@@ -23,6 +23,11 @@ krux-installer.py
 """
 
 if __name__ == "__main__":
+    import multiprocessing
+
+    # needed by the pool of processes of scrubber on frozen executables
+    multiprocessing.freeze_support()
+
     from src.app import KruxInstallerApp
 
     app = KruxInstallerApp()
@@ -24,15 +24,11 @@ __init__.py
 import sys
 from kivy.core.window import Window
 from src.app.config_krux_installer import ConfigKruxInstaller
+from src.utils.scrubber import AssetScrubber
 from src.app.screens.about_screen import AboutScreen
 from src.app.screens.ask_permission_dialout_screen import AskPermissionDialoutScreen
 from src.app.screens.download_beta_screen import DownloadBetaScreen
-from src.app.screens.download_selfcustody_pem_screen import DownloadSelfcustodyPemScreen
 from src.app.screens.download_stable_zip_screen import DownloadStableZipScreen
-from src.app.screens.download_stable_zip_sha256_screen import (
-    DownloadStableZipSha256Screen,
-)
-from src.app.screens.download_stable_zip_sig_screen import DownloadStableZipSigScreen
 from src.app.screens.error_screen import ErrorScreen
 from src.app.screens.flash_screen import FlashScreen
 from src.app.screens.greetings_screen import GreetingsScreen
@@ -65,7 +61,7 @@ class KruxInstallerApp(ConfigKruxInstaller):
         # Window.maximize()
         # Window.fullscreen = 'auto'
         Window.size = (1000, 800)
-        self.debug(f"Window.size={Window.size}")
+        self.debug("Window.size=%s", Window.size)
         Window.clearcolor = (0.9, 0.9, 0.9, 1)
 
     def build(self):
@@ -84,9 +80,6 @@ class KruxInstallerApp(ConfigKruxInstaller):
             WarningBetaScreen(),
             AboutScreen(),
             DownloadStableZipScreen(),
-            DownloadStableZipSha256Screen(),
-            DownloadStableZipSigScreen(),
-            DownloadSelfcustodyPemScreen(),
             VerifyStableZipScreen(),
             UnzipStableScreen(),
             DownloadBetaScreen(),
@@ -106,3 +99,13 @@ class KruxInstallerApp(ConfigKruxInstaller):
             self.screen_manager.add_widget(screen)
 
         return self.screen_manager
+
+    def on_start(self):
+        """
+        Start the background verification of downloaded assets
+        """
+        try:
+            scrubber = AssetScrubber(destdir=self.config.get("destdir", "assets"))
+            scrubber.start()
+        except ValueError as exc:
+            self.warning("on_start::scrubber=%s", exc)
@@ -50,23 +50,23 @@ class BaseKruxInstaller(App, Trigger):
     @property
     def screens(self) -> typing.List[Screen]:
         """Getter of :class:`kivy.uix.screenmanager.Screen`"""
-        self.debug(f"screens::setter={self._screens}")
+        self.debug("screens::setter=%s", self._screens)
         return self._screens
 
     @screens.setter
     def screens(self, value: typing.List[Screen]):
         """Setter of :class:`kivy.uix.screenmanager.Screen`"""
-        self.debug(f"screens::getter={value}")
+        self.debug("screens::getter=%s", value)
         self._screens = value
 
     @property
     def screen_manager(self) -> ScreenManager:
         """Getter of :class:`kivy.uix.screenmanager.ScreenManager`"""
-        self.debug(f"screen_manager::setter={self._screen_manager}")
+        self.debug("screen_manager::setter=%s", self._screen_manager)
         return self._screen_manager
 
     @screen_manager.setter
     def screen_manager(self, value: typing.List[Screen]):
         """Setter of :class:`kivy.uix.screenmanager.ScreenManager`"""
-        self.debug(f"screen_manager::getter={value}")
+        self.debug("screen_manager::getter=%s", value)
         self._screen_manager = value
@@ -21,6 +21,7 @@
 """
 config_krux_installer.py
 """
+from __future__ import annotations
 import os
 import sys
 import json
@@ -50,7 +51,7 @@ class ConfigKruxInstaller(BaseKruxInstaller, Trigger):
         if getattr(sys, "frozen", False):
             # this is a Pyinstaller bundle
             _meipass = getattr(sys, "_MEIPASS")
-            self.info(f"Adding resources from {_meipass}")
+            self.info("Adding resources from %s", _meipass)
             kv_resources.resource_add_path(_meipass)
             self.assets_path = os.path.join(_meipass, "assets")
             self.i18n_path = os.path.join(_meipass, "src", "i18n")
@@ -61,7 +62,7 @@ class ConfigKruxInstaller(BaseKruxInstaller, Trigger):
             self.assets_path = os.path.abspath(rel_assets_path)
             self.i18n_path = os.path.abspath(rel_i18n_path)
 
-        self.info(f"Registering assets path={self.assets_path}")
+        self.info("Registering assets path=%s", self.assets_path)
 
         font_name = "NotoSansCJK_CY_JP_SC_KR_VI_Krux.ttf"
         noto_sans_path = os.path.join(self.assets_path, font_name)
@@ -139,10 +140,10 @@ class ConfigKruxInstaller(BaseKruxInstaller, Trigger):
     def get_application_config(self) -> str:
         """Custom path for config.ini"""
         dirname = ConfigKruxInstaller.create_app_dir(name="config")
-        self.debug(f"Application directory: {dirname}")
+        self.debug("Application directory: %s", dirname)
 
         file = ConfigKruxInstaller.create_app_file(context="config", name="config.ini")
-        self.debug(f"ConfigKruxInstaller.get_application_config = {file}")
+        self.debug("ConfigKruxInstaller.get_application_config = %s", file)
 
         return super().get_application_config(file)
 
@@ -151,11 +152,24 @@ class ConfigKruxInstaller(BaseKruxInstaller, Trigger):
         _dir = ConfigKruxInstaller.create_app_dir(name="local")
 
         config.setdefaults("destdir", {"assets": _dir})
-        self.debug(f"{config}.destdir={_dir}")
+        self.debug("%s.destdir=%s", config, _dir)
 
         baudrate = 1500000
-        config.setdefaults("flash", {"baudrate": baudrate})
-        self.debug(f"{config}.baudrate={baudrate}")
+        parallel = 0
+        config.setdefaults("flash", {"baudrate": baudrate, "parallel": parallel})
+        self.debug("%s.baudrate=%s", config, baudrate)
+        self.debug("%s.parallel=%s", config, parallel)
+
+        connections = 1
+        cache_size = 512
+        warm_up = 0
+        config.setdefaults(
+            "download",
+            {"connections": connections, "cache_size": cache_size, "warm_up": warm_up},
+        )
+        self.debug("%s.connections=%s", config, connections)
+        self.debug("%s.cache_size=%s", config, cache_size)
+        self.debug("%s.warm_up=%s", config, warm_up)
 
         lang = ConfigKruxInstaller.get_system_lang()
 
@@ -165,20 +179,22 @@ class ConfigKruxInstaller(BaseKruxInstaller, Trigger):
             lang_file = os.path.join(self.i18n_path, f"{lang}.json")
             if os.path.isfile(lang_file):
                 config.setdefaults("locale", {"lang": lang})
-                self.info(f"{config}.lang={lang}")
+                self.info("%s.lang=%s", config, lang)
 
             else:
-                self.warning(f"{lang} not supported. Default {config}.lang=en_US.UTF-8")
+                self.warning(
+                    "%s not supported. Default %s.lang=en_US.UTF-8", lang, config
+                )
                 config.setdefaults("locale", {"lang": "en_US.UTF-8"})
 
         if sys.platform == "win32":
             lang_file = os.path.join(self.i18n_path, f"{lang}.UTF-8.json")
             if os.path.isfile(lang_file):
                 config.setdefaults("locale", {"lang": lang})
-                self.info(f"{config}.lang={lang}")
+                self.info("%s.lang=%s", config, lang)
 
             else:
-                self.warning(f"{lang} not supported. Default {config}.lang=en_US")
+                self.warning("%s not supported. Default %s.lang=en_US", lang, config)
                 config.setdefaults("locale", {"lang": "en_US"})
 
     def build_settings(self, settings):
@@ -198,6 +214,34 @@ class ConfigKruxInstaller(BaseKruxInstaller, Trigger):
                 "section": "flash",
                 "key": "baudrate",
             },
+            {
+                "type": "bool",
+                "title": "Flash all devices",
+                "desc": "Flash in parallel every connected device of the same kind",
+                "section": "flash",
+                "key": "parallel",
+            },
+            {
+                "type": "numeric",
+                "title": "Download connections",
+                "desc": "Parallel connections used to download large assets",
+                "section": "download",
+                "key": "connections",
+            },
+            {
+                "type": "numeric",
+                "title": "Download cache size",
+                "desc": "Maximum size (in MB) of downloaded assets kept for reuse",
+                "section": "download",
+                "key": "cache_size",
+            },
+            {
+                "type": "bool",
+                "title": "Pre-connect to GitHub",
+                "desc": "Open the connections to GitHub hosts while online, before downloads",
+                "section": "download",
+                "key": "warm_up",
+            },
             {
                 "type": "options",
                 "title": "Locale",
@@ -222,7 +266,7 @@ class ConfigKruxInstaller(BaseKruxInstaller, Trigger):
         ]
 
         json_str = json.dumps(json_data)
-        self.debug(f"{settings}.data={json_str}")
+        self.debug("%s.data=%s", settings, json_str)
         settings.add_json_panel("Settings", self.config, data=json_str)
 
     def make_main_partials(self, partials: typing.List[typing.Callable], loc: str):
@@ -310,43 +354,6 @@ class ConfigKruxInstaller(BaseKruxInstaller, Trigger):
             )
         )
 
-    def make_down_zip_sha_partials(
-        self, partials: typing.List[typing.Callable], loc: str
-    ):
-        """Update locales for DownloadStableZipSha256Screen"""
-        down_sha_zip = self.screen_manager.get_screen("DownloadStableZipSha256Screen")
-        partials.append(
-            partial(
-                down_sha_zip.update,
-                name="ConfigKruxInstaller",
-                key="locale",
-                value=loc,
-            )
-        )
-
-    def make_down_zip_sig_partials(
-        self, partials: typing.List[typing.Callable], loc: str
-    ):
-        """Update locales for DownloadStableZipSigScreen"""
-        down_sig_zip = self.screen_manager.get_screen("DownloadStableZipSigScreen")
-        partials.append(
-            partial(
-                down_sig_zip.update,
-                name="ConfigKruxInstaller",
-                key="locale",
-                value=loc,
-            )
-        )
-
-    def make_down_pem_partials(self, partials: typing.List[typing.Callable], loc: str):
-        """Update locales for DownloadSelfcustodyPemScreen"""
-        down_pem = self.screen_manager.get_screen("DownloadSelfcustodyPemScreen")
-        partials.append(
-            partial(
-                down_pem.update, name="ConfigKruxInstaller", key="locale", value=loc
-            )
-        )
-
     def make_down_beta_partials(self, partials: typing.List[typing.Callable], loc: str):
         """Update locales for DownloadBetaScreen"""
         down_beta = self.screen_manager.get_screen("DownloadBetaScreen")
@@ -464,9 +471,6 @@ class ConfigKruxInstaller(BaseKruxInstaller, Trigger):
             self.make_warn_stable_partials(partials=partials, loc=value)
             self.make_warn_beta_partials(partials=partials, loc=value)
             self.make_down_zip_partials(partials=partials, loc=value)
-            self.make_down_zip_sha_partials(partials=partials, loc=value)
-            self.make_down_zip_sig_partials(partials=partials, loc=value)
-            self.make_down_pem_partials(partials=partials, loc=value)
             self.make_down_beta_partials(partials=partials, loc=value)
             self.make_verify_partials(partials=partials, loc=value)
             self.make_unzip_partials(partials=partials, loc=value)
@@ -482,4 +486,4 @@ class ConfigKruxInstaller(BaseKruxInstaller, Trigger):
                 Clock.schedule_once(fn, 0)
 
         else:
-            self.debug(f"Skip on_config_change for {section}::{key}={value}")
+            self.debug("Skip on_config_change for %s::%s=%s", section, key, value)
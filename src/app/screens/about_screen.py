@@ -40,8 +40,8 @@ class AboutScreen(BaseScreen):
         self.make_grid(wid="about_screen_grid", rows=1)
 
         def on_ref_press(*args):
-            self.debug(f"Calling Button::{args[0]}::on_ref_press")
-            self.debug(f"Opening {args[1]}")
+            self.debug("Calling Button::%s::on_ref_press", args[0])
+            self.debug("Opening %s", args[1])
 
             if args[1] == "Back":
                 self.set_screen(name="MainScreen", direction="right")
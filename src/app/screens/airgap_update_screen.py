@@ -21,11 +21,12 @@
 """
 main_screen.py
 """
+from __future__ import annotations
 import os
 import shutil
 from functools import partial
 from kivy.clock import Clock
-from src.utils.verifyer.sha256_verifyer import Sha256Verifyer
+from src.utils.hasher import hash_copy
 from src.app.screens.base_screen import BaseScreen
 
 
@@ -39,12 +40,13 @@ class AirgapUpdateScreen(BaseScreen):
 
         self._firmware_bin = ""
         self._firmware_sig = ""
+        self._firmware_digest = None
 
     def build_drive_button(self, row: int, drive: str):
         """dynamically create a callback for copy process"""
 
         def on_press(instance):
-            self.debug(f"Calling {instance.id}::on_press")
+            self.debug("Calling %s::on_press", instance.id)
             self.set_background(wid=instance.id, rgba=(0.25, 0.25, 0.25, 1))
 
         setattr(AirgapUpdateScreen, f"on_press_{self.id}_button_{row}", on_press)
@@ -52,12 +54,18 @@ class AirgapUpdateScreen(BaseScreen):
         def on_release(instance):
             new_firmware_bin = os.path.join(drive, "firmware.bin")
             new_firmware_sig = os.path.join(drive, "firmware.bin.sig")
-            shutil.copyfile(self.firmware_bin, new_firmware_bin)
+
+            # The sha256 hash to show is computed while copying,
+            # and must match the one computed while unziping
+            with open(self.firmware_bin, "rb") as firmware:
+                digest = hash_copy(firmware, new_firmware_bin)
             shutil.copyfile(self.firmware_sig, new_firmware_sig)
 
-            # After copy, make sha256 hash to show
-            sha256 = Sha256Verifyer(filename=new_firmware_bin)
-            sha256.load()
+            if self.firmware_digest is not None and digest != self.firmware_digest:
+                exc = RuntimeError(f"Corrupted copy of firmware: {new_firmware_bin}")
+                self.error(str(exc))
+                self.redirect_exception(exception=exc)
+                return
 
             # Now update the next screen
             warn_screen = self.manager.get_screen("WarningAfterAirgapUpdateScreen")
@@ -73,7 +81,7 @@ class AirgapUpdateScreen(BaseScreen):
                     warn_screen.update,
                     name=self.name,
                     key="hash",
-                    value=sha256.data.split(" ", maxsplit=1)[0],
+                    value=digest,
                 ),
                 partial(warn_screen.update, name=self.name, key="label"),
             ]
@@ -113,27 +121,39 @@ class AirgapUpdateScreen(BaseScreen):
     @property
     def firmware_bin(self) -> str:
         """Getter for the full path of firmware.bin"""
-        self.debug(f"{self.id}::firmware_bin::getter={self._firmware_bin}")
+        self.debug("%s::firmware_bin::getter=%s", self.id, self._firmware_bin)
         return self._firmware_bin
 
     @firmware_bin.setter
     def firmware_bin(self, value: str):
         """Setter for the full path of firmware.bin"""
-        self.debug(f"{self.id}::firmware_bin::setter={self._firmware_bin}")
+        self.debug("%s::firmware_bin::setter=%s", self.id, self._firmware_bin)
         self._firmware_bin = value
 
     @property
     def firmware_sig(self) -> str:
         """Getter for the full path of firmware.bin.sig"""
-        self.debug(f"{self.id}::firmware_sig::getter={self._firmware_sig}")
+        self.debug("%s::firmware_sig::getter=%s", self.id, self._firmware_sig)
         return self._firmware_sig
 
     @firmware_sig.setter
     def firmware_sig(self, value: str):
         """Setter for the full path of firmware.bin.sig"""
-        self.debug(f"{self.id}::firmware_sig::setter={self._firmware_sig}")
+        self.debug("%s::firmware_sig::setter=%s", self.id, self._firmware_sig)
         self._firmware_sig = value
 
+    @property
+    def firmware_digest(self) -> str | None:
+        """Getter for the hex SHA-256 of firmware.bin computed while unziping"""
+        self.debug("%s::firmware_digest::getter=%s", self.id, self._firmware_digest)
+        return self._firmware_digest
+
+    @firmware_digest.setter
+    def firmware_digest(self, value: str | None):
+        """Setter for the hex SHA-256 of firmware.bin computed while unziping"""
+        self.debug("%s::firmware_digest::setter=%s", self.id, value)
+        self._firmware_digest = value
+
     # pylint: disable=unused-argument
     def update(self, *args, **kwargs):
         """Update screen with firmware.bin and firmware.bin.sig"""
@@ -153,6 +173,9 @@ class AirgapUpdateScreen(BaseScreen):
             if key == "signature":
                 self.firmware_sig = value
 
+            if key == "digest":
+                self.firmware_digest = value
+
         setattr(AirgapUpdateScreen, "on_update", on_update)
         self.update_screen(
             name=name,
@@ -80,7 +80,7 @@ class AskPermissionDialoutScreen(BaseScreen):
                 cmd.append(self.user)
 
                 try:
-                    self.debug(f"cmd={cmd}")
+                    self.debug("cmd=%s", cmd)
                     sudoer = SudoerLinux(name=f"Add {self.user} to {self.group}")
                     sudoer.exec(cmd=cmd, env={}, callback=on_permission_created)
 
@@ -21,6 +21,7 @@
 """
 base_download_screen.py
 """
+from __future__ import annotations
 import typing
 from functools import partial
 from threading import Thread
@@ -89,37 +90,37 @@ class BaseDownloadScreen(BaseScreen):
     @property
     def to_screen(self) -> str:
         """Get where the current screen will go"""
-        self.debug(f"getter::to_screen={self._to_screen}")
+        self.debug("getter::to_screen=%s", self._to_screen)
         return self._to_screen
 
     @to_screen.setter
     def to_screen(self, value: str):
         """Set where the current screen will go"""
-        self.debug(f"setter::to_screen={value}")
+        self.debug("setter::to_screen=%s", value)
         self._to_screen = value
 
     @property
     def downloader(self) -> AssetDownloader | None:
         """Get an `AssetDownloader`"""
-        self.debug(f"getter::downloader={self._downloader}")
+        self.debug("getter::downloader=%s", self._downloader)
         return self._downloader
 
     @downloader.setter
     def downloader(self, value: AssetDownloader):
         """Set an `AssetDownloader`"""
-        self.debug(f"setter::downloader={value}")
+        self.debug("setter::downloader=%s", value)
         self._downloader = value
 
     @downloader.deleter
     def downloader(self):
         """Delete an `AssetDownloader`"""
-        self.debug(f"deleter::downloader={self._downloader}")
+        self.debug("deleter::downloader=%s", self._downloader)
         del self._downloader
 
     @property
     def thread(self) -> Thread | None:
         """Return a Thread"""
-        self.debug(f"getter::thread={self._thread}")
+        self.debug("getter::thread=%s", self._thread)
         return self._thread
 
     @thread.setter
@@ -130,25 +131,25 @@ class BaseDownloadScreen(BaseScreen):
 
         See https://kivy.org/doc/stable/guide/events.html
         """
-        self.debug(f"setter::thread={self._thread}->{value}")
+        self.debug("setter::thread=%s->%s", self._thread, value)
         self._thread = value
 
     @property
     def trigger(self) -> ClockEvent:
         """Trigger is a `ClockEvent` that should be triggered after download is done"""
-        self.debug(f"getter::trigger={self._trigger}")
+        self.debug("getter::trigger=%s", self._trigger)
         return self._trigger
 
     @trigger.setter
     def trigger(self, value: typing.Callable):
         """Create a `ClockEvent` given a callback"""
-        self.debug(f"getter::trigger={value}")
+        self.debug("getter::trigger=%s", value)
         self._trigger = Clock.create_trigger(value)
 
     @trigger.deleter
     def trigger(self):
         """Delete a `ClockEvent`"""
-        self.debug(f"deleter::trigger={self._trigger}")
+        self.debug("deleter::trigger=%s", self._trigger)
         del self._trigger
 
     # pylint: disable=unused-argument
@@ -195,45 +196,3 @@ class BaseDownloadScreen(BaseScreen):
         if key == "progress":
             on_download_progress = getattr(self, "on_download_progress")
             on_download_progress(value)
-
-    @staticmethod
-    def make_download_info(
-        download_msg: str, from_url: str, to_msg: str, to_path: str
-    ) -> str:
-        """
-        download_stable_zip_sha256_screen and download_stable_zip_sig_screen
-        use same procedure to update informational content of downloaded file
-        """
-        return "".join(
-            [
-                download_msg,
-                "\n",
-                f"[color=#00AABB][ref={from_url}]{from_url}[/ref][/color]",
-                "\n",
-                to_msg,
-                "\n",
-                to_path,
-            ]
-        )
-
-    @staticmethod
-    def make_progress_info(
-        of_msg: str,
-        percent: float,
-        downloaded_len: float,
-        content_len: float,
-    ) -> str:
-        """
-        download_stable_zip_sha256_screen and download_stable_zip_sig_screen
-        use same procedure to update its progress content of downloaded file
-        """
-        return "".join(
-            [
-                f"[b]{percent * 100:,.2f} %[/b]",
-                "\n",
-                str(downloaded_len),
-                f" {of_msg} ",
-                str(content_len),
-                " B",
-            ]
-        )
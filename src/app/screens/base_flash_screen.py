@@ -21,11 +21,13 @@
 """
 base_flash__screen.py
 """
+from __future__ import annotations
 import os
 import typing
 from threading import Thread
 from kivy.clock import Clock, ClockEvent
 from src.app.screens.base_screen import BaseScreen
+from src.utils.ports import get_port_registry
 
 
 class BaseFlashScreen(BaseScreen):
@@ -43,16 +45,19 @@ class BaseFlashScreen(BaseScreen):
         self._is_done = False
 
     @property
-    def firmware(self) -> str:
-        """Getter for firmware"""
-        self.debug(f"getter::firmware={self._firmware}")
+    def firmware(self) -> str | typing.BinaryIO:
+        """Getter for firmware (a path or, if streamed from zip, a stream)"""
+        self.debug("getter::firmware=%s", self._firmware)
         return self._firmware
 
     @firmware.setter
-    def firmware(self, value: str):
-        """Setter for firmware"""
-        if os.path.exists(value):
-            self.debug(f"setter::firmware={value}")
+    def firmware(self, value: str | typing.BinaryIO):
+        """Setter for firmware (a path or, if streamed from zip, a stream)"""
+        if hasattr(value, "readinto"):
+            self.debug("setter::firmware=<stream %s>", value)
+            self._firmware = value
+        elif os.path.exists(value):
+            self.debug("setter::firmware=%s", value)
             self._firmware = value
         else:
             raise ValueError(f"Firmware not exist: {value}")
@@ -60,19 +65,19 @@ class BaseFlashScreen(BaseScreen):
     @property
     def baudrate(self) -> str:
         """Getter for baudrate"""
-        self.debug(f"getter::baudrate={self._baudrate}")
+        self.debug("getter::baudrate=%s", self._baudrate)
         return self._baudrate
 
     @baudrate.setter
     def baudrate(self, value: str):
         """Setter for baudrate"""
-        self.debug(f"setter::baudrate={value}")
+        self.debug("setter::baudrate=%s", value)
         self._baudrate = value
 
     @property
     def thread(self) -> Thread:
         """Getter for thread"""
-        self.debug(f"getter::thread={self._thread}")
+        self.debug("getter::thread=%s", self._thread)
         return self._thread
 
     @thread.setter
@@ -83,45 +88,53 @@ class BaseFlashScreen(BaseScreen):
 
         See https://kivy.org/doc/stable/guide/events.html
         """
-        self.debug(f"setter::thread={self._thread}->{value}")
+        self.debug("setter::thread=%s->%s", self._thread, value)
         self._thread = value
 
     @property
     def done(self) -> ClockEvent:
         """Trigger is a `ClockEvent` that should be triggered after download is done"""
-        self.debug(f"getter::done={self._done}")
+        self.debug("getter::done=%s", self._done)
         return self._done
 
     @done.setter
     def done(self, value: typing.Callable):
         """Create a `ClockEvent` given a callback"""
-        self.debug(f"getter::trigger={self._done}")
+        self.debug("getter::trigger=%s", self._done)
         self._done = Clock.create_trigger(value)
 
     @property
     def output(self) -> typing.List[str]:
         """Getter for output"""
-        self.debug(f"getter::output={self._output}")
+        self.debug("getter::output=%s", self._output)
         return self._output
 
     @output.setter
     def output(self, value: typing.List[str]):
         """Setter for info"""
-        self.debug(f"setter::output={value}")
+        self.debug("setter::output=%s", value)
         self._output = value
 
     @property
     def is_done(self) -> bool:
         """Getter for is_done"""
-        self.debug(f"getter::is_done={self._is_done}")
+        self.debug("getter::is_done=%s", self._is_done)
         return self._is_done
 
     @is_done.setter
     def is_done(self, value: bool):
         """Setter for info"""
-        self.debug(f"setter::is_done={value}")
+        self.debug("setter::is_done=%s", value)
         self._is_done = value
 
+    # pylint: disable=unused-argument
+    def on_leave(self, *args):
+        """
+        Event fired when the screen is left: stop the registry of serial
+        ports started on `on_enter`, so they are not probed anymore
+        """
+        get_port_registry().stop()
+
     def build_on_done(self):
         """
         Build a streaming IO static method using
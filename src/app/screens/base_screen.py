@@ -21,6 +21,7 @@
 """
 base_screen.py
 """
+from __future__ import annotations
 import os
 import re
 import sys
@@ -74,25 +75,25 @@ class BaseScreen(Screen, Trigger):
     @property
     def logo_img(self) -> str:
         """Getter for logo_img"""
-        self.debug(f"getter::logo_img={self._logo_img}")
+        self.debug("getter::logo_img=%s", self._logo_img)
         return self._logo_img
 
     @property
     def warn_img(self) -> str:
         """Getter for warn_img"""
-        self.debug(f"getter::warn_img={self._warn_img}")
+        self.debug("getter::warn_img=%s", self._warn_img)
         return self._warn_img
 
     @property
     def load_img(self) -> str:
         """Getter for load_img"""
-        self.debug(f"getter::load_img={self._load_img}")
+        self.debug("getter::load_img=%s", self._load_img)
         return self._load_img
 
     @property
     def done_img(self) -> str:
         """Getter for done_img"""
-        self.debug(f"getter::done_img={self._done_img}")
+        self.debug("getter::done_img=%s", self._done_img)
         return self._done_img
 
     @property
@@ -103,7 +104,7 @@ class BaseScreen(Screen, Trigger):
     @locale.setter
     def locale(self, value: str):
         """Setter for locale property"""
-        self.debug(f"locale = {value}")
+        self.debug("locale = %s", value)
         self._locale = value
 
     # pylint: disable=unused-argument
@@ -114,7 +115,7 @@ class BaseScreen(Screen, Trigger):
     def translate(self, key: str) -> str:
         """Translate some message as key"""
         msg = T(key, locale=self.locale, module=self.id)
-        self.debug(f"Translated '{key}' to '{msg}'")
+        self.debug("Translated '%s' to '%s'", key, msg)
         return msg
 
     def set_background(self, wid: str, rgba: typing.Tuple[float, float, float, float]):
@@ -135,7 +136,7 @@ class BaseScreen(Screen, Trigger):
         """Build grid where buttons will be placed"""
         if wid not in self.ids:
 
-            self.debug(f"Building GridLayout::{wid}")
+            self.debug("Building GridLayout::%s", wid)
             grid = GridLayout(cols=1, rows=rows)
             grid.id = wid
 
@@ -155,11 +156,11 @@ class BaseScreen(Screen, Trigger):
             self.add_widget(grid)
             self.ids[wid] = WeakProxy(grid)
         else:
-            self.debug(f"GridLayout::{wid} already exist")
+            self.debug("GridLayout::%s already exist", wid)
 
     def make_subgrid(self, wid: str, rows: int, root_widget: str):
         """Build grid where buttons will be placed"""
-        self.debug(f"Building GridLayout::{wid}")
+        self.debug("Building GridLayout::%s", wid)
         grid = GridLayout(cols=1, rows=rows)
         grid.id = wid
         self.ids[root_widget].add_widget(grid)
@@ -173,7 +174,7 @@ class BaseScreen(Screen, Trigger):
         halign: str,
     ):
         """Build grid where buttons will be placed"""
-        self.debug(f"Building Label::{wid}")
+        self.debug("Building Label::%s", wid)
         label = Label(text=text, markup=True, halign=halign)
         label.id = wid
         label.bind(texture_size=label.setter("size"))
@@ -182,7 +183,7 @@ class BaseScreen(Screen, Trigger):
 
     def make_image(self, wid: str, source: str, root_widget: str):
         """Build grid where buttons will be placed"""
-        self.debug(f"Building Image::{wid}")
+        self.debug("Building Image::%s", wid)
         image = Image(source=source, fit_mode="scale-down")
         image.id = wid
         self.ids[root_widget].add_widget(image)
@@ -190,7 +191,7 @@ class BaseScreen(Screen, Trigger):
 
     def clear_grid(self, wid: str):
         """Clear GridLayout widget"""
-        self.debug(f"Clearing widgets from GridLayout::{wid}")
+        self.debug("Clearing widgets from GridLayout::%s", wid)
         if wid in self.ids:
             self.ids[wid].clear_widgets()
 
@@ -207,7 +208,7 @@ class BaseScreen(Screen, Trigger):
         on_ref_press: typing.Callable | None,
     ):
         """Create buttons in a dynamic way"""
-        self.debug(f"button::{wid} row={row}")
+        self.debug("button::%s row=%s", wid, row)
 
         # define how many rows we have to distribute them on screen
         total = self.ids[root_widget].rows
@@ -425,7 +426,7 @@ class BaseScreen(Screen, Trigger):
         Update a screen in accord with the valid ones, here or in on_update callback
         """
         if name in allowed_screens:
-            self.debug(f"Updating {self.name} from {name}...")
+            self.debug("Updating %s from %s...", self.name, name)
         else:
             exc = RuntimeError(f"Invalid screen name: {name}")
             self.redirect_exception(exception=exc)
@@ -26,6 +26,7 @@ import time
 from functools import partial
 from kivy.clock import Clock
 from src.app.screens.base_download_screen import BaseDownloadScreen
+from src.app.settings import get_artifact_store, get_download_connections
 from src.utils.downloader.beta_downloader import BetaDownloader
 
 
@@ -79,10 +80,10 @@ class DownloadBetaScreen(BaseDownloadScreen):
             )
             Clock.schedule_once(fn, 0)
 
-        self.debug(f"Bind {self.__class__}.on_trigger={on_trigger}")
+        self.debug("Bind %s.on_trigger=%s", self.__class__, on_trigger)
         setattr(self.__class__, "on_trigger", on_trigger)
 
-        self.debug(f"Bind {self.__class__}.on_progress={on_progress}")
+        self.debug("Bind %s.on_progress=%s", self.__class__, on_progress)
         setattr(self.__class__, "on_progress", on_progress)
 
     # pylint: disable=unused-argument
@@ -145,6 +146,8 @@ class DownloadBetaScreen(BaseDownloadScreen):
             device=self.device,
             binary_type=self.firmware,
             destdir=destdir,
+            connections=get_download_connections(),
+            store=get_artifact_store(),
         )
 
         self.ids[f"{self.id}_info"].text = "".join(
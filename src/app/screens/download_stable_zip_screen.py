@@ -22,21 +22,24 @@
 download_stable_zip_screen.py
 """
 import os
-import time
 from functools import partial
 from kivy.clock import Clock
 from src.app.screens.base_download_screen import BaseDownloadScreen
-from src.utils.downloader.zip_downloader import ZipDownloader
+from src.app.settings import get_artifact_store, get_download_connections
+from src.utils.downloader.release_downloader import ReleaseDownloader
 
 
 class DownloadStableZipScreen(BaseDownloadScreen):
-    """DownloadStableZipScreen download a official krux zip release"""
+    """
+    DownloadStableZipScreen download a official krux zip release
+    and its sha256sum, signature and public key at once
+    """
 
     def __init__(self, **kwargs):
         super().__init__(
             wid="download_stable_zip_screen", name="DownloadStableZipScreen", **kwargs
         )
-        self.to_screen = "DownloadStableZipSha256Screen"
+        self.to_screen = "VerifyStableZipScreen"
 
         # Define some staticmethods in
         # dynamic way, so they can be
@@ -46,19 +49,13 @@ class DownloadStableZipScreen(BaseDownloadScreen):
         # This is a function that will be called
         # when the download thread is finished
         def on_trigger(dt):
-            self.debug(f"latter call timed {dt}ms")
-            time.sleep(2.1)
-            screen = self.manager.get_screen(self.to_screen)
-            fn = partial(
-                screen.update, name=self.name, key="version", value=self.version
-            )
-            Clock.schedule_once(fn, 0)
+            self.debug("latter call timed %sms", dt)
             self.set_screen(name=self.to_screen, direction="left")
 
         # This is a function that will be called
         # when a bunch of data are streamed from github
         def on_progress(data: bytes):
-            self.debug(f"Chunck size: {len(data)}")
+            self.debug("Chunck size: %s", len(data))
             dl_len = getattr(self.downloader, "downloaded_len")
             ct_len = getattr(self.downloader, "content_len")
             fn = partial(
@@ -105,11 +102,13 @@ class DownloadStableZipScreen(BaseDownloadScreen):
         )
 
     def build_downloader(self, version: str):
-        """Creates a Downloader given a firmware version"""
+        """Creates a Downloader of all release assets given a firmware version"""
         self.version = version
-        self.downloader = ZipDownloader(
+        self.downloader = ReleaseDownloader(
             version=self.version,
             destdir=DownloadStableZipScreen.get_destdir_assets(),
+            connections=get_download_connections(),
+            store=get_artifact_store(),
         )
 
         url = getattr(self.downloader, "url")
@@ -26,7 +26,9 @@ import traceback
 from functools import partial
 from kivy.clock import Clock
 from src.app.screens.base_flash_screen import BaseFlashScreen
+from src.app.settings import get_parallel_flash
 from src.utils.flasher import Flasher
+from src.utils.ports import get_port_registry
 
 
 class FlashScreen(BaseFlashScreen):
@@ -39,6 +41,7 @@ class FlashScreen(BaseFlashScreen):
         self.at_msg = self.translate("at")
         self.flasher = Flasher()
         self.fail_msg = ""
+        self.ports_progress = {}
         fn = partial(self.update, name=self.name, key="canvas")
         Clock.schedule_once(fn, 0)
 
@@ -116,12 +119,86 @@ class FlashScreen(BaseFlashScreen):
 
         setattr(FlashScreen, "on_process", on_process)
 
+    def build_on_process_port(self):
+        """
+        Build streaming IO static methods that show the progress and
+        logs of each port when all devices are flashed in parallel.
+        They are called from the flash thread, so the screen is
+        changed in the next frame of main thread
+
+        (useful for to be used in tests)
+        """
+
+        def on_process_port(
+            port: str, file_type: str, iteration: int, total: int, suffix: str
+        ):
+            percent = (iteration / total) * 100
+            text = "".join(
+                [
+                    f"{port}: {percent:.2f} % ",
+                    "[color=#efcc00]",
+                    file_type,
+                    "[/color]",
+                    f" {self.at_msg} {suffix}",
+                ]
+            )
+
+            # pylint: disable=unused-argument
+            def on_progress(dt):
+                self.ports_progress[port] = text
+                self.ids[f"{self.id}_progress"].text = "\n".join(
+                    [f"[b]{self.please_msg}[/b]", *self.ports_progress.values()]
+                )
+
+            Clock.schedule_once(on_progress, 0)
+
+        def on_data_port(port: str, text: str):
+            self.info("%s: %s", port, text)
+            text = FlashScreen.parse_general_output(text)
+
+            # pylint: disable=unused-argument
+            def on_output(dt):
+                if "INFO" in text:
+                    self.output.append(f"{port}: {text}")
+
+                if len(self.output) > 10:
+                    del self.output[:1]
+
+                self.ids[f"{self.id}_info"].text = "\n".join(self.output)
+
+            Clock.schedule_once(on_output, 0)
+
+        setattr(FlashScreen, "on_process_port", on_process_port)
+        setattr(FlashScreen, "on_data_port", on_data_port)
+
+    def flash_all(self):
+        """
+        Flash all connected devices in parallel and
+        fail if any of them was not flashed
+        """
+        results = self.flasher.flash_all(
+            callback=getattr(FlashScreen, "on_process_port"),
+            on_data=getattr(FlashScreen, "on_data_port"),
+        )
+        failed = [
+            f"{port}: {result['error']}"
+            for port, result in results.items()
+            if not result["success"]
+        ]
+        if len(failed) > 0:
+            raise RuntimeError("\n".join(failed))
+
+        # pylint: disable=not-callable
+        self.done()
+
     # pylint: disable=unused-argument
     def on_pre_enter(self, *args):
         self.ids[f"{self.id}_grid"].clear_widgets()
         self.build_on_data()
         self.build_on_process()
+        self.build_on_process_port()
         self.build_on_done()
+        self.ports_progress = {}
 
         wid = f"{self.id}_info"
 
@@ -179,9 +256,12 @@ class FlashScreen(BaseFlashScreen):
         """
         self.done = getattr(FlashScreen, "on_done")
         self.flasher.ktool.__class__.print_callback = getattr(FlashScreen, "on_data")
-        on_process = partial(
-            self.flasher.flash, callback=getattr(self.__class__, "on_process")
-        )
+        if get_parallel_flash():
+            on_process = self.flash_all
+        else:
+            on_process = partial(
+                self.flasher.flash, callback=getattr(self.__class__, "on_process")
+            )
         self.thread = threading.Thread(name=self.name, target=on_process)
 
         # if anything wrong happen, show it
@@ -219,6 +299,9 @@ class FlashScreen(BaseFlashScreen):
         # hook what happened
         threading.excepthook = getattr(FlashScreen, "on_except_hook")
 
+        # watch the serial ports only while they are flashed
+        get_port_registry().start()
+
         # start thread
         self.thread.start()
 
@@ -241,6 +324,9 @@ class FlashScreen(BaseFlashScreen):
             if key == "firmware":
                 setattr(self, "firmware", value)
 
+            if key == "device":
+                self.flasher.device = value
+
             if key == "flasher":
                 self.flasher.firmware = getattr(self, "firmware")
                 self.flasher.baudrate = getattr(self, "baudrate")
@@ -26,7 +26,9 @@ import sys
 from functools import partial
 from kivy.clock import Clock
 from src.utils.selector import Selector
+from src.utils.session import get_session
 from src.app.screens.base_screen import BaseScreen
+from src.app.settings import get_warm_up
 
 if sys.platform.startswith("linux"):
     import grp  # pylint: disable=import-error
@@ -170,7 +172,7 @@ class GreetingsScreen(BaseScreen):
                 # for _grpuser in _grp[3]:
                 for _grpuser in _grp.gr_mem:
                     if _grpuser == user:
-                        self.info(f"'{user}' already in group '{gr_name}'")
+                        self.info("'%s' already in group '%s'", user, gr_name)
                         _in_dialout = True
 
         return _in_dialout
@@ -233,6 +235,13 @@ class GreetingsScreen(BaseScreen):
                 value=selector.releases[0],
             )
             Clock.schedule_once(fn, 0)
+
+            # Once online (and if enabled), open the connections to the
+            # assets' hosts in background, so the downloads do not pay
+            # DNS lookups and TLS handshakes later
+            if get_warm_up():
+                get_session().warm_up()
+
             self.set_screen(name="MainScreen", direction="left")
 
         # pylint: disable=broad-exception-caught
@@ -27,6 +27,7 @@ import typing
 from functools import partial
 from kivy.clock import Clock
 from src.utils.selector import VALID_DEVICES
+from src.utils.scrubber import AssetScrubber
 from src.app.screens.base_screen import BaseScreen
 
 
@@ -62,7 +63,7 @@ class MainScreen(BaseScreen):
 
     @device.setter
     def device(self, value: str):
-        self.debug(f"device = {value}")
+        self.debug("device = %s", value)
         self._device = value
 
     @property
@@ -73,7 +74,7 @@ class MainScreen(BaseScreen):
     @version.setter
     def version(self, value: str):
         """Setter for version property"""
-        self.debug(f"version = {value}")
+        self.debug("version = %s", value)
         self._version = value
 
     @property
@@ -84,7 +85,7 @@ class MainScreen(BaseScreen):
     @will_flash.setter
     def will_flash(self, value: bool):
         """Setter for will_flash property"""
-        self.debug(f"will_flash = {value}")
+        self.debug("will_flash = %s", value)
         self._will_flash = value
 
     @property
@@ -95,7 +96,7 @@ class MainScreen(BaseScreen):
     @will_wipe.setter
     def will_wipe(self, value: bool):
         """Setter for will_wipe property"""
-        self.debug(f"will_wipe = {value}")
+        self.debug("will_wipe = %s", value)
         self._will_wipe = value
 
     def build_select_version_button(self):
@@ -105,7 +106,7 @@ class MainScreen(BaseScreen):
         msg = self.translate("Version")
 
         def on_press(instance):
-            self.debug(f"Calling {instance.id}::on_press")
+            self.debug("Calling %s::on_press", instance.id)
             self.set_background(wid=instance.id, rgba=(0.25, 0.25, 0.25, 1))
             fetch_msg = self.translate("Fetching data from")
             self.ids[instance.id].text = "".join(
@@ -119,7 +120,7 @@ class MainScreen(BaseScreen):
             )
 
         def on_release(instance):
-            self.debug(f"Calling {instance.id}::on_release")
+            self.debug("Calling %s::on_release", instance.id)
             select_version = self.manager.get_screen("SelectVersionScreen")
             select_version.clear()
             select_version.fetch_releases()
@@ -152,11 +153,11 @@ class MainScreen(BaseScreen):
         msg = self.translate("Device")
 
         def on_press_select_device(instance):
-            self.debug(f"Calling {instance.id}::on_press")
+            self.debug("Calling %s::on_press", instance.id)
             self.set_background(wid=instance.id, rgba=(0.25, 0.25, 0.25, 1))
 
         def on_release_select_device(instance):
-            self.debug(f"Calling {instance.id}::on_release")
+            self.debug("Calling %s::on_release", instance.id)
             select_device = self.manager.get_screen("SelectDeviceScreen")
             fn = partial(
                 select_device.update,
@@ -191,6 +192,17 @@ class MainScreen(BaseScreen):
         )
         self.ids[wid].size_hint = (1, 1)
 
+    def is_corrupted(self, resources: str, filename: str) -> bool:
+        """Check if the last scrub of assets flagged a file as corrupted"""
+        try:
+            corrupted = filename in AssetScrubber(destdir=resources).corrupted()
+        except ValueError:
+            return False
+
+        if corrupted:
+            self.warning("Corrupted asset: %s", filename)
+        return corrupted
+
     def on_check_any_official_release(
         self, partial_list: typing.List[typing.Callable]
     ) -> str:
@@ -199,7 +211,9 @@ class MainScreen(BaseScreen):
         zipfile = os.path.join(resources, f"krux-{self.version}.zip")
         to_screen = None
 
-        if os.path.isfile(zipfile):
+        # a release flagged by the background scrub
+        # is not reused, but downloaded again
+        if os.path.isfile(zipfile) and not self.is_corrupted(resources, zipfile):
             to_screen = "WarningAlreadyDownloadedScreen"
         else:
             to_screen = "DownloadStableZipScreen"
@@ -261,16 +275,16 @@ class MainScreen(BaseScreen):
         wid = "main_flash"
 
         def on_press_flash(instance):
-            self.debug(f"Calling {instance.id}::on_press")
+            self.debug("Calling %s::on_press", instance.id)
             if self.will_flash:
                 self.set_background(wid=instance.id, rgba=(0.25, 0.25, 0.25, 1))
             else:
-                self.warning(f"Button::{instance.id} disabled")
+                self.warning("Button::%s disabled", instance.id)
 
         def on_release_flash(instance):
-            self.debug(f"Calling {instance.id}::on_release")
+            self.debug("Calling %s::on_release", instance.id)
             if not self.will_flash:
-                self.warning(f"Button::{instance.id} disabled")
+                self.warning("Button::%s disabled", instance.id)
             else:
                 # do a click effect
                 self.set_background(wid="main_flash", rgba=(0, 0, 0, 1))
@@ -323,19 +337,19 @@ class MainScreen(BaseScreen):
         wid = "main_wipe"
 
         def on_press_wipe(instance):
-            self.debug(f"Calling {instance.id}::on_press")
+            self.debug("Calling %s::on_press", instance.id)
             if self.will_wipe:
                 self.set_background(wid=instance.id, rgba=(0.25, 0.25, 0.25, 1))
             else:
-                self.warning(f"Button::{instance.id} disabled")
+                self.warning("Button::%s disabled", instance.id)
 
         def on_release_wipe(instance):
-            self.debug(f"Calling {instance.id}::on_release")
+            self.debug("Calling %s::on_release", instance.id)
             if self.will_wipe:
                 self.set_background(wid="main_wipe", rgba=(0, 0, 0, 1))
                 self.set_screen(name="WarningWipeScreen", direction="left")
             else:
-                self.debug(f"Button::{instance.id} disabled")
+                self.debug("Button::%s disabled", instance.id)
 
         setattr(MainScreen, "on_press_wipe", on_press_wipe)
         setattr(MainScreen, "on_release_wipe", on_release_wipe)
@@ -358,11 +372,11 @@ class MainScreen(BaseScreen):
         wid = "main_settings"
 
         def on_press_settings(instance):
-            self.debug(f"Calling {instance.id}::on_press")
+            self.debug("Calling %s::on_press", instance.id)
             self.set_background(wid=instance.id, rgba=(0.25, 0.25, 0.25, 1))
 
         def on_release_settings(instance):
-            self.debug(f"Calling {instance.id}::on_release")
+            self.debug("Calling %s::on_release", instance.id)
             self.set_background(wid="main_settings", rgba=(0, 0, 0, 1))
             MainScreen.open_settings()
 
@@ -386,11 +400,11 @@ class MainScreen(BaseScreen):
         wid = "main_about"
 
         def on_press_about(instance):
-            self.debug(f"Calling Button::{instance.id}::on_press")
+            self.debug("Calling Button::%s::on_press", instance.id)
             self.set_background(wid=instance.id, rgba=(0.25, 0.25, 0.25, 1))
 
         def on_release_about(instance):
-            self.debug(f"Calling Button::{instance.id}::on_release")
+            self.debug("Calling Button::%s::on_release", instance.id)
             self.set_background(wid="main_about", rgba=(0, 0, 0, 1))
             self.set_screen(name="AboutScreen", direction="left")
 
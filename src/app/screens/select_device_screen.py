@@ -44,16 +44,16 @@ class SelectDeviceScreen(BaseScreen):
 
             def on_press(instance):
                 if instance.id in self.enabled_devices:
-                    self.debug(f"Calling Button::{instance.id}::on_press")
+                    self.debug("Calling Button::%s::on_press", instance.id)
                     self.set_background(wid=instance.id, rgba=(0.25, 0.25, 0.25, 1))
 
             def on_release(instance):
                 if instance.id in self.enabled_devices:
-                    self.debug(f"Calling Button::{instance.id}::on_release")
+                    self.debug("Calling Button::%s::on_release", instance.id)
                     self.set_background(wid=instance.id, rgba=(0, 0, 0, 1))
                     device = self.ids[instance.id].text
                     clean_device = SelectDeviceScreen.sanitize_markup(device)
-                    self.debug(f"on_release::{instance.id} = {clean_device}")
+                    self.debug("on_release::%s = %s", instance.id, clean_device)
                     main_screen = self.manager.get_screen("MainScreen")
                     fn = partial(
                         main_screen.update,
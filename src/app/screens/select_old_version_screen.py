@@ -42,14 +42,14 @@ class SelectOldVersionScreen(BaseScreen):
         wid = f"select_old_version_{sanitized}"
 
         def on_press(instance):
-            self.debug(f"Calling {instance}::on_press")
+            self.debug("Calling %s::on_press", instance)
             self.set_background(wid=instance.id, rgba=(0.25, 0.25, 0.25, 1))
 
         def on_release(instance):
-            self.debug(f"Calling {instance.id}::on_release")
+            self.debug("Calling %s::on_release", instance.id)
             self.set_background(wid=instance.id, rgba=(0, 0, 0, 1))
             version = self.ids[instance.id].text
-            self.debug(f"on_release::{instance.id} = {version}")
+            self.debug("on_release::%s = %s", instance.id, version)
             main_screen = self.manager.get_screen("MainScreen")
             fn_version = partial(
                 main_screen.update, name=self.name, key="version", value=version
@@ -81,13 +81,13 @@ class SelectOldVersionScreen(BaseScreen):
 
         # Back Button
         def on_press(instance):
-            self.debug(f"Calling {instance}::on_press")
+            self.debug("Calling %s::on_press", instance)
             self.set_background(
                 wid="select_old_version_back", rgba=(0.25, 0.25, 0.25, 1)
             )
 
         def on_release(instance):
-            self.debug(f"Calling {instance}::on_release")
+            self.debug("Calling %s::on_release", instance)
             self.set_background(wid="select_old_version_back", rgba=(0, 0, 0, 1))
             self.set_screen(name="SelectVersionScreen", direction="right")
 
@@ -47,14 +47,14 @@ class SelectVersionScreen(BaseScreen):
         """Make a button to select latest version and a staticmethod that call instance variables"""
 
         def on_press(instance):
-            self.debug(f"Calling Button::{instance.id}::on_press")
+            self.debug("Calling Button::%s::on_press", instance.id)
             self.set_background(wid=instance.id, rgba=(0.25, 0.25, 0.25, 1))
 
         def on_release(instance):
-            self.debug(f"Calling Button::{instance.id}::on_release")
+            self.debug("Calling Button::%s::on_release", instance.id)
             self.set_background(wid=instance.id, rgba=(0, 0, 0, 1))
             version = self.ids[instance.id].text
-            self.debug(f"on_release::{instance.id} = {version}")
+            self.debug("on_release::%s = %s", instance.id, version)
             main_screen = self.manager.get_screen("MainScreen")
             fn_version = partial(
                 main_screen.update,
@@ -90,11 +90,11 @@ class SelectVersionScreen(BaseScreen):
         """Make a button to select beta version and a staticmethod that call instance variables"""
 
         def on_press(instance):
-            self.debug(f"Calling Button::{instance.id}::on_press")
+            self.debug("Calling Button::%s::on_press", instance.id)
             self.set_background(wid=instance.id, rgba=(0.25, 0.25, 0.25, 1))
 
         def on_release(instance):
-            self.debug(f"Calling Button::{instance.id}::on_release")
+            self.debug("Calling Button::%s::on_release", instance.id)
             self.set_background(wid=instance.id, rgba=(0, 0, 0, 1))
             version = self.ids[instance.id].text
             main_screen = self.manager.get_screen("MainScreen")
@@ -112,7 +112,7 @@ class SelectVersionScreen(BaseScreen):
             )
             Clock.schedule_once(fn_version, 0)
             Clock.schedule_once(fn_device, 0)
-            self.debug(f"on_release::{instance.id} = {version}")
+            self.debug("on_release::%s = %s", instance.id, version)
             self.set_screen(name="WarningBetaScreen", direction="left")
 
         wid = f"{self.id}_beta"
@@ -132,11 +132,11 @@ class SelectVersionScreen(BaseScreen):
         """Make a button to select old versions and a staticmethod that call instance variables"""
 
         def on_press(instance):
-            self.debug(f"Calling Button::{instance.id}::on_press")
+            self.debug("Calling Button::%s::on_press", instance.id)
             self.set_background(wid=instance.id, rgba=(0.25, 0.25, 0.25, 1))
 
         def on_release(instance):
-            self.debug(f"Calling Button::{instance.id}::on_release")
+            self.debug("Calling Button::%s::on_release", instance.id)
             self.set_background(wid=instance.id, rgba=(0, 0, 0, 1))
             self.set_screen(name="SelectOldVersionScreen", direction="left")
 
@@ -157,11 +157,11 @@ class SelectVersionScreen(BaseScreen):
         """Make a button to back and a staticmethod that call instance variables"""
 
         def on_press(instance):
-            self.debug(f"Calling Button::{instance.id}::on_press")
+            self.debug("Calling Button::%s::on_press", instance.id)
             self.set_background(wid=instance.id, rgba=(0.25, 0.25, 0.25, 1))
 
         def on_release(instance):
-            self.debug(f"Calling Button::{instance.id}::on_release")
+            self.debug("Calling Button::%s::on_release", instance.id)
             self.set_background(wid=instance.id, rgba=(0, 0, 0, 1))
             self.set_screen(name="MainScreen", direction="right")
 
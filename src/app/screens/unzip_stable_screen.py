@@ -55,7 +55,7 @@ class UnzipStableScreen(BaseScreen):
                 self.device = value
 
             if key == "clear":
-                self.debug(f"Clearing '{self.id}_grid'")
+                self.debug("Clearing '%s_grid'", self.id)
                 self.ids[f"{self.id}_grid"].clear_widgets()
 
             if key == "flash-button":
@@ -87,10 +87,9 @@ class UnzipStableScreen(BaseScreen):
         rel_path = os.path.join(self.assets_dir, base_path)
         flash_msg = self.translate("Flash with")
         extract_msg = self.translate("Unziping")
-        extracted_msg = self.translate("Unziped")
 
         def on_press(instance):
-            self.debug(f"Calling Button::{instance.id}::on_press")
+            self.debug("Calling Button::%s::on_press", instance.id)
             file_path = os.path.join(rel_path, "kboot.kfpkg")
             self.ids[instance.id].text = "".join(
                 [
@@ -104,21 +103,37 @@ class UnzipStableScreen(BaseScreen):
             self.set_background(wid=instance.id, rgba=(0.25, 0.25, 0.25, 1))
 
         def on_release(instance):
-            self.debug(f"Calling Button::{instance.id}::on_release")
-            file_path = os.path.join(base_path, "kboot.kfpkg")
-            full_path = os.path.join(self.assets_dir, file_path)
+            self.debug("Calling Button::%s::on_release", instance.id)
             baudrate = UnzipStableScreen.get_baudrate()
 
-            unziper = KbootUnzip(
-                filename=zip_file,
-                device=getattr(self, "device"),
-                output=getattr(self, "assets_dir"),
-            )
+            # kboot.kfpkg is streamed from zip to the flasher, so it
+            # is not extracted on disk for each device and version
+            self.set_background(wid=instance.id, rgba=(0, 0, 0, 1))
+
+            try:
+                unziper = KbootUnzip(
+                    filename=zip_file,
+                    device=getattr(self, "device"),
+                    output=getattr(self, "assets_dir"),
+                )
+                firmware = unziper.open(unziper.kboot)
+
+            # a missing or broken zip
+            except (ValueError, RuntimeError) as exc:
+                self.error(str(exc))
+                self.redirect_exception(exception=exc)
+                return
 
             # load variables to FlashScreen before get in
             screen = self.manager.get_screen("FlashScreen")
             fns = [
-                partial(screen.update, name=self.name, key="firmware", value=full_path),
+                partial(screen.update, name=self.name, key="firmware", value=firmware),
+                partial(
+                    screen.update,
+                    name=self.name,
+                    key="device",
+                    value=getattr(self, "device"),
+                ),
                 partial(screen.update, name=self.name, key="baudrate", value=baudrate),
                 partial(screen.update, name=self.name, key="flasher"),
             ]
@@ -126,23 +141,16 @@ class UnzipStableScreen(BaseScreen):
             for fn in fns:
                 Clock.schedule_once(fn, 0)
 
-            # start the unzip process
-            self.set_background(wid=instance.id, rgba=(0, 0, 0, 1))
-            unziper.load()
-
-            # once unziped, give some messages
-            p = os.path.join(rel_path, "kboot.kfpkg")
+            # nothing was written on disk, so go immediately
             self.ids[instance.id].text = "".join(
                 [
-                    extracted_msg,
+                    flash_msg,
                     "\n",
                     "[color=#efcc00]",
-                    p,
+                    unziper.kboot,
                     "[/color]",
                 ]
             )
-
-            time.sleep(2.1)
             self.set_screen(name="FlashScreen", direction="left")
 
         p = os.path.join(rel_path, "kboot.kfpkg")
@@ -180,7 +188,7 @@ class UnzipStableScreen(BaseScreen):
         wid = f"{self.id}_airgap_button"
 
         def on_press(instance):
-            self.debug(f"Calling Button::{instance.id}::on_press")
+            self.debug("Calling Button::%s::on_press", instance.id)
             file_path = os.path.join(rel_path, "firmware.bin")
             self.ids[instance.id].text = "".join(
                 [extract_msg, "\n", "[color=#efcc00]", file_path, "[/color]"]
@@ -190,18 +198,40 @@ class UnzipStableScreen(BaseScreen):
         setattr(UnzipStableScreen, f"on_press_{wid}", on_press)
 
         def on_release(instance):
-            self.debug(f"Calling Button::{instance.id}::on_release")
+            self.debug("Calling Button::%s::on_release", instance.id)
             bin_path = os.path.join(base_path, "firmware.bin")
             bin_full_path = os.path.join(self.assets_dir, bin_path)
 
             sig_path = os.path.join(base_path, "firmware.bin.sig")
             sig_full_path = os.path.join(self.assets_dir, sig_path)
 
-            unziper = FirmwareUnzip(
-                filename=zip_file, device=self.device, output=self.assets_dir
-            )
+            # start the unzip process, which hashes and
+            # verifies the firmware while it is extracted
+            self.set_background(wid=instance.id, rgba=(0, 0, 0, 1))
 
-            # load variables to FlashScreen before get in
+            try:
+                unziper = FirmwareUnzip(
+                    filename=zip_file,
+                    device=self.device,
+                    output=self.assets_dir,
+                    pubkey=os.path.join(self.assets_dir, "selfcustody.pem"),
+                )
+                unziper.load()
+
+            # a missing zip, public key or signature, or a broken zip
+            except (ValueError, RuntimeError) as exc:
+                self.error(str(exc))
+                self.redirect_exception(exception=exc)
+                return
+
+            if not unziper.verified:
+                exc = RuntimeError(f"Invalid signature for {bin_full_path}")
+                self.error(str(exc))
+                self.redirect_exception(exception=exc)
+                return
+
+            # load variables to AirgapUpdateScreen before get in
+            # (the next screen reuse the digest of extraction)
             screen = self.manager.get_screen("AirgapUpdateScreen")
             fns = [
                 partial(
@@ -210,15 +240,17 @@ class UnzipStableScreen(BaseScreen):
                 partial(
                     screen.update, name=self.name, key="signature", value=sig_full_path
                 ),
+                partial(
+                    screen.update,
+                    name=self.name,
+                    key="digest",
+                    value=unziper.firmware_digest,
+                ),
             ]
 
             for fn in fns:
                 Clock.schedule_once(fn, 0)
 
-            # start the unzip process
-            self.set_background(wid=instance.id, rgba=(0, 0, 0, 1))
-            unziper.load()
-
             # once unziped, give some messages
             self.ids[instance.id].text = "".join(
                 [extracted_msg, "\n", "[color=#efcc00]", bin_full_path, "[/color]"]
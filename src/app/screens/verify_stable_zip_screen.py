@@ -21,26 +21,35 @@
 """
 verify_stable_zip_screen.py
 """
+from __future__ import annotations
 import os
 from functools import partial
+from threading import Thread
 import typing
 from kivy.clock import Clock
 from src.app.screens.base_screen import BaseScreen
+from src.app.settings import get_trust_store, get_verification_cache
+from src.utils.trust import TrustStore
 from src.utils.verifyer.sha256_check_verifyer import Sha256CheckVerifyer
 from src.utils.verifyer.sha256_verifyer import Sha256Verifyer
 from src.utils.verifyer.sig_check_verifyer import SigCheckVerifyer
 from src.utils.verifyer.sig_verifyer import SigVerifyer
-from src.utils.verifyer.pem_check_verifyer import PemCheckVerifyer
 
 
 class VerifyStableZipScreen(BaseScreen):
-    """VerifyStableZipScreen check for sha256sum and siganture"""
+    """
+    VerifyStableZipScreen check for sha256sum and siganture. The
+    verification runs on a worker thread, which streams its progress
+    and its final message to the label on the main thread
+    """
 
     def __init__(self, **kwargs):
         super().__init__(
             wid="verify_stable_zip_screen", name="VerifyStableZipScreen", **kwargs
         )
         self.success = False
+        self.zip_digest = None
+        self._thread = None
         self.make_grid(wid=f"{self.id}_grid", rows=1, resize_screen=True)
 
         fn = partial(self.update, name=self.name, key="canvas")
@@ -58,15 +67,26 @@ class VerifyStableZipScreen(BaseScreen):
                 assets_dir = VerifyStableZipScreen.get_destdir_assets()
                 main_screen = self.manager.get_screen("MainScreen")
 
-                verified = self.build_message_verify_sha256(
-                    assets_dir=assets_dir, version=main_screen.version
+                # a verification is already running
+                if self.thread is not None and self.thread.is_alive():
+                    return
+
+                fn = partial(
+                    self.verify, assets_dir=assets_dir, version=main_screen.version
                 )
+                self.thread = Thread(name=self.name, target=fn, daemon=True)
+                self.thread.start()
 
-                verified += self.build_message_verify_signature(
-                    assets_dir=assets_dir, version=main_screen.version
+            if key == "progress":
+                self.ids[f"{self.id}_label"].text = self.make_hash_progress_info(
+                    **value
                 )
 
-                self.ids[f"{self.id}_label"].text = verified
+            if key == "verified":
+                self.ids[f"{self.id}_label"].text = value
+
+            if key == "exception":
+                self.redirect_exception(exception=value)
 
         self.update_screen(
             name=name,
@@ -76,6 +96,17 @@ class VerifyStableZipScreen(BaseScreen):
             on_update=on_update,
         )
 
+    @property
+    def thread(self) -> Thread | None:
+        """Getter for the worker thread of verification"""
+        return self._thread
+
+    @thread.setter
+    def thread(self, value: Thread):
+        """Setter for the worker thread of verification"""
+        self.debug("setter::thread=%s->%s", self._thread, value)
+        self._thread = value
+
     # pylint: disable=unused-argument
     def on_pre_enter(self, *args):
         self.ids[f"{self.id}_grid"].clear_widgets()
@@ -126,21 +157,86 @@ class VerifyStableZipScreen(BaseScreen):
         fn = partial(self.update, name=self.name, key="verify")
         Clock.schedule_once(fn)
 
+    def verify(self, assets_dir: str, version: str):
+        """
+        Body of the worker thread: build the messages of integrity and
+        authenticity verifications and send them to the label, or send
+        the raised exception to the error screen
+        """
+        try:
+            verified = self.build_message_verify_sha256(
+                assets_dir=assets_dir, version=version
+            )
+            verified += self.build_message_verify_signature(
+                assets_dir=assets_dir, version=version
+            )
+            fn = partial(self.update, name=self.name, key="verified", value=verified)
+
+        # pylint: disable=broad-exception-caught
+        except Exception as exc:
+            fn = partial(self.update, name=self.name, key="exception", value=exc)
+
+        Clock.schedule_once(fn, 0)
+
+    def on_hash_progress(self, hashed_len: int, total_len: int, check: str):
+        """Send the progress of a hashing, from the worker thread, to the label"""
+        fn = partial(
+            self.update,
+            name=self.name,
+            key="progress",
+            value={"check": check, "hashed_len": hashed_len, "total_len": total_len},
+        )
+        Clock.schedule_once(fn, 0)
+
+    def make_hash_progress_info(
+        self, check: str, hashed_len: int, total_len: int
+    ) -> str:
+        """Progress of a hashing, with the name of the verification being done"""
+        percent = hashed_len / total_len if total_len > 0 else 1.0
+        check_msg = self.translate(check)
+        return "".join(
+            [
+                f"[color=#efcc00]{check_msg}[/color]",
+                "\n",
+                "\n",
+                f"[b]{percent * 100:,.2f} %[/b]",
+                "\n",
+                f"{hashed_len} / {total_len} B",
+            ]
+        )
+
     def verify_sha256(
         self, assets_dir: str, version: str
     ) -> typing.Tuple[str, str, bool]:
         """Do the verification when entering on screen"""
         # verify integrity
-        sha256_0 = Sha256Verifyer(filename=f"{assets_dir}/krux-{version}.zip")
-        sha256_1 = Sha256CheckVerifyer(
-            filename=f"{assets_dir}/krux-{version}.zip.sha256.txt"
-        )
-
-        sha256_0.load()
+        zipfile = f"{assets_dir}/krux-{version}.zip"
+        sha256_1 = Sha256CheckVerifyer(filename=f"{zipfile}.sha256.txt")
         sha256_1.load()
-        hash_0 = sha256_0.data.split(" ", maxsplit=1)[0]
         hash_1 = sha256_1.data.split(" ", maxsplit=1)[0]
-        return (hash_0, hash_1, sha256_0.verify(hash_1))
+        self.zip_digest = None
+
+        # an unchanged zip, checked against the same
+        # .sha256.txt, does not need to be hashed again
+        cache = get_verification_cache()
+        cached = cache.lookup(zipfile, hash_1)
+        if cached is not None:
+            return (cached["digest"], hash_1, cached["verified"])
+
+        sha256_0 = Sha256Verifyer(filename=zipfile)
+        sha256_0.load(
+            on_progress=partial(self.on_hash_progress, check="Integrity verification")
+        )
+        hash_0 = sha256_0.data.split(" ", maxsplit=1)[0]
+        checksummed = sha256_0.verify(hash_1)
+
+        # the bytes of zip hashed now (not a digest persisted
+        # along it) are reused by the authenticity verification
+        if sha256_0.hashed:
+            self.zip_digest = hash_0
+
+        cache.put(zipfile, hash_1, digest=hash_0, verified=checksummed)
+        return (hash_0, hash_1, checksummed)
 
     @staticmethod
     def prettyfy_hash(msg: str) -> str:
@@ -197,20 +293,68 @@ class VerifyStableZipScreen(BaseScreen):
         )
 
     def verify_signature(self, assets_dir: str, version: str) -> bool | str:
-        """Verify official release's signature"""
+        """
+        Verify official release's signature with the bundled public key. Only
+        if it fails, the public key is fetched from network, to warn that it
+        was rotated (the fetched key is never trusted, so it still fails)
+        """
         # verify signature
-        signature = SigCheckVerifyer(filename=f"{assets_dir}/krux-{version}.zip.sig")
-        publickey = PemCheckVerifyer(filename=f"{assets_dir}/selfcustody.pem")
+        zipfile = f"{assets_dir}/krux-{version}.zip"
+        signature = SigCheckVerifyer(filename=f"{zipfile}.sig")
         signature.load()
-        publickey.load()
+
+        # keep the trusted key along the release,
+        # so users can verify it with openssl
+        trust = get_trust_store()
+        trust.write_pem()
+        pubkey = trust.pem
+
+        # an unchanged zip, verified against the same
+        # .sig and .pem, does not need to be verified again
+        cache = get_verification_cache()
+        cached = cache.lookup(zipfile, signature.data, pubkey)
+        if cached is not None:
+            return cached["verified"]
+
+        # The authenticity is decided on the bytes of zip, hashed in
+        # this verification (never on a digest persisted along it,
+        # which could be stale), so the zip is hashed only once
         sig_verifyer = SigVerifyer(
-            filename=f"{assets_dir}/krux-{version}.zip",
+            filename=zipfile,
             regexp=r"^.*\.zip$",
             signature=signature.data,
-            pubkey=publickey.data,
+            pubkey=pubkey,
+            digest=self.zip_digest,
+        )
+        sig_verifyer.load(
+            on_progress=partial(
+                self.on_hash_progress, check="Authenticity verification"
+            )
+        )
+        checksig = sig_verifyer.verify()
+
+        if not checksig and self.is_key_rotated(trust):
+            self.warning("verify_signature::the published key is not the pinned one")
+
+        cache.put(
+            zipfile,
+            signature.data,
+            pubkey,
+            digest=sig_verifyer.digest,
+            verified=checksig,
         )
-        sig_verifyer.load()
-        return sig_verifyer.verify()
+        return checksig
+
+    def is_key_rotated(self, trust: TrustStore) -> bool:
+        """
+        Fetch the public key from network; return True if it is not the
+        pinned one. When it cannot be fetched (e.g. offline), return False
+        """
+        try:
+            return trust.is_rotated()
+        except (OSError, RuntimeError, ValueError) as exc:
+            self.warning("is_key_rotated::%s", exc)
+            return False
 
     def build_message_verify_signature(self, assets_dir: str, version: str) -> str:
         """Create a message which user can assert authenticity the verification"""
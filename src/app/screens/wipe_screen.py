@@ -26,6 +26,7 @@ import traceback
 from functools import partial
 from kivy.clock import Clock
 from src.utils.flasher.wiper import Wiper
+from src.utils.ports import get_port_registry
 from src.app.screens.base_flash_screen import BaseFlashScreen
 
 
@@ -189,6 +190,9 @@ class WipeScreen(BaseFlashScreen):
 
         # hook what happened
         threading.excepthook = getattr(WipeScreen, "on_except_hook")
+
+        # watch the serial ports only while they are wiped
+        get_port_registry().start()
         self.thread.start()
 
     def update(self, *args, **kwargs):
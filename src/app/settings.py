@@ -0,0 +1,72 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+settings.py
+
+Getters of the application settings (and of the stores built from them)
+used by the flash and download screens
+"""
+from kivy.app import App
+from src.utils.store import ArtifactStore, get_store
+from src.utils.trust import TrustStore
+from src.utils.verifyer import verification_cache
+
+
+def get_parallel_flash() -> bool:
+    """Return True if all connected devices should be flashed in parallel"""
+    app = App.get_running_app()
+    return bool(int(app.config.get("flash", "parallel")))
+
+
+def get_download_connections() -> int:
+    """Return the current selected number of parallel download connections"""
+    app = App.get_running_app()
+    return max(1, int(app.config.get("download", "connections")))
+
+
+def get_warm_up() -> bool:
+    """Return True if the connections to github should be opened in advance"""
+    app = App.get_running_app()
+    return bool(int(app.config.get("download", "warm_up")))
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Return the store of downloaded artifacts under assets directory"""
+    app = App.get_running_app()
+    quota = max(0, int(app.config.get("download", "cache_size"))) * (1 << 20)
+    return get_store(destdir=app.config.get("destdir", "assets"), quota=quota)
+
+
+def get_trust_store() -> TrustStore:
+    """Return the store of trusted keys under assets directory"""
+    app = App.get_running_app()
+    return TrustStore(
+        root=app.config.get("destdir", "assets"), store=get_artifact_store()
+    )
+
+
+def get_verification_cache() -> verification_cache.VerificationCache:
+    """Return the cache of verification results under app's local dir"""
+    app = App.get_running_app()
+    return verification_cache.get_verification_cache(
+        root=app.create_app_dir(name="local")
+    )
@@ -28,3 +28,4 @@ from .sha256_downloader import Sha256Downloader
 from .sig_downloader import SigDownloader
 from .pem_downloader import PemDownloader
 from .beta_downloader import BetaDownloader
+from .release_downloader import ReleaseDownloader
@@ -22,8 +22,13 @@
 """
 asset_downloader.py
 """
+from __future__ import annotations
 import os
+import json
+import codecs
 import typing
+from ..hasher import hash_file, write_digest
+from ..store import ArtifactStore
 from .stream_downloader import StreamDownloader
 
 
@@ -32,21 +37,40 @@ class AssetDownloader(StreamDownloader):
     Subclass of :class:`StreamDownloader` for versioned asset releases.
     """
 
-    def __init__(self, url: str, destdir: str, write_mode: str):
+    # Assets whose url always points to the same content (like the
+    # assets of a tagged release) are served from :attr:`store`
+    # without any request; mutable ones are revalidated with a
+    # conditional request
+    IMMUTABLE = False
+
+    def __init__(
+        self,
+        url: str,
+        destdir: str,
+        write_mode: str,
+        connections: int = 1,
+        store: ArtifactStore | None = None,
+    ):
         super().__init__(url=url)
         self.destdir = destdir
         self.write_mode = write_mode
+        self.connections = connections
+        self.store = store
+
+        # Callbacks of the stream, defined by each download
+        self.on_start = None
+        self.on_data = None
 
     @property
     def destdir(self) -> str:
         """Getter for destination dir where the downloaded file will be placed"""
-        self.debug(f"destdir::getter={self._destdir}")
+        self.debug("destdir::getter=%s", self._destdir)
         return self._destdir
 
     @destdir.setter
     def destdir(self, value):
         """Setter for destination dir where the downloaded file will be placed"""
-        self.debug(f"destdir::setter={value}")
+        self.debug("destdir::setter=%s", value)
         if not os.path.exists(value):
             os.makedirs(value, exist_ok=True)
 
@@ -55,27 +79,156 @@ class AssetDownloader(StreamDownloader):
     @property
     def write_mode(self) -> str:
         """Getter for write mode ('wb' or 'w')"""
-        self.debug(f"write_mode::getter={self._write_mode}")
+        self.debug("write_mode::getter=%s", self._write_mode)
         return self._write_mode
 
     @write_mode.setter
     def write_mode(self, value: str):
         """Setter for write mode ('wb' or 'w')"""
         if value in ("w", "wb"):
-            self.debug(f"write_mode::setter={value}")
+            self.debug("write_mode::setter=%s", value)
             self._write_mode = value
         else:
             raise ValueError(f"Write Mode '{value}' not supported")
 
+    @property
+    def connections(self) -> int:
+        """Getter for the number of parallel connections (1 disables segmented mode)"""
+        self.debug("connections::getter=%s", self._connections)
+        return self._connections
+
+    @connections.setter
+    def connections(self, value: int):
+        """Setter for the number of parallel connections (1 disables segmented mode)"""
+        if isinstance(value, int) and value >= 1:
+            self.debug("connections::setter=%s", value)
+            self._connections = value
+        else:
+            raise ValueError(f"Invalid number of connections: {value}")
+
+    @property
+    def store(self) -> ArtifactStore | None:
+        """Getter for the store of downloaded artifacts (None disables it)"""
+        self.debug("store::getter=%s", self._store)
+        return self._store
+
+    @store.setter
+    def store(self, value: ArtifactStore | None):
+        """Setter for the store of downloaded artifacts (None disables it)"""
+        self.debug("store::setter=%s", value)
+        self._store = value
+
     def download(self, on_data: typing.Callable) -> str:
         """
         Download some zip release given its version and put it
-        on a destination directory (default: OS temporary dir)
+        on a destination directory (default: OS temporary dir).
+
+        Chunks are streamed to a `<destfile>.part` file inside :attr:`destdir`,
+        so the peak memory is bounded by :attr:`chunk_size`. Once the
+        stream finishes, the part file is flushed, fsynced and
+        atomically renamed to its final name.
+
+        Binary assets are resumable: a `<destfile>.part.json` sidecar keeps
+        the url, the validator (ETag or Last-Modified) and the expected
+        length, so a interrupted download (even after an app restart) only
+        request the missing bytes.
+
+        The SHA-256 of binary assets is computed while they are streamed
+        and written in a `<destfile>.digest.json` sidecar, so the
+        verification does not need to read the file again.
+
+        If a :attr:`store` is defined, immutable assets already stored
+        are placed at destination without network, and every
+        downloaded asset is added to it (with its ETag and Last-Modified).
+        Mutable assets already stored are requested with `If-None-Match`
+        and `If-Modified-Since`, so a `304 Not Modified` response is
+        completed with the stored copy, without body transfer.
+        """
+        destfile = os.path.join(self.destdir, os.path.basename(self.url))
+        self.debug("download::destfile=%s", destfile)
+
+        if self.IMMUTABLE and self.load_stored(destfile=destfile):
+            on_data(data=b"")
+            return destfile
+
+        partfile = f"{destfile}.part"
+        offset, validator = self.load_part(
+            partfile=partfile, sidecar=f"{partfile}.json"
+        )
+        self.debug("download::part=%s::offset=%s", partfile, offset)
+
+        # A fresh binary download can be splitted in byte ranges
+        # fetched in parallel (a resumable part is continued instead)
+        if self.connections > 1 and self.write_mode == "wb" and offset == 0:
+            if self.download_segmented(on_data=on_data, destfile=destfile):
+                return destfile
+
+        return self.download_streamed(
+            on_data=on_data, destfile=destfile, offset=offset, validator=validator
+        )
+
+    def download_segmented(self, on_data: typing.Callable, destfile: str) -> bool:
+        """
+        Download :attr:`url` to `destfile` with :attr:`connections` parallel
+        byte ranges. Return False if server does not support it
         """
+        partfile = f"{destfile}.part"
+        downloaded = self.download_segments(
+            on_data=on_data, partfile=partfile, sidecar=f"{partfile}.json"
+        )
+        if downloaded:
+            os.replace(partfile, destfile)
+
+            # The segments are written out of order, so the
+            # file is hashed once, after they were joined
+            sha256 = hash_file(destfile)
+            write_digest(destfile, sha256)
+            self.save_stored(destfile=destfile, sha256=sha256)
+
+        return downloaded
+
+    def download_streamed(
+        self,
+        on_data: typing.Callable,
+        destfile: str,
+        offset: int = 0,
+        validator: str | None = None,
+    ) -> str:
+        """
+        Stream :attr:`url` to `destfile` through a part file, resuming it
+        from `offset` (if greater than zero) or revalidating the stored
+        copy (if any) with a conditional request
+        """
+        partfile = f"{destfile}.part"
+        sidecar = f"{partfile}.json"
+        conditions = self.load_conditions() if offset == 0 else {}
+
+        # When a download is resumed, the part file is opened in `ab`
+        # mode; otherwise the part file is truncated. If its a text file
+        # (a txt or sig file in our case) open the file in w mode with
+        # utf8 encode and decode each chunk incrementally (a multibyte
+        # char can be split between chunks)
+        state = {"file": None, "decoder": None, "headers": {}}
+
+        def local_on_start(offset: int, headers: typing.Mapping):
+            state["headers"] = headers
+            if self.write_mode == "wb":
+                # The digest of a resumed download
+                # includes the bytes already written
+                if offset > 0:
+                    self.hash_part(partfile=partfile, offset=offset)
+
+                # pylint: disable=consider-using-with,unspecified-encoding
+                state["file"] = open(partfile, "ab" if offset > 0 else "wb")
+                self.save_part(sidecar=sidecar, headers=headers)
+            else:
+                # pylint: disable=consider-using-with
+                state["file"] = open(partfile, self.write_mode, encoding="utf8")
+                state["decoder"] = codecs.getincrementaldecoder("utf8")()
 
         # Before the download the file stream,
         # you can define some method to be called
-        # after the buffer is wrote
+        # after the chunk is wrote
         # it will need to be a local defined function
         # because it will need a different behaviour
         # for different assets.
@@ -83,33 +236,225 @@ class AssetDownloader(StreamDownloader):
         # to update different graphical definition (in app/screens)
         # if compared to a zip file
         def local_on_data(data: bytes):
-            self.buffer.write(data)
+            if state["decoder"] is None:
+                state["file"].write(data)
+            else:
+                state["file"].write(state["decoder"].decode(data))
             on_data(data)
 
+        setattr(self, "on_start", local_on_start)
         setattr(self, "on_data", local_on_data)
 
-        # Now you can start the download process
-        self.download_file_stream(url=self.url)
+        try:
+            # Now you can start the download process
+            modified = self.download_file_stream(
+                url=self.url, offset=offset, validator=validator, **conditions
+            )
 
-        # Once the data is downloaded, you can
-        # put it on a file
-        destfile = os.path.join(self.destdir, self.filename)
-        self.debug(f"download::destfile={destfile}")
-        self.debug(f"download::write::{self.write_mode}={self.buffer.getvalue()}")
+            if not modified:
+                if self.load_stored(destfile=destfile):
+                    on_data(data=b"")
+                    return destfile
 
-        # If its a binary file (a zip in our case)
-        # open the file in wb mode
-        if self.write_mode == "wb":
-            # pylint: disable=unspecified-encoding
-            with open(destfile, self.write_mode) as file:
-                file.write(self.buffer.getvalue())
-
-        # If its a text file (a txt or sig file in our case)
-        # open the file in w mode with utf8 encode
-        if self._write_mode == "w":
-            with open(destfile, self.write_mode, encoding="utf8") as file:
-                value = self.buffer.getvalue()
-                text = value.decode("utf8")
-                file.write(text)
+                # The stored copy was evicted in the meantime
+                self.download_file_stream(url=self.url)
+
+            file = state["file"]
+            if state["decoder"] is not None:
+                file.write(state["decoder"].decode(b"", final=True))
 
+            # Ensure that data reached the disk before
+            # the file be visible with its final name
+            file.flush()
+            os.fsync(file.fileno())
+            file.close()
+
+            os.replace(partfile, destfile)
+
+            if os.path.exists(sidecar):
+                os.remove(sidecar)
+
+            if self.write_mode == "wb":
+                write_digest(destfile, self.sha256)
+
+        except BaseException:
+            if state["file"] is not None:
+                state["file"].close()
+
+            # Keep what was downloaded only if it can be resumed
+            if not os.path.exists(sidecar) and os.path.exists(partfile):
+                os.remove(partfile)
+            raise
+
+        self.save_stored(
+            destfile=destfile,
+            headers=state["headers"],
+            sha256=self.sha256 if self.write_mode == "wb" else None,
+        )
         return destfile
+
+    def load_conditions(self) -> typing.Dict[str, str]:
+        """
+        Return the validators of the stored copy of :attr:`url` as
+        arguments of a conditional :meth:`download_file_stream`
+        """
+        if self.store is None:
+            return {}
+
+        entry = self.store.lookup(self.url)
+        if entry is None:
+            return {}
+
+        conditions = {}
+        if entry.get("etag"):
+            conditions["if_none_match"] = entry["etag"]
+        if entry.get("last_modified"):
+            conditions["if_modified_since"] = entry["last_modified"]
+
+        self.debug("download::conditions=%s", conditions)
+        return conditions
+
+    def load_stored(self, destfile: str) -> bool:
+        """
+        Place the stored copy of :attr:`url` at `destfile` and
+        mark it as fully downloaded. Return False on a store miss
+        """
+        if self.store is None:
+            return False
+
+        entry = self.store.materialize(url=self.url, destfile=destfile)
+        if entry is None:
+            return False
+
+        self.debug("download::stored=%s", self.url)
+        self.content_len = os.path.getsize(destfile)
+        self.downloaded_len = self.content_len
+
+        # The store hashed the object just before placing it,
+        # so this digest was computed from the bytes at destfile
+        if self.write_mode == "wb":
+            write_digest(destfile, entry["sha256"])
+
+        return True
+
+    def hash_part(self, partfile: str, offset: int):
+        """Feed :attr:`hasher` with the first `offset` bytes of a part file"""
+        # pylint: disable=unspecified-encoding
+        with open(partfile, "rb") as file:
+            remaining = offset
+            while remaining > 0:
+                block = file.read(min(self.chunk_size << 6, remaining))
+                if not block:
+                    break
+                self.hasher.update(block)
+                remaining -= len(block)
+
+    def save_stored(
+        self,
+        destfile: str,
+        headers: typing.Mapping | None = None,
+        sha256: str | None = None,
+    ):
+        """
+        Add a downloaded file to :attr:`store`, with the `sha256` computed
+        while it was streamed, if any (a store failure is not fatal)
+        """
+        if self.store is None:
+            return
+
+        headers = headers or {}
+        try:
+            self.store.put(
+                url=self.url,
+                filename=destfile,
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified"),
+                sha256=sha256,
+            )
+        except OSError as exc:
+            self.warning("download::store_failed=%s", exc)
+
+    def download_segments(
+        self, on_data: typing.Callable, partfile: str, sidecar: str
+    ) -> bool:
+        """
+        Download the asset with :attr:`connections` parallel byte ranges
+        to a preallocated part file. Return False if server does not support it.
+        """
+        setattr(self, "on_data", on_data)
+
+        # A preallocated part file has holes, so it never can be resumed
+        if os.path.exists(sidecar):
+            os.remove(sidecar)
+
+        try:
+            downloaded = self.download_file_segments(
+                url=self.url, filename=partfile, connections=self.connections
+            )
+
+            if downloaded:
+                # pylint: disable=unspecified-encoding
+                with open(partfile, "rb+") as file:
+                    os.fsync(file.fileno())
+
+            return downloaded
+
+        except BaseException:
+            if os.path.exists(partfile):
+                os.remove(partfile)
+            raise
+
+    def load_part(self, partfile: str, sidecar: str) -> typing.Tuple[int, str | None]:
+        """
+        Check if exists a part file of a previous download of same :attr:`url`
+        and return the offset and the validator to resume it
+        """
+        if self.write_mode != "wb":
+            return (0, None)
+
+        if not os.path.isfile(partfile) or not os.path.isfile(sidecar):
+            return (0, None)
+
+        try:
+            with open(sidecar, "r", encoding="utf8") as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return (0, None)
+
+        size = os.path.getsize(partfile)
+        validator = meta.get("etag") or meta.get("last_modified")
+
+        if (
+            meta.get("url") != self.url
+            or not validator
+            or size >= int(meta.get("content_len", 0))
+        ):
+            return (0, None)
+
+        return (size, validator)
+
+    def save_part(self, sidecar: str, headers: typing.Mapping):
+        """
+        Write the sidecar of a part file if the response can be resumed later
+        (identity encoded and with a validator); otherwise remove it
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        encoding = headers.get("Content-Encoding", "identity")
+
+        if encoding != "identity" or not (etag or last_modified):
+            self.debug("download::not_resumable=%s", self.url)
+            if os.path.exists(sidecar):
+                os.remove(sidecar)
+            return
+
+        meta = {
+            "url": self.url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_len": self.content_len,
+        }
+        self.debug("download::sidecar=%s", meta)
+
+        with open(sidecar, "w", encoding="utf8") as file:
+            json.dump(meta, file)
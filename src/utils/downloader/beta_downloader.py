@@ -22,7 +22,9 @@
 """
 beta_downloader.py
 """
+from __future__ import annotations
 import tempfile
+from ..store import ArtifactStore
 from .asset_downloader import AssetDownloader
 
 
@@ -38,24 +40,32 @@ class BetaDownloader(AssetDownloader):
         device: str,
         binary_type: str,
         destdir: str = tempfile.gettempdir(),
+        connections: int = 1,
+        store: ArtifactStore | None = None,
     ):
         base_url = "https://raw.githubusercontent.com/odudex/krux_binaries/main"
         url = f"{base_url}/maixpy_{device}/{binary_type}"
-        super().__init__(url=url, destdir=destdir, write_mode="wb")
+        super().__init__(
+            url=url,
+            destdir=destdir,
+            write_mode="wb",
+            connections=connections,
+            store=store,
+        )
         self.device = device
         self.binary_type = binary_type
 
     @property
     def device(self):
         """Getter for the device of beta version"""
-        self.debug(f"device::getter={self._device}")
+        self.debug("device::getter=%s", self._device)
         return self._device
 
     @device.setter
     def device(self, value: str):
         """Setter for the device of beta version"""
         if value in BetaDownloader.VALID_DEVICES:
-            self.debug(f"device::setter={value}")
+            self.debug("device::setter=%s", value)
             self._device = value
         else:
             raise ValueError(f"Invalid device {value}")
@@ -63,14 +73,14 @@ class BetaDownloader(AssetDownloader):
     @property
     def binary_type(self):
         """Getter for the binary_type of beta version to be downloaded (firmware or kboot)"""
-        self.debug(f"binary_type::getter={self._binary_type}")
+        self.debug("binary_type::getter=%s", self._binary_type)
         return self._binary_type
 
     @binary_type.setter
     def binary_type(self, value: str):
         """Setter for the binary_type of beta version to be downloaded (firmware or kboot)"""
         if value in BetaDownloader.VALID_BINARY_TYPES:
-            self.debug(f"binary::setter={value}")
+            self.debug("binary::setter=%s", value)
             self._binary_type = value
         else:
             raise ValueError(f"Invalid binary_type {value}")
@@ -22,14 +22,18 @@
 """
 pem_downloader.py
 """
+from __future__ import annotations
 import tempfile
+from ..store import ArtifactStore
 from .asset_downloader import AssetDownloader
 
 
 class PemDownloader(AssetDownloader):
     """Download .pem public certificate file"""
 
-    def __init__(self, destdir: str = tempfile.gettempdir()):
+    def __init__(
+        self, destdir: str = tempfile.gettempdir(), store: ArtifactStore | None = None
+    ):
         base_url = "https://raw.githubusercontent.com/selfcustody/krux/main"
         url = f"{base_url}/selfcustody.pem"
-        super().__init__(url=url, destdir=destdir, write_mode="w")
+        super().__init__(url=url, destdir=destdir, write_mode="w", store=store)
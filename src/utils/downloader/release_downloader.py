@@ -0,0 +1,148 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+release_downloader.py
+"""
+from __future__ import annotations
+import tempfile
+import threading
+import typing
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from ..store import ArtifactStore
+from ..trigger import Trigger
+from .asset_downloader import AssetDownloader
+from .zip_downloader import ZipDownloader
+from .sha256_downloader import Sha256Downloader
+from .sig_downloader import SigDownloader
+
+
+class ReleaseDownloader(Trigger):
+    """
+    Download the .zip, .zip.sha256.txt and .zip.sig of an official release
+    concurrently, as one job with a single progress (the sum of all assets).
+    The selfcustody.pem is bundled (see :class:`src.utils.trust.TrustStore`)
+    """
+
+    def __init__(
+        self,
+        version: str,
+        destdir: str = tempfile.gettempdir(),
+        connections: int = 1,
+        store: ArtifactStore | None = None,
+    ):
+        super().__init__()
+        self.version = version
+        self.finished = False
+        self.downloaders = [
+            ZipDownloader(
+                version=version,
+                destdir=destdir,
+                connections=connections,
+                store=store,
+            ),
+            Sha256Downloader(version=version, destdir=destdir, store=store),
+            SigDownloader(version=version, destdir=destdir, store=store),
+        ]
+
+    @property
+    def url(self) -> str:
+        """Getter for the url of release's zip"""
+        return self.downloaders[0].url
+
+    @property
+    def destdir(self) -> str:
+        """Getter for destination dir where the downloaded files will be placed"""
+        return self.downloaders[0].destdir
+
+    @property
+    def content_len(self) -> int:
+        """Getter for the sum of content's length of all assets"""
+        return sum(d.content_len for d in self.downloaders)
+
+    @property
+    def downloaded_len(self) -> int:
+        """
+        Getter for the sum of downloaded data of all assets. It only
+        reaches :attr:`content_len` when all assets are written on disk
+        """
+        content_len = self.content_len
+        if self.finished:
+            return content_len
+
+        # A compressed response can decode to more bytes than its
+        # Content-Length, so limit each asset to its own length
+        downloaded_len = sum(
+            min(d.downloaded_len, d.content_len) for d in self.downloaders
+        )
+        return min(downloaded_len, content_len - 1)
+
+    def download(self, on_data: typing.Callable) -> typing.List[str]:
+        """
+        Download all assets in parallel threads. :attr:`on_data` is called
+        (one call at time) after all assets know their length, so the
+        progress never goes back. If a download fails, the others stop
+        at their next chunk and the first failure is raised
+        """
+        self.finished = False
+        lock = threading.Lock()
+        cancelled = threading.Event()
+
+        def local_on_data(data: bytes):
+            if cancelled.is_set():
+                raise RuntimeError("Download cancelled")
+
+            with lock:
+                if all(d.content_len > 0 for d in self.downloaders):
+                    on_data(data)
+
+        executor = ThreadPoolExecutor(max_workers=len(self.downloaders))
+        try:
+            futures = [
+                executor.submit(ReleaseDownloader._download, d, local_on_data)
+                for d in self.downloaders
+            ]
+
+            # A running download cannot be cancelled by its future, so the
+            # others are told to stop through their `on_data` callback
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            failed = [f for f in futures if f in done and f.exception() is not None]
+            if len(failed) > 0:
+                cancelled.set()
+                failed[0].result()
+
+            destfiles = [future.result() for future in futures]
+
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        self.debug("download::destfiles=%s", destfiles)
+
+        with lock:
+            self.finished = True
+            on_data(b"")
+
+        return destfiles
+
+    @staticmethod
+    def _download(downloader: AssetDownloader, on_data: typing.Callable) -> str:
+        """Download a single asset (to be submitted to a thread pool)"""
+        return downloader.download(on_data=on_data)
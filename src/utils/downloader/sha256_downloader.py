@@ -22,14 +22,23 @@
 """
 sha256_downloader.py
 """
+from __future__ import annotations
 import tempfile
+from ..store import ArtifactStore
 from .asset_downloader import AssetDownloader
 
 
 class Sha256Downloader(AssetDownloader):
     """Download .zip.sha256.txt release file"""
 
-    def __init__(self, version: str, destdir: str = tempfile.gettempdir()):
+    IMMUTABLE = True
+
+    def __init__(
+        self,
+        version: str,
+        destdir: str = tempfile.gettempdir(),
+        store: ArtifactStore | None = None,
+    ):
         base_url = "https://github.com/selfcustody/krux/releases/download"
         url = f"{base_url}/{version}/krux-{version}.zip.sha256.txt"
-        super().__init__(url=url, destdir=destdir, write_mode="w")
+        super().__init__(url=url, destdir=destdir, write_mode="w", store=store)
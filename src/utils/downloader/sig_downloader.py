@@ -22,14 +22,23 @@
 """
 sig_downloader.py
 """
+from __future__ import annotations
 import tempfile
+from ..store import ArtifactStore
 from .asset_downloader import AssetDownloader
 
 
 class SigDownloader(AssetDownloader):
     """Download .zip.sig release file"""
 
-    def __init__(self, version: str, destdir: str = tempfile.gettempdir()):
+    IMMUTABLE = True
+
+    def __init__(
+        self,
+        version: str,
+        destdir: str = tempfile.gettempdir(),
+        store: ArtifactStore | None = None,
+    ):
         base_url = "https://github.com/selfcustody/krux/releases/download"
         url = f"{base_url}/{version}/krux-{version}.zip.sig"
-        super().__init__(url=url, destdir=destdir, write_mode="wb")
+        super().__init__(url=url, destdir=destdir, write_mode="wb", store=store)
@@ -22,8 +22,14 @@
 """
 stream_downloader.py
 """
+from __future__ import annotations
 import os
+import hashlib
+import typing
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from ..session import get_session
 from .trigger_downloader import TriggerDownloader
 
 
@@ -32,7 +38,27 @@ class StreamDownloader(TriggerDownloader):
     Download files in a stream mode
     """
 
-    def download_file_stream(self, url: str):
+    # Smallest byte range fetched by a connection in segmented mode,
+    # more connections than this would only add handshake overhead
+    MIN_SEGMENT_SIZE = 1 << 20
+
+    def __init__(self, url: str):
+        super().__init__(url=url)
+        self.hasher = hashlib.sha256()
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 of the data streamed by :meth:`download_file_stream`"""
+        return self.hasher.hexdigest()
+
+    def download_file_stream(
+        self,
+        url: str,
+        offset: int = 0,
+        validator: str | None = None,
+        if_none_match: str | None = None,
+        if_modified_since: str | None = None,
+    ) -> bool:
         """
         Given a :attr:`url`, download a large file in a streaming manner to given
         destination folder (:attr: `dest_dir`)
@@ -41,25 +67,138 @@ class StreamDownloader(TriggerDownloader):
         some information with :attr:`on_data` as function (total_len, downloaded_len, start_time)
         until reaches the 100%.
 
-        Then return the name
+        If :attr:`offset` is greater than zero, only the missing bytes are
+        requested with a `Range` header (and `If-Range` with the given
+        :attr:`validator`, an ETag or Last-Modified date). If the server
+        ignores it, the download fallback to the full content. Before the
+        first chunk, :attr:`on_start` (if defined) is called with the offset
+        effectively accepted by the server (0 for a full download).
+
+        Each chunk is fed to an incremental SHA-256 (:attr:`hasher`), so the
+        digest of file is known as soon as the stream ends (when resuming,
+        :attr:`on_start` should feed it with the bytes before the offset).
+
+        A full download can be conditional: with :attr:`if_none_match`
+        (an ETag) or :attr:`if_modified_since` (a Last-Modified date) of a
+        local copy, the server can answer `304 Not Modified` without body.
+
+        Return False if the content was not modified, True otherwise.
+        """
+        self.filename = os.path.basename(url)
+        self.debug("download_file_stream::filename=%s", self.filename)
+
+        headers = self.stream_headers(
+            offset=offset,
+            validator=validator,
+            if_none_match=if_none_match,
+            if_modified_since=if_modified_since,
+        )
+        res = self.request_stream(url=url, headers=headers)
+
+        # The local copy is still valid, so there is nothing to transfer
+        if res.status_code == 304:
+            self.debug("download_file_stream::not_modified=%s", url)
+            res.close()
+            return False
+
+        # A 206 response means that server accepted the
+        # range request; any other means that server
+        # ignored it (or the file changed) and is sending
+        # the full content, so restart from the beginning
+        if offset > 0 and not StreamDownloader.is_partial_content(res, offset):
+            self.debug("download_file_stream::range_ignored=%s", offset)
+            offset = 0
+
+        # get some contents to calculate the amount
+        # of downloaded data
+        content_len = res.headers.get("Content-Length")
+        if content_len:
+            self.content_len = offset + int(content_len)
+        else:
+            raise RuntimeError(f"Empty Content-Length response for {url}")
+
+        self.downloaded_len = offset
+        self.hasher = hashlib.sha256()
+        self.debug("download_file_stream::content_len=%s", self.content_len)
+
+        on_start = getattr(self, "on_start", None)
+        if on_start is not None:
+            on_start(offset=offset, headers=res.headers)
+
+        # Get the chunks of bytes data
+        # and pass it to a post-processing
+        # method defined as `on_data`
+        on_data = getattr(self, "on_data")
+
+        # (nothing is logged per chunk, this loop is the hot path,
+        # so the state is kept in locals and only the downloaded
+        # length, read by `on_data` callbacks, is assigned)
+        downloaded_len = offset
+        update = self.hasher.update
+        for chunk in res.iter_content(chunk_size=self.chunk_size):
+            downloaded_len += len(chunk)
+            self.downloaded_len = downloaded_len
+            update(chunk)
+
+            # pylint: disable=not-callable
+            on_data(data=chunk)
+
+        # Now you can close connection
+        self.debug("download_file_stream::downloaded_len=%s", self.downloaded_len)
+        self.debug("downloaded_file_stream::closing_connection")
+        res.close()
+        return True
+
+    def stream_headers(
+        self,
+        offset: int = 0,
+        validator: str | None = None,
+        if_none_match: str | None = None,
+        if_modified_since: str | None = None,
+    ) -> typing.Dict[str, str]:
+        """
+        Headers of a request for the bytes after `offset` (a resumed download)
+        or for the full content, conditional on the given validators
+        """
+        headers = {
+            "Content-Disposition": f"attachment filename={self.filename}",
+            "Connection": "keep-alive",
+            "Cache-Control": "max-age=0",
+            "Accept-Encoding": "gzip, deflate, br",
+        }
+
+        # Ranges are meaningful only for the identity
+        # encoding of the file, so ask for it when resuming
+        if offset > 0:
+            headers["Accept-Encoding"] = "identity"
+            headers["Range"] = f"bytes={offset}-"
+            if validator:
+                headers["If-Range"] = validator
+
+        else:
+            if if_none_match:
+                headers["If-None-Match"] = if_none_match
+            if if_modified_since:
+                headers["If-Modified-Since"] = if_modified_since
+
+        return headers
+
+    def request_stream(
+        self, url: str, headers: typing.Mapping[str, str]
+    ) -> requests.Response:
+        """
+        Request a streamed response of `url`, raising a RuntimeError
+        on timeout, connection or HTTP errors
         """
-        # Get the filename by url and construct the request
         # Check for any HTTPError and then process chunks of data
         try:
-            self.filename = os.path.basename(url)
-            self.debug(f"download_file_stream::filename={self.filename}")
-
-            headers = {
-                "Content-Disposition": f"attachment filename={self.filename}",
-                "Connection": "keep-alive",
-                "Cache-Control": "max-age=0",
-                "Accept-Encoding": "gzip, deflate, br",
-            }
             self.debug(
-                "download_file_stream::requests.get=< url: "
-                + f"{url}, stream: True, headers: {headers}, timeout: 30 >"
+                "download_file_stream::session.get=< url: "
+                + "%s, stream: True, headers: %s, timeout: 30 >",
+                url,
+                headers,
             )
-            res = requests.get(url=url, stream=True, headers=headers, timeout=30)
+            res = get_session().get(url=url, stream=True, headers=headers, timeout=30)
 
             self.debug("download_file_stream::raise_for_status")
             res.raise_for_status()
@@ -77,29 +216,128 @@ class StreamDownloader(TriggerDownloader):
                 f"HTTP error {res.status_code}: {h_exc.__cause__}"
             ) from h_exc
 
-        # get some contents to calculate the amount
-        # of downloaded data
-        content_len = res.headers.get("Content-Length")
-        if content_len:
-            self.content_len = int(content_len)
-        else:
-            raise RuntimeError(f"Empty Content-Length response for {url}")
+        return res
 
-        self.debug(f"download_file_stream::content_len={self.content_len}")
+    @staticmethod
+    def is_partial_content(res: requests.Response, offset: int) -> bool:
+        """Check if a response is the requested range starting at `offset`"""
+        if res.status_code != 206:
+            return False
+
+        content_range = str(res.headers.get("Content-Range", ""))
+        return content_range.startswith(f"bytes {offset}-")
+
+    def download_file_segments(self, url: str, filename: str, connections: int) -> bool:
+        """
+        Given a :attr:`url`, download a large file splitted in byte ranges
+        fetched in parallel by :attr:`connections` workers. Each worker write
+        its range in a preallocated :attr:`filename` with positional writes,
+        while every chunk is reported by :attr:`on_data` in a single stream.
+
+        Return False (nothing is wrote) if the server do not support
+        ranges, so the caller can fallback to :meth:`download_file_stream`
+        """
+        self.filename = os.path.basename(url)
+        self.debug("download_file_segments::filename=%s", self.filename)
+
+        # Ask for the first byte to check if server accept ranges
+        # and to know the total length and the final url (releases
+        # are redirected to objects.githubusercontent.com)
+        res = self._request_range(url=url, start=0, end=0)
+        content_range = str(res.headers.get("Content-Range", ""))
+        res.close()
+
+        if res.status_code != 206 or not content_range.startswith("bytes 0-0/"):
+            self.debug("download_file_segments::ranges_not_supported=%s", url)
+            return False
+
+        total = content_range.split("/", maxsplit=1)[1]
+        if not total.isdigit():
+            self.debug("download_file_segments::unknown_length=%s", url)
+            return False
+
+        self.content_len = int(total)
+        self.downloaded_len = 0
+        self.debug("download_file_segments::content_len=%s", self.content_len)
+
+        segments = StreamDownloader.make_segments(self.content_len, connections)
+        self.debug("download_file_segments::segments=%s", segments)
+
+        # pylint: disable=unspecified-encoding
+        with open(filename, "wb") as file:
+            file.truncate(self.content_len)
 
-        # Get the chunks of bytes data
-        # and pass it to a post-processing
-        # method defined as `on_data`
         on_data = getattr(self, "on_data")
+        lock = threading.Lock()
 
-        for chunk in res.iter_content(chunk_size=self.chunk_size):
-            self.downloaded_len += len(chunk)
-            self.debug(f"download_file_stream::downloaded_len={self.downloaded_len}")
+        def fetch(segment: tuple):
+            start, end = segment
+            seg_res = self._request_range(url=res.url, start=start, end=end)
+            if not StreamDownloader.is_partial_content(seg_res, start):
+                seg_res.close()
+                raise RuntimeError(f"Invalid range response for bytes {start}-{end}")
 
-            # pylint: disable=not-callable
-            on_data(data=chunk)
+            written = 0
 
-            # Now you can close connection
-            self.debug("downloaded_file_stream::closing_connection")
+            # pylint: disable=unspecified-encoding
+            with open(filename, "r+b") as file:
+                file.seek(start)
+                for chunk in seg_res.iter_content(chunk_size=self.chunk_size):
+                    file.write(chunk)
+                    written += len(chunk)
 
-        res.close()
+                    with lock:
+                        self.downloaded_len += len(chunk)
+                        # pylint: disable=not-callable
+                        on_data(data=chunk)
+
+            seg_res.close()
+            if written != end - start + 1:
+                raise RuntimeError(
+                    f"Incomplete range bytes {start}-{end}: {written} bytes received"
+                )
+
+        with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+            for future in [executor.submit(fetch, seg) for seg in segments]:
+                future.result()
+
+        return True
+
+    def _request_range(self, url: str, start: int, end: int) -> requests.Response:
+        """Request an identity encoded byte range of url"""
+        headers = {
+            "Connection": "keep-alive",
+            "Accept-Encoding": "identity",
+            "Range": f"bytes={start}-{end}",
+        }
+        self.debug("_request_range::session.get=< url: %s, headers: %s >", url, headers)
+
+        try:
+            res = get_session().get(url=url, stream=True, headers=headers, timeout=30)
+            res.raise_for_status()
+            return res
+
+        except requests.exceptions.Timeout as t_exc:
+            raise RuntimeError(f"Download timeout error: {t_exc.__cause__ }") from t_exc
+
+        except requests.exceptions.ConnectionError as c_exc:
+            raise RuntimeError(
+                f"Download connection error: {c_exc.__cause__}"
+            ) from c_exc
+
+        except requests.exceptions.HTTPError as h_exc:
+            raise RuntimeError(
+                f"HTTP error {res.status_code}: {h_exc.__cause__}"
+            ) from h_exc
+
+    @staticmethod
+    def make_segments(content_len: int, connections: int) -> list:
+        """Split a content length in inclusive (start, end) byte ranges"""
+        count = max(
+            1, min(connections, content_len // StreamDownloader.MIN_SEGMENT_SIZE)
+        )
+        size = max(1, -(-content_len // count))
+        return [
+            (start, min(start + size, content_len) - 1)
+            for start in range(0, content_len, size)
+        ]
@@ -27,7 +27,10 @@ from .base_downloader import BaseDownloader
 
 class TriggerDownloader(BaseDownloader):
     """
-    Downloader with some configurations adds
+    Downloader with some configurations adds.
+
+    Its state is read (and the lengths are written) on every chunk,
+    so the accessors only validate on assignment and do not log
     """
 
     def __init__(self, url: str):
@@ -40,43 +43,37 @@ class TriggerDownloader(BaseDownloader):
     @property
     def content_len(self) -> int:
         """Getter for the content's length of the file to be downloaded"""
-        self.debug(f"content_len::getter={self._content_len}")
         return self._content_len
 
     @content_len.setter
     def content_len(self, value: int):
         """Setter for the content's length of the file to be downloaded"""
         self._content_len = value
-        self.debug(f"content_len::setter={value}")
 
     @property
     def filename(self) -> str:
         """Getter for the downloaded filename"""
-        self.debug(f"filename::getter={self._filename}")
         return self._filename
 
     @filename.setter
     def filename(self, value: str):
         """Setter for the downloaded filename"""
         self._filename = value
-        self.debug(f"filename::setter={self._filename}")
+        self.debug("filename::setter=%s", self._filename)
 
     @property
     def downloaded_len(self) -> int:
         """Getter for the ammount of downloaded data"""
-        self.debug(f"downloaded_len::getter={self._downloaded_len}")
         return self._downloaded_len
 
     @downloaded_len.setter
     def downloaded_len(self, value: int):
         """Setter for the ammount of downloaded data"""
         self._downloaded_len = value
-        self.debug(f"downloaded_len:setter={self._downloaded_len}")
 
     @property
     def chunk_size(self) -> int:
         """Getter for the size of chunks on downloaded data"""
-        self.debug(f"chunk_size::getter={self._chunk_size}")
         return self._chunk_size
 
     @chunk_size.setter
@@ -86,7 +83,7 @@ class TriggerDownloader(BaseDownloader):
         # see
         # https://stackoverflow.com/questions/57025836/how-to-check-if-a-given-number-is-a-power-of-two#57025941
         if (value & (value - 1) == 0) and value != 0:
-            self.debug(f"chunk_size::setter={value}")
+            self.debug("chunk_size::setter=%s", value)
             self._chunk_size = value
         else:
             raise ValueError(f"{value} isnt a power of 2")
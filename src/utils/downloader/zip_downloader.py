@@ -22,14 +22,30 @@
 """
 zip_downloader.py
 """
+from __future__ import annotations
 import tempfile
+from ..store import ArtifactStore
 from .asset_downloader import AssetDownloader
 
 
 class ZipDownloader(AssetDownloader):
     """Download .zip release file"""
 
-    def __init__(self, version: str, destdir: str = tempfile.gettempdir()):
+    IMMUTABLE = True
+
+    def __init__(
+        self,
+        version: str,
+        destdir: str = tempfile.gettempdir(),
+        connections: int = 1,
+        store: ArtifactStore | None = None,
+    ):
         base_url = "https://github.com/selfcustody/krux/releases/download"
         url = f"{base_url}/{version}/krux-{version}.zip"
-        super().__init__(url=url, destdir=destdir, write_mode="wb")
+        super().__init__(
+            url=url,
+            destdir=destdir,
+            write_mode="wb",
+            connections=connections,
+            store=store,
+        )
@@ -25,3 +25,4 @@ __init__.py
 
 from .flasher import Flasher
 from .wiper import Wiper
+from .provisioner import Provisioner
@@ -22,18 +22,29 @@
 """
 base_flasher.py
 """
+from __future__ import annotations
 import os
+import queue
 import typing
+import tempfile
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 from serial import Serial
 from serial.serialutil import SerialException
 from serial.tools import list_ports
 from src.utils.trigger import Trigger
+from src.utils.hasher import HASH_BLOCK_SIZE
+from src.utils.selector import VALID_DEVICES
+from src.utils.ports import STATE_AVAILABLE, get_port_registry
+from src.utils.ports.latency import LatencyTimer
 from src.utils.kboot.build.ktool import KTool
 
 
 class BaseFlasher(Trigger):
     """
-    Base class to flash kboot.kfpkg on devices
+    Base class to flash kboot.kfpkg on devices. The firmware can be a
+    path or a readable binary stream (e.g. a member of release zip)
     """
 
     VALID_BOARDS = ("goE", "dan")
@@ -56,49 +67,86 @@ class BaseFlasher(Trigger):
         super().__init__()
         self.ktool = KTool()
         self.stop_thread = False
+        self._device = None
 
     @property
-    def firmware(self) -> str:
-        """Getter for firmware's full path"""
-        self.debug(f"firmware::getter={self._firmware}")
+    def firmware(self) -> str | typing.BinaryIO:
+        """Getter for firmware's full path (or its stream)"""
         return self._firmware
 
     @firmware.setter
-    def firmware(self, value: str):
-        """Setter for firmware's firmware's full path"""
-        if not os.path.exists(value):
+    def firmware(self, value: str | typing.BinaryIO):
+        """Setter for firmware's full path (or its stream)"""
+        if hasattr(value, "readinto"):
+            self.debug("firmware::setter=<stream %s>", value)
+
+        elif not os.path.exists(value):
             raise ValueError(f"File do not exist: {value}")
 
-        self.debug(f"firmware::setter={value}")
+        else:
+            self.debug("firmware::setter=%s", value)
+
         self._firmware = value
 
+    @property
+    def device(self) -> str | None:
+        """
+        Getter for the device to be flashed (if None, it is
+        detected from firmware's path)
+        """
+        return self._device
+
+    @device.setter
+    def device(self, value: str | None):
+        """Setter for the device to be flashed"""
+        if value is not None and value not in VALID_DEVICES:
+            raise ValueError(f"Device not implemented: {value}")
+
+        self.debug("device::setter=%s", value)
+        self._device = value
+
+    @staticmethod
+    def get_vid(device: str) -> str:
+        """USB vendor ID of the serial converter of a device"""
+        if device in ("amigo", "amigo_tft", "amigo_ips", "m5stickv", "bit", "cube"):
+            return "0403"
+
+        if device in ("dock", "yahboom", "wonder_mv"):
+            return "7523"
+
+        raise ValueError(f"Device not implemented: {device}")
+
+    @staticmethod
+    def find_ports(device: str) -> typing.List[str]:
+        """Every port whose serial converter matches the VID of a device"""
+        vid = BaseFlasher.get_vid(device)
+        registry = get_port_registry()
+        if registry.running:
+            return [port.device for port in registry.ports(vid=vid)]
+
+        return sorted(port.device for port in list_ports.grep(vid))
+
     @property
     def port(self) -> str:
         """Getter for device port system full path"""
-        self.debug(f"ports::getter={self._port}")
         return self._port
 
     @port.setter
     def port(self, value: str):
         """Setter for available ports's full path by giving device name"""
-        if value in ("amigo", "amigo_tft", "amigo_ips", "m5stickv", "bit", "cube"):
-            vid = "0403"
-
-        elif value in ("dock", "yahboom", "wonder_mv"):
-            vid = "7523"
-
+        vid = BaseFlasher.get_vid(value)
+        registry = get_port_registry()
+        if registry.running:
+            self._available_ports_generator = iter(registry.ports(vid=vid))
         else:
-            raise ValueError(f"Device not implemented: {value}")
-
-        self._available_ports_generator = list_ports.grep(vid)
+            self._available_ports_generator = list_ports.grep(vid)
         port = next(self._available_ports_generator)
         self._port = port.device
-        self.debug(f"ports::setter={self._port}")
+        self.debug("ports::setter=%s", self._port)
 
     @property
     def board(self) -> str:
         """Return a new instance of board"""
-        self.debug(f"board::getter={self._board}")
         return self._board
 
     @board.setter
@@ -114,11 +162,11 @@ class BaseFlasher(Trigger):
             "cube",
         ):
             self._board = "goE"
-            self.debug(f"board::setter={self._board}")
+            self.debug("board::setter=%s", self._board)
 
         elif value in ("dock", "wonder_mv"):
             self._board = "dan"
-            self.debug(f"board::setter={self._board}")
+            self.debug("board::setter=%s", self._board)
 
         else:
             raise ValueError(f"Device not implemented: {value}")
@@ -126,14 +174,13 @@ class BaseFlasher(Trigger):
     @property
     def baudrate(self) -> int:
         """Getter for baudrate"""
-        self.debug(f"baudrate::getter={self._baudrate}")
         return self._baudrate
 
     @baudrate.setter
     def baudrate(self, value: int):
         """Setter for baudrate"""
         if value in BaseFlasher.VALID_BAUDRATES:
-            self.debug(f"baudrate::setter={value}")
+            self.debug("baudrate::setter=%s", value)
             self._baudrate = value
         else:
             raise ValueError(f"Invalid baudrate: {str(value)}")
@@ -145,7 +192,6 @@ class BaseFlasher(Trigger):
             - print_callback: a property of an instance of KTool that do KTool.log calls
             - callback: an argument of `process` method that parse the progress of flash
         """
-        self.debug(f"print_callback::getter={self._print_callback}")
         return self._print_callback
 
     @print_callback.setter
@@ -155,14 +201,163 @@ class BaseFlasher(Trigger):
             - print_callback: a property of an instance of KTool that do KTool.log calls
             - callback: an argument of `process` method that parse the progress of flash
         """
-        self.debug(f"print_callback::setter={value}")
+        self.debug("print_callback::setter=%s", value)
         self._print_callback = value
 
+    def detect_device(self) -> str | None:
+        """Return the given device or the one in firmware's path"""
+        if self.device is not None:
+            return self.device
+
+        detected = None
+        if isinstance(self.firmware, str):
+            for device in VALID_DEVICES:
+                # pylint: disable=unsupported-membership-test
+                if device in self.firmware:
+                    detected = device
+
+        return detected
+
+    @contextmanager
+    def firmware_file(self) -> typing.Iterator[str]:
+        """
+        Path of firmware to be given to KTool, which only read files. A
+        streamed firmware is copied, by blocks, to a private temporary
+        file, removed once the flash finishes (the stream is consumed)
+        """
+        if isinstance(self.firmware, str):
+            yield self.firmware
+            return
+
+        fd, path = tempfile.mkstemp(suffix=".kfpkg")
+        try:
+            with os.fdopen(fd, "wb") as file, self.firmware as stream:
+                buffer = bytearray(HASH_BLOCK_SIZE)
+                with memoryview(buffer) as view:
+                    for size in iter(lambda: stream.readinto(buffer), 0):
+                        file.write(view[:size])
+
+            self.debug("firmware_file::%s", path)
+            yield path
+
+        finally:
+            os.remove(path)
+
+    @contextmanager
+    def low_latency(self, port: str) -> typing.Iterator[int | None]:
+        """
+        Lower the latency timer of an FTDI port while it is flashed,
+        reporting the effective one in KTool's log
+        """
+        with LatencyTimer(port).lowered() as latency:
+            if latency is not None:
+                self.ktool.__class__.log(f"Latency timer of {port}: {latency} ms")
+            yield latency
+
     def is_port_working(self, port) -> bool:
-        """Check if a port is working"""
+        """
+        Check if a port is working. Ports known by a running
+        :class:`PortRegistry` were already probed when they arrived
+        (the unavailable ones are probed again)
+        """
+        registry = get_port_registry()
+        if registry.running:
+            state = registry.recheck(port)
+            if state is not None:
+                return state == STATE_AVAILABLE
+
         try:
             serialport = Serial(port)
             serialport.close()
             return True
         except SerialException:
             return False
+
+    def run_parallel(
+        self,
+        worker: typing.Callable,
+        ports: typing.List[str],
+        callback: typing.Callable | None = None,
+        on_data: typing.Callable[[str, str], None] | None = None,
+        max_workers: int | None = None,
+        **kwargs,
+    ) -> typing.Dict[str, typing.Dict]:
+        """
+        Run `worker(messages, port=port, **kwargs)` for each port, each one
+        with its own KTool session in a (spawned) worker process, so nothing
+        is shared among ports (neither KTool's class-level callbacks nor
+        `sys.argv`). Messages put by workers are dispatched to `callback`
+        (progress) and `on_data` (logs). Return the result of each port
+        (a port busy with another flash or wipe is not touched)
+        """
+        context = multiprocessing.get_context("spawn")
+        registry = get_port_registry()
+        acquired = [port for port in ports if registry.acquire(port)]
+        results = {
+            port: {"success": False, "error": "port busy"}
+            for port in ports
+            if port not in acquired
+        }
+
+        for port, result in results.items():
+            self.warning("run_parallel::%s=%s", port, result)
+
+        if not acquired:
+            return results
+
+        try:
+            with context.Manager() as manager:
+                messages = manager.Queue()
+                with ProcessPoolExecutor(
+                    max_workers=max_workers or len(acquired), mp_context=context
+                ) as executor:
+                    futures = {
+                        port: executor.submit(worker, messages, port=port, **kwargs)
+                        for port in acquired
+                    }
+
+                    while not all(f.done() for f in futures.values()):
+                        BaseFlasher.dispatch(messages, callback, on_data, timeout=0.1)
+
+                    BaseFlasher.dispatch(messages, callback, on_data)
+
+                    for port, future in futures.items():
+                        try:
+                            results[port] = future.result()
+                        # e.g. a worker killed (BrokenProcessPool)
+                        # pylint: disable=broad-exception-caught
+                        except Exception as exc:
+                            results[port] = {"success": False, "error": str(exc)}
+
+                        self.info("run_parallel::%s=%s", port, results[port])
+        finally:
+            for port in acquired:
+                registry.release(port)
+
+        return results
+
+    @staticmethod
+    def dispatch(
+        messages,
+        callback: typing.Callable | None,
+        on_data: typing.Callable[[str, str], None] | None,
+        timeout: float | None = None,
+    ):
+        """
+        Call the progress `callback` (or `on_data`) for each message put
+        by the workers. Wait up to `timeout` for the first one, if given
+        """
+        try:
+            message = (
+                messages.get(timeout=timeout) if timeout else messages.get_nowait()
+            )
+            while True:
+                port, kind, value = message
+                if kind == "progress" and callback is not None:
+                    callback(port, *value)
+                elif kind == "data" and on_data is not None:
+                    on_data(port, value)
+                message = messages.get_nowait()
+
+        except queue.Empty:
+            pass
@@ -22,9 +22,11 @@
 """
 __init__.py
 """
+from __future__ import annotations
 import typing
-from src.utils.selector import VALID_DEVICES
 from src.utils.flasher.base_flasher import BaseFlasher
+from src.utils.ports.latency import LatencyTimer
+from src.utils.kboot.build.ktool import KTool
 
 # Example of parsing progress
 # def get_progress(file_type_str, iteration, total, suffix):
@@ -40,6 +42,47 @@ from src.utils.flasher.base_flasher import BaseFlasher
 #        sys.stdout.write(msg)
 
 
+def flash_port(
+    messages, port: str, board: str, baudrate: int, firmware: str
+) -> typing.Dict:
+    """
+    Flash a firmware through a port with an independent KTool session
+    (it runs in a worker process, so KTool's class-level callbacks are
+    not shared among ports). KTool's logs and progress are put in the
+    `messages` queue as `(port, kind, value)` tuples
+    """
+
+    def on_data(*args, **kwargs):
+        # pylint: disable=unused-argument
+        messages.put((port, "data", " ".join(str(x) for x in args)))
+
+    def on_process(file_type: str, iteration: int, total: int, suffix: str):
+        messages.put((port, "progress", (file_type, iteration, total, suffix)))
+
+    KTool.print_callback = on_data
+    ktool = KTool()
+
+    try:
+        with LatencyTimer(port).lowered() as latency:
+            if latency is not None:
+                on_data(f"Latency timer of {port}: {latency} ms")
+
+            ktool.process(
+                terminal=False,
+                dev=port,
+                baudrate=baudrate,
+                board=board,
+                file=firmware,
+                callback=on_process,
+            )
+        return {"success": True, "error": None}
+
+    # KTool exceptions cannot be always pickled to the parent process
+    # pylint: disable=broad-exception-caught
+    except Exception as exc:
+        return {"success": False, "error": str(exc)}
+
+
 class Flasher(BaseFlasher):
     """
     A class to parse KTool outputs: We don't want to modify the
@@ -50,24 +93,33 @@ class Flasher(BaseFlasher):
     def flash(self, callback: typing.Callable):
         """
         Detect available ports, try default flash process and
-        if not work, try custom port
+        if not work, try custom port. A streamed firmware
+        needs a :attr:`device`, since it has no path to be detected
         """
-        for device in VALID_DEVICES:
-            # pylint: disable=unsupported-membership-test
-            if device in self.firmware:
-                self.port = device
-                self.board = device
+        device = self.detect_device()
+        if device is not None:
+            self.port = device
+            self.board = device
 
+        with self.firmware_file() as firmware:
+            self.flash_file(firmware, callback=callback)
+
+    def flash_file(self, firmware: str, callback: typing.Callable):
+        """
+        Try default flash process of a firmware's file and
+        if not work, try custom port
+        """
         if self.is_port_working(self.port):
             try:
-                self.ktool.process(
-                    terminal=False,
-                    dev=self.port,
-                    baudrate=int(self.baudrate),
-                    board=self.board,
-                    file=self.firmware,
-                    callback=callback,
-                )
+                with self.low_latency(self.port):
+                    self.ktool.process(
+                        terminal=False,
+                        dev=self.port,
+                        baudrate=int(self.baudrate),
+                        board=self.board,
+                        file=firmware,
+                        callback=callback,
+                    )
 
             # pylint: disable=broad-exception-caught
             except Exception as exc:
@@ -77,14 +129,15 @@ class Flasher(BaseFlasher):
                 try:
                     newport = next(self._available_ports_generator)
                     if self.is_port_working(newport.device):
-                        self.ktool.process(
-                            terminal=False,
-                            dev=newport.device,
-                            baudrate=int(self.baudrate),
-                            board=self.board,
-                            file=self.firmware,
-                            callback=callback,
-                        )
+                        with self.low_latency(newport.device):
+                            self.ktool.process(
+                                terminal=False,
+                                dev=newport.device,
+                                baudrate=int(self.baudrate),
+                                board=self.board,
+                                file=firmware,
+                                callback=callback,
+                            )
 
                     else:
                         exc = RuntimeError(f"Port {newport.device} not working")
@@ -96,3 +149,39 @@ class Flasher(BaseFlasher):
         else:
             exc = RuntimeError(f"Port {self.port} not working")
             self.ktool.__class__.log(str(exc))
+
+    def flash_all(
+        self,
+        callback: typing.Callable,
+        on_data: typing.Callable[[str, str], None] | None = None,
+        max_workers: int | None = None,
+    ) -> typing.Dict[str, typing.Dict]:
+        """
+        Flash, in parallel, every connected device whose port matches the
+        VID of :attr:`device`, each one with its own KTool session in a
+        worker process. `callback(port, file_type, iteration, total, suffix)`
+        reports the progress of each port and `on_data(port, text)` its
+        KTool's logs. Return the `{"success", "error"}` result of each port
+        """
+        device = self.detect_device()
+        if device is None:
+            raise ValueError("Device not detected")
+
+        self.board = device
+        ports = [p for p in BaseFlasher.find_ports(device) if self.is_port_working(p)]
+        if len(ports) == 0:
+            raise RuntimeError(f"No port found for {device}")
+
+        self.info("flash_all::%s=%s", device, ports)
+
+        with self.firmware_file() as firmware:
+            return self.run_parallel(
+                flash_port,
+                ports,
+                callback=callback,
+                on_data=on_data,
+                max_workers=max_workers,
+                board=self.board,
+                baudrate=int(self.baudrate),
+                firmware=firmware,
+            )
@@ -0,0 +1,174 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+provisioner.py
+
+Wipe and flash a device in a single KTool session: the greeting and the
+ISP upload happen once, then the whole SPI flash is erased and the
+firmware is programmed, reporting how long each phase took
+"""
+from __future__ import annotations
+import sys
+import time
+import typing
+from src.utils.flasher.base_flasher import BaseFlasher
+from src.utils.ports.latency import LatencyTimer
+from src.utils.kboot.build.ktool import KTool
+
+# Phases of a KTool session, each one finished when
+# its marker is found in KTool's logs
+PHASE_MARKERS = (
+    ("connect", "Initialize K210 SPI Flash"),
+    ("erase", "SPI Flash erased"),
+    ("flash", "Rebooting"),
+)
+
+
+class PhaseTimer:
+    """Time the phases of a KTool session by the markers in its logs"""
+
+    def __init__(
+        self,
+        markers: typing.Tuple[typing.Tuple[str, str], ...] = PHASE_MARKERS,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        self.markers = markers
+        self.clock = clock
+        self._started = clock()
+        self._last = self._started
+        self._timings = {}
+
+    @property
+    def timings(self) -> typing.Dict[str, float]:
+        """Seconds spent in each finished phase (and in all of them)"""
+        return dict(self._timings)
+
+    def feed(self, text: str):
+        """Finish the phases whose markers are in a log line"""
+        for phase, marker in self.markers:
+            if phase not in self._timings and marker in text:
+                now = self.clock()
+                self._timings[phase] = now - self._last
+                self._timings["total"] = now - self._started
+                self._last = now
+
+
+def provision_port(
+    messages, port: str, board: str, baudrate: int, firmware: str
+) -> typing.Dict:
+    """
+    Erase and flash a device through a port in a single KTool session. Like
+    :func:`src.utils.flasher.wiper.erase_port`, KTool reads the erase option
+    from the `sys.argv` of this worker process, now along with the firmware
+    """
+    timer = PhaseTimer()
+
+    def on_data(*args, **kwargs):
+        # pylint: disable=unused-argument
+        text = " ".join(str(x) for x in args)
+        timer.feed(text)
+        messages.put((port, "data", text))
+
+    argv = sys.argv
+    sys.argv = ["ktool", "-B", board, "-b", str(baudrate), "-p", port, "-E", firmware]
+    KTool.print_callback = on_data
+
+    try:
+        with LatencyTimer(port).lowered() as latency:
+            if latency is not None:
+                on_data(f"Latency timer of {port}: {latency} ms")
+
+            KTool().process()
+        return {"success": True, "error": None, "timings": timer.timings}
+
+    # KTool exceptions cannot be always pickled to the parent process
+    # pylint: disable=broad-exception-caught
+    except Exception as exc:
+        return {"success": False, "error": str(exc), "timings": timer.timings}
+
+    finally:
+        sys.argv = argv
+
+
+class Provisioner(BaseFlasher):
+    """Class to wipe and flash devices without replug them"""
+
+    def provision(
+        self,
+        port: str,
+        board: str,
+        baudrate: int,
+        on_data: typing.Callable[[str, str], None] | None = None,
+    ) -> typing.Dict:
+        """
+        Erase and flash :attr:`firmware` in the device at a port. Return its
+        `{"success", "error", "timings"}` result, where `timings` has the
+        seconds spent to connect (greeting and ISP upload), erase and flash
+        """
+        if board not in BaseFlasher.VALID_BOARDS:
+            raise ValueError(f"Invalid board: {board}")
+
+        if baudrate not in BaseFlasher.VALID_BAUDRATES:
+            raise ValueError(f"Invalid baudrate: {str(baudrate)}")
+
+        with self.firmware_file() as firmware:
+            results = self.run_parallel(
+                provision_port,
+                [port],
+                on_data=on_data,
+                board=board,
+                baudrate=baudrate,
+                firmware=firmware,
+            )
+
+        self.info("provision::%s=%s", port, results[port]["timings"])
+        return results[port]
+
+    def provision_all(
+        self,
+        on_data: typing.Callable[[str, str], None] | None = None,
+        max_workers: int | None = None,
+    ) -> typing.Dict[str, typing.Dict]:
+        """
+        Erase and flash, in parallel, every connected device whose port
+        matches the VID of :attr:`device`. Return the result of each port
+        """
+        device = self.detect_device()
+        if device is None:
+            raise ValueError("Device not detected")
+
+        self.board = device
+        ports = [p for p in BaseFlasher.find_ports(device) if self.is_port_working(p)]
+        if len(ports) == 0:
+            raise RuntimeError(f"No port found for {device}")
+
+        self.info("provision_all::%s=%s", device, ports)
+        with self.firmware_file() as firmware:
+            return self.run_parallel(
+                provision_port,
+                ports,
+                on_data=on_data,
+                max_workers=max_workers,
+                board=self.board,
+                baudrate=int(self.baudrate),
+                firmware=firmware,
+            )
@@ -22,49 +22,135 @@
 """
 wiper.py
 """
+from __future__ import annotations
 import sys
+import typing
 from src.utils.flasher.base_flasher import BaseFlasher
 from src.utils.selector import VALID_DEVICES
+from src.utils.kboot.build.ktool import KTool
+
+
+def erase_port(messages, port: str, board: str, baudrate: int) -> typing.Dict:
+    """
+    Erase a device through a port with an independent KTool session. KTool
+    only reads the erase option from `sys.argv`, so this runs in a worker
+    process, whose own `sys.argv` is given to KTool (the caller's one is
+    never changed). KTool's logs are put in the `messages` queue
+    """
+
+    def on_data(*args, **kwargs):
+        # pylint: disable=unused-argument
+        messages.put((port, "data", " ".join(str(x) for x in args)))
+
+    argv = sys.argv
+    sys.argv = ["ktool", "-B", board, "-b", str(baudrate), "-p", port, "-E"]
+    KTool.print_callback = on_data
+
+    try:
+        KTool().process()
+        return {"success": True, "error": None}
+
+    # KTool exceptions cannot be always pickled to the parent process
+    # pylint: disable=broad-exception-caught
+    except Exception as exc:
+        return {"success": False, "error": str(exc)}
+
+    finally:
+        sys.argv = argv
 
 
 class Wiper(BaseFlasher):
     """Class to wipe some specific board"""
 
+    def erase(
+        self,
+        port: str,
+        board: str,
+        baudrate: int,
+        on_data: typing.Callable[[str, str], None] | None = None,
+    ) -> typing.Dict:
+        """
+        Erase the device at a port with explicit arguments. It is safe to be
+        called concurrently (e.g. from many threads), since each erase runs
+        in its own process. Return its `{"success", "error"}` result
+        """
+        if board not in BaseFlasher.VALID_BOARDS:
+            raise ValueError(f"Invalid board: {board}")
+
+        if baudrate not in BaseFlasher.VALID_BAUDRATES:
+            raise ValueError(f"Invalid baudrate: {str(baudrate)}")
+
+        results = self.run_parallel(
+            erase_port, [port], on_data=on_data, board=board, baudrate=baudrate
+        )
+        return results[port]
+
+    def erase_all(
+        self,
+        device: str,
+        on_data: typing.Callable[[str, str], None] | None = None,
+        max_workers: int | None = None,
+    ) -> typing.Dict[str, typing.Dict]:
+        """
+        Erase, in parallel, every connected device whose port matches the VID
+        of a device. Return the `{"success", "error"}` result of each port
+        """
+        self.board = device
+        ports = [p for p in BaseFlasher.find_ports(device) if self.is_port_working(p)]
+        if len(ports) == 0:
+            raise RuntimeError(f"No port found for {device}")
+
+        self.info("erase_all::%s=%s", device, ports)
+        return self.run_parallel(
+            erase_port,
+            ports,
+            on_data=on_data,
+            max_workers=max_workers,
+            board=self.board,
+            baudrate=int(self.baudrate),
+        )
+
+    def on_erase_data(self, port: str, text: str):
+        """Forward the logs of an erase to KTool's print_callback"""
+        self.debug("on_erase_data::%s", port)
+        print_callback = getattr(self.ktool.__class__, "print_callback", None)
+        if print_callback is not None:
+            print_callback(text)
+
     def wipe(self, device: str):
         """Detect available ports, try default erase process and
         it not work, try custom port"""
         for dev in VALID_DEVICES:
             if dev == device:
-                self.info(f"Detected valid {device} to be wiped")
+                self.info("Detected valid %s to be wiped", device)
                 self.port = device
                 self.board = device
 
         if self.is_port_working(self.port):
-            try:
-                sys.argv.extend(
-                    ["-B", self.board, "-b", str(self.baudrate), "-p", self.port, "-E"]
-                )
-
-                self.ktool.process()
+            result = self.erase(
+                port=self.port,
+                board=self.board,
+                baudrate=int(self.baudrate),
+                on_data=self.on_erase_data,
+            )
 
-            # pylint: disable=broad-exception-caught
-            except Exception as exc:
-                self.ktool.__class__.log(f"{str(exc)} for {self.port}")
+            if not result["success"]:
+                self.ktool.__class__.log(f"{result['error']} for {self.port}")
                 self.ktool.__class__.log("")
 
                 try:
                     newport = next(self._available_ports_generator)
                     if self.is_port_working(newport.device):
-                        sys.argv = [
-                            "--port",
-                            newport.device,
-                            "--Board",
-                            self.board,
-                            "--baudrate",
-                            str(self.baudrate),
-                            "-E",
-                        ]
-                        self.ktool.process()
+                        result = self.erase(
+                            port=newport.device,
+                            board=self.board,
+                            baudrate=int(self.baudrate),
+                            on_data=self.on_erase_data,
+                        )
+                        if not result["success"]:
+                            raise RuntimeError(
+                                f"{result['error']} for {newport.device}"
+                            )
 
                     else:
                         exc = RuntimeError(f"Port {newport.device} not working")
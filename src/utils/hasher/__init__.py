@@ -0,0 +1,172 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+hasher.py
+
+Hash files in large blocks (`hashlib` releases the GIL while it
+digests blocks bigger than 2047 bytes, so the GUI keeps rendering while
+a release is hashed), in parallel for many files, or while they are
+copied from a stream (e.g. a zip member), and persist the SHA-256
+computed while an asset is downloaded in a `<file>.digest.json` sidecar,
+so the integrity check can reuse it instead of read the file again (the
+authenticity check always hashes the bytes on disk)
+"""
+from __future__ import annotations
+import os
+import json
+import mmap
+import hashlib
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+# Suffix of digest's sidecar
+DIGEST_SUFFIX = ".digest.json"
+
+# Size of each block fed to hashlib
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def hash_file(
+    filename: str,
+    block_size: int = HASH_BLOCK_SIZE,
+    on_progress: typing.Callable[[int, int], None] | None = None,
+) -> str:
+    """
+    Return the hex SHA-256 of a file. The file is mapped in memory and
+    hashed in slices of `block_size` (without copies); if it cannot
+    be mapped (e.g. an empty file), it is read into a reused buffer.
+    After each block, `on_progress(hashed_len, total_len)` is called
+    """
+    sha256 = hashlib.sha256()
+
+    with open(filename, "rb") as file:
+        total_len = os.fstat(file.fileno()).st_size
+        hashed_len = 0
+
+        try:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    for start in range(0, len(view), block_size):
+                        with view[start : start + block_size] as block:
+                            sha256.update(block)
+                            hashed_len += len(block)
+
+                        if on_progress is not None:
+                            on_progress(hashed_len, total_len)
+
+        except (OSError, ValueError):
+            file.seek(0)
+            hashed_len = 0
+            buffer = bytearray(block_size)
+            with memoryview(buffer) as view:
+                for size in iter(lambda: file.readinto(buffer), 0):
+                    sha256.update(view[:size])
+                    hashed_len += size
+
+                    if on_progress is not None:
+                        on_progress(hashed_len, total_len)
+
+    return sha256.hexdigest()
+
+
+def hash_copy(
+    source: typing.BinaryIO, destfile: str, block_size: int = HASH_BLOCK_SIZE
+) -> str:
+    """
+    Copy a readable binary stream to `destfile` and return the hex SHA-256
+    of copied data, computed in the same pass. The destination is written
+    in a temporary file and only replaces `destfile` when complete
+    """
+    sha256 = hashlib.sha256()
+    tmpfile = f"{destfile}.tmp"
+
+    try:
+        with open(tmpfile, "wb") as file:
+            buffer = bytearray(block_size)
+            with memoryview(buffer) as view:
+                for size in iter(lambda: source.readinto(buffer), 0):
+                    sha256.update(view[:size])
+                    file.write(view[:size])
+
+        os.replace(tmpfile, destfile)
+
+    except BaseException:
+        if os.path.exists(tmpfile):
+            os.remove(tmpfile)
+        raise
+
+    return sha256.hexdigest()
+
+
+def hash_files(
+    filenames: typing.Iterable[str], max_workers: int | None = None
+) -> typing.Dict[str, str]:
+    """
+    Hash many files in parallel threads and return a
+    dict of `filename -> hex SHA-256`
+    """
+    filenames = list(filenames)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        digests = executor.map(hash_file, filenames)
+        return dict(zip(filenames, digests))
+
+
+def digest_file(filename: str) -> str:
+    """Path of digest's sidecar of a file"""
+    return f"{filename}{DIGEST_SUFFIX}"
+
+
+def write_digest(filename: str, sha256: str):
+    """
+    Write the hex SHA-256 of a file along with its size and modification
+    time, so a changed file invalidates the digest
+    """
+    stat = os.stat(filename)
+    meta = {"sha256": sha256, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    sidecar = digest_file(filename)
+    tmpfile = f"{sidecar}.tmp"
+    with open(tmpfile, "w", encoding="utf8") as file:
+        json.dump(meta, file)
+    os.replace(tmpfile, sidecar)
+
+
+def read_digest(filename: str) -> str | None:
+    """
+    Return the persisted hex SHA-256 of a file, or None if there is no
+    digest or the file changed after it was written
+    """
+    try:
+        stat = os.stat(filename)
+        with open(digest_file(filename), "r", encoding="utf8") as file:
+            meta = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(meta, dict)
+        or meta.get("size") != stat.st_size
+        or meta.get("mtime_ns") != stat.st_mtime_ns
+    ):
+        return None
+
+    return meta.get("sha256")
@@ -0,0 +1,379 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+ports
+
+Long-lived registry of serial ports. A watcher thread polls the system for
+hotplug events and keeps the ports indexed by device, VID and USB topology
+path (location), each one with a state. On Linux, only the entries of
+`/dev/serial/by-path` and `/sys/class/tty` are listed at each poll, and the
+ports are enumerated again only when they change. Flash and wipe requests
+resolve their ports from the registry, and station UIs can be called back
+when a port arrives or departs. Opening a port toggles its DTR line (and can
+reset the device), so only the ports of supported serial converters are
+probed, and the registry is only watched while the ports are requested
+(e.g. while the flash or wipe screens are shown)
+"""
+from __future__ import annotations
+import os
+import sys
+import typing
+import threading
+from serial import Serial
+from serial.serialutil import SerialException
+from serial.tools import list_ports
+from serial.tools.list_ports_common import ListPortInfo
+from ..trigger import Trigger
+
+# Directories whose entries change when a serial device is (un)plugged
+WATCHED_DIRS = ("/dev/serial/by-path", "/sys/class/tty")
+
+# Seconds between polls of watcher thread
+POLL_INTERVAL = 1.0
+
+# Seconds to wait for the probe of an arrived port
+PROBE_TIMEOUT = 5.0
+
+# USB vendor IDs of the serial converters of supported devices
+# (FTDI and WCH), the only ports which are probed
+SUPPORTED_VIDS = ("0403", "7523")
+
+# States of a port
+STATE_AVAILABLE = "available"
+STATE_UNAVAILABLE = "unavailable"
+STATE_BUSY = "busy"
+STATE_PROBING = "probing"
+
+PortCallback = typing.Callable[[ListPortInfo], None]
+
+
+def probe_port(device: str) -> bool:
+    """Check if a port can be opened"""
+    try:
+        serialport = Serial(device)
+        serialport.close()
+        return True
+    except SerialException:
+        return False
+
+
+class PortRegistry(Trigger):
+    """
+    Indexed view of serial ports, refreshed on hotplug events. Each port
+    of :attr:`vids` is probed when it arrives, instead of each time it is
+    used, and probed again (see :meth:`recheck`) while it is unavailable
+    """
+
+    def __init__(
+        self,
+        interval: float = POLL_INTERVAL,
+        probe: bool = True,
+        vids: typing.Iterable[str] = SUPPORTED_VIDS,
+    ):
+        super().__init__()
+        self.interval = interval
+        self.probe = probe
+        self.vids = tuple(vid.lower() for vid in vids)
+        self._lock = threading.RLock()
+        self._probed = threading.Condition(self._lock)
+        self._ports = {}
+        self._states = {}
+        self._by_vid = {}
+        self._by_location = {}
+        self._signature = None
+        self._scanned = False
+        self._on_arrival = []
+        self._on_departure = []
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """Getter for the status of watcher thread"""
+        return self._thread is not None and self._thread.is_alive()
+
+    @staticmethod
+    def vid_of(info: ListPortInfo) -> str | None:
+        """USB vendor ID of a port as 4 hex digits (None if it is not USB)"""
+        return f"{info.vid:04x}" if info.vid is not None else None
+
+    @staticmethod
+    def signature() -> typing.Tuple | None:
+        """
+        Cheap fingerprint of the serial devices of system, changed by hotplug
+        events (the entries of :data:`WATCHED_DIRS`). None if it cannot be
+        computed in this platform, so the ports are always enumerated
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+
+        entries = []
+        for path in WATCHED_DIRS:
+            try:
+                entries.append(tuple(sorted(os.listdir(path))))
+            except OSError:
+                entries.append(None)
+
+        return tuple(entries)
+
+    def bind(
+        self,
+        on_arrival: PortCallback | None = None,
+        on_departure: PortCallback | None = None,
+    ):
+        """
+        Register callbacks for arrival and departure of ports. They are
+        called from the watcher thread (a GUI should schedule its changes)
+        """
+        with self._lock:
+            if on_arrival is not None:
+                self._on_arrival.append(on_arrival)
+            if on_departure is not None:
+                self._on_departure.append(on_departure)
+
+    def unbind(
+        self,
+        on_arrival: PortCallback | None = None,
+        on_departure: PortCallback | None = None,
+    ):
+        """Remove callbacks registered with :meth:`bind`"""
+        with self._lock:
+            if on_arrival in self._on_arrival:
+                self._on_arrival.remove(on_arrival)
+            if on_departure in self._on_departure:
+                self._on_departure.remove(on_departure)
+
+    def refresh(
+        self, force: bool = False
+    ) -> typing.Tuple[typing.List[str], typing.List[str]]:
+        """
+        Enumerate the ports again if the system changed since the last
+        refresh (or if `force`d), update the indexes and call the callbacks.
+        Return the devices which arrived and departed
+        """
+        signature = PortRegistry.signature()
+        if (
+            not force
+            and self._scanned
+            and signature is not None
+            and signature == self._signature
+        ):
+            return [], []
+
+        infos = {info.device: info for info in list_ports.comports()}
+
+        with self._lock:
+            arrived = [infos[d] for d in sorted(infos) if d not in self._ports]
+            departed = [self._ports[d] for d in sorted(self._ports) if d not in infos]
+
+            for info in departed:
+                self._remove(info)
+
+            for info in arrived:
+                self._add(info)
+
+            self._signature = signature
+            self._scanned = True
+            on_arrival = list(self._on_arrival)
+            on_departure = list(self._on_departure)
+
+        for info in arrived:
+            state = STATE_AVAILABLE
+            if self.probes(info) and not probe_port(info.device):
+                state = STATE_UNAVAILABLE
+
+            with self._lock:
+                if self._states.get(info.device) == STATE_PROBING:
+                    self._states[info.device] = state
+                self._probed.notify_all()
+
+            self.info("refresh::arrived::%s=%s", info.device, state)
+            for callback in on_arrival:
+                callback(info)
+
+        for info in departed:
+            self.info("refresh::departed::%s", info.device)
+            for callback in on_departure:
+                callback(info)
+
+        return [i.device for i in arrived], [i.device for i in departed]
+
+    def probes(self, info: ListPortInfo) -> bool:
+        """Check if a port is probed (i.e. it is of a supported VID)"""
+        return self.probe and PortRegistry.vid_of(info) in self.vids
+
+    def _add(self, info: ListPortInfo):
+        """
+        Index an arrived port, which cannot be acquired until it is probed
+        (see :meth:`refresh`)
+        """
+        self._ports[info.device] = info
+        # a port acquired before it was scanned is still busy
+        self._states.setdefault(
+            info.device, STATE_PROBING if self.probes(info) else STATE_AVAILABLE
+        )
+        vid = PortRegistry.vid_of(info)
+        if vid is not None:
+            self._by_vid.setdefault(vid, {})[info.device] = info
+        if info.location is not None:
+            self._by_location[info.location] = info
+
+    def _remove(self, info: ListPortInfo):
+        """Remove a departed port from indexes"""
+        del self._ports[info.device]
+        del self._states[info.device]
+        vid = PortRegistry.vid_of(info)
+        if vid is not None:
+            del self._by_vid[vid][info.device]
+            if len(self._by_vid[vid]) == 0:
+                del self._by_vid[vid]
+        if self._by_location.get(info.location) is info:
+            del self._by_location[info.location]
+
+    def ensure_scanned(self):
+        """Enumerate the ports at the first lookup"""
+        if not self._scanned:
+            self.refresh(force=True)
+
+    def ports(
+        self, vid: str | None = None, state: str | None = None
+    ) -> typing.List[ListPortInfo]:
+        """Ports of a VID (e.g. "0403") and/or in a state, sorted by device"""
+        self.ensure_scanned()
+        with self._lock:
+            found = self._ports if vid is None else self._by_vid.get(vid.lower(), {})
+            return [
+                found[d]
+                for d in sorted(found)
+                if state is None or self._states[d] == state
+            ]
+
+    def get(self, device: str) -> ListPortInfo | None:
+        """Port of a device (e.g. "/dev/ttyUSB0")"""
+        self.ensure_scanned()
+        with self._lock:
+            return self._ports.get(device)
+
+    def by_location(self, location: str) -> ListPortInfo | None:
+        """Port at a USB topology path (e.g. "1-1.2:1.0")"""
+        self.ensure_scanned()
+        with self._lock:
+            return self._by_location.get(location)
+
+    def state(self, device: str) -> str | None:
+        """State of a port (None if it is not connected)"""
+        self.ensure_scanned()
+        with self._lock:
+            return self._states.get(device)
+
+    def wait_probed(self, device: str, timeout: float = PROBE_TIMEOUT) -> str | None:
+        """State of a port after its probe (if it was still probed)"""
+        self.ensure_scanned()
+        with self._probed:
+            self._probed.wait_for(
+                lambda: self._states.get(device) != STATE_PROBING, timeout=timeout
+            )
+            return self._states.get(device)
+
+    def recheck(self, device: str) -> str | None:
+        """
+        State of a port, probed again if it was unavailable (e.g. it was
+        still opened by other program or its permission was just given)
+        """
+        state = self.wait_probed(device)
+        if state != STATE_UNAVAILABLE:
+            return state
+
+        state = STATE_AVAILABLE if probe_port(device) else STATE_UNAVAILABLE
+        with self._lock:
+            if self._states.get(device) == STATE_UNAVAILABLE:
+                self._states[device] = state
+            state = self._states.get(device)
+
+        self.debug("recheck::%s=%s", device, state)
+        return state
+
+    def acquire(self, device: str) -> bool:
+        """
+        Mark an available port (or one the registry does not know, e.g. it
+        was not scanned yet) as busy; False if it is unavailable, busy or
+        still probed
+        """
+        with self._lock:
+            if self._states.get(device) not in (None, STATE_AVAILABLE):
+                return False
+            self._states[device] = STATE_BUSY
+            return True
+
+    def release(self, device: str):
+        """Mark a busy port as available again (or forget an unknown one)"""
+        with self._lock:
+            if self._states.get(device) != STATE_BUSY:
+                return
+            if device in self._ports:
+                self._states[device] = STATE_AVAILABLE
+            else:
+                del self._states[device]
+
+    def start(self):
+        """Start the watcher thread (once)"""
+        with self._lock:
+            if self.running:
+                return
+
+            self._stop.clear()
+            self._thread = threading.Thread(
+                name="PortRegistry", target=self.watch, daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stop the watcher thread (it can be started again)"""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def watch(self):
+        """Poll the system for hotplug events until :meth:`stop`"""
+        self.refresh(force=True)
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            # keep watching (e.g. a device unplugged while it was probed)
+            # pylint: disable=broad-exception-caught
+            except Exception as exc:
+                self.warning("watch::%s", exc)
+
+
+_REGISTRY = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_port_registry() -> PortRegistry:
+    """Return the :class:`PortRegistry` shared by the application"""
+    # pylint: disable=global-statement
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = PortRegistry()
+        return _REGISTRY
@@ -0,0 +1,104 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+latency.py
+
+FTDI converters (VID 0403: amigo, m5stickv, bit and cube) buffer the data
+they receive for up to `latency_timer` milliseconds (16 by default on Linux)
+before sending it to the host, which throttles the request/ACK pattern of
+K210's ISP protocol. The ftdi_sio driver exposes this timer in sysfs, so it
+can be lowered while a device is flashed and restored afterwards
+"""
+from __future__ import annotations
+import os
+import typing
+from contextlib import contextmanager
+from ..trigger import Trigger
+
+# Where the usb-serial drivers expose the attributes of each tty
+SYSFS_USB_SERIAL = "/sys/bus/usb-serial/devices"
+
+# Latency timer (ms) used while flashing
+LOW_LATENCY_MS = 1
+
+
+class LatencyTimer(Trigger):
+    """
+    The `latency_timer` sysfs attribute of a port. Only ftdi_sio ports
+    have it, so a port without it (e.g. CH340 or not Linux) is unsupported
+    """
+
+    def __init__(self, device: str, root: str = SYSFS_USB_SERIAL):
+        super().__init__()
+        self.device = device
+        self.root = root
+
+    @property
+    def path(self) -> str:
+        """Path of attribute (a /dev/serial/by-* link is resolved to its tty)"""
+        tty = os.path.basename(os.path.realpath(self.device))
+        return os.path.join(self.root, tty, "latency_timer")
+
+    @property
+    def supported(self) -> bool:
+        """Check if the port has a latency timer"""
+        return os.path.isfile(self.path)
+
+    def read(self) -> int | None:
+        """Current latency timer in ms (None if it cannot be read)"""
+        try:
+            with open(self.path, "r", encoding="utf8") as file:
+                return int(file.read().strip())
+        except (OSError, ValueError):
+            return None
+
+    def write(self, value: int) -> bool:
+        """
+        Set the latency timer in ms. Writing needs permission (e.g. root
+        or an udev rule), so a refusal is logged and reported as False
+        """
+        try:
+            with open(self.path, "w", encoding="utf8") as file:
+                file.write(str(value))
+            self.debug("write::%s=%s", self.path, value)
+            return True
+        except OSError as exc:
+            self.warning("write::%s=%s", self.path, exc)
+            return False
+
+    @contextmanager
+    def lowered(self, value: int = LOW_LATENCY_MS) -> typing.Iterator[int | None]:
+        """
+        Lower the latency timer to `value` (if greater) within this context,
+        restoring the original one at exit. Yield the effective latency
+        timer (None if unsupported)
+        """
+        original = self.read()
+        changed = original is not None and original > value and self.write(value)
+        effective = self.read() if changed else original
+        self.info("lowered::%s=%s (was %s)", self.device, effective, original)
+
+        try:
+            yield effective
+        finally:
+            if changed:
+                self.write(original)
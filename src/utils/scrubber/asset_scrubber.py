@@ -0,0 +1,270 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+asset_scrubber.py
+
+Walk the assets' destination dir in background and verify every release
+(zip against its .sha256.txt and .sig) and every extracted member (against
+the size and CRC-32 recorded in its zip's index, and firmware.bin against
+its .sig), spreading the work over a small pool of low priority processes. The
+outcomes are recorded in a manifest, so corrupted files are flagged before
+they are needed and unchanged files are not verified again
+"""
+from __future__ import annotations
+import os
+import re
+import json
+import time
+import threading
+import multiprocessing
+import typing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from ..trigger import Trigger
+from ..trust import SELFCUSTODY_PEM, fingerprint
+from ..unzip.zip_index import ZipIndex
+from .checks import check_member, check_release, lower_priority
+
+# Name of manifest's file inside the destination dir
+MANIFEST_FILENAME = "scrub-manifest.json"
+
+# Name of releases that will be scrubbed
+RELEASE_REGEXP = r"^krux-v?\d+\.\d+\.\d+.*\.zip$"
+
+# Most worker processes of a scrub (it runs along a flash,
+# so it should not take all the cores of a station)
+MAX_WORKERS = 2
+
+
+class AssetScrubber(Trigger):
+    """
+    Verify the releases (and their extracted trees) found in :attr:`destdir`
+    and keep a `scrub-manifest.json` of `path -> {identity, sha256,
+    integrity, authenticity, ok, scrubbed_at}`. The identity (size and
+    modification time of the file and of the files it is checked against,
+    and the fingerprint of the public key) tells if a file must be
+    verified again
+    """
+
+    def __init__(
+        self,
+        destdir: str,
+        max_workers: int | None = None,
+        pubkey: bytes | None = None,
+    ):
+        super().__init__()
+        self.destdir = destdir
+        self.max_workers = max(1, min(max_workers or MAX_WORKERS, MAX_WORKERS))
+        # The pinned key, never a selfcustody.pem found in destdir
+        # (a tampered release could come with a tampered key)
+        self.pubkey = pubkey or SELFCUSTODY_PEM
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def destdir(self) -> str:
+        """Getter for the directory to be scrubbed"""
+        return self._destdir
+
+    @destdir.setter
+    def destdir(self, value: str):
+        """Setter for the directory to be scrubbed"""
+        if os.path.isdir(value):
+            self.debug("destdir::setter=%s", value)
+            self._destdir = value
+        else:
+            raise ValueError(f"Given path not exist: {value}")
+
+    @property
+    def manifest_file(self) -> str:
+        """Path of manifest"""
+        return os.path.join(self.destdir, MANIFEST_FILENAME)
+
+    @property
+    def thread(self) -> threading.Thread | None:
+        """Getter for the background thread of scrubbing"""
+        return self._thread
+
+    def load_manifest(self) -> typing.Dict[str, typing.Dict]:
+        """Read the manifest (an unreadable manifest is the same as an empty one)"""
+        try:
+            with open(self.manifest_file, "r", encoding="utf8") as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        return manifest if isinstance(manifest, dict) else {}
+
+    def save_manifest(self, manifest: typing.Dict[str, typing.Dict]):
+        """Write the manifest atomically"""
+        tmpfile = f"{self.manifest_file}.tmp"
+        with open(tmpfile, "w", encoding="utf8") as file:
+            json.dump(manifest, file, indent=2)
+        os.replace(tmpfile, self.manifest_file)
+
+    @staticmethod
+    def identity(*filenames: str | None) -> typing.List:
+        """Size and modification time of files (None for missing files)"""
+        identity = []
+        for filename in filenames:
+            try:
+                stat = os.stat(filename)
+                identity.append([stat.st_size, stat.st_mtime_ns])
+            except (OSError, TypeError):
+                identity.append(None)
+        return identity
+
+    def jobs(self) -> typing.Iterator[typing.Tuple[str, typing.Callable, tuple, list]]:
+        """
+        Yield the `(path, check, args, identity)` of every release
+        and of every extracted member found in :attr:`destdir`
+        """
+        for filename in sorted(os.listdir(self.destdir)):
+            if not re.match(RELEASE_REGEXP, filename):
+                continue
+
+            zipfile = os.path.join(self.destdir, filename)
+            sha256file = f"{zipfile}.sha256.txt"
+            sigfile = f"{zipfile}.sig"
+            yield (
+                zipfile,
+                check_release,
+                (zipfile, sha256file, sigfile, self.pubkey),
+                AssetScrubber.identity(zipfile, sha256file, sigfile)
+                + [fingerprint(self.pubkey)],
+            )
+
+            # only the members of devices are extracted
+            try:
+                names = list(ZipIndex(zipfile).members)
+            except (OSError, RuntimeError) as exc:
+                self.warning("jobs::%s::%s", zipfile, exc)
+                continue
+
+            for name in names:
+                path = os.path.join(self.destdir, *name.split("/"))
+                if not os.path.isfile(path):
+                    continue
+
+                # firmware.bin is signed by a firmware.bin.sig
+                sigfile = f"{path}.sig" if f"{name}.sig" in names else None
+                yield (
+                    path,
+                    check_member,
+                    (zipfile, name, path, sigfile, self.pubkey),
+                    AssetScrubber.identity(path, zipfile, sigfile)
+                    + [fingerprint(self.pubkey)],
+                )
+
+    def scrub(
+        self, on_result: typing.Callable[[str, typing.Dict], None] | None = None
+    ) -> typing.Dict[str, typing.Dict]:
+        """
+        Verify, on a pool of processes, every file that changed since it was
+        last verified, calling `on_result(path, entry)` as each one finishes.
+        Return the updated manifest
+        """
+        with self._lock:
+            manifest = self.load_manifest()
+            pending = {}
+            present = set()
+
+            for path, check, args, identity in self.jobs():
+                present.add(path)
+                entry = manifest.get(path)
+                if entry is None or entry.get("identity") != identity:
+                    pending[path] = (check, args, identity)
+
+            # forget files that are gone
+            manifest = {p: e for p, e in manifest.items() if p in present}
+            self.debug("scrub::pending=%s", len(pending))
+
+            if pending:
+                # spawn (instead of fork) is safe along the GUI threads
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=context,
+                    initializer=lower_priority,
+                ) as executor:
+                    futures = {
+                        executor.submit(check, *args): path
+                        for path, (check, args, _) in pending.items()
+                    }
+
+                    for future in as_completed(futures):
+                        path = futures[future]
+                        try:
+                            result = future.result()
+
+                        # pylint: disable=broad-exception-caught
+                        except Exception as exc:
+                            result = {"error": str(exc)}
+
+                        entry = AssetScrubber.make_entry(result, pending[path][2])
+                        manifest[path] = entry
+
+                        if not entry["ok"]:
+                            self.warning("scrub::corrupted=%s", path)
+
+                        if on_result is not None:
+                            on_result(path, entry)
+
+            self.save_manifest(manifest)
+            return manifest
+
+    @staticmethod
+    def make_entry(result: typing.Dict, identity: typing.List) -> typing.Dict:
+        """Create a manifest's entry from the result of a check"""
+        ok = (
+            "error" not in result
+            and result.get("integrity") is not False
+            and result.get("authenticity") is not False
+        )
+        return {
+            **result,
+            "identity": identity,
+            "ok": ok,
+            "scrubbed_at": time.time(),
+        }
+
+    def corrupted(self) -> typing.List[str]:
+        """Paths flagged as corrupted in the manifest"""
+        return [p for p, e in self.load_manifest().items() if not e.get("ok")]
+
+    def start(
+        self, on_result: typing.Callable[[str, typing.Dict], None] | None = None
+    ) -> threading.Thread:
+        """Scrub on a background thread (only one at a time) and return it"""
+        if self._thread is None or not self._thread.is_alive():
+
+            def _scrub():
+                try:
+                    self.scrub(on_result=on_result)
+                except OSError as exc:
+                    self.error("scrub::%s", exc)
+
+            self._thread = threading.Thread(
+                name="AssetScrubber", target=_scrub, daemon=True
+            )
+            self._thread.start()
+
+        return self._thread
@@ -0,0 +1,132 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+checks.py
+
+Self-contained checks run by the scrubber's worker processes. They only
+need the paths of files (so they are cheap to send to another process)
+and return plain dicts with the outcome
+"""
+from __future__ import annotations
+import os
+import typing
+from ..hasher import hash_file
+from ..unzip.zip_index import ZipIndex
+from ..verifyer.sig_verifyer import SigVerifyer
+
+
+def lower_priority():
+    """Initializer of worker processes: run them with a lower priority"""
+    # only POSIX systems have nice
+    if hasattr(os, "nice"):
+        try:
+            os.nice(10)
+        except OSError:
+            pass
+
+
+def read_bytes(filename: str | None) -> bytes | None:
+    """Read a small file (e.g. .sig), or None if there is no file"""
+    if filename is None:
+        return None
+
+    try:
+        with open(filename, "rb") as file:
+            return file.read()
+    except FileNotFoundError:
+        return None
+
+
+def check_signature(
+    filename: str, sha256: str, sigfile: str | None, pubkey: bytes
+) -> bool | None:
+    """
+    Verify a file, given its hex SHA-256, against its signature and the
+    public key's PEM (None if there is no signature)
+    """
+    signature = read_bytes(sigfile)
+    if signature is None:
+        return None
+
+    sig_verifyer = SigVerifyer(
+        filename=filename,
+        signature=signature,
+        pubkey=pubkey,
+        regexp=r".*",
+        digest=sha256,
+    )
+    return sig_verifyer.verify()
+
+
+def check_release(
+    zipfile: str, sha256file: str, sigfile: str, pubkey: bytes
+) -> typing.Dict:
+    """
+    Hash a release's zip and check it against its .sha256.txt (integrity)
+    and against its .sig with the public key's PEM (authenticity). Checks
+    without the needed files are None
+    """
+    result = {"sha256": None, "integrity": None, "authenticity": None}
+
+    try:
+        result["sha256"] = hash_file(zipfile)
+
+        provided = read_bytes(sha256file)
+        if provided is not None:
+            provided_hash = provided.decode("utf8").strip().split(" ", maxsplit=1)[0]
+            result["integrity"] = result["sha256"] == provided_hash
+
+        result["authenticity"] = check_signature(
+            zipfile, result["sha256"], sigfile, pubkey
+        )
+
+    except (OSError, ValueError) as exc:
+        result["error"] = str(exc)
+
+    return result
+
+
+def check_member(
+    zipfile: str, name: str, path: str, sigfile: str | None, pubkey: bytes
+) -> typing.Dict:
+    """
+    Hash an extracted member and check it against the size and CRC-32
+    recorded in the zip's index (integrity). If a signature of member is
+    given, check it with the public key too (authenticity)
+    """
+    result = {"sha256": None, "integrity": None, "authenticity": None}
+
+    try:
+        index = ZipIndex(zipfile)
+        if name not in index.members:
+            raise ValueError(f"Member not found: {name}")
+
+        result["integrity"] = index.matches(name, path)
+        result["sha256"] = hash_file(path)
+        result["authenticity"] = check_signature(
+            path, result["sha256"], sigfile, pubkey
+        )
+
+    except (OSError, ValueError, RuntimeError) as exc:
+        result["error"] = str(exc)
+
+    return result
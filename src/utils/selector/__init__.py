@@ -28,6 +28,7 @@ Generic selector to select devices or versions
 import typing
 from http.client import HTTPResponse
 import requests
+from ..session import get_session
 from ..trigger import Trigger
 
 VALID_DEVICES = (
@@ -65,15 +66,15 @@ class Selector(Trigger):
         """
         Get the current device
         """
-        self.debug(f"device::getter={self._device}")
+        self.debug("device::getter=%s", self._device)
         return self._device
 
     @device.setter
     def device(self, value: str):
         """Setter for the current device"""
-        self.debug(f"device::setter={value}")
+        self.debug("device::setter=%s", value)
         if value in VALID_DEVICES or value is None:
-            self.debug(f"device::setter={value}")
+            self.debug("device::setter=%s", value)
             self._device = value
         else:
             raise ValueError(f"Device '{value}' is not valid")
@@ -81,14 +82,14 @@ class Selector(Trigger):
     @property
     def firmware(self) -> str:
         """Getter for the current firmware version"""
-        self.debug(f"firmware::getter={self._firmware}")
+        self.debug("firmware::getter=%s", self._firmware)
         return self._firmware
 
     @firmware.setter
     def firmware(self, value: str):
         """Setter for the current firmware version"""
         if value in self.releases or value is None:
-            self.debug(f"firmware::setter={value}")
+            self.debug("firmware::setter=%s", value)
             self._firmware = value
         else:
             raise ValueError(f"Firmware '{value}' is not valid")
@@ -96,13 +97,13 @@ class Selector(Trigger):
     @property
     def releases(self) -> typing.List[dict]:
         """Getter of releases"""
-        self.debug(f"releases::getter={self._releases}")
+        self.debug("releases::getter=%s", self._releases)
         return self._releases
 
     @releases.setter
     def releases(self, value: typing.List[dict]):
         """Set a list of releases"""
-        self.debug(f"releases::setter={value}")
+        self.debug("releases::setter=%s", value)
         self._releases = value
 
     def _fetch_releases(self, timeout: int = 10) -> typing.List[str]:
@@ -111,12 +112,12 @@ class Selector(Trigger):
         https://github.com/selfcustody/krux/releases
         """
         try:
-            self.debug(f"releases::getter::URL={Selector.URL}")
+            self.debug("releases::getter::URL=%s", Selector.URL)
             accept = Selector.HEADERS["Accept"]
             api = Selector.HEADERS["X-GitHub-Api-Version"]
-            self.debug(f"releases::getter::HEADER=Accept: {accept}")
-            self.debug(f"releases::getter::HEADER=X-Github-Api-Version: {api}")
-            response = requests.get(
+            self.debug("releases::getter::HEADER=Accept: %s", accept)
+            self.debug("releases::getter::HEADER=X-Github-Api-Version: %s", api)
+            response = get_session().get(
                 url=Selector.URL, headers=Selector.HEADERS, timeout=timeout
             )
             response.raise_for_status()
@@ -131,7 +132,7 @@ class Selector(Trigger):
             raise RuntimeError(h_exc) from h_exc
 
         res = response.json()
-        self.debug(f"releases::getter::response='{res}'")
+        self.debug("releases::getter::response='%s'", res)
 
         if len(res) == 0:
             raise ValueError(f"{Selector.URL} returned empty data")
@@ -144,5 +145,5 @@ class Selector(Trigger):
             obj.append(data["tag_name"])
 
         obj.append("odudex/krux_binaries")
-        self.debug(f"releases::getter={obj}")
+        self.debug("releases::getter=%s", obj)
         return obj
@@ -0,0 +1,230 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+session.py
+
+Process-wide HTTP session, shared by the selector and all downloaders,
+with keep-alive connection pools, a per-host connection limit and a DNS cache
+"""
+import socket
+import threading
+import time
+import typing
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+from ..trigger import Trigger
+
+# Hosts contacted along the flash flow (api, release redirects,
+# release assets and raw files). They are pre-connected by `warm_up`
+WARM_UP_URLS = (
+    "https://api.github.com",
+    "https://github.com",
+    "https://objects.githubusercontent.com",
+    "https://raw.githubusercontent.com",
+)
+
+
+class DnsCache:
+    """
+    Cache of `socket.getaddrinfo` results with a time to live.
+    It is bound to the pools of a :class:`DnsCachedAdapter` so every
+    new connection in a pool to a known host skips the DNS lookup
+    """
+
+    def __init__(self, ttl: float = 300):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def getaddrinfo(self, host: str, port: int, family: int = 0) -> typing.List:
+        """Return the cached addresses of host, resolving it if expired"""
+        key = (host, port, family)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+        infos = socket.getaddrinfo(host, port, family, socket.SOCK_STREAM)
+
+        with self._lock:
+            self._entries[key] = (now + self.ttl, infos)
+
+        return infos
+
+    def forget(self, host: str):
+        """Remove all cached addresses of a host"""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == host]:
+                del self._entries[key]
+
+    def clear(self):
+        """Remove all cached addresses"""
+        with self._lock:
+            self._entries.clear()
+
+    def connect(
+        self, conn: HTTPConnection, new_conn: typing.Callable[[], socket.socket]
+    ) -> socket.socket:
+        """
+        Open the socket of an urllib3 connection to the cached addresses
+        of its host. TLS still uses the hostname (for SNI and certificate
+        verification) because urllib3 take it from `conn.host`, not from
+        the resolved address
+        """
+        # pylint: disable=protected-access
+        host = conn._dns_host
+        try:
+            infos = self.getaddrinfo(host, conn.port, allowed_gai_family())
+        except OSError:
+            return new_conn()
+
+        error = None
+        for info in infos:
+            conn._dns_host = info[4][0]
+            try:
+                return new_conn()
+            except (NewConnectionError, ConnectTimeoutError) as exc:
+                error = exc
+            finally:
+                conn._dns_host = host
+
+        # all cached addresses failed, so they can be stale
+        self.forget(host)
+        if error is not None:
+            raise error
+        return new_conn()
+
+    def bind(self, pool_cls: typing.Type[HTTPConnectionPool]) -> typing.Type:
+        """
+        Subclass an urllib3 connection pool whose connections
+        resolve their host through this cache
+        """
+        cache = self
+
+        # pylint: disable=too-few-public-methods
+        class Connection(pool_cls.ConnectionCls):
+            """Connection that open its socket with :meth:`DnsCache.connect`"""
+
+            def _new_conn(self) -> socket.socket:
+                return cache.connect(self, super()._new_conn)
+
+        return type(pool_cls.__name__, (pool_cls,), {"ConnectionCls": Connection})
+
+
+class DnsCachedAdapter(HTTPAdapter):
+    """
+    A `HTTPAdapter` whose pools resolve hosts through a :class:`DnsCache`,
+    so only the connections of the mounting session use the cache
+    """
+
+    def __init__(self, dns_cache: DnsCache, **kwargs):
+        self.dns_cache = dns_cache
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": self.dns_cache.bind(HTTPConnectionPool),
+            "https": self.dns_cache.bind(HTTPSConnectionPool),
+        }
+
+
+class PooledSession(Trigger):
+    """
+    A `requests.Session` with keep-alive pools: each asset download
+    reuses the TCP/TLS connection of the previous one to the same host
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 8,
+        pool_maxsize: int = 8,
+        dns_ttl: float = 300,
+    ):
+        super().__init__()
+        self.dns_cache = DnsCache(ttl=dns_ttl)
+
+        # `pool_connections` is the number of hosts with a cached
+        # pool and `pool_maxsize` is the per-host connection limit
+        # (`pool_block` make callers wait for a free connection
+        # instead of opening one above the limit)
+        adapter = DnsCachedAdapter(
+            self.dns_cache,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=True,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.debug("session::pool=%sx%s", pool_connections, pool_maxsize)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Same as `requests.get`, but using the pooled connections"""
+        return self.session.get(url=url, **kwargs)
+
+    def warm_up(self, urls: typing.Iterable[str] = WARM_UP_URLS) -> threading.Thread:
+        """
+        Open (in background) the TLS connections to the given urls and
+        keep them in the pools, so the first byte of a later request
+        arrives sooner. Failures are ignored, since the real request
+        will report them
+        """
+
+        def connect():
+            for url in urls:
+                try:
+                    res = self.session.head(url, timeout=10, allow_redirects=False)
+                    res.close()
+                    self.debug("warm_up::%s=%s", url, res.status_code)
+                except requests.exceptions.RequestException as exc:
+                    self.debug("warm_up::%s=%s", url, exc)
+
+        thread = threading.Thread(name="warm_up", target=connect, daemon=True)
+        thread.start()
+        return thread
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+
+
+_SHARED_SESSION = None
+_SHARED_SESSION_LOCK = threading.Lock()
+
+
+def get_session() -> PooledSession:
+    """Return the process-wide :class:`PooledSession` (created on first use)"""
+    # pylint: disable=global-statement
+    global _SHARED_SESSION
+
+    with _SHARED_SESSION_LOCK:
+        if _SHARED_SESSION is None:
+            _SHARED_SESSION = PooledSession()
+
+        return _SHARED_SESSION
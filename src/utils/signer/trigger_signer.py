@@ -50,7 +50,7 @@ class TriggerSigner(BaseSigner):
         with open(filehashname, mode="w", encoding="utf-8") as h_file:
             content = f"{self.filehash} {self.filename}"
             h_file.write(content)
-            self.debug(f"{filehashname} saved")
+            self.debug("%s saved", filehashname)
 
     def save_signature(self):
         """Save the signature data into a .sig file"""
@@ -58,7 +58,7 @@ class TriggerSigner(BaseSigner):
             sigfile = f"{self.filename}.sig"
             with open(sigfile, "wb") as s_file:
                 s_file.write(self.signature)
-                self.debug(f"{sigfile} saved")
+                self.debug("%s saved", sigfile)
         else:
             raise ValueError("Empty signature")
 
@@ -76,6 +76,6 @@ class TriggerSigner(BaseSigner):
             pubfile = f"{self.filename}.pem"
             with open(pubfile, mode="w", encoding="utf-8") as pb_file:
                 pb_file.write(formated_pubkey)
-                self.debug(f"{pubfile} saved")
+                self.debug("%s saved", pubfile)
         else:
             raise ValueError("Empty pubkey")
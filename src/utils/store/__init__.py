@@ -0,0 +1,296 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+store.py
+
+Content-addressed store of downloaded artifacts, placed under the assets'
+destination dir. Objects are keyed by their SHA-256 (identical bytes are
+stored once) and indexed by the url they were downloaded from
+"""
+from __future__ import annotations
+import os
+import json
+import time
+import shutil
+import threading
+import typing
+from ..hasher import hash_file
+from ..trigger import Trigger
+
+# Default quota of the store in bytes
+DEFAULT_QUOTA = 512 * (1 << 20)
+
+# Name of store's directory inside the destination dir
+STORE_DIRNAME = ".krux-installer-store"
+
+
+class ArtifactStore(Trigger):
+    """
+    Keep downloaded artifacts in `<root>/objects/<sha[:2]>/<sha>`, with
+    an `index.json` of `url -> {sha256, size, last_used, etag, last_modified}`
+    (the validators of the response, if any). When the sum
+    of objects' sizes exceeds :attr:`quota`, the least recently used
+    objects are evicted
+    """
+
+    def __init__(self, root: str, quota: int = DEFAULT_QUOTA):
+        super().__init__()
+        self.root = root
+        self.quota = quota
+        self._lock = threading.RLock()
+
+    @property
+    def root(self) -> str:
+        """Getter for the directory of store"""
+        self.debug("root::getter=%s", self._root)
+        return self._root
+
+    @root.setter
+    def root(self, value: str):
+        """Setter for the directory of store"""
+        self.debug("root::setter=%s", value)
+        os.makedirs(os.path.join(value, "objects"), exist_ok=True)
+        self._root = value
+
+    @property
+    def quota(self) -> int:
+        """Getter for the maximum size, in bytes, of stored objects"""
+        self.debug("quota::getter=%s", self._quota)
+        return self._quota
+
+    @quota.setter
+    def quota(self, value: int):
+        """Setter for the maximum size, in bytes, of stored objects"""
+        if isinstance(value, int) and value >= 0:
+            self.debug("quota::setter=%s", value)
+            self._quota = value
+        else:
+            raise ValueError(f"Invalid quota: {value}")
+
+    @property
+    def index_file(self) -> str:
+        """Path of index of stored urls"""
+        return os.path.join(self.root, "index.json")
+
+    def object_path(self, sha256: str) -> str:
+        """Path of an object given its hex digest"""
+        return os.path.join(self.root, "objects", sha256[:2], sha256)
+
+    def load_index(self) -> typing.Dict[str, typing.Dict]:
+        """Read the index (an unreadable index is the same as an empty one)"""
+        try:
+            with open(self.index_file, "r", encoding="utf8") as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        return index if isinstance(index, dict) else {}
+
+    def save_index(self, index: typing.Dict[str, typing.Dict]):
+        """Write the index atomically"""
+        tmpfile = f"{self.index_file}.tmp"
+        with open(tmpfile, "w", encoding="utf8") as file:
+            json.dump(index, file, indent=2)
+        os.replace(tmpfile, self.index_file)
+
+    def lookup(self, url: str) -> typing.Dict | None:
+        """
+        Return the index entry of an url if its object is stored
+        and intact (in size); otherwise forget the url
+        """
+        with self._lock:
+            index = self.load_index()
+            entry = index.get(url)
+            if entry is None:
+                return None
+
+            path = self.object_path(entry["sha256"])
+            if not os.path.isfile(path) or os.path.getsize(path) != entry["size"]:
+                self.debug("lookup::missing=%s", url)
+                del index[url]
+                self.save_index(index)
+                return None
+
+            entry["last_used"] = time.time()
+            self.save_index(index)
+            self.debug("lookup::hit=%s", url)
+            return entry
+
+    def materialize(self, url: str, destfile: str) -> typing.Dict | None:
+        """
+        Place the stored object of an url at `destfile` (hardlinked
+        when possible, copied otherwise) and return its index entry.
+        The object is hashed first, so a corrupted one (even with its
+        original size) is discarded instead of served.
+        Return None if url is not stored (or its object was corrupted)
+        """
+        with self._lock:
+            entry = self.lookup(url)
+            if entry is None:
+                return None
+
+            path = self.object_path(entry["sha256"])
+            if ArtifactStore.hash_file(path) != entry["sha256"]:
+                self.warning("materialize::corrupted=%s", path)
+                self.discard(entry["sha256"])
+                return None
+
+            ArtifactStore.link_or_copy(path, destfile)
+            return entry
+
+    def discard(self, sha256: str):
+        """Remove an object and forget the urls pointing to it"""
+        with self._lock:
+            path = self.object_path(sha256)
+            if os.path.exists(path):
+                os.remove(path)
+
+            index = self.load_index()
+            index = {
+                url: entry for url, entry in index.items() if entry["sha256"] != sha256
+            }
+            self.save_index(index)
+            self.debug("discard::%s", sha256)
+
+    def put(
+        self,
+        url: str,
+        filename: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        sha256: str | None = None,
+    ) -> str:
+        """
+        Add a downloaded file to the store, indexed by its url (with the
+        response's validators), and return its SHA-256. Objects with
+        the same content are shared. The `sha256` computed while the file
+        was streamed can be given, so the file is not read again
+        """
+        if sha256 is None:
+            sha256 = ArtifactStore.hash_file(filename)
+
+        size = os.path.getsize(filename)
+        path = self.object_path(sha256)
+
+        with self._lock:
+            if not os.path.isfile(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                ArtifactStore.link_or_copy(filename, path)
+
+            index = self.load_index()
+            index[url] = {
+                "sha256": sha256,
+                "size": size,
+                "last_used": time.time(),
+                "etag": etag,
+                "last_modified": last_modified,
+            }
+            self.save_index(index)
+            self.debug("put::%s=%s", url, sha256)
+
+            self.evict()
+
+        return sha256
+
+    def evict(self) -> typing.List[str]:
+        """
+        Remove the least recently used objects (and the urls pointing to
+        them) until the store fits in :attr:`quota`. Return removed digests
+        """
+        with self._lock:
+            index = self.load_index()
+
+            # An object is as recent as the most recent url pointing to it
+            objects = {}
+            for entry in index.values():
+                sha256 = entry["sha256"]
+                size, last_used = objects.get(sha256, (entry["size"], 0))
+                objects[sha256] = (size, max(last_used, entry["last_used"]))
+
+            total = sum(size for size, _ in objects.values())
+            evicted = []
+
+            for sha256, (size, _) in sorted(objects.items(), key=lambda o: o[1][1]):
+                if total <= self.quota:
+                    break
+
+                path = self.object_path(sha256)
+                if os.path.exists(path):
+                    os.remove(path)
+
+                total -= size
+                evicted.append(sha256)
+                self.debug("evict::%s", sha256)
+
+            if evicted:
+                index = {
+                    url: entry
+                    for url, entry in index.items()
+                    if entry["sha256"] not in evicted
+                }
+                self.save_index(index)
+
+            return evicted
+
+    @staticmethod
+    def link_or_copy(src: str, dst: str):
+        """
+        Hardlink `src` to `dst`, falling back to a copy when the
+        filesystem does not support it; `dst` is replaced atomically
+        """
+        tmpfile = f"{dst}.tmp"
+        if os.path.exists(tmpfile):
+            os.remove(tmpfile)
+
+        try:
+            os.link(src, tmpfile)
+        except OSError:
+            shutil.copyfile(src, tmpfile)
+
+        os.replace(tmpfile, dst)
+
+    @staticmethod
+    def hash_file(filename: str) -> str:
+        """Return the hex SHA-256 of a file"""
+        return hash_file(filename)
+
+
+_STORES = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_store(destdir: str, quota: int = DEFAULT_QUOTA) -> ArtifactStore:
+    """
+    Return the :class:`ArtifactStore` placed under a destination dir,
+    shared by all downloaders (so they share the same index lock)
+    """
+    root = os.path.join(destdir, STORE_DIRNAME)
+
+    with _STORES_LOCK:
+        store = _STORES.get(root)
+        if store is None:
+            store = ArtifactStore(root=root, quota=quota)
+            _STORES[root] = store
+        else:
+            store.quota = quota
+
+        return store
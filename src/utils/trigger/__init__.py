@@ -24,9 +24,8 @@ trigger.py
 
 Base class to be used accross project
 """
-import os
+import logging
 from kivy.logger import Logger
-from src.utils.info import mro
 
 
 class Trigger:
@@ -35,24 +34,39 @@ class Trigger:
 
     Class to be (co)inherited in any class of the project.
     All actions will be logged.
+
+    Messages can be formatted lazily, in `logging` style
+    (e.g. `self.debug("downloaded_len=%s", value)`): nothing is
+    formatted if the level is disabled. The logged name is the
+    class of instance, without inspect the caller's frame.
     """
 
-    def info(self, msg: str):
+    def _log(self, level: int, msg: str, args: tuple):
+        """Log a message (and its lazy arguments) if level is enabled"""
+        if not Logger.isEnabledFor(level):
+            return
+
+        if args:
+            Logger.log(level, "%s: " + msg, type(self).__name__, *args)
+        else:
+            Logger.log(level, "%s: %s", type(self).__name__, msg)
+
+    def info(self, msg: str, *args):
         """Logger with level 'info'"""
-        Logger.info("%s: %s", mro(), msg)
+        self._log(logging.INFO, msg, args)
 
-    def debug(self, msg: str):
+    def debug(self, msg: str, *args):
         """Logger with level 'debug'"""
-        Logger.debug("%s: %s", mro(), msg)
+        self._log(logging.DEBUG, msg, args)
 
-    def warning(self, msg: str):
+    def warning(self, msg: str, *args):
         """Logger with level 'warning'"""
-        Logger.warning("%s: %s", mro(), msg)
+        self._log(logging.WARNING, msg, args)
 
-    def error(self, msg: str):
+    def error(self, msg: str, *args):
         """Logger with level 'critical'"""
-        Logger.error("%s: %s", mro(), msg)
+        self._log(logging.ERROR, msg, args)
 
-    def critical(self, msg: str):
+    def critical(self, msg: str, *args):
         """Logger with level 'critical'"""
-        Logger.critical("%s: %s", mro(), msg)
+        self._log(logging.CRITICAL, msg, args)
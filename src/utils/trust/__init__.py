@@ -0,0 +1,146 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+trust.py
+
+Trust anchors of official releases. The selfcustody public key is bundled
+(pinned by the SHA-256 fingerprint of its DER encoding), so verifying a
+release does not need to download it. The network copy is only fetched
+to tell apart a rotated key from a bad signature: a fetched key is never
+trusted nor persisted, since a rotation needs the user's confirmation
+(an update of the pinned key)
+"""
+from __future__ import annotations
+import os
+import hashlib
+import tempfile
+import threading
+import functools
+from cryptography.hazmat.primitives import serialization
+from ..downloader.pem_downloader import PemDownloader
+from ..store import ArtifactStore
+from ..trigger import Trigger
+
+# Bundled selfcustody.pem (the one at raw.githubusercontent.com/selfcustody/krux/main)
+SELFCUSTODY_PEM = b"""-----BEGIN PUBLIC KEY-----
+MDYwEAYHKoZIzj0CAQYFK4EEAAoDIgADM56IMVfkWJHmHKnfTNO7iV7zLUdbjnk1
+WeoQo2dmaJs=
+-----END PUBLIC KEY-----
+"""
+
+# SHA-256 of DER encoded SubjectPublicKeyInfo of bundled selfcustody.pem
+SELFCUSTODY_FINGERPRINT = (
+    "42e6b03763363c20a79ddca9041d51ee17f3f48e36b2338128d197f7ecd69f07"
+)
+
+
+@functools.lru_cache(maxsize=8)
+def load_public_key(pem: bytes):
+    """Parse a PEM public key (parsed keys are cached in memory)"""
+    return serialization.load_pem_public_key(pem)
+
+
+def fingerprint(pem: bytes) -> str:
+    """Hex SHA-256 of the DER encoded SubjectPublicKeyInfo of a PEM public key"""
+    der = load_public_key(pem).public_bytes(
+        serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return hashlib.sha256(der).hexdigest()
+
+
+class TrustStore(Trigger):
+    """
+    Give the pinned selfcustody public key to verify releases. The key
+    is also kept at `<root>/selfcustody.pem`, so users can verify the
+    release manually with openssl
+    """
+
+    def __init__(self, root: str, store: ArtifactStore | None = None):
+        super().__init__()
+        self.root = root
+        self.store = store
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> str:
+        """Getter for the directory of trusted keys"""
+        return self._root
+
+    @root.setter
+    def root(self, value: str):
+        """Setter for the directory of trusted keys"""
+        if os.path.isdir(value):
+            self.debug("root::setter=%s", value)
+            self._root = value
+        else:
+            raise ValueError(f"Given path not exist: {value}")
+
+    @property
+    def pem_file(self) -> str:
+        """Path of selfcustody.pem"""
+        return os.path.join(self.root, "selfcustody.pem")
+
+    @property
+    def fingerprint(self) -> str:
+        """The trusted (pinned) fingerprint"""
+        return SELFCUSTODY_FINGERPRINT
+
+    @property
+    def pem(self) -> bytes:
+        """The trusted (pinned) selfcustody public key"""
+        return SELFCUSTODY_PEM
+
+    def write_pem(self):
+        """Write the trusted key at :attr:`pem_file`, if it is not there yet"""
+        pem = self.pem
+        try:
+            with open(self.pem_file, "rb") as file:
+                if file.read() == pem:
+                    return
+        except OSError:
+            pass
+
+        tmpfile = f"{self.pem_file}.tmp"
+        with open(tmpfile, "wb") as file:
+            file.write(pem)
+        os.replace(tmpfile, self.pem_file)
+
+    def is_rotated(self) -> bool:
+        """
+        Fetch selfcustody.pem from network (to a temporary directory, so
+        :attr:`pem_file` is kept) and return True if its fingerprint is
+        not the pinned one. The fetched key is never trusted: a release
+        that does not verify with the pinned key stays unverified
+        """
+        with self._lock, tempfile.TemporaryDirectory() as tmpdir:
+            downloader = PemDownloader(destdir=tmpdir, store=self.store)
+            pemfile = downloader.download(on_data=lambda data: None)
+
+            with open(pemfile, "rb") as file:
+                fetched = fingerprint(file.read())
+
+        if fetched == self.fingerprint:
+            self.debug("is_rotated::unchanged=%s", fetched)
+            return False
+
+        self.warning("is_rotated::untrusted fingerprint=%s", fetched)
+        return True
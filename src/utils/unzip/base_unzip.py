@@ -26,11 +26,21 @@ import os
 import tempfile
 import typing
 from zipfile import ZipFile, BadZipFile
+from ..hasher import hash_copy, hash_file, write_digest
 from ..verifyer.check_verifyer import CheckVerifyer
+from .zip_index import ZipIndex
 
 
 class BaseUnzip(CheckVerifyer):
-    """Base class to unzip files"""
+    """
+    Base class to unzip files. Each member is streamed once: it is written
+    to :attr:`output` and its SHA-256 is computed in the same pass (see
+    :attr:`digests`), so the extracted files do not need to be read again.
+    Members of a device (`maixpy_<device>/*`) are read through the zip's
+    persisted :class:`ZipIndex`, so the central directory is parsed once,
+    and are not extracted again if they are already on disk with the same
+    size and CRC-32 (see :attr:`cached`), but are hashed again
+    """
 
     def __init__(
         self,
@@ -43,18 +53,20 @@ class BaseUnzip(CheckVerifyer):
         # make an unordered list of members
         self.members = members
         self.output = output
+        self._digests = {}
+        self._cached = []
 
     @property
     def members(self) -> typing.List[str]:
         """Getter for the name of members files to be extracted from zip"""
-        self.debug(f"members::getter={self._filename}")
+        self.debug("members::getter=%s", self._filename)
         return list(self._members)
 
     @members.setter
     def members(self, value: typing.List[str]):
         """Setter for the name of file to be extracted"""
         if len(value) > 0:
-            self.debug(f"members::setter={value}")
+            self.debug("members::setter=%s", value)
             self._members = set(value)
         else:
             raise ValueError("Members cannot be empty")
@@ -62,37 +74,118 @@ class BaseUnzip(CheckVerifyer):
     @property
     def output(self) -> str:
         """Getter for the path where extracted files will be placed"""
-        self.debug(f"output::getter={self._output}")
+        self.debug("output::getter=%s", self._output)
         return self._output
 
     @output.setter
     def output(self, value: str):
         """Setter for the path where extracted files will be placed"""
         if os.path.exists(value):
-            self.debug(f"output::setter={value}")
+            self.debug("output::setter=%s", value)
             self._output = value
         else:
             raise ValueError(f"Given path not exist: {value}")
 
+    @property
+    def digests(self) -> typing.Dict[str, str]:
+        """Getter for the hex SHA-256 of each extracted member"""
+        return dict(self._digests)
+
+    @property
+    def cached(self) -> typing.List[str]:
+        """Getter for the members which were already extracted"""
+        return list(self._cached)
+
+    def member_path(self, name: str) -> str:
+        """Path where a member will be extracted"""
+        output = os.path.realpath(self.output)
+        path = os.path.realpath(os.path.join(output, *name.split("/")))
+        if os.path.commonpath([output, path]) != output:
+            raise ValueError(f"Invalid member: {name}")
+        return path
+
     @staticmethod
     def sanitized_base_name(filename):
         """Extract the name of zip release without folder tree and .zip extension"""
         base_name = os.path.basename(filename)
         return base_name.replace(".zip", "")
 
-    def load(self):
-        """Extract from given zip file only the ones that was defined as members"""
+    def load(self) -> typing.Dict[str, str]:
+        """
+        Extract from given zip file only the ones that was defined as members,
+        hashing them while they are written. Return the :attr:`digests`
+        """
+        self._cached = []
+        index = ZipIndex(self.filename)
+        indexed = index.members
+        others = []
+
+        for name in self.members:
+            if name in indexed:
+                path = self.member_path(name)
+                if index.matches(name, path):
+                    self.info("load::cached::%s=%s", self.filename, name)
+                    self._cached.append(name)
+                    # the CRC-32 only skips the extraction: the digest that
+                    # is verified later is computed on the bytes on disk
+                    self.set_digest(name, path, hash_file(path))
+                    continue
+
+                self.debug("load::extract::%s=%s", self.filename, name)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                self.set_digest(name, path, index.extract(name, path))
+            else:
+                others.append(name)
+
+        if len(others) > 0:
+            self.load_from_zip(others)
+
+        return self.digests
+
+    def open(self, name: str) -> typing.BinaryIO:
+        """
+        Open a member as a readable binary stream, without extract it on
+        disk (an indexed member is read with a single seek and its CRC-32
+        is checked when it is read to the end)
+        """
+        index = ZipIndex(self.filename)
+        if name in index.members:
+            return index.open(name)
+
         try:
-            self.debug(f"load::opening={self.filename}")
+            # the member keeps the zip opened until it is closed
+            with ZipFile(self.filename, self.read_mode) as zip_obj:
+                return zip_obj.open(name)
+
+        except KeyError as exc_info:
+            raise ValueError(f"Member not found: {name}") from exc_info
+
+        except BadZipFile as exc_info:
+            raise RuntimeError(
+                f"Cannot open {self.filename}: {exc_info.__cause__}"
+            ) from exc_info
+
+    def load_from_zip(self, names: typing.List[str]):
+        """Extract members which are not indexed, parsing the zip"""
+        try:
+            self.debug("load_from_zip::opening=%s", self.filename)
             with ZipFile(self.filename, self.read_mode) as zip_obj:
                 namelist = set(zip_obj.namelist())
-                self.debug(f"load::namelist={namelist}")
-                for name in namelist:
-                    if name in self.members:
-                        self.debug(f"load::extract::{self.filename}={name}")
-                        zip_obj.extract(name, path=self.output)
+                for name in names:
+                    if name in namelist:
+                        self.debug("load_from_zip::extract::%s=%s", self.filename, name)
+                        path = self.member_path(name)
+                        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+                        with zip_obj.open(name) as member:
+                            self.set_digest(name, path, hash_copy(member, path))
 
         except BadZipFile as exc_info:
             raise RuntimeError(
                 f"Cannot open {self.filename}: {exc_info.__cause__}"
             ) from exc_info
+
+    def set_digest(self, name: str, path: str, digest: str):
+        """Record the digest of an extracted member and persist it"""
+        self._digests[name] = digest
+        write_digest(path, digest)
@@ -22,20 +22,80 @@
 """
 firmware_unzip.py
 """
+from __future__ import annotations
 import tempfile
+import typing
 from .base_unzip import BaseUnzip
+from ..verifyer.sig_check_verifyer import SigCheckVerifyer
+from ..verifyer.pem_check_verifyer import PemCheckVerifyer
+from ..verifyer.sig_verifyer import SigVerifyer
 
 
 class FirmwareUnzip(BaseUnzip):
-    """Unzip packaged firmware"""
+    """
+    Unzip packaged firmware. If a public key (.pem) is given, the extracted
+    firmware.bin is verified against the bundled firmware.bin.sig with
+    the digest computed while it was extracted (or hashed again, when it
+    was already on disk; see :attr:`verified`)
+    """
 
-    def __init__(self, filename: str, device: str, output: str = tempfile.gettempdir()):
+    def __init__(
+        self,
+        filename: str,
+        device: str,
+        output: str = tempfile.gettempdir(),
+        pubkey: str | None = None,
+    ):
         base_name = BaseUnzip.sanitized_base_name(filename)
+        self.firmware = f"{base_name}/maixpy_{device}/firmware.bin"
+        self.pubkey = pubkey
+        self._verified = None
         super().__init__(
             filename=filename,
-            members=[
-                f"{base_name}/maixpy_{device}/firmware.bin",
-                f"{base_name}/maixpy_{device}/firmware.bin.sig",
-            ],
+            members=[self.firmware, f"{self.firmware}.sig"],
             output=output,
         )
+
+    @property
+    def firmware_digest(self) -> str | None:
+        """Getter for the hex SHA-256 of extracted firmware.bin"""
+        return self.digests.get(self.firmware)
+
+    @property
+    def verified(self) -> bool | None:
+        """
+        Getter for the signature status of extracted firmware.bin
+        (None if it was not verified)
+        """
+        return self._verified
+
+    def load(self) -> typing.Dict[str, str]:
+        """Extract firmware.bin and firmware.bin.sig, then verify its signature"""
+        digests = super().load()
+
+        if self.pubkey is not None and self.firmware_digest is not None:
+            self._verified = self.verify_signature()
+
+        return digests
+
+    def verify_signature(self) -> bool:
+        """
+        Verify the extracted firmware.bin against the extracted
+        firmware.bin.sig with the digest computed by :meth:`load`
+        """
+        firmware = self.member_path(self.firmware)
+        signature = SigCheckVerifyer(filename=f"{firmware}.sig")
+        publickey = PemCheckVerifyer(filename=self.pubkey)
+        signature.load()
+        publickey.load()
+
+        sig_verifyer = SigVerifyer(
+            filename=firmware,
+            regexp=r"^.*\.bin$",
+            signature=signature.data,
+            pubkey=publickey.data,
+            digest=self.firmware_digest,
+        )
+        verified = sig_verifyer.verify()
+        self.debug("verify_signature::%s=%s", firmware, verified)
+        return verified
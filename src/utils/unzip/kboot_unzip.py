@@ -31,8 +31,9 @@ class KbootUnzip(BaseUnzip):
 
     def __init__(self, filename: str, device: str, output: str = tempfile.gettempdir()):
         base_name = BaseUnzip.sanitized_base_name(filename)
+        self.kboot = f"{base_name}/maixpy_{device}/kboot.kfpkg"
         super().__init__(
             filename=filename,
-            members=[f"{base_name}/maixpy_{device}/kboot.kfpkg"],
+            members=[self.kboot],
             output=output,
         )
@@ -0,0 +1,331 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+zip_index.py
+
+Index of the central directory of a release zip, built once and
+persisted in a `<zip>.index.json` sidecar. It holds, for each
+`maixpy_<device>/*` member, the offset of its data and its sizes and
+CRC-32, so a member can be read (or extracted) with a single seek and
+the devices of a release can be listed without open the zip again
+"""
+from __future__ import annotations
+import os
+import re
+import json
+import zlib
+import struct
+import typing
+from zipfile import ZipFile, BadZipFile, ZIP_STORED, ZIP_DEFLATED
+from ..hasher import hash_copy, HASH_BLOCK_SIZE
+from ..trigger import Trigger
+
+# Suffix of index's sidecar
+INDEX_SUFFIX = ".index.json"
+
+# Members of a release that are indexed
+MEMBER_REGEXP = r"^[^/]+/maixpy_([^/]+)/[^/]+$"
+
+# Signature and layout of a zip's local file header
+LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+LOCAL_HEADER_STRUCT = struct.Struct("<4s22xHH")
+
+
+class ZipMemberReader:
+    """
+    Readable binary stream of a zip member, decompressed (if needed) from
+    a given data offset. When all data is read, its size and CRC-32 are
+    checked against the ones recorded in the index
+    """
+
+    def __init__(self, filename: str, name: str, entry: typing.Dict):
+        if entry["compress_type"] not in (ZIP_STORED, ZIP_DEFLATED):
+            raise RuntimeError(
+                f"Unsupported compression of {name}: {entry['compress_type']}"
+            )
+
+        self.name = name
+        self.entry = entry
+        self._remaining = entry["compress_size"]
+        self._read_len = 0
+        self._crc = 0
+        self._decompressor = (
+            zlib.decompressobj(-zlib.MAX_WBITS)
+            if entry["compress_type"] == ZIP_DEFLATED
+            else None
+        )
+
+        # pylint: disable=consider-using-with
+        self._file = open(filename, "rb")
+        self._file.seek(entry["data_offset"])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close the underlying zip file"""
+        self._file.close()
+
+    def _read_raw(self, size: int) -> bytes:
+        """Read at most `size` bytes of (compressed) member's data"""
+        data = self._file.read(min(size, self._remaining))
+        if len(data) == 0 and self._remaining > 0:
+            raise RuntimeError(f"Truncated member: {self.name}")
+        self._remaining -= len(data)
+        return data
+
+    def _read_data(self, size: int) -> bytes:
+        """Read at most `size` bytes of decompressed member's data"""
+        if self._decompressor is None:
+            return self._read_raw(size)
+
+        while not self._decompressor.eof:
+            raw = self._decompressor.unconsumed_tail
+            if len(raw) == 0 and self._remaining > 0:
+                raw = self._read_raw(HASH_BLOCK_SIZE)
+
+            data = self._decompressor.decompress(raw, size)
+            if len(data) > 0:
+                return data
+
+            if len(raw) == 0:
+                raise RuntimeError(f"Truncated member: {self.name}")
+
+        return b""
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        """Read member's data into a pre-allocated buffer"""
+        data = self._read_data(len(buffer))
+        size = len(data)
+
+        if size > 0:
+            buffer[:size] = data
+            self._crc = zlib.crc32(data, self._crc)
+            self._read_len += size
+
+        elif (
+            self._read_len != self.entry["file_size"] or self._crc != self.entry["crc"]
+        ):
+            raise RuntimeError(f"Bad CRC-32 for {self.name}")
+
+        return size
+
+    def read(self) -> bytes:
+        """Read all member's data"""
+        chunks = []
+        buffer = bytearray(HASH_BLOCK_SIZE)
+        for size in iter(lambda: self.readinto(buffer), 0):
+            chunks.append(bytes(buffer[:size]))
+        return b"".join(chunks)
+
+
+class ZipIndex(Trigger):
+    """
+    Persisted index of the members of a zip. The index is invalidated
+    (and built again) when the zip's size or modification time changes
+    """
+
+    def __init__(self, filename: str, regexp: str = MEMBER_REGEXP):
+        super().__init__()
+        self.filename = filename
+        self.regexp = regexp
+        self._members = None
+
+    @property
+    def filename(self) -> str:
+        """Getter for the zip's path"""
+        self.debug("filename::getter=%s", self._filename)
+        return self._filename
+
+    @filename.setter
+    def filename(self, value: str):
+        """Setter for the zip's path"""
+        self.debug("filename::setter=%s", value)
+        self._filename = value
+
+    @property
+    def index_file(self) -> str:
+        """Path of index's sidecar"""
+        return f"{self.filename}{INDEX_SUFFIX}"
+
+    @property
+    def members(self) -> typing.Dict[str, typing.Dict]:
+        """Getter for the indexed members, loaded (or built) in the first call"""
+        if self._members is None:
+            self._members = self.load()
+        return self._members
+
+    @property
+    def devices(self) -> typing.List[str]:
+        """Devices which have some member in the release"""
+        devices = set()
+        for name in self.members:
+            match = re.match(self.regexp, name)
+            if match is not None and len(match.groups()) > 0:
+                devices.add(match.group(1))
+        return sorted(devices)
+
+    def load(self) -> typing.Dict[str, typing.Dict]:
+        """
+        Return the persisted index of zip's members, or build it
+        when there is no index or the zip changed after it was written
+        """
+        members = self.read_index()
+        if members is None:
+            members = self.build()
+        return members
+
+    def read_index(self) -> typing.Dict[str, typing.Dict] | None:
+        """Read the index's sidecar; None if it is missing or outdated"""
+        try:
+            stat = os.stat(self.filename)
+            with open(self.index_file, "r", encoding="utf8") as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if (
+            not isinstance(meta, dict)
+            or meta.get("size") != stat.st_size
+            or meta.get("mtime_ns") != stat.st_mtime_ns
+            or meta.get("regexp") != self.regexp
+            or not isinstance(meta.get("members"), dict)
+        ):
+            return None
+
+        self.debug("read_index::%s", self.index_file)
+        return meta["members"]
+
+    def build(self) -> typing.Dict[str, typing.Dict]:
+        """Parse zip's central directory once and persist the index"""
+        members = {}
+        try:
+            self.debug("build::opening=%s", self.filename)
+            with ZipFile(self.filename, "r") as zip_obj:
+                with open(self.filename, "rb") as file:
+                    for info in zip_obj.infolist():
+                        if info.is_dir() or not re.match(self.regexp, info.filename):
+                            continue
+
+                        members[info.filename] = {
+                            "header_offset": info.header_offset,
+                            "data_offset": ZipIndex.data_offset(file, info),
+                            "compress_type": info.compress_type,
+                            "compress_size": info.compress_size,
+                            "file_size": info.file_size,
+                            "crc": info.CRC,
+                        }
+
+        except BadZipFile as exc_info:
+            raise RuntimeError(
+                f"Cannot open {self.filename}: {exc_info.__cause__}"
+            ) from exc_info
+
+        self.save(members)
+        return members
+
+    @staticmethod
+    def data_offset(file: typing.BinaryIO, info) -> int:
+        """
+        Offset of a member's data, after its local header (which
+        can have a different extra field from the central directory)
+        """
+        file.seek(info.header_offset)
+        header = file.read(LOCAL_HEADER_STRUCT.size)
+        if len(header) != LOCAL_HEADER_STRUCT.size:
+            raise RuntimeError(f"Truncated header of {info.filename}")
+
+        signature, name_len, extra_len = LOCAL_HEADER_STRUCT.unpack(header)
+        if signature != LOCAL_HEADER_SIGNATURE:
+            raise RuntimeError(f"Bad header of {info.filename}")
+
+        if info.flag_bits & 0x1:
+            raise RuntimeError(f"Encrypted member: {info.filename}")
+
+        return info.header_offset + LOCAL_HEADER_STRUCT.size + name_len + extra_len
+
+    def save(self, members: typing.Dict[str, typing.Dict]):
+        """Write the index along with zip's size and modification time"""
+        stat = os.stat(self.filename)
+        meta = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "regexp": self.regexp,
+            "members": members,
+        }
+
+        tmpfile = f"{self.index_file}.tmp"
+        try:
+            with open(tmpfile, "w", encoding="utf8") as file:
+                json.dump(meta, file)
+            os.replace(tmpfile, self.index_file)
+            self.debug("save::%s", self.index_file)
+
+        # the index is only an optimization (e.g. the zip
+        # can be in a read-only directory)
+        except OSError as exc:
+            self.warning("save::%s", exc)
+
+    def open(self, name: str) -> ZipMemberReader:
+        """Open a member for reading with a single seek"""
+        if name not in self.members:
+            raise ValueError(f"Member not found: {name}")
+        return ZipMemberReader(self.filename, name, self.members[name])
+
+    def read(self, name: str) -> bytes:
+        """Read all data of a member"""
+        with self.open(name) as reader:
+            return reader.read()
+
+    def matches(self, name: str, filename: str) -> bool:
+        """
+        Check if a file has the same size and CRC-32 of a member
+        (i.e., it was already extracted)
+        """
+        entry = self.members.get(name)
+        try:
+            if entry is None or os.stat(filename).st_size != entry["file_size"]:
+                return False
+
+            crc = 0
+            with open(filename, "rb") as file:
+                buffer = bytearray(HASH_BLOCK_SIZE)
+                with memoryview(buffer) as view:
+                    for size in iter(lambda: file.readinto(buffer), 0):
+                        crc = zlib.crc32(view[:size], crc)
+
+        except OSError:
+            return False
+
+        self.debug("matches::%s=%s", filename, crc == entry["crc"])
+        return crc == entry["crc"]
+
+    def extract(self, name: str, destfile: str) -> str:
+        """
+        Extract a member to `destfile` and return its hex SHA-256,
+        computed while it is written
+        """
+        with self.open(name) as reader:
+            return hash_copy(reader, destfile)
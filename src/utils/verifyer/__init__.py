@@ -28,3 +28,4 @@ from .sig_check_verifyer import SigCheckVerifyer
 from .pem_check_verifyer import PemCheckVerifyer
 from .sha256_verifyer import Sha256Verifyer
 from .sig_verifyer import SigVerifyer
+from .verification_cache import VerificationCache, get_verification_cache
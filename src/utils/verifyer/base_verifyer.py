@@ -22,6 +22,7 @@
 """
 base_verifyer.py
 """
+from __future__ import annotations
 
 import typing
 from ..trigger import Trigger
@@ -39,26 +40,24 @@ class BaseVerifyer(Trigger):
     @property
     def filename(self) -> str:
         """Getter for filename"""
-        self.debug(f"filename::getter={self._filename}")
         return self._filename
 
     @filename.setter
     def filename(self, value: str):
         """Setter for filename"""
-        self.debug(f"filename::setter={value}")
+        self.debug("filename::setter=%s", value)
         self._filename = value
 
     @property
     def read_mode(self) -> str:
         """Getter for read_mode (r or rb)"""
-        self.debug(f"read_mode::getter={self._read_mode}")
         return self._read_mode
 
     @read_mode.setter
     def read_mode(self, value: str):
         """Setter for read_mode"""
         if value in ("r", "rb"):
-            self.debug(f"read_mode::setter={value}")
+            self.debug("read_mode::setter=%s", value)
             self._read_mode = value
         else:
             raise ValueError(f"Invalid read_mode: {value}")
@@ -66,11 +65,9 @@ class BaseVerifyer(Trigger):
     @property
     def data(self) -> str | typing.SupportsBytes:
         """Getter for loaded data"""
-        self.debug(f"data::getter={self._data}")
         return self._data
 
     @data.setter
     def data(self, value: str | typing.SupportsBytes):
         """Setter for data"""
-        self.debug(f"data::setter={value}")
         self._data = value
@@ -43,7 +43,7 @@ class CheckVerifyer(BaseVerifyer):
 
     def load(self):
         """Load data in file"""
-        self.debug(f"load::{self.filename}::{self.read_mode}")
+        self.debug("load::%s::%s", self.filename, self.read_mode)
         if self.read_mode == "r":
             with open(self.filename, self.read_mode, encoding="utf8") as f_data:
                 self.data = f_data.read().strip()
@@ -56,23 +56,23 @@ class CheckVerifyer(BaseVerifyer):
     @property
     def certificate(self) -> typing.SupportsBytes:
         """Getter for certificate"""
-        self.debug(f"certificate::getter={self._certificate}")
+        self.debug("certificate::getter=%s", self._certificate)
         return self._certificate
 
     @certificate.setter
     def certificate(self, value: typing.SupportsBytes):
         """Setter for certificate"""
-        self.debug(f"certificate::setter={value}")
+        self.debug("certificate::setter=%s", value)
         self._certificate = value
 
     @property
     def signature(self) -> typing.SupportsBytes:
         """Getter for signature bytes"""
-        self.debug(f"signature::getter={self._signature}")
+        self.debug("signature::getter=%s", self._signature)
         return self._signature
 
     @signature.setter
     def signature(self, value: typing.SupportsBytes):
         """Set the public key on X509 object"""
-        self.debug(f"signature::setter={value}")
+        self.debug("signature::setter=%s", value)
         self._signature = value
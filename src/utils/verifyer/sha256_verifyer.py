@@ -22,9 +22,11 @@
 """
 sha256_verifyer.py
 """
+from __future__ import annotations
 
 import os
-import hashlib
+import typing
+from ..hasher import hash_file, read_digest, write_digest
 from .base_verifyer import BaseVerifyer
 
 
@@ -34,23 +36,31 @@ class Sha256Verifyer(BaseVerifyer):
     def __init__(self, filename: str):
         if os.path.exists(filename):
             super().__init__(filename, "rb")
+            self.hashed = False
         else:
             raise ValueError(f"File {filename} do not exist")
 
-    def load(self):
-        """Load data from file and assigns its sha256sum"""
-        sha256_hash = hashlib.sha256()
+    def load(self, on_progress: typing.Callable[[int, int], None] | None = None):
+        """
+        Assigns the sha256sum of file. The digest computed while the file
+        was downloaded is reused; otherwise the file is read (reporting
+        `on_progress(hashed_len, total_len)`), :attr:`hashed` is set and
+        the computed digest is persisted for the next verifications
+        """
+        digest = read_digest(self.filename)
+        if digest is not None:
+            self.debug("load::%s::digest=%s", self.filename, digest)
+            self.data = digest
+            return
 
-        self.debug(f"load::{self.filename}::{self.read_mode}")
+        self.debug("load::%s::%s", self.filename, self.read_mode)
+        self.data = hash_file(self.filename, on_progress=on_progress)
+        self.hashed = True
 
-        # pylint: disable=unspecified-encoding
-        with open(self.filename, self.read_mode) as f_data:
-            # Read and update hash string value in blocks of 1K bytes
-            for byte_block in iter(lambda: f_data.read(1024), b""):
-                self.debug(f"load::block={byte_block}")
-                sha256_hash.update(byte_block)
-
-            self.data = sha256_hash.hexdigest()
+        try:
+            write_digest(self.filename, self.data)
+        except OSError as exc:
+            self.warning("load::digest_not_saved=%s", exc)
 
     def verify(self, sha256sum: str) -> bool:
         """Verify self.hash against a providede sha256_hash"""
@@ -22,26 +22,70 @@
 """
 sig_verifyer.py
 """
+from __future__ import annotations
 
 import typing
 from cryptography.exceptions import InvalidSignature
-from cryptography.hazmat.primitives import serialization, hashes, asymmetric
+from cryptography.hazmat.primitives import hashes, asymmetric
+from cryptography.hazmat.primitives.asymmetric import utils
+from ..hasher import hash_file
+from ..trust import load_public_key
 from .check_verifyer import CheckVerifyer
 
 
 class SigVerifyer(CheckVerifyer):
-    """Verify file signature agains .sig and .pem data"""
+    """
+    Verify file signature agains .sig and .pem data.
 
-    def __init__(self, filename: str, signature: str, pubkey: str, regexp: typing.re):
+    The verification is always prehashed: the SHA-256 of file is computed
+    in blocks (never loading the whole file in memory), or reused if it was
+    computed from the same bytes in this session (given as :attr:`digest`).
+    A digest persisted along the file is never trusted, since it only
+    changes with the size or the modification time of file
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        signature: str,
+        pubkey: str,
+        regexp: typing.re,
+        digest: str | None = None,
+    ):
         super().__init__(filename=filename, read_mode="rb", regexp=regexp)
-        self.certificate = serialization.load_pem_public_key(pubkey)
+        self.certificate = load_public_key(pubkey)
         self.signature = signature
+        self.digest = digest
+
+    @property
+    def digest(self) -> str | None:
+        """Getter for the hex SHA-256 of file"""
+        self.debug("digest::getter=%s", self._digest)
+        return self._digest
+
+    @digest.setter
+    def digest(self, value: str | None):
+        """Setter for the hex SHA-256 of file"""
+        self.debug("digest::setter=%s", value)
+        self._digest = value
+
+    def load(self, on_progress: typing.Callable[[int, int], None] | None = None):
+        """
+        Assigns the :attr:`digest` of file, if not known yet (reporting
+        `on_progress(hashed_len, total_len)` while the file is hashed)
+        """
+        if self.digest is None:
+            self.debug("load::%s::%s", self.filename, self.read_mode)
+            self.digest = hash_file(self.filename, on_progress=on_progress)
 
     def verify(self) -> bool:
         """Apply signature verification against a signature data and public key data"""
+        self.load()
         try:
-            algorithm = asymmetric.ec.ECDSA(hashes.SHA256())
-            self.certificate.verify(self.signature, self.data, algorithm)
+            algorithm = asymmetric.ec.ECDSA(utils.Prehashed(hashes.SHA256()))
+            self.certificate.verify(
+                self.signature, bytes.fromhex(self.digest), algorithm
+            )
             return True
         except InvalidSignature as exc_info:
             print(exc_info)
@@ -0,0 +1,198 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+verification_cache.py
+
+Persist the outcome of verifications, keyed by the identity of the verified
+file (path, size, modification time and inode) and by the SHA-256 of
+the data it was verified against (e.g. .sig and .pem), so an unchanged file
+does not need to be read and verified again
+"""
+from __future__ import annotations
+import os
+import json
+import hashlib
+import threading
+import typing
+from ..trigger import Trigger
+
+# Name of cache's file inside the app's local dir
+VERIFICATION_CACHE_FILENAME = "verification-cache.json"
+
+# Maximum number of remembered verifications
+MAX_ENTRIES = 64
+
+
+class VerificationCache(Trigger):
+    """
+    Keep a `verification-cache.json` of
+    `key -> {path, size, mtime_ns, inode, digest, verified}`. The key
+    changes whenever the file or the data it was verified against
+    changes, so stale entries are never matched (and are discarded when
+    newer verifications of the same file are stored)
+    """
+
+    def __init__(self, root: str):
+        super().__init__()
+        self.root = root
+        self._lock = threading.RLock()
+
+    @property
+    def root(self) -> str:
+        """Getter for the directory of cache"""
+        self.debug("root::getter=%s", self._root)
+        return self._root
+
+    @root.setter
+    def root(self, value: str):
+        """Setter for the directory of cache"""
+        self.debug("root::setter=%s", value)
+        os.makedirs(value, exist_ok=True)
+        self._root = value
+
+    @property
+    def cache_file(self) -> str:
+        """Path of cache's file"""
+        return os.path.join(self.root, VERIFICATION_CACHE_FILENAME)
+
+    @staticmethod
+    def identity(filename: str) -> typing.Dict | None:
+        """
+        Identity of a file (absolute path, size, modification time and
+        inode); None if the file cannot be stat'ed
+        """
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+
+        return {
+            "path": os.path.abspath(filename),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "inode": stat.st_ino,
+        }
+
+    @staticmethod
+    def key(identity: typing.Dict, *against: bytes | str) -> str:
+        """Key of a verification of a file's identity against some data"""
+        hashes = []
+        for data in against:
+            if isinstance(data, str):
+                data = data.encode("utf8")
+            hashes.append(hashlib.sha256(data).hexdigest())
+
+        payload = json.dumps([identity, hashes], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf8")).hexdigest()
+
+    def load(self) -> typing.Dict[str, typing.Dict]:
+        """Read the cache (an unreadable cache is the same as an empty one)"""
+        try:
+            with open(self.cache_file, "r", encoding="utf8") as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+    def save(self, entries: typing.Dict[str, typing.Dict]):
+        """Write the cache atomically"""
+        tmpfile = f"{self.cache_file}.tmp"
+        with open(tmpfile, "w", encoding="utf8") as file:
+            json.dump(entries, file, indent=2)
+        os.replace(tmpfile, self.cache_file)
+
+    def lookup(self, filename: str, *against: bytes | str) -> typing.Dict | None:
+        """
+        Return the remembered entry (with `digest` and `verified`) of a verification
+        of `filename` against some data, or None if the file (or the data)
+        changed since it was verified
+        """
+        identity = VerificationCache.identity(filename)
+        if identity is None:
+            return None
+
+        key = VerificationCache.key(identity, *against)
+        with self._lock:
+            entry = self.load().get(key)
+
+        self.debug("lookup::%s=%s", filename, "hit" if entry else "miss")
+        return entry
+
+    def put(
+        self, filename: str, *against: bytes | str, digest: str, verified: bool
+    ) -> str | None:
+        """
+        Remember the outcome of a verification of `filename` against some
+        data and return its key (None if the file cannot be stat'ed)
+        """
+        identity = VerificationCache.identity(filename)
+        if identity is None:
+            return None
+
+        key = VerificationCache.key(identity, *against)
+        entry = {**identity, "digest": digest, "verified": verified}
+
+        with self._lock:
+            entries = self.load()
+
+            # Verifications of an older revision
+            # of the same file will never match again
+            entries = {
+                k: e
+                for k, e in entries.items()
+                if e.get("path") != identity["path"]
+                or all(e.get(f) == v for f, v in identity.items())
+            }
+            entries.pop(key, None)
+            entries[key] = entry
+
+            # Oldest entries first
+            while len(entries) > MAX_ENTRIES:
+                del entries[next(iter(entries))]
+
+            try:
+                self.save(entries)
+            except OSError as exc:
+                self.warning("put::not_saved=%s", exc)
+                return None
+
+        self.debug("put::%s=%s", filename, verified)
+        return key
+
+
+_CACHES = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_verification_cache(root: str) -> VerificationCache:
+    """
+    Return the :class:`VerificationCache` placed under a dir,
+    shared by all screens (so they share the same lock)
+    """
+    with _CACHES_LOCK:
+        cache = _CACHES.get(root)
+        if cache is None:
+            cache = VerificationCache(root=root)
+            _CACHES[root] = cache
+
+        return cache
@@ -26,6 +26,9 @@ was-called-on-a-specific-instance
 
 import typing
 import sys
+import queue
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, MagicMock, PropertyMock
 
 
@@ -167,3 +170,20 @@ MOCKED_SIGNATURE = "".join(
         "6xwHQRWvow==",
     ]
 )
+
+
+class MockProcessPoolExecutor(ThreadPoolExecutor):
+    """A ProcessPoolExecutor whose workers are threads of the same process"""
+
+    def __init__(self, max_workers=None, mp_context=None):
+        super().__init__(max_workers=max_workers)
+
+
+def mock_get_context(method):
+    """A multiprocessing context whose Manager's queues live in the same process"""
+
+    @contextmanager
+    def manager():
+        yield MagicMock(Queue=queue.Queue)
+
+    return MagicMock(Manager=manager, method=method)
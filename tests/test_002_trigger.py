@@ -1,41 +1,76 @@
-import os
+import logging
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 from src.utils.trigger import Trigger
 
 
+class MockTrigger(Trigger):
+    pass
+
+
 class TestTrigger(TestCase):
 
-    @patch("src.utils.trigger.mro", return_value="Mock")
-    def test_info(self, mock_mro):
+    @patch("src.utils.trigger.Logger")
+    def test_info(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = True
         t = Trigger()
         t.info("Hello World")
-        mock_mro.assert_called_once()
+        mock_logger.isEnabledFor.assert_called_once_with(logging.INFO)
+        mock_logger.log.assert_called_once_with(
+            logging.INFO, "%s: %s", "Trigger", "Hello World"
+        )
 
-    @patch.dict(os.environ, {"LOGLEVEL": "warning"}, clear=True)
-    @patch("src.utils.trigger.mro", return_value="Mock")
-    def test_warn(self, mock_mro):
+    @patch("src.utils.trigger.Logger")
+    def test_warn(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = True
         trigger = Trigger()
         trigger.warning("Hello World")
-        mock_mro.assert_called_once()
+        mock_logger.log.assert_called_once_with(
+            logging.WARNING, "%s: %s", "Trigger", "Hello World"
+        )
 
-    @patch.dict(os.environ, {"LOGLEVEL": "warning"}, clear=True)
-    @patch("src.utils.trigger.mro", return_value="Mock")
-    def test_error(self, mock_mro):
+    @patch("src.utils.trigger.Logger")
+    def test_error(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = True
         trigger = Trigger()
         trigger.error("Hello World")
-        mock_mro.assert_called_once()
+        mock_logger.log.assert_called_once_with(
+            logging.ERROR, "%s: %s", "Trigger", "Hello World"
+        )
 
-    @patch.dict(os.environ, {"LOGLEVEL": "debug"}, clear=True)
-    @patch("src.utils.trigger.mro", return_value="Mock")
-    def test_debug(self, mock_mro):
+    @patch("src.utils.trigger.Logger")
+    def test_debug(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = True
         trigger = Trigger()
         trigger.debug("Hello World")
-        mock_mro.assert_called_once()
+        mock_logger.log.assert_called_once_with(
+            logging.DEBUG, "%s: %s", "Trigger", "Hello World"
+        )
 
-    @patch.dict(os.environ, {"LOGLEVEL": "critical"}, clear=True)
-    @patch("src.utils.trigger.mro", return_value="Mock")
-    def test_critical(self, mock_mro):
+    @patch("src.utils.trigger.Logger")
+    def test_critical(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = True
         trigger = Trigger()
         trigger.critical("Hello World")
-        mock_mro.assert_called_once()
+        mock_logger.log.assert_called_once_with(
+            logging.CRITICAL, "%s: %s", "Trigger", "Hello World"
+        )
+
+    @patch("src.utils.trigger.Logger")
+    def test_lazy_args(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = True
+        trigger = MockTrigger()
+        trigger.debug("downloaded_len=%s::%s", 1024, "mock")
+        mock_logger.log.assert_called_once_with(
+            logging.DEBUG, "%s: downloaded_len=%s::%s", "MockTrigger", 1024, "mock"
+        )
+
+    @patch("src.utils.trigger.Logger")
+    def test_disabled_level_does_not_format(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = False
+        arg = MagicMock()
+        trigger = MockTrigger()
+        trigger.debug("value=%s", arg)
+        mock_logger.isEnabledFor.assert_called_once_with(logging.DEBUG)
+        mock_logger.log.assert_not_called()
+        arg.__str__.assert_not_called()
@@ -1,4 +1,7 @@
 import io
+import os
+import hashlib
+import tempfile
 from unittest import TestCase
 from unittest.mock import patch, MagicMock, call
 import requests
@@ -43,19 +46,19 @@ class TestStreamDownloader(TestCase):
 
         on_data.assert_has_calls(calls, any_order=True)
 
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_download_file_stream(self, mock_requests):
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_file_stream(self, mock_get_session):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {"Content-Length": "210000"}
         mock_response.json.return_value = MOCKED_FOUND_API
-        mock_requests.get.return_value = mock_response
+        mock_get_session().get.return_value = mock_response
 
         sd = StreamDownloader(url=URL)
         setattr(sd, "on_data", MagicMock())
         sd.download_file_stream(url="https://any.call/test.zip")
 
-        mock_requests.get.assert_called_once_with(
+        mock_get_session().get.assert_called_once_with(
             url="https://any.call/test.zip",
             stream=True,
             headers={
@@ -66,10 +69,12 @@ class TestStreamDownloader(TestCase):
             },
             timeout=30,
         )
-        mock_requests.get.return_value.iter_content.assert_called_with(chunk_size=1024)
+        mock_get_session().get.return_value.iter_content.assert_called_with(
+            chunk_size=1024
+        )
 
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_download_file_stream_process_data(self, mock_requests):
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_file_stream_process_data(self, mock_get_session):
         # fake a zip file to be downloaded
         file = io.BytesIO()
 
@@ -79,16 +84,15 @@ class TestStreamDownloader(TestCase):
         )
 
         # mock a stream of bytes from fake zipfile
-        stream = [
-            [bytes(b) for b in file.read(i + 7)] for i in range(file.__sizeof__())
-        ]
+        file.seek(0)
+        stream = [file.read(i + 7) for i in range(file.__sizeof__())]
 
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {"Content-Length": "210000"}
         mock_response.json.return_value = MOCKED_FOUND_API
         mock_response.iter_content.return_value = stream
-        mock_requests.get.return_value = mock_response
+        mock_get_session().get.return_value = mock_response
 
         sd = StreamDownloader(url=URL)
 
@@ -100,7 +104,7 @@ class TestStreamDownloader(TestCase):
         # download
         sd.download_file_stream(url="https://any.call/test.zip")
 
-        mock_requests.get.assert_called_once_with(
+        mock_get_session().get.assert_called_once_with(
             url="https://any.call/test.zip",
             stream=True,
             headers={
@@ -111,18 +115,21 @@ class TestStreamDownloader(TestCase):
             },
             timeout=30,
         )
-        mock_requests.get.return_value.iter_content.assert_called_with(chunk_size=1024)
+        mock_get_session().get.return_value.iter_content.assert_called_with(
+            chunk_size=1024
+        )
         assert len(on_data.mock_calls) > 0
-        on_data.assert_has_calls([call()(data=[])], any_order=True)
+        on_data.assert_has_calls([call(data=stream[0])], any_order=True)
+        self.assertEqual(sd.sha256, hashlib.sha256(file.getvalue()).hexdigest())
 
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_fail_download_file_stream_no_content_len_header(self, mock_requests):
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_fail_download_file_stream_no_content_len_header(self, mock_get_session):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = MagicMock()
         mock_response.headers = {"No-Content-Length": "210000"}
         mock_response.json.return_value = MOCKED_FOUND_API
-        mock_requests.get.return_value = mock_response
+        mock_get_session().get.return_value = mock_response
 
         with self.assertRaises(RuntimeError) as exc_info:
             sd = StreamDownloader(url=URL)
@@ -133,7 +140,7 @@ class TestStreamDownloader(TestCase):
             "Empty Content-Length response for https://any.call/test.zip",
         )
 
-        mock_requests.get.assert_called_once_with(
+        mock_get_session().get.assert_called_once_with(
             url="https://any.call/test.zip",
             stream=True,
             headers={
@@ -145,12 +152,11 @@ class TestStreamDownloader(TestCase):
             timeout=30,
         )
 
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_fail_server_error_download_file_stream(self, mock_requests):
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_fail_server_error_download_file_stream(self, mock_get_session):
         mock_response = MagicMock(status_code=500)
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-        mock_requests.exceptions = requests.exceptions
-        mock_requests.get.return_value = mock_response
+        mock_get_session().get.return_value = mock_response
 
         with self.assertRaises(RuntimeError) as exc_info:
             sd = StreamDownloader(url=URL)
@@ -158,12 +164,11 @@ class TestStreamDownloader(TestCase):
 
         self.assertEqual(str(exc_info.exception), "HTTP error 500: None")
 
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_fail_timeout_download_file_stream(self, mock_requests):
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_fail_timeout_download_file_stream(self, mock_get_session):
         mock_response = MagicMock()
         mock_response.raise_for_status.side_effect = requests.exceptions.Timeout()
-        mock_requests.exceptions = requests.exceptions
-        mock_requests.get.return_value = mock_response
+        mock_get_session().get.return_value = mock_response
 
         with self.assertRaises(RuntimeError) as exc_info:
             sd = StreamDownloader(url=URL)
@@ -171,17 +176,194 @@ class TestStreamDownloader(TestCase):
 
         self.assertEqual(str(exc_info.exception), "Download timeout error: None")
 
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_fail_connection_download_file_stream(self, mock_requests):
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_fail_connection_download_file_stream(self, mock_get_session):
         mock_response = MagicMock()
         mock_response.raise_for_status.side_effect = (
             requests.exceptions.ConnectionError()
         )
-        mock_requests.exceptions = requests.exceptions
-        mock_requests.get.return_value = mock_response
+        mock_get_session().get.return_value = mock_response
 
         with self.assertRaises(RuntimeError) as exc_info:
             sd = StreamDownloader(url=URL)
             sd.download_file_stream(url="https://any.request/test.zip")
 
         self.assertEqual(str(exc_info.exception), "Download connection error: None")
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_file_stream_range(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 206
+        mock_response.headers = {
+            "Content-Length": "10",
+            "Content-Range": "bytes 90-99/100",
+        }
+        mock_response.iter_content.return_value = [b"0123456789"]
+        mock_get_session().get.return_value = mock_response
+
+        sd = StreamDownloader(url=URL)
+        sd.on_start = MagicMock()
+        sd.on_data = MagicMock()
+        sd.download_file_stream(
+            url="https://any.call/test.zip", offset=90, validator='"mocketag"'
+        )
+
+        mock_get_session().get.assert_called_once_with(
+            url="https://any.call/test.zip",
+            stream=True,
+            headers={
+                "Content-Disposition": "attachment filename=test.zip",
+                "Connection": "keep-alive",
+                "Cache-Control": "max-age=0",
+                "Accept-Encoding": "identity",
+                "Range": "bytes=90-",
+                "If-Range": '"mocketag"',
+            },
+            timeout=30,
+        )
+        sd.on_start.assert_called_once_with(offset=90, headers=mock_response.headers)
+        self.assertEqual(sd.content_len, 100)
+        self.assertEqual(sd.downloaded_len, 100)
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_file_stream_not_modified(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 304
+        mock_response.headers = {"ETag": '"mocketag"'}
+        mock_get_session().get.return_value = mock_response
+
+        sd = StreamDownloader(url=URL)
+        sd.on_start = MagicMock()
+        sd.on_data = MagicMock()
+        modified = sd.download_file_stream(
+            url="https://any.call/test.pem",
+            if_none_match='"mocketag"',
+            if_modified_since="Wed, 21 Oct 2015 07:28:00 GMT",
+        )
+
+        self.assertFalse(modified)
+        mock_get_session().get.assert_called_once_with(
+            url="https://any.call/test.pem",
+            stream=True,
+            headers={
+                "Content-Disposition": "attachment filename=test.pem",
+                "Connection": "keep-alive",
+                "Cache-Control": "max-age=0",
+                "Accept-Encoding": "gzip, deflate, br",
+                "If-None-Match": '"mocketag"',
+                "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+            },
+            timeout=30,
+        )
+        mock_response.iter_content.assert_not_called()
+        mock_response.close.assert_called_once()
+        sd.on_start.assert_not_called()
+        sd.on_data.assert_not_called()
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_file_stream_range_ignored(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "100"}
+        mock_response.iter_content.return_value = [b"0" * 100]
+        mock_get_session().get.return_value = mock_response
+
+        sd = StreamDownloader(url=URL)
+        sd.on_start = MagicMock()
+        sd.on_data = MagicMock()
+        sd.download_file_stream(
+            url="https://any.call/test.zip", offset=90, validator='"mocketag"'
+        )
+
+        sd.on_start.assert_called_once_with(offset=0, headers=mock_response.headers)
+        self.assertEqual(sd.content_len, 100)
+        self.assertEqual(sd.downloaded_len, 100)
+
+    def test_stream_headers(self):
+        sd = StreamDownloader(url=URL)
+        sd.filename = os.path.basename(URL)
+
+        headers = sd.stream_headers(offset=10, validator='"abcd"')
+        self.assertEqual(headers["Accept-Encoding"], "identity")
+        self.assertEqual(headers["Range"], "bytes=10-")
+        self.assertEqual(headers["If-Range"], '"abcd"')
+        self.assertNotIn("If-None-Match", headers)
+
+        headers = sd.stream_headers(
+            if_none_match='"abcd"', if_modified_since="Mon, 01 Jan 2024 00:00:00 GMT"
+        )
+        self.assertEqual(headers["Accept-Encoding"], "gzip, deflate, br")
+        self.assertEqual(headers["If-None-Match"], '"abcd"')
+        self.assertEqual(headers["If-Modified-Since"], "Mon, 01 Jan 2024 00:00:00 GMT")
+        self.assertNotIn("Range", headers)
+
+    def test_make_segments(self):
+        mb = StreamDownloader.MIN_SEGMENT_SIZE
+        self.assertEqual(StreamDownloader.make_segments(10, 4), [(0, 9)])
+        self.assertEqual(
+            StreamDownloader.make_segments(4 * mb, 4),
+            [(0, mb - 1), (mb, 2 * mb - 1), (2 * mb, 3 * mb - 1), (3 * mb, 4 * mb - 1)],
+        )
+        self.assertEqual(
+            StreamDownloader.make_segments(2 * mb + 1, 8),
+            [(0, mb), (mb + 1, 2 * mb)],
+        )
+
+    @patch(
+        "src.utils.downloader.stream_downloader.StreamDownloader.MIN_SEGMENT_SIZE", 4
+    )
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_file_segments(self, mock_get_session):
+        data = b"0123456789abcdef"
+
+        def get(url, stream, headers, timeout):
+            start, end = [int(n) for n in headers["Range"][6:].split("-")]
+            res = MagicMock(status_code=206, url="https://any.cdn/test.zip")
+            res.headers = {
+                "Content-Range": f"bytes {start}-{end}/{len(data)}",
+                "Content-Length": str(end - start + 1),
+            }
+            res.iter_content.return_value = [data[start : end + 1]]
+            return res
+
+        mock_get_session().get.side_effect = get
+
+        sd = StreamDownloader(url=URL)
+        sd.on_data = MagicMock()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.zip")
+            downloaded = sd.download_file_segments(
+                url="https://any.call/test.zip", filename=filename, connections=4
+            )
+
+            self.assertTrue(downloaded)
+            with open(filename, "rb") as f:
+                self.assertEqual(f.read(), data)
+
+        self.assertEqual(sd.content_len, 16)
+        self.assertEqual(sd.downloaded_len, 16)
+        self.assertEqual(len(sd.on_data.mock_calls), 4)
+        urls = [c.kwargs["url"] for c in mock_get_session().get.call_args_list]
+        self.assertEqual(urls[0], "https://any.call/test.zip")
+        self.assertEqual(urls[1:], ["https://any.cdn/test.zip"] * 4)
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_file_segments_not_supported(self, mock_get_session):
+        mock_response = MagicMock(status_code=200)
+        mock_response.headers = {"Content-Length": "16"}
+        mock_get_session().get.return_value = mock_response
+
+        sd = StreamDownloader(url=URL)
+        sd.on_data = MagicMock()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.zip")
+            downloaded = sd.download_file_segments(
+                url="https://any.call/test.zip", filename=filename, connections=4
+            )
+
+            self.assertFalse(downloaded)
+            self.assertFalse(os.path.exists(filename))
+
+        sd.on_data.assert_not_called()
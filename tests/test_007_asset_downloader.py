@@ -1,8 +1,12 @@
-import io
-import sys
+import os
+import json
+import hashlib
+import tempfile
 from unittest import TestCase
-from unittest.mock import MagicMock, patch, mock_open
+from unittest.mock import MagicMock, patch, call
 from src.utils.downloader.asset_downloader import AssetDownloader
+from src.utils.hasher import read_digest
+from src.utils.store import ArtifactStore
 from .shared_mocks import PropertyInstanceMock
 
 MOCKED_FOUND_API = [
@@ -59,86 +63,452 @@ class TestAssetDownloader(TestCase):
 
         self.assertEqual(str(exc_info.exception), "Write Mode 'r' not supported")
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("tempfile.gettempdir")
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_download_wb(self, mock_requests, mock_gettempdir, open_mock):
-        if sys.platform in ("linux", "darwin"):
-            mock_gettempdir.return_value = "/tmp/dir"
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_wb(self, mock_get_session):
+        stream = [b"PK\x03\x04", b"\x14\x00\x00\x00", b"\x08\x00"]
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "10"}
+        mock_response.json.return_value = MOCKED_FOUND_API
+        mock_response.iter_content.return_value = stream
+        mock_get_session().get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.zip",
+                destdir=tmpdir,
+                write_mode="wb",
+            )
 
-        if sys.platform == "win32":
-            mock_gettempdir.return_value = "C:\\tmp\\dir"
+            mock_on_data = MagicMock()
+            destfile = a.download(on_data=mock_on_data)
 
-        file = io.BytesIO()
+            self.assertEqual(destfile, os.path.join(tmpdir, "asset.zip"))
+            self.assertEqual(
+                sorted(os.listdir(tmpdir)), ["asset.zip", "asset.zip.digest.json"]
+            )
+            with open(destfile, "rb") as f:
+                self.assertEqual(f.read(), b"".join(stream))
 
-        # pylint: disable=line-too-long
-        file.write(
-            b"PK\x03\x04\x14\x00\x00\x00\x08\x00\x08`1Xb\x1f\x95Q\xb3\x00\x00\x00!\x04\x00\x00\x0e\x00\x1c\x00tests/krux.txtUT\t\x00\x03\x7f\xeb\xa7e\x7f\xeb\xa7eux\x0b\x00\x01\x04\xe8\x03\x00\x00\x04\xe8\x03\x00\x00\xad\x90K\x0e\xc2 \x14E\xe7\xae\x82\r\x94~\x8c\x03;s%\rE\xa8/\x94O(m\xd1\xd5k\xd5\xc4X\x13\x05\xe2\xf8\xdd\x93s\xf2\x0e\x96\x9e`b5B\xc2\x8e>\x9b\xaa-.\xf6\xb8\xc4\x170\x1b\x84@\xf1\x9e8P]\xfd~\xce\x85\xd3\xba\xcfzP\xa3G\xe8\xf7P\x12\x1a8\xcb\xca\"d9\x83\xc2\xcc\xb3\xefSI\xc0\x9bs#w\x83\x03*\xa6\x9c\x83\x953\xb1\x0c\xb77z\x80.\x9d\x8e#E\xab\xb5\xc3\x82\x1b\x11\xa6$\x12:\xdd\x80\x19\xe2\x9d/\xf4?\xd2\xe07=p\xc7]j\xf3\x82\xa65\xaf\xa5\xc1\xcd-$\xd4.Pl\xe7Z\x14\\x\xd4T\xc4'\xde\xa9\xd8\xc6\x0f\xd53\xf2\nPK\x01\x02\x1e\x03\x14\x00\x00\x00\x08\x00\x08`1Xb\x1f\x95Q\xb3\x00\x00\x00!\x04\x00\x00\x0e\x00\x18\x00\x00\x00\x00\x00\x01\x00\x00\x00\xa4\x81\x00\x00\x00\x00tests/krux.txtUT\x05\x00\x03\x7f\xeb\xa7eux\x0b\x00\x01\x04\xe8\x03\x00\x00\x04\xe8\x03\x00\x00PK\x05\x06\x00\x00\x00\x00\x01\x00\x01\x00T\x00\x00\x00\xfb\x00\x00\x00\x00\x00"
-        )
+            mock_on_data.assert_has_calls([call(chunk) for chunk in stream])
 
-        stream = [bytes(b) for b in file.read(8)]
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_w(self, mock_get_session):
+        # split a multibyte char between two chunks
+        text = "abc  äbc  krux-v0.0.1.zip"
+        data = text.encode("utf8")
+        stream = [data[:6], data[6:]]
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.headers = {"Content-Length": "210000"}
-        mock_response.json.return_value = MOCKED_FOUND_API
         mock_response.iter_content.return_value = stream
-        mock_requests.get.return_value = mock_response
+        mock_get_session().get.return_value = mock_response
 
-        a = AssetDownloader(
-            url="https://github.com/selfcustody/krux/asset.zip",
-            destdir=mock_gettempdir(),
-            write_mode="wb",
-        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.txt",
+                destdir=tmpdir,
+                write_mode="w",
+            )
 
-        mock_on_data = MagicMock()
-        a.download(on_data=mock_on_data)
+            mock_on_data = MagicMock()
+            destfile = a.download(on_data=mock_on_data)
 
-        if sys.platform in ("linux", "darwin"):
-            open_mock.assert_called_once_with("/tmp/dir/asset.zip", "wb")
+            self.assertEqual(destfile, os.path.join(tmpdir, "asset.txt"))
+            self.assertEqual(os.listdir(tmpdir), ["asset.txt"])
+            with open(destfile, "r", encoding="utf8") as f:
+                self.assertEqual(f.read(), text)
 
-        if sys.platform == "win32":
-            open_mock.assert_called_once_with("C:\\tmp\\dir\\asset.zip", "wb")
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_fail_download_remove_tmpfile(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "10"}
+        mock_response.iter_content.side_effect = RuntimeError("mock interrupted")
+        mock_get_session().get.return_value = mock_response
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("tempfile.gettempdir")
-    @patch("src.utils.downloader.stream_downloader.requests")
-    def test_download_w(self, mock_requests, mock_gettempdir, open_mock):
-        if sys.platform in ("linux", "darwin"):
-            mock_gettempdir.return_value = "/tmp/dir"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.zip",
+                destdir=tmpdir,
+                write_mode="wb",
+            )
+
+            with self.assertRaises(RuntimeError) as exc_info:
+                a.download(on_data=MagicMock())
+
+            self.assertEqual(str(exc_info.exception), "mock interrupted")
+            self.assertEqual(os.listdir(tmpdir), [])
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_fail_download_keep_resumable_part(self, mock_get_session):
+        def interrupted(chunk_size):
+            yield b"01234"
+            raise RuntimeError("mock interrupted")
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "10", "ETag": '"mocketag"'}
+        mock_response.iter_content.side_effect = interrupted
+        mock_get_session().get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.zip",
+                destdir=tmpdir,
+                write_mode="wb",
+            )
+
+            with self.assertRaises(RuntimeError):
+                a.download(on_data=MagicMock())
+
+            partfile = os.path.join(tmpdir, "asset.zip.part")
+            with open(partfile, "rb") as f:
+                self.assertEqual(f.read(), b"01234")
+
+            with open(f"{partfile}.json", "r", encoding="utf8") as f:
+                self.assertEqual(
+                    json.load(f),
+                    {
+                        "url": "https://github.com/selfcustody/krux/asset.zip",
+                        "etag": '"mocketag"',
+                        "last_modified": None,
+                        "content_len": 10,
+                    },
+                )
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_resume_part(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 206
+        mock_response.headers = {
+            "Content-Length": "5",
+            "Content-Range": "bytes 5-9/10",
+            "ETag": '"mocketag"',
+        }
+        mock_response.iter_content.return_value = [b"56789"]
+        mock_get_session().get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            partfile = os.path.join(tmpdir, "asset.zip.part")
+            with open(partfile, "wb") as f:
+                f.write(b"01234")
+
+            with open(f"{partfile}.json", "w", encoding="utf8") as f:
+                json.dump(
+                    {
+                        "url": "https://github.com/selfcustody/krux/asset.zip",
+                        "etag": '"mocketag"',
+                        "last_modified": None,
+                        "content_len": 10,
+                    },
+                    f,
+                )
+
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.zip",
+                destdir=tmpdir,
+                write_mode="wb",
+            )
+            destfile = a.download(on_data=MagicMock())
+
+            headers = mock_get_session().get.call_args.kwargs["headers"]
+            self.assertEqual(headers["Range"], "bytes=5-")
+            self.assertEqual(headers["If-Range"], '"mocketag"')
+            self.assertEqual(
+                sorted(os.listdir(tmpdir)), ["asset.zip", "asset.zip.digest.json"]
+            )
+            self.assertEqual(
+                read_digest(destfile), hashlib.sha256(b"0123456789").hexdigest()
+            )
+            with open(destfile, "rb") as f:
+                self.assertEqual(f.read(), b"0123456789")
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_resume_part_range_ignored(self, mock_get_session):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "10", "ETag": '"newetag"'}
+        mock_response.iter_content.return_value = [b"abcdefghij"]
+        mock_get_session().get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            partfile = os.path.join(tmpdir, "asset.zip.part")
+            with open(partfile, "wb") as f:
+                f.write(b"01234")
+
+            with open(f"{partfile}.json", "w", encoding="utf8") as f:
+                json.dump(
+                    {
+                        "url": "https://github.com/selfcustody/krux/asset.zip",
+                        "etag": '"mocketag"',
+                        "last_modified": None,
+                        "content_len": 10,
+                    },
+                    f,
+                )
+
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.zip",
+                destdir=tmpdir,
+                write_mode="wb",
+            )
+            destfile = a.download(on_data=MagicMock())
+
+            self.assertEqual(
+                sorted(os.listdir(tmpdir)), ["asset.zip", "asset.zip.digest.json"]
+            )
+            with open(destfile, "rb") as f:
+                self.assertEqual(f.read(), b"abcdefghij")
+            self.assertEqual(
+                read_digest(destfile), hashlib.sha256(b"abcdefghij").hexdigest()
+            )
+
+    def test_fail_init_connections(self):
+        with self.assertRaises(ValueError) as exc_info:
+            AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.zip",
+                destdir=tempfile.gettempdir(),
+                write_mode="wb",
+                connections=0,
+            )
+
+        self.assertEqual(str(exc_info.exception), "Invalid number of connections: 0")
+
+    @patch(
+        "src.utils.downloader.asset_downloader.AssetDownloader.download_file_segments"
+    )
+    def test_download_segments(self, mock_download_file_segments):
+        def download_file_segments(url, filename, connections):
+            with open(filename, "wb") as f:
+                f.write(b"0123456789")
+            return True
+
+        mock_download_file_segments.side_effect = download_file_segments
 
-        if sys.platform == "win32":
-            mock_gettempdir.return_value = "C:\\tmp\\dir"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.zip",
+                destdir=tmpdir,
+                write_mode="wb",
+                connections=4,
+            )
+            destfile = a.download(on_data=MagicMock())
 
-        file = io.BytesIO()
+            self.assertEqual(
+                sorted(os.listdir(tmpdir)), ["asset.zip", "asset.zip.digest.json"]
+            )
+            with open(destfile, "rb") as f:
+                self.assertEqual(f.read(), b"0123456789")
+
+            # the joined segments are hashed once
+            self.assertEqual(
+                read_digest(destfile), hashlib.sha256(b"0123456789").hexdigest()
+            )
 
-        # pylint: disable=line-too-long
-        file.write(
-            b"PK\x03\x04\x14\x00\x00\x00\x08\x00\x08`1Xb\x1f\x95Q\xb3\x00\x00\x00!\x04\x00\x00\x0e\x00\x1c\x00tests/krux.txtUT\t\x00\x03\x7f\xeb\xa7e\x7f\xeb\xa7eux\x0b\x00\x01\x04\xe8\x03\x00\x00\x04\xe8\x03\x00\x00\xad\x90K\x0e\xc2 \x14E\xe7\xae\x82\r\x94~\x8c\x03;s%\rE\xa8/\x94O(m\xd1\xd5k\xd5\xc4X\x13\x05\xe2\xf8\xdd\x93s\xf2\x0e\x96\x9e`b5B\xc2\x8e>\x9b\xaa-.\xf6\xb8\xc4\x170\x1b\x84@\xf1\x9e8P]\xfd~\xce\x85\xd3\xba\xcfzP\xa3G\xe8\xf7P\x12\x1a8\xcb\xca\"d9\x83\xc2\xcc\xb3\xefSI\xc0\x9bs#w\x83\x03*\xa6\x9c\x83\x953\xb1\x0c\xb77z\x80.\x9d\x8e#E\xab\xb5\xc3\x82\x1b\x11\xa6$\x12:\xdd\x80\x19\xe2\x9d/\xf4?\xd2\xe07=p\xc7]j\xf3\x82\xa65\xaf\xa5\xc1\xcd-$\xd4.Pl\xe7Z\x14\\x\xd4T\xc4'\xde\xa9\xd8\xc6\x0f\xd53\xf2\nPK\x01\x02\x1e\x03\x14\x00\x00\x00\x08\x00\x08`1Xb\x1f\x95Q\xb3\x00\x00\x00!\x04\x00\x00\x0e\x00\x18\x00\x00\x00\x00\x00\x01\x00\x00\x00\xa4\x81\x00\x00\x00\x00tests/krux.txtUT\x05\x00\x03\x7f\xeb\xa7eux\x0b\x00\x01\x04\xe8\x03\x00\x00\x04\xe8\x03\x00\x00PK\x05\x06\x00\x00\x00\x00\x01\x00\x01\x00T\x00\x00\x00\xfb\x00\x00\x00\x00\x00"
+        mock_download_file_segments.assert_called_once_with(
+            url="https://github.com/selfcustody/krux/asset.zip",
+            filename=os.path.join(tmpdir, "asset.zip.part"),
+            connections=4,
         )
 
-        stream = [bytes(b) for b in file.read(8)]
+    @patch(
+        "src.utils.downloader.asset_downloader.AssetDownloader.download_file_segments",
+        return_value=False,
+    )
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_segments_fallback(
+        self, mock_get_session, mock_download_file_segments
+    ):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "10"}
+        mock_response.iter_content.return_value = [b"0123456789"]
+        mock_get_session().get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.zip",
+                destdir=tmpdir,
+                write_mode="wb",
+                connections=4,
+            )
+            destfile = a.download(on_data=MagicMock())
+
+            with open(destfile, "rb") as f:
+                self.assertEqual(f.read(), b"0123456789")
+
+        mock_download_file_segments.assert_called_once()
+        mock_get_session().get.assert_called_once()
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_put_in_store(self, mock_get_session):
+        stream = [b"PK\x03\x04", b"\x14\x00\x00\x00", b"\x08\x00"]
 
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "10"}
         mock_response.iter_content.return_value = stream
-        mock_requests.get.return_value = mock_response
+        mock_get_session().get.return_value = mock_response
 
-        a = AssetDownloader(
-            url="https://github.com/selfcustody/krux/asset.txt",
-            destdir=mock_gettempdir(),
-            write_mode="w",
-        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = ArtifactStore(root=os.path.join(tmpdir, "store"))
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.zip",
+                destdir=os.path.join(tmpdir, "assets"),
+                write_mode="wb",
+                store=store,
+            )
+
+            with patch.object(ArtifactStore, "hash_file") as mock_hash_file:
+                a.download(on_data=MagicMock())
+
+            # the digest computed while streaming is stored
+            mock_hash_file.assert_not_called()
+            entry = store.lookup("https://github.com/selfcustody/krux/asset.zip")
+            self.assertEqual(entry["size"], 10)
+            self.assertEqual(
+                entry["sha256"], hashlib.sha256(b"".join(stream)).hexdigest()
+            )
 
-        mock_on_data = MagicMock()
-        a.download(on_data=mock_on_data)
+    @patch(
+        "src.utils.downloader.asset_downloader.AssetDownloader.download_file_segments"
+    )
+    def test_download_segments_put_in_store(self, mock_download_file_segments):
+        def download_file_segments(url, filename, connections):
+            with open(filename, "wb") as f:
+                f.write(b"0123456789")
+            return True
 
-        if sys.platform in ("linux", "darwin"):
-            open_mock.assert_called_once_with(
-                "/tmp/dir/asset.txt", "w", encoding="utf8"
+        mock_download_file_segments.side_effect = download_file_segments
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = ArtifactStore(root=os.path.join(tmpdir, "store"))
+            a = AssetDownloader(
+                url="https://github.com/selfcustody/krux/asset.zip",
+                destdir=os.path.join(tmpdir, "assets"),
+                write_mode="wb",
+                connections=4,
+                store=store,
             )
 
-        if sys.platform == "win32":
-            open_mock.assert_called_once_with(
-                "C:\\tmp\\dir\\asset.txt", "w", encoding="utf8"
+            with patch.object(ArtifactStore, "hash_file") as mock_hash_file:
+                a.download(on_data=MagicMock())
+
+            # the digest of the joined segments is stored
+            mock_hash_file.assert_not_called()
+            entry = store.lookup("https://github.com/selfcustody/krux/asset.zip")
+            self.assertEqual(entry["size"], 10)
+            self.assertEqual(entry["sha256"], hashlib.sha256(b"0123456789").hexdigest())
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_immutable_from_store(self, mock_get_session):
+        url = "https://github.com/selfcustody/krux/asset.zip"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = ArtifactStore(root=os.path.join(tmpdir, "store"))
+            cached = os.path.join(tmpdir, "cached.zip")
+            with open(cached, "wb") as f:
+                f.write(b"cached")
+            store.put(url=url, filename=cached)
+
+            a = AssetDownloader(
+                url=url, destdir=os.path.join(tmpdir, "assets"), write_mode="wb"
             )
+            a.store = store
+            setattr(a, "IMMUTABLE", True)
+
+            mock_on_data = MagicMock()
+            destfile = a.download(on_data=mock_on_data)
+
+            with open(destfile, "rb") as f:
+                self.assertEqual(f.read(), b"cached")
+
+            self.assertEqual(a.content_len, 6)
+            self.assertEqual(a.downloaded_len, 6)
+            mock_on_data.assert_called_once_with(data=b"")
+            mock_get_session().get.assert_not_called()
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_mutable_ignore_store(self, mock_get_session):
+        url = "https://github.com/selfcustody/krux/asset.zip"
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "3"}
+        mock_response.iter_content.return_value = [b"new"]
+        mock_get_session().get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = ArtifactStore(root=os.path.join(tmpdir, "store"))
+            cached = os.path.join(tmpdir, "cached.zip")
+            with open(cached, "wb") as f:
+                f.write(b"old")
+            store.put(url=url, filename=cached)
+
+            a = AssetDownloader(
+                url=url,
+                destdir=os.path.join(tmpdir, "assets"),
+                write_mode="wb",
+                store=store,
+            )
+            destfile = a.download(on_data=MagicMock())
+
+            with open(destfile, "rb") as f:
+                self.assertEqual(f.read(), b"new")
+
+            mock_get_session().get.assert_called_once()
+            self.assertEqual(
+                store.lookup(url)["sha256"], ArtifactStore.hash_file(destfile)
+            )
+
+    @patch("src.utils.downloader.stream_downloader.get_session")
+    def test_download_mutable_not_modified(self, mock_get_session):
+        url = "https://github.com/selfcustody/krux/asset.pem"
+
+        first_response = MagicMock()
+        first_response.status_code = 200
+        first_response.headers = {
+            "Content-Length": "3",
+            "ETag": '"mocketag"',
+            "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+        }
+        first_response.iter_content.return_value = [b"pem"]
+
+        second_response = MagicMock()
+        second_response.status_code = 304
+        second_response.headers = {"ETag": '"mocketag"'}
+
+        mock_get_session().get.side_effect = [first_response, second_response]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = ArtifactStore(root=os.path.join(tmpdir, "store"))
+            a = AssetDownloader(
+                url=url,
+                destdir=os.path.join(tmpdir, "assets"),
+                write_mode="w",
+                store=store,
+            )
+            destfile = a.download(on_data=MagicMock())
+
+            entry = store.lookup(url)
+            self.assertEqual(entry["etag"], '"mocketag"')
+            self.assertEqual(entry["last_modified"], "Wed, 21 Oct 2015 07:28:00 GMT")
+
+            os.remove(destfile)
+            mock_on_data = MagicMock()
+            self.assertEqual(a.download(on_data=mock_on_data), destfile)
+
+            headers = mock_get_session().get.call_args.kwargs["headers"]
+            self.assertEqual(headers["If-None-Match"], '"mocketag"')
+            self.assertEqual(
+                headers["If-Modified-Since"], "Wed, 21 Oct 2015 07:28:00 GMT"
+            )
+
+            with open(destfile, "r", encoding="utf8") as f:
+                self.assertEqual(f.read(), "pem")
+
+            self.assertEqual(a.downloaded_len, a.content_len)
+            mock_on_data.assert_called_once_with(data=b"")
+            self.assertFalse(os.path.exists(f"{destfile}.part"))
@@ -28,3 +28,13 @@ class TestZipDownloader(TestCase):
 
         z = ZipDownloader(version="v0.0.1", destdir=mock_gettempdir())
         self.assertEqual(z.write_mode, "wb")
+
+    @patch("tempfile.gettempdir")
+    def test_init_connections(self, mock_gettempdir):
+        mock_gettempdir.return_value = "/tmp/dir"
+
+        z = ZipDownloader(version="v0.0.1", destdir=mock_gettempdir())
+        self.assertEqual(z.connections, 1)
+
+        z = ZipDownloader(version="v0.0.1", destdir=mock_gettempdir(), connections=4)
+        self.assertEqual(z.connections, 4)
@@ -88,3 +88,14 @@ class TestBetaDownloader(TestCase):
         )
         self.assertEqual(b.device, "m5stickv")
         self.assertEqual(b.binary_type, "kboot.kfpkg")
+
+    @patch("tempfile.gettempdir")
+    def test_init_connections(self, mock_gettempdir):
+        mock_gettempdir.return_value = "/tmp/dir"
+        b = BetaDownloader(
+            device="m5stickv",
+            binary_type="kboot.kfpkg",
+            destdir=mock_gettempdir(),
+            connections=4,
+        )
+        self.assertEqual(b.connections, 4)
@@ -1,5 +1,8 @@
+import os
+import tempfile
 from unittest import TestCase
-from unittest.mock import patch, mock_open
+from unittest.mock import patch, call
+from src.utils.hasher import read_digest, write_digest
 from src.utils.verifyer.sha256_verifyer import Sha256Verifyer
 
 MOCK_SHA = "4ab12c3cc56b2641e7b216666186558cf40a36e76947edfd1b37cc1b190255ac"
@@ -29,21 +32,57 @@ class TestSha256VerifyerDownloader(TestCase):
             "File test.mock do not exist",
         )
 
+    @patch("src.utils.verifyer.sha256_verifyer.write_digest")
+    @patch("src.utils.verifyer.sha256_verifyer.read_digest", return_value=None)
+    @patch("src.utils.verifyer.sha256_verifyer.hash_file", return_value=MOCK_SHA)
     @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=MOCK_ZIP)
-    def test_load(self, open_mock, mock_exists):
+    def test_load(self, mock_exists, mock_hash_file, mock_read_digest, mock_write):
         sha = Sha256Verifyer(filename="test.mock")
         sha.load()
         mock_exists.assert_called_once_with("test.mock")
-        open_mock.assert_called_once_with("test.mock", "rb")
+        mock_read_digest.assert_called_once_with("test.mock")
+        mock_hash_file.assert_called_once_with("test.mock", on_progress=None)
+        mock_write.assert_called_once_with("test.mock", MOCK_SHA)
         self.assertEqual(sha.data, MOCK_SHA)
 
-    @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=MOCK_ZIP)
-    def test_verify(self, open_mock, mock_exists):
-        sha = Sha256Verifyer(filename="test.mock")
-        sha.load()
-        mock_exists.assert_called_once_with("test.mock")
-        open_mock.assert_called_once_with("test.mock", "rb")
-        verify = sha.verify(MOCK_SHA)
-        self.assertTrue(verify)
+    def test_verify(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.mock")
+            with open(filename, "wb") as f:
+                f.write(MOCK_ZIP)
+
+            sha = Sha256Verifyer(filename=filename)
+            sha.load()
+            verify = sha.verify(MOCK_SHA)
+            self.assertTrue(verify)
+
+    def test_load_persist_digest(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.zip")
+            with open(filename, "wb") as f:
+                f.write(MOCK_ZIP)
+
+            sha = Sha256Verifyer(filename=filename)
+            sha.load()
+
+            self.assertEqual(sha.data, MOCK_SHA)
+            self.assertTrue(sha.hashed)
+            self.assertEqual(read_digest(filename), MOCK_SHA)
+
+    def test_load_reuse_digest(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.zip")
+            with open(filename, "wb") as f:
+                f.write(MOCK_ZIP)
+
+            write_digest(filename, MOCK_SHA)
+
+            with patch("builtins.open", wraps=open) as open_mock:
+                sha = Sha256Verifyer(filename=filename)
+                sha.load()
+
+                self.assertNotIn(call(filename, "rb"), open_mock.call_args_list)
+
+            self.assertEqual(sha.data, MOCK_SHA)
+            self.assertFalse(sha.hashed)
+            self.assertTrue(sha.verify(MOCK_SHA))
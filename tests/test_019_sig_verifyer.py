@@ -1,5 +1,9 @@
+import os
+import hashlib
+import tempfile
 from unittest import TestCase
-from unittest.mock import patch, mock_open
+from unittest.mock import patch
+from src.utils.hasher import write_digest
 from src.utils.verifyer.sig_verifyer import SigVerifyer
 
 MOCK_PEM = b"""-----BEGIN PUBLIC KEY-----
@@ -20,20 +24,21 @@ MOCK_ZIP = b'PK\x03\x04\x14\x00\x00\x00\x08\x00Aj>Xf\x088\xde\xec\x02\x00\x00H\x
 
 class TestSigVerifyerDownloader(TestCase):
 
+    @patch("src.utils.verifyer.sig_verifyer.hash_file", return_value="abcd")
     @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=MOCK_ZIP)
-    def test_init_zip(self, open_mock, mock_exists):
+    def test_init_zip(self, mock_exists, mock_hash_file):
         sig = SigVerifyer(
             filename="test.zip", signature=MOCK_SIG, pubkey=MOCK_PEM, regexp=r".*\.zip"
         )
         sig.load()
 
         mock_exists.assert_called_once_with("test.zip")
-        open_mock.assert_called_once_with("test.zip", "rb")
+        mock_hash_file.assert_called_once_with("test.zip", on_progress=None)
+        self.assertEqual(sig.digest, "abcd")
+        self.assertEqual(sig.data, None)
 
     @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=MOCK_ZIP)
-    def test_fail_init_zip(self, open_mock, mock_exists):
+    def test_fail_init_zip(self, mock_exists):
         with self.assertRaises(ValueError) as exc_info:
             SigVerifyer(
                 filename="test.zip",
@@ -42,51 +47,114 @@ class TestSigVerifyerDownloader(TestCase):
                 regexp=r".*\.txt",
             )
             mock_exists.assert_called_once_with("test.zip")
-            open_mock.assert_called_once_with("test.zip", "rb")
 
         self.assertEqual(
             str(exc_info.exception),
             "Invalid file: test.zip do not assert with .*\\.txt",
         )
 
+    @patch("src.utils.verifyer.sig_verifyer.hash_file")
     @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=MOCK_ZIP)
-    def test_init_any(self, open_mock, mock_exists):
+    def test_init_any_digest(self, mock_exists, mock_hash_file):
         sig = SigVerifyer(
-            filename="test", signature=MOCK_SIG, pubkey=MOCK_PEM, regexp=r".*"
+            filename="test",
+            signature=MOCK_SIG,
+            pubkey=MOCK_PEM,
+            regexp=r".*",
+            digest="abcd",
         )
         sig.load()
 
         mock_exists.assert_called_once_with("test")
-        open_mock.assert_called_once_with("test", "rb")
+        mock_hash_file.assert_not_called()
+        self.assertEqual(sig.digest, "abcd")
+
+    def test_verify_ignore_persisted_digest(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.zip")
+            with open(filename, "wb") as f:
+                f.write(MOCK_ZIP)
+
+            # a stale digest, with the size and mtime of tampered file
+            write_digest(filename, hashlib.sha256(MOCK_ZIP).hexdigest())
+            stat = os.stat(filename)
+            with open(filename, "r+b") as f:
+                f.write(b"XX")
+            os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            sig = SigVerifyer(
+                filename=filename,
+                signature=MOCK_SIG,
+                pubkey=MOCK_PEM,
+                regexp=r".*\.zip",
+            )
+
+            self.assertFalse(sig.verify())
+            self.assertNotEqual(sig.digest, hashlib.sha256(MOCK_ZIP).hexdigest())
+
+    def test_verify(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.zip")
+            with open(filename, "wb") as f:
+                f.write(MOCK_ZIP)
+
+            sig = SigVerifyer(
+                filename=filename,
+                signature=MOCK_SIG,
+                pubkey=MOCK_PEM,
+                regexp=r".*\.zip",
+            )
+            sig.load()
+
+            result = sig.verify()
+
+            self.assertEqual(sig.digest, hashlib.sha256(MOCK_ZIP).hexdigest())
+            self.assertEqual(result, True)
+
+    def test_fail_verify_sig(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.zip")
+            with open(filename, "wb") as f:
+                f.write(MOCK_ZIP)
 
+            sig = SigVerifyer(
+                filename=filename,
+                signature=MOCK_SIG_FAIL,
+                pubkey=MOCK_PEM,
+                regexp=r".*\.zip",
+            )
+            sig.load()
+
+            result = sig.verify()
+
+            self.assertEqual(result, False)
+
+    @patch("src.utils.verifyer.sig_verifyer.hash_file")
     @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=MOCK_ZIP)
-    def test_verify(self, open_mock, mock_exists):
+    def test_verify_prehashed(self, mock_exists, mock_hash_file):
         sig = SigVerifyer(
-            filename="test.zip", signature=MOCK_SIG, pubkey=MOCK_PEM, regexp=r".*\.zip"
+            filename="test.zip",
+            signature=MOCK_SIG,
+            pubkey=MOCK_PEM,
+            regexp=r".*\.zip",
+            digest=hashlib.sha256(MOCK_ZIP).hexdigest(),
         )
-        sig.load()
 
         result = sig.verify()
 
         mock_exists.assert_called_once_with("test.zip")
-        open_mock.assert_called_once_with("test.zip", "rb")
+        mock_hash_file.assert_not_called()
         self.assertEqual(result, True)
 
     @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=MOCK_ZIP)
-    def test_fail_verify_sig(self, open_mock, mock_exists):
+    def test_fail_verify_prehashed(self, mock_exists):
         sig = SigVerifyer(
             filename="test.zip",
-            signature=MOCK_SIG_FAIL,
+            signature=MOCK_SIG,
             pubkey=MOCK_PEM,
             regexp=r".*\.zip",
+            digest=hashlib.sha256(b"other").hexdigest(),
         )
-        sig.load()
-
-        result = sig.verify()
 
+        self.assertEqual(sig.verify(), False)
         mock_exists.assert_called_once_with("test.zip")
-        open_mock.assert_called_once_with("test.zip", "rb")
-        self.assertEqual(result, False)
@@ -1,9 +1,12 @@
+import os
+import hashlib
 import tempfile
 import zipfile
 from unittest import TestCase
-from unittest.mock import patch, call, mock_open
+from unittest.mock import patch, call
+from src.utils.hasher import read_digest, write_digest
 from src.utils.unzip.base_unzip import BaseUnzip
-from .shared_mocks import PropertyInstanceMock, MockZipFile
+from .shared_mocks import PropertyInstanceMock
 
 
 class TestBaseUnzip(TestCase):
@@ -57,23 +60,142 @@ class TestBaseUnzip(TestCase):
         mock_exists.assert_has_calls([call("test.zip"), call(tempfile.gettempdir())])
         mock_members.assert_called_once_with(unzip, ["README.md"])
 
-    @patch("src.utils.unzip.base_unzip.ZipFile")
-    @patch("os.path.exists", return_value=True)
-    def test_load_extract(self, mock_exists, mock_zipfile):
-        mock_zipfile.return_value = MockZipFile()
-        mock_zipfile.return_value.open = mock_open
+    def test_load_extract(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.zip")
+            with zipfile.ZipFile(filename, "w", zipfile.ZIP_DEFLATED) as zip_obj:
+                zip_obj.writestr("test/README.md", b"krux" * 1000)
+                zip_obj.writestr("test/LICENSE", b"MIT")
 
-        with patch.object(MockZipFile, "extract") as mock_extract:
-            unzip = BaseUnzip(filename="test.zip", members=["README.md"])
-            mock_exists.assert_has_calls(
-                [call("test.zip"), call(tempfile.gettempdir())]
+            unzip = BaseUnzip(
+                filename=filename, members=["test/README.md"], output=tmpdir
+            )
+            digests = unzip.load()
+
+            extracted = os.path.join(tmpdir, "test", "README.md")
+            sha256 = hashlib.sha256(b"krux" * 1000).hexdigest()
+            with open(extracted, "rb") as f:
+                self.assertEqual(f.read(), b"krux" * 1000)
+
+            self.assertEqual(digests, {"test/README.md": sha256})
+            self.assertEqual(unzip.digests, digests)
+            self.assertEqual(read_digest(extracted), sha256)
+            self.assertFalse(os.path.exists(os.path.join(tmpdir, "test", "LICENSE")))
+            self.assertFalse(os.path.exists(f"{extracted}.tmp"))
+
+    def test_load_extract_indexed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.zip")
+            with zipfile.ZipFile(filename, "w", zipfile.ZIP_DEFLATED) as zip_obj:
+                zip_obj.writestr("test/maixpy_amigo/firmware.bin", b"krux" * 1000)
+                zip_obj.writestr("test/README.md", b"MIT")
+
+            unzip = BaseUnzip(
+                filename=filename,
+                members=["test/maixpy_amigo/firmware.bin", "test/README.md"],
+                output=tmpdir,
             )
+
+            with patch("src.utils.unzip.base_unzip.ZipFile") as mock_zipfile:
+                mock_zipfile.return_value.__enter__.return_value.namelist.return_value = (
+                    []
+                )
+                digests = unzip.load()
+
+                # only the not indexed member is looked up in zip
+                mock_zipfile.assert_called_once_with(filename, "r")
+
+            extracted = os.path.join(tmpdir, "test", "maixpy_amigo", "firmware.bin")
+            sha256 = hashlib.sha256(b"krux" * 1000).hexdigest()
+            with open(extracted, "rb") as f:
+                self.assertEqual(f.read(), b"krux" * 1000)
+
+            self.assertEqual(digests, {"test/maixpy_amigo/firmware.bin": sha256})
+            self.assertEqual(read_digest(extracted), sha256)
+            self.assertTrue(os.path.exists(f"{filename}.index.json"))
+
+    def test_load_cached(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.zip")
+            with zipfile.ZipFile(filename, "w", zipfile.ZIP_DEFLATED) as zip_obj:
+                zip_obj.writestr("test/maixpy_amigo/kboot.kfpkg", b"krux" * 1000)
+
+            members = ["test/maixpy_amigo/kboot.kfpkg"]
+            sha256 = hashlib.sha256(b"krux" * 1000).hexdigest()
+            unzip = BaseUnzip(filename=filename, members=members, output=tmpdir)
             unzip.load()
-            mock_extract.assert_called_once_with(
-                "README.md", path=tempfile.gettempdir()
+            self.assertEqual(unzip.cached, [])
+
+            # same file on disk (even without its digest)
+            extracted = os.path.join(tmpdir, "test", "maixpy_amigo", "kboot.kfpkg")
+            os.remove(f"{extracted}.digest.json")
+            with patch("src.utils.unzip.zip_index.hash_copy") as mock_hash_copy:
+                digests = unzip.load()
+                mock_hash_copy.assert_not_called()
+
+            self.assertEqual(unzip.cached, members)
+            self.assertEqual(digests, {members[0]: sha256})
+            self.assertEqual(read_digest(extracted), sha256)
+
+            # a stale digest on disk is not trusted
+            write_digest(extracted, "abcd")
+            digests = unzip.load()
+            self.assertEqual(unzip.cached, members)
+            self.assertEqual(digests, {members[0]: sha256})
+            self.assertEqual(read_digest(extracted), sha256)
+
+            # a changed file with same size is extracted again
+            with open(extracted, "wb") as f:
+                f.write(b"xurk" * 1000)
+
+            digests = unzip.load()
+            self.assertEqual(unzip.cached, [])
+            self.assertEqual(digests, {members[0]: sha256})
+            with open(extracted, "rb") as f:
+                self.assertEqual(f.read(), b"krux" * 1000)
+
+    def test_open(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.zip")
+            with zipfile.ZipFile(filename, "w", zipfile.ZIP_DEFLATED) as zip_obj:
+                zip_obj.writestr("test/maixpy_amigo/kboot.kfpkg", b"krux" * 1000)
+                zip_obj.writestr("test/README.md", b"MIT")
+
+            unzip = BaseUnzip(filename=filename, members=["README.md"], output=tmpdir)
+            with unzip.open("test/maixpy_amigo/kboot.kfpkg") as member:
+                self.assertEqual(member.read(), b"krux" * 1000)
+
+            with unzip.open("test/README.md") as member:
+                self.assertEqual(member.read(), b"MIT")
+
+            with self.assertRaises(ValueError) as exc_info:
+                unzip.open("test/LICENSE")
+
+            self.assertEqual(str(exc_info.exception), "Member not found: test/LICENSE")
+
+            # nothing was extracted
+            self.assertEqual(
+                sorted(os.listdir(tmpdir)), ["test.zip", "test.zip.index.json"]
             )
 
-    @patch("src.utils.unzip.base_unzip.ZipFile")
+    @patch("os.path.exists", return_value=True)
+    def test_member_path(self, mock_exists):
+        unzip = BaseUnzip(filename="test.zip", members=["README.md"])
+        output = os.path.realpath(tempfile.gettempdir())
+        self.assertEqual(
+            unzip.member_path("test/README.md"),
+            os.path.join(output, "test", "README.md"),
+        )
+
+    @patch("os.path.exists", return_value=True)
+    def test_fail_member_path(self, mock_exists):
+        unzip = BaseUnzip(filename="test.zip", members=["README.md"])
+        with self.assertRaises(ValueError) as exc_info:
+            unzip.member_path("../README.md")
+
+        self.assertEqual(str(exc_info.exception), "Invalid member: ../README.md")
+
+    @patch("src.utils.unzip.zip_index.ZipFile")
     @patch("os.path.exists", return_value=True)
     def test_fail_load_badfile(self, mock_exists, mock_zipfile):
 
@@ -1,3 +1,5 @@
+import os
+import zipfile
 import tempfile
 from unittest import TestCase
 from unittest.mock import patch, call
@@ -53,3 +55,22 @@ class TestKbootUnzip(TestCase):
         self.assertEqual(unzip.filename, "test.zip")
         self.assertIn("test/maixpy_yahboom/kboot.kfpkg", unzip.members)
         self.assertEqual(unzip.output, tempfile.gettempdir())
+
+    def test_load_kboot(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "krux-v0.0.1.zip")
+            with zipfile.ZipFile(filename, "w", zipfile.ZIP_DEFLATED) as zip_obj:
+                zip_obj.writestr("krux-v0.0.1/maixpy_amigo/kboot.kfpkg", b"kboot")
+
+            unzip = KbootUnzip(filename=filename, device="amigo", output=tmpdir)
+            self.assertEqual(unzip.kboot, "krux-v0.0.1/maixpy_amigo/kboot.kfpkg")
+            unzip.load()
+            self.assertEqual(unzip.cached, [])
+
+            kboot = os.path.join(tmpdir, "krux-v0.0.1", "maixpy_amigo", "kboot.kfpkg")
+            with open(kboot, "rb") as f:
+                self.assertEqual(f.read(), b"kboot")
+
+            # the next flash of same version and device reuse it
+            unzip.load()
+            self.assertEqual(unzip.cached, [unzip.kboot])
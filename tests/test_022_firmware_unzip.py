@@ -1,7 +1,21 @@
+import os
+import hashlib
 import tempfile
+import zipfile
 from unittest import TestCase
 from unittest.mock import patch, call
+from src.utils.hasher import write_digest
 from src.utils.unzip import FirmwareUnzip
+from .test_019_sig_verifyer import MOCK_PEM, MOCK_SIG, MOCK_SIG_FAIL, MOCK_ZIP
+
+
+def make_release(tmpdir: str, signature: bytes) -> str:
+    filename = os.path.join(tmpdir, "krux-v0.0.1.zip")
+    with zipfile.ZipFile(filename, "w") as zip_obj:
+        zip_obj.writestr("krux-v0.0.1/maixpy_m5stickv/firmware.bin", MOCK_ZIP)
+        zip_obj.writestr("krux-v0.0.1/maixpy_m5stickv/firmware.bin.sig", signature)
+        zip_obj.writestr("krux-v0.0.1/maixpy_m5stickv/kboot.kfpkg", b"kboot")
+    return filename
 
 
 class TestFirmwareUnzip(TestCase):
@@ -59,3 +73,88 @@ class TestFirmwareUnzip(TestCase):
         self.assertIn("test/maixpy_yahboom/firmware.bin", unzip.members)
         self.assertIn("test/maixpy_yahboom/firmware.bin.sig", unzip.members)
         self.assertEqual(unzip.output, tempfile.gettempdir())
+
+    def test_load_verified(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pem = os.path.join(tmpdir, "selfcustody.pem")
+            with open(pem, "wb") as f:
+                f.write(MOCK_PEM)
+
+            unzip = FirmwareUnzip(
+                filename=make_release(tmpdir, MOCK_SIG),
+                device="m5stickv",
+                output=tmpdir,
+                pubkey=pem,
+            )
+            digests = unzip.load()
+
+            sha256 = hashlib.sha256(MOCK_ZIP).hexdigest()
+            self.assertEqual(
+                digests["krux-v0.0.1/maixpy_m5stickv/firmware.bin"], sha256
+            )
+            self.assertEqual(unzip.firmware_digest, sha256)
+            self.assertTrue(unzip.verified)
+            self.assertTrue(
+                os.path.isfile(
+                    os.path.join(
+                        tmpdir, "krux-v0.0.1", "maixpy_m5stickv", "firmware.bin.sig"
+                    )
+                )
+            )
+
+    def test_load_cached_rehashed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pem = os.path.join(tmpdir, "selfcustody.pem")
+            with open(pem, "wb") as f:
+                f.write(MOCK_PEM)
+
+            unzip = FirmwareUnzip(
+                filename=make_release(tmpdir, MOCK_SIG),
+                device="m5stickv",
+                output=tmpdir,
+                pubkey=pem,
+            )
+            unzip.load()
+
+            # the digest persisted along a cached member is not trusted
+            firmware = unzip.member_path(unzip.firmware)
+            write_digest(firmware, hashlib.sha256(b"stale").hexdigest())
+            unzip.load()
+
+            self.assertIn(unzip.firmware, unzip.cached)
+            self.assertEqual(
+                unzip.firmware_digest, hashlib.sha256(MOCK_ZIP).hexdigest()
+            )
+            self.assertTrue(unzip.verified)
+
+    def test_load_not_verified(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pem = os.path.join(tmpdir, "selfcustody.pem")
+            with open(pem, "wb") as f:
+                f.write(MOCK_PEM)
+
+            unzip = FirmwareUnzip(
+                filename=make_release(tmpdir, MOCK_SIG_FAIL),
+                device="m5stickv",
+                output=tmpdir,
+                pubkey=pem,
+            )
+            unzip.load()
+
+            self.assertFalse(unzip.verified)
+
+    @patch("src.utils.unzip.firmware_unzip.SigVerifyer")
+    def test_load_without_pubkey(self, mock_sig_verifyer):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            unzip = FirmwareUnzip(
+                filename=make_release(tmpdir, MOCK_SIG),
+                device="m5stickv",
+                output=tmpdir,
+            )
+            unzip.load()
+
+            self.assertIsNone(unzip.verified)
+            self.assertEqual(
+                unzip.firmware_digest, hashlib.sha256(MOCK_ZIP).hexdigest()
+            )
+            mock_sig_verifyer.assert_not_called()
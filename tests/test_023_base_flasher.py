@@ -1,9 +1,31 @@
+import io
+import os
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 from serial import SerialException
 from src.utils.flasher.base_flasher import BaseFlasher
-from .shared_mocks import MockListPortsGrep
+from .shared_mocks import (
+    MockListPortsGrep,
+    MockProcessPoolExecutor,
+    mock_get_context,
+)
+
+
+def mock_registry(running: bool = True, ports=None, state=None):
+    """A PortRegistry-like object"""
+    registry = MagicMock(running=running)
+    registry.ports.return_value = ports or []
+    registry.state.return_value = state
+    registry.recheck.return_value = state
+    registry.acquire.return_value = True
+    return registry
+
+
+def put_result(messages, port):
+    """A worker for run_parallel"""
+    messages.put((port, "data", "done"))
+    return {"success": True, "error": None}
 
 
 class TestBaseFlasher(TestCase):
@@ -25,6 +47,82 @@ class TestBaseFlasher(TestCase):
             str(exc_info.exception), "File do not exist: mock/test/kboot.kfpkg"
         )
 
+    def test_set_device(self):
+        b = BaseFlasher()
+        self.assertEqual(b.device, None)
+        b.device = "amigo"
+        self.assertEqual(b.device, "amigo")
+
+    def test_fail_set_device(self):
+        with self.assertRaises(ValueError) as exc_info:
+            b = BaseFlasher()
+            b.device = "mock"
+
+        self.assertEqual(str(exc_info.exception), "Device not implemented: mock")
+
+    @patch("os.path.exists", return_value=True)
+    def test_detect_device(self, mock_exists):
+        b = BaseFlasher()
+        b.firmware = "mock/maixpy_dock/kboot.kfpkg"
+        self.assertEqual(b.detect_device(), "dock")
+
+        b.device = "amigo"
+        self.assertEqual(b.detect_device(), "amigo")
+
+        b.device = None
+        b.firmware = "mock/kboot.kfpkg"
+        self.assertEqual(b.detect_device(), None)
+
+        b.firmware = io.BytesIO(b"kboot")
+        self.assertEqual(b.detect_device(), None)
+
+    @patch("os.path.exists")
+    def test_set_firmware_stream(self, mock_exists):
+        b = BaseFlasher()
+        stream = io.BytesIO(b"kboot")
+        b.firmware = stream
+        self.assertEqual(b.firmware, stream)
+        mock_exists.assert_not_called()
+
+    @patch("os.path.exists", return_value=True)
+    def test_firmware_file_path(self, mock_exists):
+        b = BaseFlasher()
+        b.firmware = "mock/test/kboot.kfpkg"
+        with b.firmware_file() as path:
+            self.assertEqual(path, "mock/test/kboot.kfpkg")
+
+    def test_firmware_file_stream(self):
+        b = BaseFlasher()
+        stream = io.BytesIO(b"kboot" * 1000)
+        b.firmware = stream
+        with b.firmware_file() as path:
+            self.assertTrue(path.endswith(".kfpkg"))
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"kboot" * 1000)
+
+        # private file removed once flashed
+        self.assertFalse(os.path.exists(path))
+        self.assertTrue(stream.closed)
+
+    def test_get_vid(self):
+        self.assertEqual(BaseFlasher.get_vid("m5stickv"), "0403")
+        self.assertEqual(BaseFlasher.get_vid("dock"), "7523")
+
+        with self.assertRaises(ValueError) as exc_info:
+            BaseFlasher.get_vid("mock")
+
+        self.assertEqual(str(exc_info.exception), "Device not implemented: mock")
+
+    @patch("src.utils.flasher.base_flasher.list_ports.grep")
+    def test_find_ports(self, mock_grep):
+        mock_grep.return_value = iter(
+            [MagicMock(device="/mock/path1"), MagicMock(device="/mock/path0")]
+        )
+        self.assertEqual(
+            BaseFlasher.find_ports("m5stickv"), ["/mock/path0", "/mock/path1"]
+        )
+        mock_grep.assert_called_once_with("0403")
+
     @patch(
         "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
     )
@@ -165,3 +263,115 @@ class TestBaseFlasher(TestCase):
         self.assertTrue(result)
 
         mock_serial.assert_called_once_with("mock")
+
+    @patch("src.utils.flasher.base_flasher.list_ports.grep")
+    @patch("src.utils.flasher.base_flasher.get_port_registry")
+    def test_find_ports_registry(self, mock_get_port_registry, mock_grep):
+        mock_get_port_registry.return_value = mock_registry(
+            ports=[MagicMock(device="/mock/path0"), MagicMock(device="/mock/path1")]
+        )
+        self.assertEqual(
+            BaseFlasher.find_ports("m5stickv"), ["/mock/path0", "/mock/path1"]
+        )
+        mock_get_port_registry.return_value.ports.assert_called_once_with(vid="0403")
+        mock_grep.assert_not_called()
+
+    @patch("src.utils.flasher.base_flasher.list_ports.grep")
+    @patch("src.utils.flasher.base_flasher.get_port_registry")
+    def test_set_port_registry(self, mock_get_port_registry, mock_grep):
+        mock_get_port_registry.return_value = mock_registry(
+            ports=[MagicMock(device="/mock/path0"), MagicMock(device="/mock/path1")]
+        )
+        f = BaseFlasher()
+        f.port = "dock"
+        self.assertEqual(f.port, "/mock/path0")
+        self.assertEqual(next(f._available_ports_generator).device, "/mock/path1")
+        mock_get_port_registry.return_value.ports.assert_called_once_with(vid="7523")
+        mock_grep.assert_not_called()
+
+    @patch("src.utils.flasher.base_flasher.Serial")
+    @patch("src.utils.flasher.base_flasher.get_port_registry")
+    def test_is_port_working_registry(self, mock_get_port_registry, mock_serial):
+        f = BaseFlasher()
+        for state, working in (
+            ("available", True),
+            ("busy", False),
+            ("unavailable", False),
+        ):
+            mock_get_port_registry.return_value = mock_registry(state=state)
+            self.assertEqual(f.is_port_working(port="mock"), working)
+            mock_get_port_registry.return_value.recheck.assert_called_once_with("mock")
+
+        mock_serial.assert_not_called()
+
+    @patch("src.utils.flasher.base_flasher.Serial")
+    @patch("src.utils.flasher.base_flasher.get_port_registry")
+    def test_is_port_working_unknown_to_registry(
+        self, mock_get_port_registry, mock_serial
+    ):
+        mock_get_port_registry.return_value = mock_registry(state=None)
+        f = BaseFlasher()
+        self.assertTrue(f.is_port_working(port="mock"))
+        mock_serial.assert_called_once_with("mock")
+
+    @patch(
+        "src.utils.flasher.base_flasher.multiprocessing.get_context", mock_get_context
+    )
+    @patch(
+        "src.utils.flasher.base_flasher.ProcessPoolExecutor", MockProcessPoolExecutor
+    )
+    @patch("src.utils.flasher.base_flasher.get_port_registry")
+    def test_run_parallel_acquire_release(self, mock_get_port_registry):
+        registry = mock_registry()
+        registry.acquire.side_effect = lambda port: port == "/mock/path0"
+        mock_get_port_registry.return_value = registry
+        on_data = MagicMock()
+
+        f = BaseFlasher()
+        results = f.run_parallel(
+            put_result, ["/mock/path0", "/mock/path1"], on_data=on_data
+        )
+
+        self.assertEqual(
+            results,
+            {
+                "/mock/path0": {"success": True, "error": None},
+                "/mock/path1": {"success": False, "error": "port busy"},
+            },
+        )
+        self.assertEqual(registry.acquire.call_count, 2)
+        registry.release.assert_called_once_with("/mock/path0")
+
+        # only the acquired port was flashed
+        on_data.assert_called_once_with("/mock/path0", "done")
+
+    @patch("src.utils.flasher.base_flasher.multiprocessing.get_context")
+    @patch("src.utils.flasher.base_flasher.ProcessPoolExecutor")
+    @patch("src.utils.flasher.base_flasher.get_port_registry")
+    def test_run_parallel_all_busy(
+        self, mock_get_port_registry, mock_executor, mock_get_context
+    ):
+        registry = mock_registry()
+        registry.acquire.return_value = False
+        mock_get_port_registry.return_value = registry
+
+        f = BaseFlasher()
+        results = f.run_parallel(put_result, ["/mock/path0"])
+
+        self.assertEqual(
+            results, {"/mock/path0": {"success": False, "error": "port busy"}}
+        )
+        mock_executor.assert_not_called()
+        registry.release.assert_not_called()
+
+    @patch("src.utils.kboot.build.ktool.KTool.log")
+    @patch("src.utils.flasher.base_flasher.LatencyTimer")
+    def test_low_latency_unsupported(self, mock_latency_timer, mock_ktool_log):
+        lowered = mock_latency_timer.return_value.lowered
+        lowered.return_value.__enter__.return_value = None
+        f = BaseFlasher()
+        with f.low_latency("/mock/path0") as latency:
+            self.assertIsNone(latency)
+
+        mock_latency_timer.assert_called_once_with("/mock/path0")
+        mock_ktool_log.assert_not_called()
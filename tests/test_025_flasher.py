@@ -1,7 +1,15 @@
+import io
+import os
+import queue
 from unittest import TestCase
 from unittest.mock import patch, MagicMock, call
 from src.utils.flasher import Flasher
-from .shared_mocks import MockListPortsGrep
+from src.utils.flasher.flasher import flash_port
+from .shared_mocks import (
+    MockListPortsGrep,
+    MockProcessPoolExecutor,
+    mock_get_context,
+)
 
 
 class TestFlasher(TestCase):
@@ -43,6 +51,81 @@ class TestFlasher(TestCase):
             callback=callback,
         )
 
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.base_flasher.list_ports", new_callable=MockListPortsGrep)
+    @patch("src.utils.flasher.base_flasher.next")
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=True)
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_flash_device_success(
+        self,
+        mock_process,
+        mock_is_port_working,
+        mock_next,
+        mock_list_ports,
+        mock_exists,
+    ):
+        mock_next.return_value = MagicMock(device="mock")
+        callback = MagicMock()
+        f = Flasher()
+        f.firmware = "mock/kboot.kfpkg"
+        f.device = "amigo"
+        f.baudrate = 1500000
+        f.flash(callback=callback)
+
+        mock_exists.assert_called_once_with("mock/kboot.kfpkg")
+        mock_list_ports.grep.assert_called_once_with("0403")
+        mock_is_port_working.assert_called_once_with("mock")
+        mock_process.assert_called_once_with(
+            terminal=False,
+            dev="mock",
+            baudrate=1500000,
+            board="goE",
+            file="mock/kboot.kfpkg",
+            callback=callback,
+        )
+
+    @patch("src.utils.flasher.base_flasher.list_ports", new_callable=MockListPortsGrep)
+    @patch("src.utils.flasher.base_flasher.next")
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=True)
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_flash_stream_success(
+        self,
+        mock_process,
+        mock_is_port_working,
+        mock_next,
+        mock_list_ports,
+    ):
+        flashed = {}
+
+        # pylint: disable=unused-argument
+        def process(file, **kwargs):
+            with open(file, "rb") as f:
+                flashed[file] = f.read()
+
+        mock_process.side_effect = process
+        mock_next.return_value = MagicMock(device="mock")
+        callback = MagicMock()
+        f = Flasher()
+        f.firmware = io.BytesIO(b"kboot")
+        f.device = "amigo"
+        f.baudrate = 1500000
+        f.flash(callback=callback)
+
+        mock_list_ports.grep.assert_called_once_with("0403")
+        mock_is_port_working.assert_called_once_with("mock")
+        file = mock_process.call_args.kwargs["file"]
+        self.assertTrue(file.endswith(".kfpkg"))
+        self.assertEqual(flashed, {file: b"kboot"})
+        self.assertFalse(os.path.exists(file))
+        mock_process.assert_called_once_with(
+            terminal=False,
+            dev="mock",
+            baudrate=1500000,
+            board="goE",
+            file=file,
+            callback=callback,
+        )
+
     @patch("os.path.exists", return_value=False)
     def test_fail_flash_firmware_not_exist(self, mock_exists):
         with self.assertRaises(ValueError) as exc_info:
@@ -260,3 +343,230 @@ class TestFlasher(TestCase):
         mock_ktool_log.assert_has_calls(
             [call("Greeting fail: mock test for mocked"), call("")]
         )
+
+    @patch("src.utils.flasher.flasher.LatencyTimer")
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_flash_port_low_latency(self, mock_process, mock_latency_timer):
+        lowered = mock_latency_timer.return_value.lowered
+        lowered.return_value.__enter__.return_value = 1
+        messages = queue.Queue()
+        result = flash_port(
+            messages,
+            port="/mock/path0",
+            board="goE",
+            baudrate=1500000,
+            firmware="mock.kfpkg",
+        )
+
+        self.assertEqual(result, {"success": True, "error": None})
+        mock_latency_timer.assert_called_once_with("/mock/path0")
+        lowered.assert_called_once_with()
+        lowered.return_value.__exit__.assert_called_once()
+        self.assertEqual(
+            messages.get_nowait(),
+            ("/mock/path0", "data", "Latency timer of /mock/path0: 1 ms"),
+        )
+        mock_process.assert_called_once()
+
+    @patch("src.utils.flasher.base_flasher.LatencyTimer")
+    @patch("src.utils.flasher.base_flasher.list_ports", new_callable=MockListPortsGrep)
+    @patch("src.utils.flasher.base_flasher.next")
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=True)
+    @patch("src.utils.kboot.build.ktool.KTool.log")
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_flash_low_latency(
+        self,
+        mock_process,
+        mock_ktool_log,
+        mock_is_port_working,
+        mock_next,
+        mock_list_ports,
+        mock_latency_timer,
+    ):
+        mock_next.return_value = MagicMock(device="mock")
+        lowered = mock_latency_timer.return_value.lowered
+        lowered.return_value.__enter__.return_value = 1
+        f = Flasher()
+        with patch("os.path.exists", return_value=True):
+            f.firmware = "mock/kboot.kfpkg"
+        f.device = "m5stickv"
+        f.baudrate = 1500000
+        f.flash(callback=MagicMock())
+
+        mock_list_ports.grep.assert_called_once_with("0403")
+        mock_is_port_working.assert_called_once_with("mock")
+        mock_latency_timer.assert_called_once_with("mock")
+        lowered.return_value.__exit__.assert_called_once()
+        mock_ktool_log.assert_called_once_with("Latency timer of mock: 1 ms")
+        mock_process.assert_called_once()
+
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_flash_port(self, mock_process):
+
+        # pylint: disable=unused-argument
+        def process(callback, **kwargs):
+            callback("firmware.bin", 1, 2, "21 KiB/s")
+
+        mock_process.side_effect = process
+        messages = queue.Queue()
+        result = flash_port(
+            messages,
+            port="/mock/path0",
+            board="goE",
+            baudrate=1500000,
+            firmware="mock.kfpkg",
+        )
+
+        self.assertEqual(result, {"success": True, "error": None})
+        self.assertEqual(
+            messages.get_nowait(),
+            ("/mock/path0", "progress", ("firmware.bin", 1, 2, "21 KiB/s")),
+        )
+        mock_process.assert_called_once_with(
+            terminal=False,
+            dev="/mock/path0",
+            baudrate=1500000,
+            board="goE",
+            file="mock.kfpkg",
+            callback=mock_process.call_args.kwargs["callback"],
+        )
+
+    @patch(
+        "src.utils.kboot.build.ktool.KTool.process",
+        side_effect=Exception("Greeting fail"),
+    )
+    def test_fail_flash_port(self, mock_process):
+        result = flash_port(
+            queue.Queue(),
+            port="/mock/path0",
+            board="goE",
+            baudrate=1500000,
+            firmware="mock.kfpkg",
+        )
+        self.assertEqual(result, {"success": False, "error": "Greeting fail"})
+        mock_process.assert_called_once()
+
+    @patch(
+        "src.utils.flasher.base_flasher.multiprocessing.get_context", mock_get_context
+    )
+    @patch(
+        "src.utils.flasher.base_flasher.ProcessPoolExecutor", MockProcessPoolExecutor
+    )
+    @patch(
+        "src.utils.flasher.base_flasher.BaseFlasher.find_ports",
+        return_value=["/mock/path0", "/mock/path1", "/mock/path2"],
+    )
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=True)
+    @patch("src.utils.flasher.flasher.flash_port")
+    def test_flash_all(self, mock_flash_port, mock_is_port_working, mock_find_ports):
+        # pylint: disable=unused-argument
+        def flash(messages, port, board, baudrate, firmware):
+            messages.put((port, "progress", ("firmware.bin", 1, 1, "21 KiB/s")))
+            messages.put((port, "data", "Rebooting..."))
+            if port == "/mock/path2":
+                return {"success": False, "error": "Greeting fail"}
+            return {"success": True, "error": None}
+
+        mock_flash_port.side_effect = flash
+        callback = MagicMock()
+        on_data = MagicMock()
+        f = Flasher()
+        with patch("os.path.exists", return_value=True):
+            f.firmware = "mock/kboot.kfpkg"
+        f.device = "m5stickv"
+        f.baudrate = 1500000
+        results = f.flash_all(callback=callback, on_data=on_data)
+
+        self.assertEqual(
+            results,
+            {
+                "/mock/path0": {"success": True, "error": None},
+                "/mock/path1": {"success": True, "error": None},
+                "/mock/path2": {"success": False, "error": "Greeting fail"},
+            },
+        )
+        mock_find_ports.assert_called_once_with("m5stickv")
+        self.assertEqual(mock_flash_port.call_count, 3)
+        callback.assert_has_calls(
+            [
+                call("/mock/path0", "firmware.bin", 1, 1, "21 KiB/s"),
+                call("/mock/path1", "firmware.bin", 1, 1, "21 KiB/s"),
+                call("/mock/path2", "firmware.bin", 1, 1, "21 KiB/s"),
+            ],
+            any_order=True,
+        )
+        on_data.assert_has_calls(
+            [
+                call("/mock/path0", "Rebooting..."),
+                call("/mock/path1", "Rebooting..."),
+                call("/mock/path2", "Rebooting..."),
+            ],
+            any_order=True,
+        )
+
+    @patch(
+        "src.utils.flasher.base_flasher.multiprocessing.get_context", mock_get_context
+    )
+    @patch(
+        "src.utils.flasher.base_flasher.ProcessPoolExecutor", MockProcessPoolExecutor
+    )
+    @patch(
+        "src.utils.flasher.base_flasher.BaseFlasher.find_ports",
+        return_value=["/mock/path0", "/mock/path1"],
+    )
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=True)
+    @patch("src.utils.flasher.flasher.flash_port")
+    def test_flash_all_stream(
+        self, mock_flash_port, mock_is_port_working, mock_find_ports
+    ):
+        flashed = {}
+
+        # pylint: disable=unused-argument
+        def flash(messages, port, board, baudrate, firmware):
+            with open(firmware, "rb") as f:
+                flashed[port] = (firmware, f.read())
+            return {"success": True, "error": None}
+
+        mock_flash_port.side_effect = flash
+        f = Flasher()
+        f.firmware = io.BytesIO(b"kboot")
+        f.device = "m5stickv"
+        f.baudrate = 1500000
+        f.flash_all(callback=MagicMock())
+
+        # all ports flashed from one private file, removed after
+        file = flashed["/mock/path0"][0]
+        self.assertEqual(
+            flashed,
+            {"/mock/path0": (file, b"kboot"), "/mock/path1": (file, b"kboot")},
+        )
+        self.assertFalse(os.path.exists(file))
+        mock_find_ports.assert_called_once_with("m5stickv")
+
+    @patch(
+        "src.utils.flasher.base_flasher.BaseFlasher.find_ports",
+        return_value=["/mock/path0"],
+    )
+    @patch("src.utils.flasher.flasher.Flasher.is_port_working", return_value=False)
+    def test_fail_flash_all_no_port(self, mock_is_port_working, mock_find_ports):
+        f = Flasher()
+        with patch("os.path.exists", return_value=True):
+            f.firmware = "mock/kboot.kfpkg"
+        f.device = "dock"
+        f.baudrate = 1500000
+
+        with self.assertRaises(RuntimeError) as exc_info:
+            f.flash_all(callback=MagicMock())
+
+        self.assertEqual(str(exc_info.exception), "No port found for dock")
+        mock_is_port_working.assert_called_once_with("/mock/path0")
+
+    def test_fail_flash_all_no_device(self):
+        f = Flasher()
+        with patch("os.path.exists", return_value=True):
+            f.firmware = "mock/kboot.kfpkg"
+
+        with self.assertRaises(ValueError) as exc_info:
+            f.flash_all(callback=MagicMock())
+
+        self.assertEqual(str(exc_info.exception), "Device not detected")
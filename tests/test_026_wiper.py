@@ -22,12 +22,20 @@
 """
 base_flasher.py
 """
+import sys
 from unittest import TestCase
 from unittest.mock import patch, call, MagicMock
 from src.utils.flasher import Wiper
-from .shared_mocks import MockListPortsGrep
+from src.utils.flasher.wiper import erase_port
+from .shared_mocks import (
+    MockListPortsGrep,
+    MockProcessPoolExecutor,
+    mock_get_context,
+)
 
 
+@patch("src.utils.flasher.base_flasher.multiprocessing.get_context", mock_get_context)
+@patch("src.utils.flasher.base_flasher.ProcessPoolExecutor", MockProcessPoolExecutor)
 class TestWiper(TestCase):
 
     @patch("src.utils.flasher.base_flasher.list_ports", new_callable=MockListPortsGrep)
@@ -183,3 +191,138 @@ class TestWiper(TestCase):
         mock_ktool_log.assert_has_calls(
             [call("Greeting fail: mock test for mocked"), call("")]
         )
+
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_erase_port(self, mock_process):
+        argv = []
+
+        def process():
+            argv.extend(sys.argv)
+
+        mock_process.side_effect = process
+        before = list(sys.argv)
+        result = erase_port(
+            MagicMock(), port="/mock/path0", board="goE", baudrate=1500000
+        )
+
+        self.assertEqual(result, {"success": True, "error": None})
+        self.assertEqual(
+            argv, ["ktool", "-B", "goE", "-b", "1500000", "-p", "/mock/path0", "-E"]
+        )
+        self.assertEqual(sys.argv, before)
+
+    @patch(
+        "src.utils.kboot.build.ktool.KTool.process",
+        side_effect=Exception("Greeting fail"),
+    )
+    def test_fail_erase_port(self, mock_process):
+        before = list(sys.argv)
+        result = erase_port(
+            MagicMock(), port="/mock/path0", board="goE", baudrate=1500000
+        )
+
+        self.assertEqual(result, {"success": False, "error": "Greeting fail"})
+        self.assertEqual(sys.argv, before)
+        mock_process.assert_called_once()
+
+    @patch("src.utils.flasher.wiper.erase_port")
+    def test_erase(self, mock_erase_port):
+
+        # pylint: disable=unused-argument
+        def erase(messages, port, board, baudrate):
+            messages.put((port, "data", "Erasing"))
+            return {"success": True, "error": None}
+
+        mock_erase_port.side_effect = erase
+        on_data = MagicMock()
+        f = Wiper()
+        result = f.erase(
+            port="/mock/path0", board="goE", baudrate=1500000, on_data=on_data
+        )
+
+        self.assertEqual(result, {"success": True, "error": None})
+        on_data.assert_called_once_with("/mock/path0", "Erasing")
+
+    def test_fail_erase_invalid_args(self):
+        f = Wiper()
+        with self.assertRaises(ValueError) as exc_info:
+            f.erase(port="/mock/path0", board="mock", baudrate=1500000)
+
+        self.assertEqual(str(exc_info.exception), "Invalid board: mock")
+
+        with self.assertRaises(ValueError) as exc_info:
+            f.erase(port="/mock/path0", board="goE", baudrate=1234567)
+
+        self.assertEqual(str(exc_info.exception), "Invalid baudrate: 1234567")
+
+    @patch(
+        "src.utils.flasher.base_flasher.BaseFlasher.find_ports",
+        return_value=["/mock/path0", "/mock/path1"],
+    )
+    @patch("src.utils.flasher.wiper.Wiper.is_port_working", return_value=True)
+    @patch("src.utils.flasher.wiper.erase_port")
+    def test_erase_all(self, mock_erase_port, mock_is_port_working, mock_find_ports):
+
+        # pylint: disable=unused-argument
+        def erase(messages, port, board, baudrate):
+            if port == "/mock/path1":
+                return {"success": False, "error": "Greeting fail"}
+            return {"success": True, "error": None}
+
+        mock_erase_port.side_effect = erase
+        f = Wiper()
+        f.baudrate = 1500000
+        results = f.erase_all(device="amigo")
+
+        self.assertEqual(
+            results,
+            {
+                "/mock/path0": {"success": True, "error": None},
+                "/mock/path1": {"success": False, "error": "Greeting fail"},
+            },
+        )
+        mock_find_ports.assert_called_once_with("amigo")
+        self.assertEqual(mock_erase_port.call_count, 2)
+
+    @patch("src.utils.flasher.base_flasher.BaseFlasher.find_ports", return_value=[])
+    def test_fail_erase_all_no_port(self, mock_find_ports):
+        f = Wiper()
+        f.baudrate = 1500000
+        with self.assertRaises(RuntimeError) as exc_info:
+            f.erase_all(device="dock")
+
+        self.assertEqual(str(exc_info.exception), "No port found for dock")
+        mock_find_ports.assert_called_once_with("dock")
+
+    def test_on_erase_data(self):
+        f = Wiper()
+        with patch.object(f.ktool.__class__, "print_callback", create=True) as mock_cb:
+            f.on_erase_data("/mock/path0", "Erasing")
+            mock_cb.assert_called_once_with("Erasing")
+
+    @patch("src.utils.flasher.base_flasher.list_ports", new_callable=MockListPortsGrep)
+    @patch("src.utils.flasher.base_flasher.next")
+    @patch("src.utils.flasher.wiper.Wiper.is_port_working", return_value=True)
+    @patch(
+        "src.utils.kboot.build.ktool.KTool.process",
+        side_effect=[Exception("Greeting fail"), Exception("Greeting fail")],
+    )
+    def test_fail_wipe_after_second_greeting_fail(
+        self,
+        mock_process,
+        mock_is_port_working,
+        mock_next,
+        mock_list_ports,
+    ):
+        mock_next.side_effect = [MagicMock(device="mocked")]
+        mock_list_ports.grep.return_value.__next__.side_effect = [
+            MagicMock(device="mocked_next")
+        ]
+
+        f = Wiper()
+        f.baudrate = 1500000
+        with self.assertRaises(RuntimeError) as exc_info:
+            f.wipe(device="amigo")
+
+        self.assertEqual(str(exc_info.exception), "Greeting fail for mocked_next")
+        self.assertEqual(mock_process.call_count, 2)
@@ -0,0 +1,159 @@
+import socket
+from unittest import TestCase
+from unittest.mock import patch, MagicMock, call
+import requests
+from urllib3.connectionpool import HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+from urllib3.util import connection as urllib3_connection
+from urllib3.util.connection import create_connection
+from src.utils.session import (
+    DnsCache,
+    DnsCachedAdapter,
+    PooledSession,
+    get_session,
+    WARM_UP_URLS,
+)
+
+
+class TestSession(TestCase):
+
+    @patch("src.utils.session.socket.getaddrinfo")
+    def test_dns_cache_getaddrinfo(self, mock_getaddrinfo):
+        infos = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 443))]
+        mock_getaddrinfo.return_value = infos
+
+        cache = DnsCache(ttl=300)
+        self.assertEqual(cache.getaddrinfo("github.com", 443), infos)
+        self.assertEqual(cache.getaddrinfo("github.com", 443), infos)
+
+        mock_getaddrinfo.assert_called_once_with(
+            "github.com", 443, 0, socket.SOCK_STREAM
+        )
+
+    @patch("src.utils.session.time.monotonic", side_effect=[0, 301])
+    @patch("src.utils.session.socket.getaddrinfo")
+    def test_dns_cache_expired(self, mock_getaddrinfo, mock_monotonic):
+        cache = DnsCache(ttl=300)
+        cache.getaddrinfo("github.com", 443)
+        cache.getaddrinfo("github.com", 443)
+
+        self.assertEqual(len(mock_getaddrinfo.mock_calls), 2)
+        self.assertEqual(len(mock_monotonic.mock_calls), 2)
+
+    @patch("src.utils.session.socket.getaddrinfo")
+    def test_dns_cache_forget(self, mock_getaddrinfo):
+        cache = DnsCache(ttl=300)
+        cache.getaddrinfo("github.com", 443)
+        cache.forget("github.com")
+        cache.getaddrinfo("github.com", 443)
+
+        self.assertEqual(len(mock_getaddrinfo.mock_calls), 2)
+
+    @patch("src.utils.session.allowed_gai_family", return_value=socket.AF_INET)
+    @patch("src.utils.session.socket.getaddrinfo")
+    def test_dns_cache_connect(self, mock_getaddrinfo, mock_allowed_gai_family):
+        mock_getaddrinfo.return_value = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 443)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.2", 443)),
+        ]
+        conn = MagicMock(_dns_host="github.com", port=443)
+        hosts = []
+
+        def new_conn():
+            hosts.append(conn._dns_host)
+            if len(hosts) == 1:
+                raise NewConnectionError(conn, "unreachable")
+            return "mocksock"
+
+        cache = DnsCache()
+        sock = cache.connect(conn, new_conn)
+
+        self.assertEqual(sock, "mocksock")
+        self.assertEqual(hosts, ["10.0.0.1", "10.0.0.2"])
+        self.assertEqual(conn._dns_host, "github.com")
+        mock_allowed_gai_family.assert_called_once()
+        mock_getaddrinfo.assert_called_once_with(
+            "github.com", 443, socket.AF_INET, socket.SOCK_STREAM
+        )
+
+    @patch("src.utils.session.socket.getaddrinfo")
+    def test_dns_cache_connect_stale(self, mock_getaddrinfo):
+        mock_getaddrinfo.return_value = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 443)),
+        ]
+        conn = MagicMock(_dns_host="github.com", port=443)
+        new_conn = MagicMock(side_effect=NewConnectionError(conn, "unreachable"))
+
+        cache = DnsCache()
+        with self.assertRaises(NewConnectionError):
+            cache.connect(conn, new_conn)
+
+        # the stale address is resolved again on the next connection
+        cache.getaddrinfo("github.com", 443)
+        self.assertEqual(len(mock_getaddrinfo.mock_calls), 2)
+
+    @patch("src.utils.session.socket.getaddrinfo", side_effect=OSError("mock"))
+    def test_dns_cache_connect_unresolved(self, mock_getaddrinfo):
+        conn = MagicMock(_dns_host="github.com", port=443)
+        new_conn = MagicMock(return_value="mocksock")
+
+        self.assertEqual(DnsCache().connect(conn, new_conn), "mocksock")
+        mock_getaddrinfo.assert_called_once()
+        new_conn.assert_called_once()
+
+    def test_dns_cache_bind(self):
+        cache = DnsCache()
+        pool_cls = cache.bind(HTTPSConnectionPool)
+
+        self.assertTrue(issubclass(pool_cls, HTTPSConnectionPool))
+        self.assertTrue(
+            issubclass(pool_cls.ConnectionCls, HTTPSConnectionPool.ConnectionCls)
+        )
+
+        # the global create_connection of urllib3 is left untouched
+        self.assertIs(urllib3_connection.create_connection, create_connection)
+
+    def test_pooled_session(self):
+        s = PooledSession(pool_connections=4, pool_maxsize=2)
+        adapter = s.session.get_adapter("https://github.com")
+
+        self.assertIsInstance(adapter, DnsCachedAdapter)
+        self.assertIs(adapter.dns_cache, s.dns_cache)
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 2)
+        self.assertTrue(adapter._pool_block)
+
+        pool = adapter.poolmanager.connection_from_url("https://github.com")
+        self.assertIsInstance(pool, HTTPSConnectionPool)
+        self.assertIsNot(type(pool), HTTPSConnectionPool)
+
+    def test_pooled_session_get(self):
+        s = PooledSession()
+        s.session = MagicMock()
+        s.get(url="https://github.com", timeout=10)
+
+        s.session.get.assert_called_once_with(url="https://github.com", timeout=10)
+
+    def test_warm_up(self):
+        s = PooledSession()
+        s.session = MagicMock()
+        s.session.head.side_effect = [
+            MagicMock(status_code=200),
+            requests.exceptions.ConnectionError("mock"),
+            MagicMock(status_code=400),
+            MagicMock(status_code=301),
+        ]
+
+        thread = s.warm_up()
+        thread.join()
+
+        s.session.head.assert_has_calls(
+            [call(url, timeout=10, allow_redirects=False) for url in WARM_UP_URLS],
+            any_order=True,
+        )
+
+    @patch("src.utils.session._SHARED_SESSION", None)
+    @patch("src.utils.session.PooledSession")
+    def test_get_session(self, mock_pooled_session):
+        self.assertEqual(get_session(), get_session())
+        mock_pooled_session.assert_called_once()
@@ -0,0 +1,120 @@
+import os
+import time
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+from src.utils.downloader.release_downloader import ReleaseDownloader
+
+
+class TestReleaseDownloader(TestCase):
+
+    def test_init(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            r = ReleaseDownloader(version="v0.0.1", destdir=tmpdir, connections=2)
+            self.assertEqual(
+                r.url,
+                "https://github.com/selfcustody/krux/releases/download/v0.0.1/krux-v0.0.1.zip",
+            )
+            self.assertEqual(r.destdir, tmpdir)
+            self.assertEqual(len(r.downloaders), 3)
+            self.assertEqual(r.downloaders[0].connections, 2)
+            self.assertEqual(
+                [os.path.basename(d.url) for d in r.downloaders],
+                [
+                    "krux-v0.0.1.zip",
+                    "krux-v0.0.1.zip.sha256.txt",
+                    "krux-v0.0.1.zip.sig",
+                ],
+            )
+
+    def test_lens(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            r = ReleaseDownloader(version="v0.0.1", destdir=tmpdir)
+            for i, d in enumerate(r.downloaders):
+                d.content_len = 10 * (i + 1)
+                d.downloaded_len = 10 * (i + 1)
+
+            # compressed assets can decode more than its length
+            r.downloaders[2].downloaded_len = 100
+
+            self.assertEqual(r.content_len, 60)
+            self.assertEqual(r.downloaded_len, 59)
+
+            r.finished = True
+            self.assertEqual(r.downloaded_len, 60)
+
+    def test_download(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            r = ReleaseDownloader(version="v0.0.1", destdir=tmpdir)
+
+            def fake_download(downloader):
+                def _download(on_data):
+                    downloader.content_len = 4
+                    downloader.downloaded_len = 4
+                    on_data(b"data")
+                    return os.path.join(tmpdir, os.path.basename(downloader.url))
+
+                return _download
+
+            for d in r.downloaders:
+                setattr(d, "download", fake_download(d))
+
+            on_data = MagicMock()
+            destfiles = r.download(on_data=on_data)
+
+            self.assertEqual(
+                destfiles,
+                [os.path.join(tmpdir, os.path.basename(d.url)) for d in r.downloaders],
+            )
+            self.assertTrue(r.finished)
+            self.assertEqual(r.downloaded_len, r.content_len)
+            on_data.assert_called_with(b"")
+
+    @patch("src.utils.downloader.sig_downloader.SigDownloader.download")
+    @patch("src.utils.downloader.sha256_downloader.Sha256Downloader.download")
+    @patch("src.utils.downloader.zip_downloader.ZipDownloader.download")
+    def test_fail_download(self, mock_zip, mock_sha, mock_sig):
+        mock_sha.side_effect = RuntimeError("HTTP error 404: Not Found")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            r = ReleaseDownloader(version="v0.0.1", destdir=tmpdir)
+            on_data = MagicMock()
+
+            with self.assertRaises(RuntimeError) as exc_info:
+                r.download(on_data=on_data)
+
+            self.assertEqual(str(exc_info.exception), "HTTP error 404: Not Found")
+            self.assertFalse(r.finished)
+            on_data.assert_not_called()
+
+    def test_fail_download_cancel_others(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            r = ReleaseDownloader(version="v0.0.1", destdir=tmpdir)
+            failed = threading.Event()
+            chunks = []
+
+            def slow_download(on_data):
+                # stream until cancelled by the failure of other download
+                failed.wait(5)
+                for _ in range(1000):
+                    on_data(b"data")
+                    chunks.append(b"data")
+                    time.sleep(0.001)
+                return "never"
+
+            def fail_download(on_data):
+                failed.set()
+                raise RuntimeError("HTTP error 404: Not Found")
+
+            setattr(r.downloaders[0], "download", slow_download)
+            setattr(r.downloaders[1], "download", fail_download)
+            setattr(r.downloaders[2], "download", slow_download)
+
+            with self.assertRaises(RuntimeError) as exc_info:
+                r.download(on_data=MagicMock())
+
+            self.assertEqual(str(exc_info.exception), "HTTP error 404: Not Found")
+            self.assertFalse(r.finished)
+            # both stopped before streaming a whole download
+            self.assertLess(len(chunks), 1000)
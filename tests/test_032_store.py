@@ -0,0 +1,167 @@
+import os
+import json
+import hashlib
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+from src.utils.store import ArtifactStore, get_store, STORE_DIRNAME
+
+URL_A = "https://github.com/selfcustody/krux/releases/download/v0.0.1/a.zip"
+URL_B = "https://github.com/selfcustody/krux/releases/download/v0.0.2/b.zip"
+URL_C = "https://github.com/selfcustody/krux/releases/download/v0.0.3/c.zip"
+
+
+def write(path: str, data: bytes) -> str:
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+class TestArtifactStore(TestCase):
+
+    def test_init(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            s = ArtifactStore(root=os.path.join(tmpdir, "store"), quota=10)
+            self.assertTrue(os.path.isdir(os.path.join(tmpdir, "store", "objects")))
+            self.assertEqual(s.quota, 10)
+            self.assertEqual(s.load_index(), {})
+
+    def test_fail_init_quota(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(ValueError) as exc_info:
+                ArtifactStore(root=tmpdir, quota=-1)
+
+            self.assertEqual(str(exc_info.exception), "Invalid quota: -1")
+
+    def test_put_lookup(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            s = ArtifactStore(root=os.path.join(tmpdir, "store"))
+            filename = write(os.path.join(tmpdir, "a.zip"), b"krux")
+
+            sha256 = s.put(url=URL_A, filename=filename)
+
+            self.assertEqual(sha256, hashlib.sha256(b"krux").hexdigest())
+            self.assertTrue(os.path.isfile(s.object_path(sha256)))
+            entry = s.lookup(URL_A)
+            self.assertEqual(entry["sha256"], sha256)
+            self.assertEqual(entry["size"], 4)
+            self.assertIsNone(s.lookup(URL_B))
+
+    def test_put_deduplicate(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            s = ArtifactStore(root=os.path.join(tmpdir, "store"))
+            a = write(os.path.join(tmpdir, "a.zip"), b"krux")
+            b = write(os.path.join(tmpdir, "b.zip"), b"krux")
+
+            self.assertEqual(s.put(url=URL_A, filename=a), s.put(url=URL_B, filename=b))
+            objects = [
+                f
+                for _, _, files in os.walk(os.path.join(s.root, "objects"))
+                for f in files
+            ]
+            self.assertEqual(len(objects), 1)
+
+    def test_lookup_forget_missing_object(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            s = ArtifactStore(root=os.path.join(tmpdir, "store"))
+            sha256 = s.put(
+                url=URL_A, filename=write(os.path.join(tmpdir, "a"), b"krux")
+            )
+            os.remove(s.object_path(sha256))
+
+            self.assertIsNone(s.lookup(URL_A))
+            self.assertEqual(s.load_index(), {})
+
+    def test_load_corrupted_index(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            s = ArtifactStore(root=tmpdir)
+            with open(s.index_file, "w", encoding="utf8") as f:
+                f.write("{not json")
+
+            self.assertEqual(s.load_index(), {})
+
+    def test_materialize(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            s = ArtifactStore(root=os.path.join(tmpdir, "store"))
+            s.put(url=URL_A, filename=write(os.path.join(tmpdir, "a"), b"krux"))
+            destfile = os.path.join(tmpdir, "dest.zip")
+
+            self.assertTrue(s.materialize(url=URL_A, destfile=destfile))
+            self.assertFalse(s.materialize(url=URL_B, destfile=destfile))
+
+            with open(destfile, "rb") as f:
+                self.assertEqual(f.read(), b"krux")
+
+    @patch("src.utils.store.os.link", side_effect=OSError("not supported"))
+    def test_materialize_copy_fallback(self, mock_link):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            s = ArtifactStore(root=os.path.join(tmpdir, "store"))
+            s.put(url=URL_A, filename=write(os.path.join(tmpdir, "a"), b"krux"))
+            destfile = os.path.join(tmpdir, "dest.zip")
+
+            self.assertTrue(s.materialize(url=URL_A, destfile=destfile))
+            mock_link.assert_called()
+
+            with open(destfile, "rb") as f:
+                self.assertEqual(f.read(), b"krux")
+
+    @patch("src.utils.store.ArtifactStore.hash_file")
+    def test_put_streamed_digest(self, mock_hash_file):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            s = ArtifactStore(root=os.path.join(tmpdir, "store"))
+            filename = write(os.path.join(tmpdir, "a.zip"), b"krux")
+            sha256 = hashlib.sha256(b"krux").hexdigest()
+
+            self.assertEqual(s.put(url=URL_A, filename=filename, sha256=sha256), sha256)
+            mock_hash_file.assert_not_called()
+            self.assertEqual(s.lookup(URL_A)["sha256"], sha256)
+
+    def test_materialize_discard_corrupted(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            s = ArtifactStore(root=os.path.join(tmpdir, "store"))
+            sha256 = s.put(
+                url=URL_A, filename=write(os.path.join(tmpdir, "a"), b"krux")
+            )
+            s.put(url=URL_B, filename=write(os.path.join(tmpdir, "b"), b"krux"))
+
+            # corrupted in place, with the same size
+            os.remove(s.object_path(sha256))
+            write(s.object_path(sha256), b"xrux")
+            destfile = os.path.join(tmpdir, "dest.zip")
+
+            with patch.object(s, "warning") as mock_warning:
+                self.assertIsNone(s.materialize(url=URL_A, destfile=destfile))
+
+            mock_warning.assert_called_once()
+            self.assertFalse(os.path.exists(destfile))
+            self.assertFalse(os.path.exists(s.object_path(sha256)))
+            self.assertEqual(s.load_index(), {})
+
+    @patch("src.utils.store.time.time")
+    def test_evict_least_recently_used(self, mock_time):
+        mock_time.side_effect = [1, 2, 3, 4, 5]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            s = ArtifactStore(root=os.path.join(tmpdir, "store"), quota=8)
+            s.put(url=URL_A, filename=write(os.path.join(tmpdir, "a"), b"aaaa"))
+            s.put(url=URL_B, filename=write(os.path.join(tmpdir, "b"), b"bbbb"))
+
+            # use A, so B become the least recently used
+            self.assertIsNotNone(s.lookup(URL_A))
+            s.put(url=URL_C, filename=write(os.path.join(tmpdir, "c"), b"cccc"))
+
+            index = s.load_index()
+            self.assertEqual(sorted(index.keys()), sorted([URL_A, URL_C]))
+            self.assertFalse(
+                os.path.exists(s.object_path(hashlib.sha256(b"bbbb").hexdigest()))
+            )
+
+            with open(s.index_file, "r", encoding="utf8") as f:
+                self.assertEqual(json.load(f), index)
+
+    def test_get_store(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            s = get_store(destdir=tmpdir, quota=10)
+            self.assertEqual(s.root, os.path.join(tmpdir, STORE_DIRNAME))
+            self.assertIs(get_store(destdir=tmpdir, quota=20), s)
+            self.assertEqual(s.quota, 20)
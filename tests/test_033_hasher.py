@@ -0,0 +1,175 @@
+import os
+import json
+import hashlib
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch, call, MagicMock
+from src.utils.hasher import (
+    digest_file,
+    hash_copy,
+    hash_file,
+    hash_files,
+    read_digest,
+    write_digest,
+)
+
+MOCK_SHA = "4ab12c3cc56b2641e7b216666186558cf40a36e76947edfd1b37cc1b190255ac"
+
+
+class TestHasher(TestCase):
+
+    def test_digest_file(self):
+        self.assertEqual(digest_file("mock.zip"), "mock.zip.digest.json")
+
+    def test_write_read_digest(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "mock.zip")
+            with open(filename, "wb") as f:
+                f.write(b"krux")
+
+            write_digest(filename, MOCK_SHA)
+
+            with open(digest_file(filename), "r", encoding="utf8") as f:
+                meta = json.load(f)
+
+            self.assertEqual(meta["sha256"], MOCK_SHA)
+            self.assertEqual(meta["size"], 4)
+            self.assertEqual(read_digest(filename), MOCK_SHA)
+
+    def test_read_digest_missing(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "mock.zip")
+            self.assertIsNone(read_digest(filename))
+
+            with open(filename, "wb") as f:
+                f.write(b"krux")
+
+            self.assertIsNone(read_digest(filename))
+
+    def test_read_digest_changed_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "mock.zip")
+            with open(filename, "wb") as f:
+                f.write(b"krux")
+
+            write_digest(filename, MOCK_SHA)
+
+            with open(filename, "ab") as f:
+                f.write(b"-installer")
+
+            self.assertIsNone(read_digest(filename))
+
+    def test_read_digest_corrupted(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "mock.zip")
+            with open(filename, "wb") as f:
+                f.write(b"krux")
+
+            with open(digest_file(filename), "w", encoding="utf8") as f:
+                f.write("{not json")
+
+            self.assertIsNone(read_digest(filename))
+
+    def test_hash_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "mock.zip")
+            data = os.urandom((3 << 20) + 7)
+            with open(filename, "wb") as f:
+                f.write(data)
+
+            self.assertEqual(hash_file(filename), hashlib.sha256(data).hexdigest())
+            self.assertEqual(
+                hash_file(filename, block_size=1000),
+                hashlib.sha256(data).hexdigest(),
+            )
+
+    def test_hash_empty_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "mock.zip")
+            open(filename, "wb").close()
+
+            self.assertEqual(hash_file(filename), hashlib.sha256(b"").hexdigest())
+
+    @patch("src.utils.hasher.mmap.mmap", side_effect=OSError("not supported"))
+    def test_hash_file_without_mmap(self, mock_mmap):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "mock.zip")
+            with open(filename, "wb") as f:
+                f.write(b"krux" * 1000)
+
+            self.assertEqual(
+                hash_file(filename, block_size=1024),
+                hashlib.sha256(b"krux" * 1000).hexdigest(),
+            )
+            mock_mmap.assert_called_once()
+
+    def test_hash_file_on_progress(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "mock.zip")
+            with open(filename, "wb") as f:
+                f.write(b"krux" * 640)
+
+            on_progress = MagicMock()
+            hash_file(filename, block_size=1024, on_progress=on_progress)
+
+            on_progress.assert_has_calls(
+                [call(1024, 2560), call(2048, 2560), call(2560, 2560)]
+            )
+            self.assertEqual(on_progress.call_count, 3)
+
+    @patch("src.utils.hasher.mmap.mmap", side_effect=OSError("not supported"))
+    def test_hash_file_on_progress_without_mmap(self, mock_mmap):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "mock.zip")
+            with open(filename, "wb") as f:
+                f.write(b"krux" * 640)
+
+            on_progress = MagicMock()
+            hash_file(filename, block_size=2048, on_progress=on_progress)
+
+            on_progress.assert_has_calls([call(2048, 2560), call(2560, 2560)])
+            self.assertEqual(on_progress.call_count, 2)
+
+    def test_hash_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filenames = []
+            for i in range(4):
+                filename = os.path.join(tmpdir, f"mock_{i}.zip")
+                with open(filename, "wb") as f:
+                    f.write(bytes([i]) * 100)
+                filenames.append(filename)
+
+            digests = hash_files(filenames, max_workers=2)
+
+            self.assertEqual(list(digests.keys()), filenames)
+            for i, filename in enumerate(filenames):
+                self.assertEqual(
+                    digests[filename], hashlib.sha256(bytes([i]) * 100).hexdigest()
+                )
+
+    def test_hash_copy(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = os.path.join(tmpdir, "firmware.bin")
+            dst = os.path.join(tmpdir, "copy.bin")
+            with open(src, "wb") as f:
+                f.write(b"krux" * 1000)
+
+            with open(src, "rb") as f:
+                digest = hash_copy(f, dst, block_size=1024)
+
+            self.assertEqual(digest, hashlib.sha256(b"krux" * 1000).hexdigest())
+            with open(dst, "rb") as f:
+                self.assertEqual(f.read(), b"krux" * 1000)
+            self.assertFalse(os.path.exists(f"{dst}.tmp"))
+
+    def test_fail_hash_copy(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dst = os.path.join(tmpdir, "copy.bin")
+            source = MagicMock()
+            source.readinto.side_effect = OSError("read error")
+
+            with self.assertRaises(OSError):
+                hash_copy(source, dst)
+
+            self.assertFalse(os.path.exists(dst))
+            self.assertFalse(os.path.exists(f"{dst}.tmp"))
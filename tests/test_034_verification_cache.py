@@ -0,0 +1,130 @@
+import os
+import json
+import tempfile
+from unittest import TestCase
+from src.utils.verifyer.verification_cache import (
+    VerificationCache,
+    get_verification_cache,
+    VERIFICATION_CACHE_FILENAME,
+    MAX_ENTRIES,
+)
+
+
+def write(path: str, data: bytes) -> str:
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+class TestVerificationCache(TestCase):
+
+    def test_init(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = os.path.join(tmpdir, "local")
+            c = VerificationCache(root=root)
+            self.assertTrue(os.path.isdir(root))
+            self.assertEqual(
+                c.cache_file, os.path.join(root, VERIFICATION_CACHE_FILENAME)
+            )
+            self.assertEqual(c.load(), {})
+
+    def test_identity(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = write(os.path.join(tmpdir, "a.zip"), b"krux")
+            stat = os.stat(filename)
+
+            self.assertEqual(
+                VerificationCache.identity(filename),
+                {
+                    "path": os.path.abspath(filename),
+                    "size": 4,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "inode": stat.st_ino,
+                },
+            )
+            self.assertIsNone(VerificationCache.identity(os.path.join(tmpdir, "b.zip")))
+
+    def test_key(self):
+        identity = {"path": "/a.zip", "size": 4, "mtime_ns": 1, "inode": 2}
+        key = VerificationCache.key(identity, b"sig", "pem")
+
+        self.assertEqual(key, VerificationCache.key(identity, "sig", b"pem"))
+        self.assertNotEqual(key, VerificationCache.key(identity, b"sig", b"other"))
+        self.assertNotEqual(key, VerificationCache.key(identity, b"sig"))
+        self.assertNotEqual(
+            key, VerificationCache.key({**identity, "mtime_ns": 3}, b"sig", b"pem")
+        )
+
+    def test_put_lookup(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            c = VerificationCache(root=os.path.join(tmpdir, "local"))
+            filename = write(os.path.join(tmpdir, "a.zip"), b"krux")
+
+            key = c.put(filename, b"sig", b"pem", digest="abcd", verified=True)
+
+            self.assertIsNotNone(key)
+            entry = c.lookup(filename, b"sig", b"pem")
+            self.assertEqual(entry["digest"], "abcd")
+            self.assertTrue(entry["verified"])
+            self.assertIsNone(c.lookup(filename, b"other", b"pem"))
+            self.assertIsNone(c.lookup(os.path.join(tmpdir, "b.zip"), b"sig"))
+
+            # persisted
+            with open(c.cache_file, "r", encoding="utf8") as f:
+                self.assertIn(key, json.load(f))
+
+    def test_put_missing_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            c = VerificationCache(root=tmpdir)
+            filename = os.path.join(tmpdir, "a.zip")
+
+            self.assertIsNone(c.put(filename, b"sig", digest="abcd", verified=True))
+            self.assertEqual(c.load(), {})
+
+    def test_changed_file_invalidates(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            c = VerificationCache(root=os.path.join(tmpdir, "local"))
+            filename = write(os.path.join(tmpdir, "a.zip"), b"krux")
+            c.put(filename, b"sig", digest="abcd", verified=True)
+            c.put(filename, b"txt", digest="abcd", verified=True)
+
+            # same size, other content and modification time
+            stat = os.stat(filename)
+            write(filename, b"xurk")
+            os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+            self.assertIsNone(c.lookup(filename, b"sig"))
+
+            # verifications of the older revision are discarded
+            c.put(filename, b"sig", digest="efgh", verified=False)
+            entries = c.load()
+            self.assertEqual(len(entries), 1)
+            self.assertEqual(c.lookup(filename, b"sig")["digest"], "efgh")
+
+    def test_put_max_entries(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            c = VerificationCache(root=os.path.join(tmpdir, "local"))
+            filename = write(os.path.join(tmpdir, "a.zip"), b"krux")
+
+            for i in range(MAX_ENTRIES + 2):
+                c.put(filename, str(i), digest="abcd", verified=True)
+
+            self.assertEqual(len(c.load()), MAX_ENTRIES)
+            self.assertIsNone(c.lookup(filename, "0"))
+            self.assertIsNone(c.lookup(filename, "1"))
+            self.assertIsNotNone(c.lookup(filename, str(MAX_ENTRIES + 1)))
+
+    def test_unreadable_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            c = VerificationCache(root=tmpdir)
+            write(c.cache_file, b"not json")
+            self.assertEqual(c.load(), {})
+
+            write(c.cache_file, b"[]")
+            self.assertEqual(c.load(), {})
+
+    def test_get_verification_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            c = get_verification_cache(root=tmpdir)
+            self.assertIs(c, get_verification_cache(root=tmpdir))
+            self.assertEqual(c.root, tmpdir)
@@ -0,0 +1,288 @@
+import os
+import hashlib
+import tempfile
+import zipfile
+from unittest import TestCase
+from unittest.mock import MagicMock
+from src.utils.scrubber import AssetScrubber, MANIFEST_FILENAME
+from src.utils.scrubber.checks import check_member, check_release
+from src.utils.trust import SELFCUSTODY_PEM
+from .test_019_sig_verifyer import MOCK_PEM, MOCK_SIG, MOCK_SIG_FAIL, MOCK_ZIP
+
+MOCK_SHA = hashlib.sha256(MOCK_ZIP).hexdigest()
+
+
+def write(path: str, data: bytes) -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+def make_station(tmpdir: str) -> str:
+    """A release (signed by MOCK_SIG) and its extracted tree"""
+    zipfile_path = write(os.path.join(tmpdir, "krux-v0.0.1.zip"), MOCK_ZIP)
+    write(f"{zipfile_path}.sha256.txt", f"{MOCK_SHA} krux-v0.0.1.zip".encode())
+    write(f"{zipfile_path}.sig", MOCK_SIG)
+    write(os.path.join(tmpdir, "selfcustody.pem"), MOCK_PEM)
+
+    with zipfile.ZipFile(zipfile_path, "r") as zip_obj:
+        zip_obj.extractall(tmpdir)
+
+    return zipfile_path
+
+
+def make_firmware_zip(tmpdir: str, signature: bytes) -> str:
+    filename = os.path.join(tmpdir, "firmware.zip")
+    with zipfile.ZipFile(filename, "w") as zip_obj:
+        zip_obj.writestr("test/maixpy_amigo/firmware.bin", MOCK_ZIP)
+        zip_obj.writestr("test/maixpy_amigo/firmware.bin.sig", signature)
+
+    with zipfile.ZipFile(filename, "r") as zip_obj:
+        zip_obj.extractall(tmpdir)
+
+    return filename
+
+
+def make_release(tmpdir: str) -> str:
+    """A release with a device, whose firmware.bin is signed by MOCK_SIG"""
+    zipfile_path = os.path.join(tmpdir, "krux-v0.0.1.zip")
+    with zipfile.ZipFile(zipfile_path, "w") as zip_obj:
+        zip_obj.writestr("krux-v0.0.1/README.md", b"MIT")
+        zip_obj.writestr("krux-v0.0.1/maixpy_amigo/firmware.bin", MOCK_ZIP)
+        zip_obj.writestr("krux-v0.0.1/maixpy_amigo/firmware.bin.sig", MOCK_SIG)
+
+    with open(zipfile_path, "rb") as f:
+        sha256 = hashlib.sha256(f.read()).hexdigest()
+
+    write(f"{zipfile_path}.sha256.txt", f"{sha256} krux-v0.0.1.zip".encode())
+    write(os.path.join(tmpdir, "selfcustody.pem"), MOCK_PEM)
+
+    with zipfile.ZipFile(zipfile_path, "r") as zip_obj:
+        zip_obj.extractall(tmpdir)
+
+    return zipfile_path
+
+
+class TestChecks(TestCase):
+
+    def test_check_release(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            zipfile_path = make_station(tmpdir)
+            result = check_release(
+                zipfile_path,
+                f"{zipfile_path}.sha256.txt",
+                f"{zipfile_path}.sig",
+                MOCK_PEM,
+            )
+
+            self.assertEqual(
+                result, {"sha256": MOCK_SHA, "integrity": True, "authenticity": True}
+            )
+
+    def test_check_release_corrupted(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            zipfile_path = make_station(tmpdir)
+            write(zipfile_path, MOCK_ZIP[:-1])
+            result = check_release(
+                zipfile_path,
+                f"{zipfile_path}.sha256.txt",
+                f"{zipfile_path}.sig",
+                MOCK_PEM,
+            )
+
+            self.assertFalse(result["integrity"])
+            self.assertFalse(result["authenticity"])
+
+    def test_check_release_without_companions(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            zipfile_path = write(os.path.join(tmpdir, "krux-v0.0.1.zip"), MOCK_ZIP)
+            result = check_release(
+                zipfile_path,
+                f"{zipfile_path}.sha256.txt",
+                f"{zipfile_path}.sig",
+                MOCK_PEM,
+            )
+
+            self.assertEqual(
+                result, {"sha256": MOCK_SHA, "integrity": None, "authenticity": None}
+            )
+
+    def test_check_release_missing(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            zipfile_path = os.path.join(tmpdir, "krux-v0.0.1.zip")
+            result = check_release(
+                zipfile_path,
+                f"{zipfile_path}.sha256.txt",
+                f"{zipfile_path}.sig",
+                MOCK_PEM,
+            )
+            self.assertIn("error", result)
+
+    def test_check_member(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = make_firmware_zip(tmpdir, MOCK_SIG)
+            path = os.path.join(tmpdir, "test", "maixpy_amigo", "firmware.bin")
+            result = check_member(
+                filename,
+                "test/maixpy_amigo/firmware.bin",
+                path,
+                f"{path}.sig",
+                MOCK_PEM,
+            )
+
+            self.assertEqual(
+                result, {"sha256": MOCK_SHA, "integrity": True, "authenticity": True}
+            )
+
+    def test_check_member_bad_signature(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = make_firmware_zip(tmpdir, MOCK_SIG_FAIL)
+            path = os.path.join(tmpdir, "test", "maixpy_amigo", "firmware.bin")
+            result = check_member(
+                filename,
+                "test/maixpy_amigo/firmware.bin",
+                path,
+                f"{path}.sig",
+                MOCK_PEM,
+            )
+
+            self.assertTrue(result["integrity"])
+            self.assertFalse(result["authenticity"])
+
+    def test_check_member_corrupted(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = make_firmware_zip(tmpdir, MOCK_SIG)
+            path = write(
+                os.path.join(tmpdir, "test", "maixpy_amigo", "firmware.bin"), b"krux"
+            )
+
+            result = check_member(
+                filename, "test/maixpy_amigo/firmware.bin", path, None, MOCK_PEM
+            )
+
+            self.assertFalse(result["integrity"])
+            self.assertIsNone(result["authenticity"])
+
+    def test_check_member_not_in_zip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = make_firmware_zip(tmpdir, MOCK_SIG)
+            path = os.path.join(tmpdir, "test", "maixpy_amigo", "firmware.bin")
+
+            result = check_member(
+                filename, "test/maixpy_amigo/kboot.kfpkg", path, None, MOCK_PEM
+            )
+
+            self.assertIn("error", result)
+
+
+class TestAssetScrubber(TestCase):
+
+    def test_init(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            s = AssetScrubber(destdir=tmpdir, max_workers=2)
+            self.assertEqual(s.destdir, tmpdir)
+            self.assertEqual(s.max_workers, 2)
+            self.assertEqual(s.pubkey, SELFCUSTODY_PEM)
+            self.assertEqual(s.manifest_file, os.path.join(tmpdir, MANIFEST_FILENAME))
+            self.assertEqual(s.load_manifest(), {})
+
+            # it runs along a flash, so its pool is capped
+            self.assertEqual(
+                AssetScrubber(destdir=tmpdir, max_workers=8).max_workers, 2
+            )
+            self.assertEqual(AssetScrubber(destdir=tmpdir).max_workers, 2)
+
+    def test_fail_init(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "mock")
+            with self.assertRaises(ValueError) as exc_info:
+                AssetScrubber(destdir=path)
+
+            self.assertEqual(str(exc_info.exception), f"Given path not exist: {path}")
+
+    def test_jobs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            zipfile_path = make_release(tmpdir)
+            device = os.path.join(tmpdir, "krux-v0.0.1", "maixpy_amigo")
+            write(os.path.join(tmpdir, "krux-beta.zip.sig"), b"")
+
+            jobs = list(AssetScrubber(destdir=tmpdir).jobs())
+
+            self.assertEqual(
+                [(path, check) for path, check, _, _ in jobs],
+                [
+                    (zipfile_path, check_release),
+                    (os.path.join(device, "firmware.bin"), check_member),
+                    (os.path.join(device, "firmware.bin.sig"), check_member),
+                ],
+            )
+            self.assertEqual(jobs[1][2][3], os.path.join(device, "firmware.bin.sig"))
+            self.assertIsNone(jobs[2][2][3])
+
+    def test_scrub(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            zipfile_path = make_release(tmpdir)
+            device = os.path.join(tmpdir, "krux-v0.0.1", "maixpy_amigo")
+            firmware = os.path.join(device, "firmware.bin")
+            signature = os.path.join(device, "firmware.bin.sig")
+            s = AssetScrubber(destdir=tmpdir, max_workers=1, pubkey=MOCK_PEM)
+            on_result = MagicMock()
+
+            manifest = s.scrub(on_result=on_result)
+
+            self.assertEqual(set(manifest.keys()), {zipfile_path, firmware, signature})
+            self.assertTrue(manifest[zipfile_path]["ok"])
+            self.assertTrue(manifest[firmware]["ok"])
+            self.assertTrue(manifest[firmware]["authenticity"])
+            self.assertTrue(manifest[signature]["ok"])
+            self.assertEqual(on_result.call_count, 3)
+            self.assertEqual(s.load_manifest(), manifest)
+            self.assertEqual(s.corrupted(), [])
+
+            # unchanged files are not verified again
+            on_result.reset_mock()
+            s.scrub(on_result=on_result)
+            on_result.assert_not_called()
+
+            # a changed file is verified again and flagged
+            with open(firmware, "ab") as f:
+                f.write(b"corrupted")
+
+            manifest = s.scrub(on_result=on_result)
+
+            on_result.assert_called_once()
+            self.assertFalse(manifest[firmware]["ok"])
+            self.assertEqual(s.corrupted(), [firmware])
+
+            # removed files are forgotten
+            os.remove(firmware)
+            manifest = s.scrub()
+            self.assertEqual(set(manifest.keys()), {zipfile_path, signature})
+
+    def test_scrub_ignore_destdir_pem(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            zipfile_path = make_release(tmpdir)
+            firmware = os.path.join(
+                tmpdir, "krux-v0.0.1", "maixpy_amigo", "firmware.bin"
+            )
+            write(f"{zipfile_path}.sig", MOCK_SIG)
+
+            # the selfcustody.pem of destdir (the key of MOCK_SIG)
+            # is swapped, but the pinned key is the trusted one
+            manifest = AssetScrubber(destdir=tmpdir, max_workers=1).scrub()
+
+            self.assertFalse(manifest[firmware]["authenticity"])
+            self.assertFalse(manifest[firmware]["ok"])
+            self.assertFalse(manifest[zipfile_path]["authenticity"])
+
+    def test_start(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            zipfile_path = make_station(tmpdir)
+            s = AssetScrubber(destdir=tmpdir, max_workers=1)
+
+            thread = s.start()
+            self.assertIs(s.start(), thread)
+            thread.join()
+
+            self.assertIn(zipfile_path, s.load_manifest())
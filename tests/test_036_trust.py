@@ -0,0 +1,109 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+from src.utils.trust import (
+    TrustStore,
+    fingerprint,
+    load_public_key,
+    SELFCUSTODY_PEM,
+    SELFCUSTODY_FINGERPRINT,
+)
+from .test_019_sig_verifyer import MOCK_PEM
+
+
+def fake_download(pem: bytes):
+    """Make PemDownloader.download write some pem in its destdir"""
+
+    # pylint: disable=unused-argument
+    def _download(self, on_data):
+        destfile = os.path.join(self.destdir, "selfcustody.pem")
+        with open(destfile, "wb") as f:
+            f.write(pem)
+        return destfile
+
+    return _download
+
+
+class TestTrust(TestCase):
+
+    def test_fingerprint(self):
+        self.assertEqual(fingerprint(SELFCUSTODY_PEM), SELFCUSTODY_FINGERPRINT)
+        self.assertNotEqual(fingerprint(MOCK_PEM), SELFCUSTODY_FINGERPRINT)
+
+    def test_load_public_key_cached(self):
+        self.assertIs(
+            load_public_key(SELFCUSTODY_PEM), load_public_key(SELFCUSTODY_PEM)
+        )
+
+    def test_fail_load_public_key(self):
+        with self.assertRaises(ValueError):
+            load_public_key(b"not a pem")
+
+
+class TestTrustStore(TestCase):
+
+    def test_init(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            t = TrustStore(root=tmpdir)
+            self.assertEqual(t.root, tmpdir)
+            self.assertEqual(t.pem_file, os.path.join(tmpdir, "selfcustody.pem"))
+            self.assertEqual(t.fingerprint, SELFCUSTODY_FINGERPRINT)
+            self.assertEqual(t.pem, SELFCUSTODY_PEM)
+
+    def test_fail_init(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "mock")
+            with self.assertRaises(ValueError) as exc_info:
+                TrustStore(root=path)
+
+            self.assertEqual(str(exc_info.exception), f"Given path not exist: {path}")
+
+    def test_write_pem(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            t = TrustStore(root=tmpdir)
+            t.write_pem()
+
+            with open(t.pem_file, "rb") as f:
+                self.assertEqual(f.read(), SELFCUSTODY_PEM)
+
+            # an untrusted key is replaced by the pinned one
+            with open(t.pem_file, "wb") as f:
+                f.write(MOCK_PEM)
+
+            t.write_pem()
+            with open(t.pem_file, "rb") as f:
+                self.assertEqual(f.read(), SELFCUSTODY_PEM)
+
+    @patch(
+        "src.utils.downloader.pem_downloader.PemDownloader.download",
+        fake_download(SELFCUSTODY_PEM),
+    )
+    def test_is_rotated_unchanged(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            t = TrustStore(root=tmpdir)
+
+            self.assertFalse(t.is_rotated())
+            self.assertEqual(os.listdir(tmpdir), [])
+            self.assertEqual(t.pem, SELFCUSTODY_PEM)
+
+    @patch(
+        "src.utils.downloader.pem_downloader.PemDownloader.download",
+        fake_download(MOCK_PEM),
+    )
+    def test_is_rotated_changed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            t = TrustStore(root=tmpdir)
+            t.write_pem()
+
+            self.assertTrue(t.is_rotated())
+
+            # the fetched key is neither trusted nor persisted
+            self.assertEqual(t.fingerprint, SELFCUSTODY_FINGERPRINT)
+            self.assertEqual(t.pem, SELFCUSTODY_PEM)
+            self.assertEqual(os.listdir(tmpdir), ["selfcustody.pem"])
+            with open(t.pem_file, "rb") as f:
+                self.assertEqual(f.read(), SELFCUSTODY_PEM)
+
+            # and it is reported again on the next check
+            self.assertTrue(t.is_rotated())
@@ -0,0 +1,153 @@
+import os
+import json
+import hashlib
+import tempfile
+import zipfile
+from unittest import TestCase
+from unittest.mock import patch
+from src.utils.unzip.zip_index import ZipIndex, INDEX_SUFFIX
+
+FIRMWARE = b"".join(i.to_bytes(4, "little") for i in range(100000))
+
+
+class TestZipIndex(TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "krux-v0.0.1.zip")
+        with zipfile.ZipFile(self.filename, "w") as zip_obj:
+            zip_obj.writestr("krux-v0.0.1/README.md", b"krux")
+            zip_obj.writestr(
+                "krux-v0.0.1/maixpy_amigo/firmware.bin",
+                FIRMWARE,
+                compress_type=zipfile.ZIP_DEFLATED,
+            )
+            zip_obj.writestr(
+                "krux-v0.0.1/maixpy_amigo/firmware.bin.sig",
+                b"signature",
+                compress_type=zipfile.ZIP_STORED,
+            )
+            zip_obj.writestr("krux-v0.0.1/maixpy_dock/kboot.kfpkg", b"")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_build(self):
+        index = ZipIndex(self.filename)
+        self.assertEqual(index.index_file, f"{self.filename}{INDEX_SUFFIX}")
+        self.assertEqual(
+            sorted(index.members),
+            [
+                "krux-v0.0.1/maixpy_amigo/firmware.bin",
+                "krux-v0.0.1/maixpy_amigo/firmware.bin.sig",
+                "krux-v0.0.1/maixpy_dock/kboot.kfpkg",
+            ],
+        )
+        entry = index.members["krux-v0.0.1/maixpy_amigo/firmware.bin"]
+        self.assertEqual(entry["file_size"], len(FIRMWARE))
+        self.assertEqual(entry["compress_type"], zipfile.ZIP_DEFLATED)
+        self.assertGreater(entry["data_offset"], entry["header_offset"])
+
+        with open(index.index_file, "r", encoding="utf8") as f:
+            self.assertEqual(json.load(f)["members"], index.members)
+
+    def test_devices(self):
+        index = ZipIndex(self.filename)
+        self.assertEqual(index.devices, ["amigo", "dock"])
+
+    def test_load_persisted(self):
+        ZipIndex(self.filename).load()
+
+        with patch("src.utils.unzip.zip_index.ZipFile") as mock_zipfile:
+            index = ZipIndex(self.filename)
+            self.assertEqual(index.devices, ["amigo", "dock"])
+            mock_zipfile.assert_not_called()
+
+    def test_load_outdated(self):
+        ZipIndex(self.filename).load()
+
+        with zipfile.ZipFile(self.filename, "a") as zip_obj:
+            zip_obj.writestr("krux-v0.0.1/maixpy_bit/firmware.bin", b"bit")
+
+        index = ZipIndex(self.filename)
+        self.assertEqual(index.devices, ["amigo", "bit", "dock"])
+
+    def test_read(self):
+        index = ZipIndex(self.filename)
+        self.assertEqual(index.read("krux-v0.0.1/maixpy_amigo/firmware.bin"), FIRMWARE)
+        self.assertEqual(
+            index.read("krux-v0.0.1/maixpy_amigo/firmware.bin.sig"), b"signature"
+        )
+        self.assertEqual(index.read("krux-v0.0.1/maixpy_dock/kboot.kfpkg"), b"")
+
+    def test_extract(self):
+        index = ZipIndex(self.filename)
+        destfile = os.path.join(self.tmpdir.name, "firmware.bin")
+        digest = index.extract("krux-v0.0.1/maixpy_amigo/firmware.bin", destfile)
+
+        self.assertEqual(digest, hashlib.sha256(FIRMWARE).hexdigest())
+        with open(destfile, "rb") as f:
+            self.assertEqual(f.read(), FIRMWARE)
+
+    def test_matches(self):
+        index = ZipIndex(self.filename)
+        name = "krux-v0.0.1/maixpy_amigo/firmware.bin"
+        destfile = os.path.join(self.tmpdir.name, "firmware.bin")
+        self.assertFalse(index.matches(name, destfile))
+
+        index.extract(name, destfile)
+        self.assertTrue(index.matches(name, destfile))
+        self.assertFalse(index.matches("krux-v0.0.1/README.md", destfile))
+
+        with open(destfile, "r+b") as f:
+            f.write(b"\xff")
+        self.assertFalse(index.matches(name, destfile))
+
+    def test_fail_open_not_indexed(self):
+        index = ZipIndex(self.filename)
+        with self.assertRaises(ValueError) as exc_info:
+            index.open("krux-v0.0.1/README.md")
+
+        self.assertEqual(
+            str(exc_info.exception), "Member not found: krux-v0.0.1/README.md"
+        )
+
+    def test_fail_read_corrupted(self):
+        index = ZipIndex(self.filename)
+        entry = index.members["krux-v0.0.1/maixpy_amigo/firmware.bin.sig"]
+
+        with open(self.filename, "r+b") as f:
+            f.seek(entry["data_offset"])
+            f.write(b"S")
+
+        with self.assertRaises(RuntimeError) as exc_info:
+            index.read("krux-v0.0.1/maixpy_amigo/firmware.bin.sig")
+
+        self.assertEqual(
+            str(exc_info.exception),
+            "Bad CRC-32 for krux-v0.0.1/maixpy_amigo/firmware.bin.sig",
+        )
+
+    def test_fail_extract_corrupted(self):
+        index = ZipIndex(self.filename)
+        entry = index.members["krux-v0.0.1/maixpy_amigo/firmware.bin.sig"]
+
+        with open(self.filename, "r+b") as f:
+            f.seek(entry["data_offset"])
+            f.write(b"S")
+
+        destfile = os.path.join(self.tmpdir.name, "firmware.bin.sig")
+        with self.assertRaises(RuntimeError):
+            index.extract("krux-v0.0.1/maixpy_amigo/firmware.bin.sig", destfile)
+
+        self.assertFalse(os.path.exists(destfile))
+        self.assertFalse(os.path.exists(f"{destfile}.tmp"))
+
+    @patch("src.utils.unzip.zip_index.ZipFile", side_effect=zipfile.BadZipFile)
+    def test_fail_build_badfile(self, mock_zipfile):
+        with self.assertRaises(RuntimeError) as exc_info:
+            ZipIndex("test.zip").load()
+
+        mock_zipfile.assert_called_once_with("test.zip", "r")
+        self.assertEqual(str(exc_info.exception), "Cannot open test.zip: None")
@@ -0,0 +1,202 @@
+import sys
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+from src.utils.flasher import Provisioner
+from src.utils.flasher.provisioner import PhaseTimer, provision_port
+from src.utils.kboot.build.ktool import KTool
+from .shared_mocks import MockProcessPoolExecutor, mock_get_context
+
+LOGS = [
+    "[INFO] Greeting Message Detected, Start Downloading ISP",
+    "[INFO] Initialize K210 SPI Flash",
+    "[INFO] Erasing the whole SPI Flash",
+    "[INFO] SPI Flash erased.",
+    "[INFO] Writing firmware.bin into 0x00080000",
+    "[INFO] Rebooting...",
+]
+
+
+class TestPhaseTimer(TestCase):
+
+    def test_timings(self):
+        clock = MagicMock(side_effect=[0.0, 2.0, 5.0, 12.0])
+        timer = PhaseTimer(clock=clock)
+        for text in LOGS:
+            timer.feed(text)
+
+        self.assertEqual(
+            timer.timings, {"connect": 2.0, "erase": 3.0, "flash": 7.0, "total": 12.0}
+        )
+
+    def test_unfinished_timings(self):
+        clock = MagicMock(side_effect=[0.0, 2.0])
+        timer = PhaseTimer(clock=clock)
+        for text in LOGS[:3]:
+            timer.feed(text)
+
+        self.assertEqual(timer.timings, {"connect": 2.0, "total": 2.0})
+
+
+@patch("src.utils.flasher.base_flasher.multiprocessing.get_context", mock_get_context)
+@patch("src.utils.flasher.base_flasher.ProcessPoolExecutor", MockProcessPoolExecutor)
+class TestProvisioner(TestCase):
+
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_provision_port(self, mock_process):
+        argv = []
+
+        def process():
+            argv.extend(sys.argv)
+            for text in LOGS:
+                KTool.print_callback(text)
+
+        mock_process.side_effect = process
+        messages = MagicMock()
+        before = list(sys.argv)
+        result = provision_port(
+            messages,
+            port="/mock/path0",
+            board="goE",
+            baudrate=1500000,
+            firmware="mock.kfpkg",
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["error"], None)
+        self.assertEqual(
+            sorted(result["timings"]), ["connect", "erase", "flash", "total"]
+        )
+        self.assertEqual(
+            argv,
+            [
+                "ktool",
+                "-B",
+                "goE",
+                "-b",
+                "1500000",
+                "-p",
+                "/mock/path0",
+                "-E",
+                "mock.kfpkg",
+            ],
+        )
+        self.assertEqual(sys.argv, before)
+        self.assertEqual(messages.put.call_count, len(LOGS))
+
+    @patch("src.utils.flasher.provisioner.LatencyTimer")
+    @patch("src.utils.kboot.build.ktool.KTool.process")
+    def test_provision_port_low_latency(self, mock_process, mock_latency_timer):
+        lowered = mock_latency_timer.return_value.lowered
+        lowered.return_value.__enter__.return_value = 1
+        messages = MagicMock()
+        result = provision_port(
+            messages,
+            port="/mock/path0",
+            board="goE",
+            baudrate=1500000,
+            firmware="mock.kfpkg",
+        )
+
+        self.assertTrue(result["success"])
+        mock_latency_timer.assert_called_once_with("/mock/path0")
+        lowered.return_value.__exit__.assert_called_once()
+        messages.put.assert_called_once_with(
+            ("/mock/path0", "data", "Latency timer of /mock/path0: 1 ms")
+        )
+        mock_process.assert_called_once()
+
+    @patch(
+        "src.utils.kboot.build.ktool.KTool.process",
+        side_effect=Exception("Greeting fail"),
+    )
+    def test_fail_provision_port(self, mock_process):
+        before = list(sys.argv)
+        result = provision_port(
+            MagicMock(),
+            port="/mock/path0",
+            board="goE",
+            baudrate=1500000,
+            firmware="mock.kfpkg",
+        )
+
+        self.assertEqual(
+            result, {"success": False, "error": "Greeting fail", "timings": {}}
+        )
+        self.assertEqual(sys.argv, before)
+        mock_process.assert_called_once()
+
+    @patch("os.path.exists", return_value=True)
+    @patch("src.utils.flasher.provisioner.provision_port")
+    def test_provision(self, mock_provision_port, mock_exists):
+
+        # pylint: disable=unused-argument
+        def provision(messages, port, board, baudrate, firmware):
+            messages.put((port, "data", "Rebooting..."))
+            return {"success": True, "error": None, "timings": {"total": 1.0}}
+
+        mock_provision_port.side_effect = provision
+        on_data = MagicMock()
+        p = Provisioner()
+        p.firmware = "mock/kboot.kfpkg"
+        result = p.provision(
+            port="/mock/path0", board="goE", baudrate=1500000, on_data=on_data
+        )
+
+        self.assertEqual(
+            result, {"success": True, "error": None, "timings": {"total": 1.0}}
+        )
+        on_data.assert_called_once_with("/mock/path0", "Rebooting...")
+        self.assertEqual(
+            mock_provision_port.call_args.kwargs["firmware"], "mock/kboot.kfpkg"
+        )
+
+    def test_fail_provision_invalid_args(self):
+        p = Provisioner()
+        with self.assertRaises(ValueError) as exc_info:
+            p.provision(port="/mock/path0", board="mock", baudrate=1500000)
+
+        self.assertEqual(str(exc_info.exception), "Invalid board: mock")
+
+        with self.assertRaises(ValueError) as exc_info:
+            p.provision(port="/mock/path0", board="goE", baudrate=1234567)
+
+        self.assertEqual(str(exc_info.exception), "Invalid baudrate: 1234567")
+
+    @patch(
+        "src.utils.flasher.base_flasher.BaseFlasher.find_ports",
+        return_value=["/mock/path0", "/mock/path1"],
+    )
+    @patch("src.utils.flasher.provisioner.Provisioner.is_port_working")
+    @patch("src.utils.flasher.provisioner.provision_port")
+    def test_provision_all(
+        self, mock_provision_port, mock_is_port_working, mock_find_ports
+    ):
+        mock_is_port_working.side_effect = lambda port: port == "/mock/path1"
+        mock_provision_port.return_value = {
+            "success": True,
+            "error": None,
+            "timings": {},
+        }
+        p = Provisioner()
+        with patch("os.path.exists", return_value=True):
+            p.firmware = "mock/kboot.kfpkg"
+        p.device = "dock"
+        p.baudrate = 1500000
+        results = p.provision_all()
+
+        self.assertEqual(list(results), ["/mock/path1"])
+        mock_find_ports.assert_called_once_with("dock")
+        self.assertEqual(
+            mock_provision_port.call_args.kwargs["board"],
+            "dan",
+        )
+
+    def test_fail_provision_all_no_device(self):
+        p = Provisioner()
+        with patch("os.path.exists", return_value=True):
+            p.firmware = "mock/kboot.kfpkg"
+
+        with self.assertRaises(ValueError) as exc_info:
+            p.provision_all()
+
+        self.assertEqual(str(exc_info.exception), "Device not detected")
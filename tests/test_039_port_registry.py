@@ -0,0 +1,291 @@
+from __future__ import annotations
+import threading
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+from serial.serialutil import SerialException
+from src.utils.ports import (
+    PortRegistry,
+    get_port_registry,
+    probe_port,
+    STATE_AVAILABLE,
+    STATE_UNAVAILABLE,
+    STATE_BUSY,
+    STATE_PROBING,
+)
+
+
+def mock_port(device: str, vid: int | None = 0x0403, location: str | None = None):
+    """A ListPortInfo-like object"""
+    port = MagicMock(vid=vid, location=location)
+    port.device = device
+    return port
+
+
+USB0 = mock_port("/dev/ttyUSB0", location="1-1.1:1.0")
+USB1 = mock_port("/dev/ttyUSB1", location="1-1.2:1.0")
+ACM0 = mock_port("/dev/ttyACM0", vid=0x7523, location="1-1.3:1.0")
+TTYS0 = mock_port("/dev/ttyS0", vid=None)
+MODEM0 = mock_port("/dev/ttyACM1", vid=0x1546, location="1-1.4:1.0")
+
+
+class TestPortRegistry(TestCase):
+
+    @patch("src.utils.ports.Serial")
+    def test_probe_port(self, mock_serial):
+        self.assertTrue(probe_port("/dev/ttyUSB0"))
+        mock_serial.assert_called_once_with("/dev/ttyUSB0")
+        mock_serial.return_value.close.assert_called_once()
+
+    @patch("src.utils.ports.Serial", side_effect=SerialException)
+    def test_probe_port_fail(self, mock_serial):
+        self.assertFalse(probe_port("/dev/ttyUSB0"))
+        mock_serial.assert_called_once_with("/dev/ttyUSB0")
+
+    def test_vid_of(self):
+        self.assertEqual(PortRegistry.vid_of(USB0), "0403")
+        self.assertEqual(PortRegistry.vid_of(ACM0), "7523")
+        self.assertIsNone(PortRegistry.vid_of(TTYS0))
+
+    @patch("src.utils.ports.sys")
+    def test_signature_not_linux(self, mock_sys):
+        mock_sys.platform = "win32"
+        self.assertIsNone(PortRegistry.signature())
+
+    @patch("src.utils.ports.os.listdir")
+    @patch("src.utils.ports.sys")
+    def test_signature_linux(self, mock_sys, mock_listdir):
+        mock_sys.platform = "linux"
+        mock_listdir.side_effect = [["b", "a"], OSError]
+        self.assertEqual(PortRegistry.signature(), (("a", "b"), None))
+
+    @patch("src.utils.ports.PortRegistry.signature", return_value=None)
+    @patch("src.utils.ports.list_ports.comports", return_value=[USB1, ACM0, USB0])
+    def test_refresh_index(self, mock_comports, mock_signature):
+        registry = PortRegistry(probe=False)
+        arrived, departed = registry.refresh()
+
+        mock_signature.assert_called_once()
+        mock_comports.assert_called_once()
+        self.assertEqual(arrived, ["/dev/ttyACM0", "/dev/ttyUSB0", "/dev/ttyUSB1"])
+        self.assertEqual(departed, [])
+        self.assertEqual(registry.ports(vid="0403"), [USB0, USB1])
+        self.assertEqual(registry.ports(vid="7523"), [ACM0])
+        self.assertEqual(registry.ports(vid="1a86"), [])
+        self.assertEqual(registry.ports(), [ACM0, USB0, USB1])
+        self.assertIs(registry.get("/dev/ttyUSB1"), USB1)
+        self.assertIsNone(registry.get("/dev/ttyUSB2"))
+        self.assertIs(registry.by_location("1-1.3:1.0"), ACM0)
+        self.assertEqual(registry.state("/dev/ttyUSB0"), STATE_AVAILABLE)
+        self.assertIsNone(registry.state("/dev/ttyUSB2"))
+
+    @patch("src.utils.ports.PortRegistry.signature", return_value=None)
+    @patch("src.utils.ports.list_ports.comports")
+    def test_refresh_arrival_departure(self, mock_comports, mock_signature):
+        on_arrival = MagicMock()
+        on_departure = MagicMock()
+        registry = PortRegistry(probe=False)
+        registry.bind(on_arrival=on_arrival, on_departure=on_departure)
+
+        mock_comports.return_value = [USB0, TTYS0]
+        self.assertEqual(registry.refresh(), (["/dev/ttyS0", "/dev/ttyUSB0"], []))
+        self.assertEqual(on_arrival.call_count, 2)
+        on_departure.assert_not_called()
+
+        mock_comports.return_value = [USB1, TTYS0]
+        self.assertEqual(registry.refresh(), (["/dev/ttyUSB1"], ["/dev/ttyUSB0"]))
+        on_arrival.assert_called_with(USB1)
+        on_departure.assert_called_once_with(USB0)
+        self.assertEqual(registry.ports(vid="0403"), [USB1])
+        self.assertIsNone(registry.by_location("1-1.1:1.0"))
+        self.assertEqual(mock_signature.call_count, 2)
+
+        registry.unbind(on_arrival=on_arrival, on_departure=on_departure)
+        mock_comports.return_value = []
+        self.assertEqual(registry.refresh(), ([], ["/dev/ttyS0", "/dev/ttyUSB1"]))
+        self.assertEqual(on_arrival.call_count, 3)
+        on_departure.assert_called_once()
+        self.assertEqual(registry.ports(vid="0403"), [])
+
+    @patch("src.utils.ports.PortRegistry.signature", return_value=(("a",), None))
+    @patch("src.utils.ports.list_ports.comports", return_value=[USB0])
+    def test_refresh_unchanged_signature(self, mock_comports, mock_signature):
+        registry = PortRegistry(probe=False)
+        self.assertEqual(registry.refresh(), (["/dev/ttyUSB0"], []))
+        self.assertEqual(registry.refresh(), ([], []))
+        mock_comports.assert_called_once()
+
+        mock_signature.return_value = (("a", "b"), None)
+        registry.refresh()
+        self.assertEqual(mock_comports.call_count, 2)
+
+        registry.refresh(force=True)
+        self.assertEqual(mock_comports.call_count, 3)
+
+    @patch("src.utils.ports.PortRegistry.signature", return_value=None)
+    @patch("src.utils.ports.list_ports.comports", return_value=[USB0, USB1])
+    @patch("src.utils.ports.probe_port", side_effect=[True, False])
+    def test_refresh_probe(self, mock_probe_port, mock_comports, mock_signature):
+        registry = PortRegistry()
+        registry.refresh()
+
+        mock_signature.assert_called_once()
+        mock_comports.assert_called_once()
+        self.assertEqual(mock_probe_port.call_count, 2)
+        self.assertEqual(registry.state("/dev/ttyUSB0"), STATE_AVAILABLE)
+        self.assertEqual(registry.state("/dev/ttyUSB1"), STATE_UNAVAILABLE)
+        self.assertEqual(registry.ports(state=STATE_AVAILABLE), [USB0])
+
+        # probed once, on arrival
+        registry.refresh()
+        self.assertEqual(mock_probe_port.call_count, 2)
+
+    @patch("src.utils.ports.PortRegistry.signature", return_value=None)
+    @patch("src.utils.ports.list_ports.comports", return_value=[TTYS0, MODEM0, ACM0])
+    @patch("src.utils.ports.probe_port", return_value=True)
+    def test_refresh_probe_supported_vids(
+        self, mock_probe_port, mock_comports, mock_signature
+    ):
+        registry = PortRegistry()
+        registry.refresh()
+
+        mock_signature.assert_called_once()
+        mock_comports.assert_called_once()
+        mock_probe_port.assert_called_once_with("/dev/ttyACM0")
+        self.assertEqual(registry.state("/dev/ttyS0"), STATE_AVAILABLE)
+        self.assertEqual(registry.state("/dev/ttyACM1"), STATE_AVAILABLE)
+
+    @patch("src.utils.ports.PortRegistry.signature", return_value=None)
+    @patch("src.utils.ports.list_ports.comports", return_value=[USB0, USB1])
+    @patch("src.utils.ports.probe_port", side_effect=[True, False, False, True])
+    def test_recheck(self, mock_probe_port, mock_comports, mock_signature):
+        registry = PortRegistry()
+        registry.refresh()
+        mock_signature.assert_called_once()
+        mock_comports.assert_called_once()
+
+        # an available port is not probed again
+        self.assertEqual(registry.recheck("/dev/ttyUSB0"), STATE_AVAILABLE)
+        self.assertEqual(mock_probe_port.call_count, 2)
+
+        # an unavailable one is, until it works
+        self.assertEqual(registry.recheck("/dev/ttyUSB1"), STATE_UNAVAILABLE)
+        self.assertEqual(registry.recheck("/dev/ttyUSB1"), STATE_AVAILABLE)
+        self.assertEqual(registry.state("/dev/ttyUSB1"), STATE_AVAILABLE)
+        self.assertEqual(mock_probe_port.call_count, 4)
+
+        self.assertIsNone(registry.recheck("/dev/ttyUSB2"))
+        self.assertEqual(mock_probe_port.call_count, 4)
+
+    @patch("src.utils.ports.PortRegistry.signature", return_value=None)
+    @patch("src.utils.ports.list_ports.comports", return_value=[USB0])
+    def test_acquire_while_probing(self, mock_comports, mock_signature):
+        probing = threading.Event()
+        probed = threading.Event()
+
+        def probe(device):
+            probing.set()
+            return probed.wait(5)
+
+        registry = PortRegistry()
+        with patch("src.utils.ports.probe_port", side_effect=probe):
+            thread = threading.Thread(target=registry.refresh)
+            thread.start()
+            self.assertTrue(probing.wait(5))
+
+            # an arrived port cannot be acquired before its probe
+            self.assertEqual(registry.state("/dev/ttyUSB0"), STATE_PROBING)
+            self.assertFalse(registry.acquire("/dev/ttyUSB0"))
+
+            # but its probe can be waited
+            probed.set()
+            self.assertEqual(registry.recheck("/dev/ttyUSB0"), STATE_AVAILABLE)
+            thread.join()
+
+        self.assertTrue(registry.acquire("/dev/ttyUSB0"))
+        mock_signature.assert_called_once()
+        mock_comports.assert_called_once()
+
+    @patch("src.utils.ports.PortRegistry.signature", return_value=None)
+    @patch("src.utils.ports.list_ports.comports", return_value=[USB0])
+    def test_lookup_scans_once(self, mock_comports, mock_signature):
+        registry = PortRegistry(probe=False)
+        registry.ports()
+        registry.get("/dev/ttyUSB0")
+        registry.state("/dev/ttyUSB0")
+        registry.by_location("1-1.1:1.0")
+
+        mock_signature.assert_called_once()
+        mock_comports.assert_called_once()
+
+    @patch("src.utils.ports.PortRegistry.signature", return_value=None)
+    @patch("src.utils.ports.list_ports.comports", return_value=[USB0])
+    def test_acquire_release(self, mock_comports, mock_signature):
+        registry = PortRegistry(probe=False)
+        registry.refresh()
+        mock_signature.assert_called_once()
+        mock_comports.assert_called_once()
+
+        self.assertTrue(registry.acquire("/dev/ttyUSB0"))
+        self.assertEqual(registry.state("/dev/ttyUSB0"), STATE_BUSY)
+        self.assertFalse(registry.acquire("/dev/ttyUSB0"))
+        self.assertEqual(registry.ports(state=STATE_AVAILABLE), [])
+
+        # ports unknown to registry can be acquired once too
+        self.assertTrue(registry.acquire("/dev/ttyUSB1"))
+        self.assertEqual(registry.state("/dev/ttyUSB1"), STATE_BUSY)
+        self.assertFalse(registry.acquire("/dev/ttyUSB1"))
+
+        registry.release("/dev/ttyUSB0")
+        self.assertEqual(registry.state("/dev/ttyUSB0"), STATE_AVAILABLE)
+        registry.release("/dev/ttyUSB1")
+        self.assertIsNone(registry.state("/dev/ttyUSB1"))
+
+    @patch("src.utils.ports.PortRegistry.signature", return_value=None)
+    @patch("src.utils.ports.list_ports.comports", return_value=[USB0])
+    def test_start_stop(self, mock_comports, mock_signature):
+        arrived = threading.Event()
+        registry = PortRegistry(interval=0.01, probe=False)
+        registry.bind(on_arrival=lambda port: arrived.set())
+        self.assertFalse(registry.running)
+
+        registry.start()
+        thread = registry._thread
+        registry.start()
+        self.assertIs(registry._thread, thread)
+        self.assertTrue(arrived.wait(5))
+        self.assertTrue(registry.running)
+
+        registry.stop()
+        self.assertFalse(registry.running)
+
+        # started again (e.g. when flash screen is shown again)
+        registry.start()
+        self.assertTrue(registry.running)
+        registry.stop()
+        self.assertFalse(registry.running)
+        mock_signature.assert_called()
+        mock_comports.assert_called()
+
+    @patch("src.utils.ports.PortRegistry.refresh")
+    def test_watch_keep_running_on_error(self, mock_refresh):
+        registry = PortRegistry(interval=0.01, probe=False)
+        calls = []
+
+        def refresh(force=False):
+            calls.append(force)
+            if len(calls) == 2:
+                raise SerialException("unplugged")
+            if len(calls) == 3:
+                registry._stop.set()
+            return [], []
+
+        mock_refresh.side_effect = refresh
+        with patch.object(registry, "warning") as mock_warning:
+            registry.watch()
+
+        self.assertEqual(calls, [True, False, False])
+        mock_warning.assert_called_once()
+
+    def test_get_port_registry(self):
+        self.assertIsInstance(get_port_registry(), PortRegistry)
+        self.assertIs(get_port_registry(), get_port_registry())
@@ -0,0 +1,106 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+from src.utils.ports.latency import LatencyTimer, SYSFS_USB_SERIAL, LOW_LATENCY_MS
+
+
+class TestLatencyTimer(TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        self.make_tty("ttyUSB0", "16\n")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def make_tty(self, tty: str, latency: str):
+        """Make a fake sysfs entry of an usb-serial tty"""
+        os.makedirs(os.path.join(self.root, tty))
+        with open(os.path.join(self.root, tty, "latency_timer"), "w") as f:
+            f.write(latency)
+
+    def latency_of(self, tty: str) -> str:
+        with open(os.path.join(self.root, tty, "latency_timer"), "r") as f:
+            return f.read()
+
+    def test_init(self):
+        timer = LatencyTimer("/dev/ttyUSB0")
+        self.assertEqual(timer.device, "/dev/ttyUSB0")
+        self.assertEqual(timer.root, SYSFS_USB_SERIAL)
+        self.assertEqual(
+            timer.path, os.path.join(SYSFS_USB_SERIAL, "ttyUSB0", "latency_timer")
+        )
+
+    def test_path_resolve_link(self):
+        link = os.path.join(self.root, "pci-0000:00:14.0-usb-0:1:1.0-port0")
+        os.symlink("/dev/ttyUSB3", link)
+        timer = LatencyTimer(link, root=self.root)
+        self.assertEqual(
+            timer.path, os.path.join(self.root, "ttyUSB3", "latency_timer")
+        )
+
+    def test_supported(self):
+        self.assertTrue(LatencyTimer("/dev/ttyUSB0", root=self.root).supported)
+        self.assertFalse(LatencyTimer("/dev/ttyACM0", root=self.root).supported)
+
+    def test_read(self):
+        self.make_tty("ttyUSB1", "garbage")
+        self.assertEqual(LatencyTimer("/dev/ttyUSB0", root=self.root).read(), 16)
+        self.assertIsNone(LatencyTimer("/dev/ttyUSB1", root=self.root).read())
+        self.assertIsNone(LatencyTimer("/dev/ttyACM0", root=self.root).read())
+
+    def test_write(self):
+        timer = LatencyTimer("/dev/ttyUSB0", root=self.root)
+        self.assertTrue(timer.write(2))
+        self.assertEqual(self.latency_of("ttyUSB0"), "2")
+
+    def test_fail_write(self):
+        timer = LatencyTimer("/dev/ttyACM0", root=self.root)
+        with patch.object(timer, "warning") as mock_warning:
+            self.assertFalse(timer.write(2))
+        mock_warning.assert_called_once()
+
+    def test_lowered(self):
+        timer = LatencyTimer("/dev/ttyUSB0", root=self.root)
+        with timer.lowered() as latency:
+            self.assertEqual(latency, LOW_LATENCY_MS)
+            self.assertEqual(self.latency_of("ttyUSB0"), str(LOW_LATENCY_MS))
+
+        self.assertEqual(self.latency_of("ttyUSB0"), "16")
+
+    def test_lowered_restore_on_error(self):
+        timer = LatencyTimer("/dev/ttyUSB0", root=self.root)
+        with self.assertRaises(RuntimeError):
+            with timer.lowered(4):
+                self.assertEqual(self.latency_of("ttyUSB0"), "4")
+                raise RuntimeError("flash failed")
+
+        self.assertEqual(self.latency_of("ttyUSB0"), "16")
+
+    def test_lowered_already_low(self):
+        self.make_tty("ttyUSB1", "1\n")
+        timer = LatencyTimer("/dev/ttyUSB1", root=self.root)
+        with patch.object(timer, "write") as mock_write:
+            with timer.lowered() as latency:
+                self.assertEqual(latency, 1)
+
+        mock_write.assert_not_called()
+
+    def test_lowered_unsupported(self):
+        timer = LatencyTimer("/dev/ttyACM0", root=self.root)
+        with patch.object(timer, "write") as mock_write:
+            with timer.lowered() as latency:
+                self.assertIsNone(latency)
+
+        mock_write.assert_not_called()
+
+    def test_lowered_not_permitted(self):
+        timer = LatencyTimer("/dev/ttyUSB0", root=self.root)
+        with patch.object(timer, "write", return_value=False) as mock_write:
+            with timer.lowered() as latency:
+                self.assertEqual(latency, 16)
+
+        mock_write.assert_called_once_with(LOW_LATENCY_MS)
+        self.assertEqual(self.latency_of("ttyUSB0"), "16\n")